@@ -183,11 +183,13 @@ def sp_timezone() -> str:
 
 EMBED_BATCH_SIZE = _env_int("EMBED_BATCH_SIZE", 32)
 EMBED_WORKERS = _env_int("EMBED_WORKERS", 1)
+EMBED_PARSE_WORKERS = _env_int("EMBED_PARSE_WORKERS", 1)
 EMBED_RATE_LIMIT_PER_MIN = _env_int_or_none("EMBED_RATE_LIMIT_PER_MIN")
 
 logger.info(
-    "config: EMBED_BATCH_SIZE=%s EMBED_WORKERS=%s EMBED_RATE_LIMIT_PER_MIN=%s",
+    "config: EMBED_BATCH_SIZE=%s EMBED_WORKERS=%s EMBED_PARSE_WORKERS=%s EMBED_RATE_LIMIT_PER_MIN=%s",
     EMBED_BATCH_SIZE,
     EMBED_WORKERS,
+    EMBED_PARSE_WORKERS,
     EMBED_RATE_LIMIT_PER_MIN,
 )
@@ -471,7 +471,6 @@ def _probe_service(section: str) -> Dict[str, Any]:
                 auth_profile=cfg["auth_profile"],
                 doc_input_type=doc_it,
                 query_input_type=qry_it,
-                batch_size=app_config.EMBED_BATCH_SIZE,
             )
             adapter.embed_query("ping")
         elif section == "llm_primary":
@@ -543,7 +542,6 @@ def make_embeddings():
         auth_profile=cfg["auth_profile"],
         doc_input_type=doc_it,
         query_input_type=qry_it,
-        batch_size=app_config.EMBED_BATCH_SIZE,
     )
 
 
@@ -560,7 +558,7 @@ def make_vector_store(embeddings=None):
         embeddings = make_embeddings()
 
     try:
-        from backend.providers.oci.vectorstore import OracleVSStore
+        from backend.providers.oci.vectorstore import OracleVSStore, create_vector_pool
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
             "The 'oracledb' package is required for Oracle vector operations. "
@@ -570,49 +568,50 @@ def make_vector_store(embeddings=None):
     # Resolve alias (stable read surface)
     alias_name = _resolve_alias_table()
     ovs = settings.providers["oraclevs"]
+    pool_cfg = ovs.get("pool") if isinstance(ovs.get("pool"), dict) else None
 
-    # Guard: ensure alias exists and is a VIEW before constructing the store
+    # One session pool serves the alias guard below and every vector search afterwards.
+    pool = create_vector_pool(ovs["dsn"], ovs["user"], ovs["password"], pool_cfg)
     try:
-        import oracledb  # type: ignore
-    except ModuleNotFoundError as exc:
-        raise ModuleNotFoundError(
-            "The 'oracledb' package is required for Oracle vector operations. "
-            "Install it with `pip install oracledb`."
-        ) from exc
-
-    conn = oracledb.connect(user=ovs["user"], password=ovs["password"], dsn=ovs["dsn"])
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT object_type FROM user_objects WHERE object_name = :1",
-                (alias_name.upper(),),
-            )
-            row = cur.fetchone()
-            if not row:
-                raise RuntimeError(
-                    f"Alias view '{alias_name}' not found. Run the embedding job with --update-alias first."
+        # Guard: ensure alias exists and is a VIEW before constructing the store
+        with pool.acquire() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT object_type FROM user_objects WHERE object_name = :1",
+                    (alias_name.upper(),),
                 )
-            obj_type = (row[0] or "").upper()
-            if obj_type != "VIEW":
-                raise RuntimeError(
-                    f"Alias name '{alias_name}' is a {obj_type}. Drop/rename it; it must be a VIEW."
-                )
-    finally:
+                row = cur.fetchone()
+        if not row:
+            raise RuntimeError(
+                f"Alias view '{alias_name}' not found. Run the embedding job with --update-alias first."
+            )
+        obj_type = (row[0] or "").upper()
+        if obj_type != "VIEW":
+            raise RuntimeError(
+                f"Alias name '{alias_name}' is a {obj_type}. Drop/rename it; it must be a VIEW."
+            )
+
+        # Instantiate store pointing at the alias (read surface). Preventing auto-bootstrap is handled
+        # by the guard above; OracleVS should not attempt to create a TABLE when a VIEW exists.
+        return OracleVSStore(
+            dsn=ovs["dsn"],
+            user=ovs["user"],
+            password=ovs["password"],
+            table=alias_name,
+            embeddings=embeddings,
+            distance=ovs.get("distance", "dot_product"),
+            pool=pool,
+            pool_config=pool_cfg,
+            search_mode=ovs.get("search_mode") or "native",
+            approximate=bool(ovs.get("approximate", True)),
+            target_accuracy=ovs.get("target_accuracy"),
+        )
+    except Exception:
         try:
-            conn.close()
+            pool.close(force=True)
         except Exception:  # noqa: BLE001
             pass
-
-    # Instantiate store pointing at the alias (read surface). Preventing auto-bootstrap is handled
-    # by the guard above; OracleVS should not attempt to create a TABLE when a VIEW exists.
-    return OracleVSStore(
-        dsn=ovs["dsn"],
-        user=ovs["user"],
-        password=ovs["password"],
-        table=alias_name,
-        embeddings=embeddings,
-        distance=ovs.get("distance", "dot_product"),
-    )
+        raise
 
 
 def _create_vector_store(embeddings):
@@ -38,7 +38,21 @@ _health_embeddings = make_embeddings()
 def healthz_db():
     vector = get_vector_store_safe(_health_embeddings)
     ok = vector is not None
-    return {"ok": ok, "vector": "up" if ok else "down"}
+    payload = {"ok": ok, "vector": "up" if ok else "down"}
+    stats_fn = getattr(vector, "pool_stats", None)
+    if callable(stats_fn):
+        try:
+            payload["pool"] = stats_fn()
+        except Exception as exc:  # noqa: BLE001
+            logging.getLogger(__name__).debug("vector pool stats unavailable: %s", exc)
+    return payload
+
+
+@app.get("/healthz/oci-limits")
+def healthz_oci_limits():
+    from backend.providers.oci.adaptive_limiter import controller_stats
+
+    return {"controllers": controller_stats()}
 
 # Ensure DB tables exist (auto-create if migrations not applied)
 try:
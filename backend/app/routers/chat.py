@@ -1,17 +1,21 @@
+import json
 import logging
+import math
 from decimal import Decimal
 from threading import Lock
 from time import perf_counter
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from backend.app.models.chat import ChatRequest
 from backend.app import deps as app_deps
 from backend.app.config import usage_log_enabled
 from backend.core.db.session import session_scope
 from backend.core.repos.usage_repo_db import UsageRepoDB
+from backend.core.services.answer_cache import AnswerCache
 from backend.core.services.retrieval_service import RetrievalService
 
 router = APIRouter()
@@ -25,6 +29,11 @@ _llm_fallback = app_deps.make_chat_model_fallback()
 _service_lock = Lock()
 _service: Optional[RetrievalService] = None
 _cached_vector_id: Optional[int] = None
+_answer_cache: Optional[AnswerCache] = AnswerCache.from_config(
+    (app_deps.settings.app.get("retrieval", {}) or {}).get("answer_cache")
+    if isinstance(app_deps.settings.app, dict)
+    else None
+)
 
 
 def _vector_dependency():
@@ -40,20 +49,8 @@ def _get_service(vector_store) -> RetrievalService:
         return _service
 
 
-@router.post("/chat")
-def chat(
-    req: ChatRequest,
-    response: Response,
-    request: Request,
-    vector_store=Depends(_vector_dependency),
-    current_user: Optional[Any] = Depends(app_deps.get_current_user_optional),
-):
-    if vector_store is None:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Vector store unavailable. Please try again shortly.",
-        )
-
+def _resolve_target_view(request: Request) -> Optional[str]:
+    """Map the optional X-RAG-Domain header to embeddings.domains.<key>.alias_name."""
     target_view = None
     domain_key = request.headers.get("x-rag-domain")
     domain_key = domain_key.strip() if isinstance(domain_key, str) else ""
@@ -74,22 +71,147 @@ def chat(
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
         target_view = alias_name
         logger.info("X-RAG-Domain override active domain_key=%s target_view=%s", domain_key, target_view)
+    return target_view
+
 
+@router.post("/chat")
+async def chat(
+    req: ChatRequest,
+    response: Response,
+    request: Request,
+    vector_store=Depends(_vector_dependency),
+    current_user: Optional[Any] = Depends(app_deps.get_current_user_optional),
+):
+    if vector_store is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector store unavailable. Please try again shortly.",
+        )
+
+    target_view = _resolve_target_view(request)
     service = _get_service(vector_store)
     start_ts = perf_counter()
-    result = service.answer(req.question, target_view=target_view)
+    # Alias resolution may hit the database; it goes through the store's async pool.
+    cache_key = await _answer_cache_key_async(req.question, target_view, vector_store)
+    cached = _answer_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        result, age_s = cached
+        explain = result.get("decision_explain")
+        if isinstance(explain, dict):
+            explain["answer_cache"] = {"hit": True, "age_ms": int(age_s * 1000.0)}
+    else:
+        result = await service.answer_async(req.question, target_view=target_view)
+        if cache_key is not None:
+            _answer_cache.put(cache_key, result)
     latency_ms = int((perf_counter() - start_ts) * 1000.0)
     mode = result.get("mode")
     if mode:
         response.headers["X-Answer-Mode"] = str(mode)
+    if cached is not None:
+        response.headers["X-Answer-Cache"] = "hit"
     if usage_log_enabled():
         try:
-            _log_chat_usage(req, request, result, current_user, latency_ms)
+            await run_in_threadpool(_log_chat_usage, req, request, result, current_user, latency_ms)
         except Exception as exc:  # noqa: BLE001
             logger.debug("usage.log_interaction skipped (%s)", exc.__class__.__name__)
     return JSONResponse(content=result)
 
 
+def _answer_cache_key(question: str, target_view: Optional[str], vector_store):
+    if _answer_cache is None:
+        return None
+    cache_view = target_view or getattr(vector_store, "table_name", None) or ""
+    resolver = getattr(vector_store, "resolve_physical_index", None) or (lambda _view: None)
+    return _answer_cache.make_key(question, cache_view, resolver)
+
+
+async def _answer_cache_key_async(question: str, target_view: Optional[str], vector_store):
+    if _answer_cache is None:
+        return None
+    cache_view = target_view or getattr(vector_store, "table_name", None) or ""
+    resolver = getattr(vector_store, "aresolve_physical_index", None)
+    if resolver is None:
+        return await run_in_threadpool(_answer_cache_key, question, target_view, vector_store)
+    return await _answer_cache.amake_key(question, cache_view, resolver)
+
+
+def _sse(event: str, data: Any) -> str:
+    payload = json.dumps(_json_safe(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def _json_safe(value: Any) -> Any:
+    # SSE payloads are parsed by browsers; NaN/Infinity are not valid JSON there.
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+@router.post("/chat/stream")
+def chat_stream(
+    req: ChatRequest,
+    request: Request,
+    vector_store=Depends(_vector_dependency),
+    current_user: Optional[Any] = Depends(app_deps.get_current_user_optional),
+):
+    """Server-sent events: ``metadata`` -> ``token``* -> ``done`` (see RetrievalService.answer_stream)."""
+    if vector_store is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector store unavailable. Please try again shortly.",
+        )
+    target_view = _resolve_target_view(request)
+    service = _get_service(vector_store)
+    cache_key = _answer_cache_key(req.question, target_view, vector_store)
+    cached = _answer_cache.get(cache_key) if cache_key is not None else None
+
+    def _events() -> Iterator[str]:
+        start_ts = perf_counter()
+        result: Optional[dict] = None
+        try:
+            if cached is not None:
+                result, age_s = cached
+                explain = result.get("decision_explain")
+                if isinstance(explain, dict):
+                    explain["answer_cache"] = {"hit": True, "age_ms": int(age_s * 1000.0)}
+                yield _sse(
+                    "metadata",
+                    {k: result.get(k) for k in ("question", "mode", "retrieved_chunks_metadata", "used_chunks", "decision_explain")},
+                )
+                yield _sse("token", {"text": result.get("answer") or ""})
+                result["usage"] = {"llm": None, "elapsed_ms": int((perf_counter() - start_ts) * 1000.0)}
+                yield _sse("done", result)
+            else:
+                for event, data in service.answer_stream(req.question, target_view=target_view):
+                    if event == "done":
+                        result = data
+                    yield _sse(event, data)
+                if result is not None and cache_key is not None:
+                    _answer_cache.put(cache_key, {k: v for k, v in result.items() if k != "usage"})
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("chat stream failed: %s", exc)
+            yield _sse("error", {"detail": "Answer generation failed."})
+            return
+        if result is not None and usage_log_enabled():
+            latency_ms = int((perf_counter() - start_ts) * 1000.0)
+            try:
+                _log_chat_usage(req, request, result, current_user, latency_ms)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("usage.log_interaction skipped (%s)", exc.__class__.__name__)
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if cached is not None:
+        headers["X-Answer-Cache"] = "hit"
+        if cached[0].get("mode"):
+            # Fresh answers only know their mode once retrieval runs; it arrives in the metadata event.
+            headers["X-Answer-Mode"] = str(cached[0]["mode"])
+    return StreamingResponse(_events(), media_type="text/event-stream", headers=headers)
+
+
 def _log_chat_usage(req: ChatRequest, request: Request, result: dict, current_user: Optional[Any], latency_ms: int) -> None:
     _ = current_user
     metadata = getattr(req, "metadata", None)
@@ -10,6 +10,7 @@ from backend.app.services.ingest import (
     ConflictError,
     EmptyUploadError,
     FileTooLargeError,
+    JobNotRetryableError,
     UnknownProfileError,
     UnsupportedContentTypeError,
     ingest_service,
@@ -105,3 +106,20 @@ def get_ingest_job(job_id: str) -> IngestJobStatus:
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
     return job
+
+
+@router.post(
+    "/ingest/jobs/{job_id}/retry",
+    response_model=IngestJobStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Retry a failed ingestion job, resuming from its last committed chunks",
+)
+def retry_ingest_job(job_id: str, background_tasks: BackgroundTasks) -> IngestJobStatus:
+    try:
+        job = ingest_service.retry_job(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found") from exc
+    except JobNotRetryableError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    background_tasks.add_task(ingest_service.run_job, job.job_id)
+    return job
@@ -17,10 +17,15 @@ def _build_embed_command(
     profile: str,
     update_alias: bool,
     evaluate: bool,
+    job_id: Optional[str] = None,
+    resume: bool = False,
 ) -> list[str]:
     cmd = [sys.executable, "-m", "backend.batch.cli", "embed", "--manifest", str(manifest_path)]
     if profile:
         cmd.extend(["--profile", profile])
+    if job_id:
+        # Checkpoints are keyed by the ingest job id, so a retry can pick up where it stopped.
+        cmd.extend(["--resume", job_id] if resume else ["--job-id", job_id])
     if update_alias:
         cmd.append("--update-alias")
     if evaluate:
@@ -38,6 +43,8 @@ def run_embed_job_via_cli(
     update_alias: bool,
     evaluate: bool,
     log_callback: Optional[LogCallback] = None,
+    job_id: Optional[str] = None,
+    resume: bool = False,
 ) -> int:
     """
     Execute the existing embedding pipeline via its CLI entrypoint.
@@ -45,7 +52,7 @@ def run_embed_job_via_cli(
     Returns the subprocess exit code.
     """
     manifest_path = manifest_path.resolve()
-    command = _build_embed_command(manifest_path, profile, update_alias, evaluate)
+    command = _build_embed_command(manifest_path, profile, update_alias, evaluate, job_id=job_id, resume=resume)
     logger.info("Launching embed job via CLI: %s", " ".join(command))
 
     process = subprocess.Popen(
@@ -31,6 +31,10 @@ class ConflictError(Exception):
     """Raised when a conflicting active job already exists."""
 
 
+class JobNotRetryableError(Exception):
+    """Raised when a retry is requested for a job that has not failed retryably."""
+
+
 class UnknownProfileError(Exception):
     """Raised when an ingest profile is not recognised."""
 
@@ -198,6 +202,23 @@ class IngestService:
             return None
         return self._status_from_dict(job)
 
+    def retry_job(self, job_id: str) -> IngestJobStatus:
+        """Re-queue a failed job; the next run_job resumes from its embed checkpoints."""
+        with self._lock:
+            jobs = self._read_json(self._jobs_path)
+            rec = jobs.get(job_id)
+            if not rec:
+                raise KeyError(job_id)
+            error = rec.get("error") or {}
+            if rec.get("status") != "failed" or not error.get("retryable"):
+                raise JobNotRetryableError(f"job {job_id} is {rec.get('status')} and not retryable")
+            rec["status"] = "queued"
+            rec["attempts"] = int(rec.get("attempts") or 1) + 1
+            rec["finished_at"] = None
+            rec["error"] = None
+            self._write_json(self._jobs_path, jobs)
+        return self._status_from_dict(rec)
+
     # ---------- Runtime ----------
     def run_job(self, job_id: str) -> None:
         job = self.get_job(job_id)
@@ -230,6 +251,8 @@ class IngestService:
             bool(inputs.get("update_alias")),
             bool(inputs.get("evaluate")),
             log_callback=lambda line: self._append_log(job_id, line),
+            job_id=job_id,
+            resume=int(record.get("attempts") or 1) > 1,
         )
         duration = max(time.time() - start, 0.0)
 
@@ -506,5 +529,6 @@ __all__ = [
     "UnsupportedContentTypeError",
     "ConflictError",
     "IngestService",
+    "JobNotRetryableError",
     "UnknownProfileError",
 ]
@@ -7,6 +7,10 @@ Usage examples:
     python -m backend.batch.cli embed --manifest path/to/manifest.jsonl
     python -m backend.batch.cli embed --manifest m.jsonl --profile standard_profile --update-alias --dry-run
     python -m backend.batch.cli embed --manifest m.jsonl --evaluate backend/ingest/golden_queries.yaml
+    python -m backend.batch.cli embed --manifest m.jsonl --domain-key TS_SBC --incremental
+    python -m backend.batch.cli embed --manifest m.jsonl --resume embed-20260110093000-1a2b3c
+    python -m backend.batch.cli vector-index --domain-key TS_SBC --action rebuild --type hnsw --target-accuracy 95
+    python -m backend.batch.cli assets-gc --dry-run
 """
 from __future__ import annotations
 
@@ -64,8 +68,64 @@ def _build_parser() -> argparse.ArgumentParser:
         dest="evaluate_path",
         help="Run golden query evaluation after ingestion",
     )
+    embed_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip unchanged documents, rewrite changed ones and purge documents removed from the manifest",
+    )
+    embed_parser.add_argument("--job-id", dest="job_id", help="Checkpoint key for this run (default: generated)")
+    embed_parser.add_argument(
+        "--resume",
+        metavar="JOB_ID",
+        help="Resume a failed job, skipping chunks it already committed",
+    )
     embed_parser.set_defaults(command_handler=_handle_embed)
 
+    index_parser = subparsers.add_parser(
+        "vector-index",
+        help="Create, rebuild or drop the HNSW/IVF vector index on an embedding table",
+    )
+    index_parser.add_argument("--profile", help="Embedding profile override")
+    index_parser.add_argument(
+        "--domain-key",
+        dest="domain_key",
+        help="Target embeddings.domains.<key>.index_name instead of the profile index",
+    )
+    index_parser.add_argument("--action", choices=("ensure", "rebuild", "drop"), default="ensure")
+    index_parser.add_argument("--type", dest="index_type", choices=("hnsw", "ivf"), help="Index organization")
+    index_parser.add_argument("--target-accuracy", type=int, dest="target_accuracy", help="Target accuracy (1-100)")
+    index_parser.add_argument("--neighbors", type=int, help="HNSW neighbors per node")
+    index_parser.add_argument("--efconstruction", type=int, help="HNSW efConstruction")
+    index_parser.add_argument("--partitions", type=int, dest="neighbor_partitions", help="IVF neighbor partitions")
+    index_parser.add_argument("--parallel", type=int, help="Degree of parallelism for the build")
+    index_parser.add_argument(
+        "--metadata-indexes",
+        action="store_true",
+        help="Also create JSON_VALUE indexes on METADATA doc_id/content_type for filter pushdown",
+    )
+    index_parser.add_argument("--dry-run", action="store_true", help="Print the DDL without connecting")
+    index_parser.set_defaults(command_handler=_handle_vector_index)
+
+    gc_parser = subparsers.add_parser(
+        "assets-gc",
+        help="Delete figure blobs under RAG_ASSETS_DIR that no ingested document references",
+    )
+    gc_parser.add_argument("--assets-dir", dest="assets_dir", help="Override RAG_ASSETS_DIR")
+    gc_parser.add_argument(
+        "--min-age",
+        type=float,
+        default=3600.0,
+        dest="min_age_seconds",
+        help="Keep unreferenced blobs younger than this many seconds (default: 3600)",
+    )
+    gc_parser.add_argument(
+        "--prune-missing-sources",
+        action="store_true",
+        help="Also drop reference records whose source document no longer exists",
+    )
+    gc_parser.add_argument("--dry-run", action="store_true", help="Report what would be deleted")
+    gc_parser.set_defaults(command_handler=_handle_assets_gc)
+
     return parser
 
 
@@ -79,7 +139,7 @@ def _handle_embed(args: argparse.Namespace) -> None:
     from backend.ingest.chunking.token_chunker import chunk_text_by_tokens
 
     logger.info(
-        "Starting embed job: manifest=%s profile=%s dry_run=%s update_alias=%s batch_size=%s workers=%s evaluate=%s",
+        "Starting embed job: manifest=%s profile=%s dry_run=%s update_alias=%s batch_size=%s workers=%s evaluate=%s incremental=%s",
         args.manifest,
         args.profile,
         args.dry_run,
@@ -87,6 +147,7 @@ def _handle_embed(args: argparse.Namespace) -> None:
         args.batch_size,
         args.workers,
         args.evaluate_path,
+        args.incremental,
     )
     if args.dry_run:
         # Preflight: expand, load, normalize, chunk; print content_type summary
@@ -163,6 +224,9 @@ def _handle_embed(args: argparse.Namespace) -> None:
             batch_size_override=args.batch_size,
             max_workers=args.workers,
             evaluate_path=args.evaluate_path,
+            incremental=args.incremental,
+            job_id=args.job_id,
+            resume=args.resume,
         )
     except Exception:
         logger.exception("Embed CLI failed unexpectedly")
@@ -174,6 +238,79 @@ def _handle_embed(args: argparse.Namespace) -> None:
     print(json.dumps(payload, indent=2, default=str))
 
 
+def _handle_vector_index(args: argparse.Namespace) -> None:
+    from backend.app.deps import settings
+    from backend.providers.oracle_vs.index_admin import (
+        build_vector_index_ddl,
+        ensure_metadata_indexes,
+        ensure_vector_index,
+        resolve_vector_index_config,
+    )
+
+    embeddings_cfg = settings.app.get("embeddings", {}) or {}
+    profile_name = args.profile or embeddings_cfg.get("active_profile")
+    profile_cfg = (embeddings_cfg.get("profiles") or {}).get(profile_name)
+    if not isinstance(profile_cfg, dict):
+        raise ValueError(f"Embedding profile '{profile_name}' not defined")
+    if args.domain_key:
+        domain_cfg = (embeddings_cfg.get("domains") or {}).get(args.domain_key)
+        if not isinstance(domain_cfg, dict) or not domain_cfg.get("index_name"):
+            raise ValueError(f"embeddings.domains.{args.domain_key}.index_name not configured")
+        index_name = domain_cfg["index_name"]
+    else:
+        index_name = profile_cfg.get("index_name")
+        if not index_name:
+            raise ValueError(f"Embedding profile '{profile_name}' missing index_name")
+    distance_metric = profile_cfg.get("distance_metric", "dot_product")
+    overrides = {
+        "type": args.index_type,
+        "target_accuracy": args.target_accuracy,
+        "neighbors": args.neighbors,
+        "efconstruction": args.efconstruction,
+        "neighbor_partitions": args.neighbor_partitions,
+        "parallel": args.parallel,
+    }
+    cfg = resolve_vector_index_config(embeddings_cfg, profile_name, args.domain_key, overrides)
+    logger.info(
+        "Vector index %s: table=%s metric=%s config=%s", args.action, index_name, distance_metric, cfg
+    )
+    if args.dry_run:
+        ddl = build_vector_index_ddl(index_name, distance_metric, cfg) if args.action != "drop" else None
+        print(json.dumps({"ok": True, "dry_run": True, "table": index_name, "ddl": ddl}, indent=2))
+        return
+
+    import oracledb  # type: ignore
+    from backend.providers.oci.vectorstore import connect_params
+
+    ovs = settings.providers["oraclevs"]
+    conn = oracledb.connect(**connect_params(ovs["dsn"], ovs["user"], ovs["password"]))
+    try:
+        result = ensure_vector_index(conn, index_name, distance_metric, cfg, action=args.action)
+        if args.metadata_indexes and args.action != "drop":
+            result["metadata_indexes"] = ensure_metadata_indexes(conn, index_name)["created"]
+    finally:
+        conn.close()
+    result["ok"] = True
+    print(json.dumps(result, indent=2, default=str))
+
+
+
+def _handle_assets_gc(args: argparse.Namespace) -> None:
+    from backend.ingest.asset_store import AssetStore, assets_root
+
+    root = Path(args.assets_dir).expanduser() if args.assets_dir else assets_root()
+    result = AssetStore(root).gc(
+        dry_run=args.dry_run,
+        min_age_seconds=args.min_age_seconds,
+        prune_missing_sources=args.prune_missing_sources,
+    )
+    result["assets_dir"] = str(root)
+    logger.info("Asset GC: %s", result)
+    print(json.dumps(result, indent=2, default=str))
+    if not result.get("ok"):
+        sys.exit(2)
+
+
 def main(argv: list[str] | None = None) -> None:
     _load_env()
     parser = _build_parser()
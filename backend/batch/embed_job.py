@@ -3,32 +3,56 @@
 from __future__ import annotations
 
 import argparse
+import array
 import glob
 import hashlib
 import json
 import logging
 import os
 import time
-from dataclasses import dataclass
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from backend.app import config as app_config
 from backend.app.deps import make_embeddings, settings as deps_settings
+from backend.batch.pipeline import batched, staged
+from backend.core.services.answer_cache import bump_index_epoch
 from backend.ingest.manifests.spec import validate_and_expand_manifest
 from backend.ingest.router import route_and_load
 from backend.ingest.normalizer import normalize_metadata
 from backend.ingest.chunking.char_chunker import chunk_text
 from backend.ingest.chunking.token_chunker import chunk_text_by_tokens
 from backend.ingest.chunking.structured_docx_chunker import chunk_structured_docx_items
-from backend.ingest.chunking.structured_pdf_chunker import chunk_structured_pdf_items
+from backend.ingest.chunking.structured_pdf_chunker import chunk_structured_pdf_items, iter_structured_pdf_chunks
 from backend.ingest.chunking.toc_section_docx_chunker import chunk_docx_toc_sections
+from backend.providers.oracle_vs.checkpoints import (
+    JobCheckpoint,
+    ensure_checkpoint_table,
+    manifest_fingerprint,
+    purge_expired_checkpoints,
+)
+from backend.providers.oracle_vs.doc_registry import (
+    DocumentRecord,
+    DocumentRegistry,
+    config_fingerprint,
+    ensure_registry_table,
+    file_sha256,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 PIPELINE_CHUNK_DEBUG = (os.getenv("PIPELINE_CHUNK_DEBUG") or "").lower() in {"1", "true", "on", "yes"}
 USE_TOC_SECTION_DOCX_CHUNKER = (os.getenv("USE_TOC_SECTION_DOCX_CHUNKER") or "").lower() in {"1", "true", "on", "yes"}
 CHUNKING_DIAGNOSTIC = (os.getenv("CHUNKING_DIAGNOSTIC") or "").lower() in {"1", "true", "on", "yes"}
+# Chunks per existing-hash lookup when dedupe streams ahead of embedding (Oracle IN-list limit).
+_DEDUPE_WINDOW = 1000
+# Chunks per piece handed downstream while a PDF is still being parsed page by page.
+_STREAM_PIECE_CHUNKS = 64
 
 
 # --- Sanitizer (optional import)
@@ -55,6 +79,14 @@ class EmbeddingJobSummary:
     token_limit_truncations: int = 0
     skipped_token_limit: int = 0
     embedding_summary: Optional[Dict[str, Any]] = None
+    # Chunks dropped by hash dedupe before any embedding call (duplicates within the job or
+    # already present in the target table).
+    skipped_before_embed: int = 0
+    # --incremental document counts (unchanged/changed/new/removed, written/purged, deleted_chunks)
+    incremental: Optional[Dict[str, Any]] = None
+    # Checkpoint key (pass to --resume) and chunks skipped because an earlier run committed them.
+    job_id: Optional[str] = None
+    resumed_chunks: int = 0
 
 
 def format_summary(summary: EmbeddingJobSummary) -> str:
@@ -62,7 +94,8 @@ def format_summary(summary: EmbeddingJobSummary) -> str:
 
     base = (
         f"docs={summary.docs} chunks={summary.chunks} inserted={summary.inserted} "
-        f"skipped={summary.skipped} errors={summary.errors} dry_run={summary.dry_run}"
+        f"skipped={summary.skipped} skipped_before_embed={summary.skipped_before_embed} "
+        f"errors={summary.errors} dry_run={summary.dry_run}"
     )
     if summary.evaluation and isinstance(summary.evaluation, dict):
         hit_rate = summary.evaluation.get("hit_rate")
@@ -85,6 +118,32 @@ def format_summary(summary: EmbeddingJobSummary) -> str:
             f" skipped={emb.get('skipped')}"
             f" failed_batches={emb.get('failed_batches')}"
         )
+        cache = emb.get("cache") or {}
+        if cache.get("enabled"):
+            base += f" cache_hits={cache.get('hits')} cache_misses={cache.get('misses')} cache_hit_rate={cache.get('hit_rate')}"
+        batching = emb.get("batching") or {}
+        if batching.get("batches"):
+            base += (
+                f" requests={batching.get('batches')} avg_items={batching.get('avg_items')}"
+                f" avg_tokens={batching.get('avg_tokens')} fill_ratio={batching.get('fill_ratio')}"
+            )
+        rate = emb.get("rate_control") or {}
+        if rate.get("enabled"):
+            base += (
+                f" rate_per_min={rate.get('rate_per_min')} concurrency={rate.get('concurrency')}"
+                f" throttled={rate.get('throttled')}"
+            )
+    if summary.resumed_chunks:
+        base += f" resumed_chunks={summary.resumed_chunks}"
+    if summary.job_id:
+        base += f" job_id={summary.job_id}"
+    if summary.incremental:
+        inc = summary.incremental
+        base += (
+            " Incremental"
+            f" unchanged={inc.get('unchanged')} changed={inc.get('changed')} new={inc.get('new')}"
+            f" removed={inc.get('removed')} deleted_chunks={inc.get('deleted_chunks')}"
+        )
     return base
 
 PDF_EXTENSIONS = {".pdf"}
@@ -140,10 +199,22 @@ def _lazy_import_oracledb():
     return oracledb
 
 
+UPSERT_DEFAULTS: Dict[str, Any] = {
+    # "bulk": executemany with array binds and native VECTOR values; "row": one INSERT per chunk.
+    "mode": "bulk",
+    "array_size": 500,
+    "commit_every": 2000,
+}
+# Longest string (in bytes) bound as a plain VARCHAR; larger TEXT/METADATA values go as LONG.
+_MAX_VARCHAR_BIND_BYTES = 4000
+# Oracle's limit on expressions in an IN list.
+_MAX_IN_LIST = 1000
+
+
 class OracleVSUpserter:
     """Light wrapper for inserting vectors into Oracle."""
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> None:
         self._table = config["table"]
         self._config = {
             "dsn": config["dsn"],
@@ -151,6 +222,19 @@ class OracleVSUpserter:
             "password": config["password"],
         }
         self._conn = None
+        opts = dict(UPSERT_DEFAULTS)
+        opts.update({k: v for k, v in (options or {}).items() if v is not None})
+        self._mode = str(opts["mode"]).lower()
+        if self._mode not in ("bulk", "row"):
+            raise ValueError(f"embeddings.upsert.mode must be 'bulk' or 'row', got {self._mode!r}")
+        self._array_size = max(1, int(opts["array_size"]))
+        self._commit_every = max(1, int(opts["commit_every"]))
+        self._uncommitted = 0
+        # Set inside transaction(): periodic commits are held back until the block ends.
+        self._in_transaction = False
+        # Optional JobCheckpoint; written chunk ids are recorded before each commit.
+        self._checkpoint = None
+        self.batch_errors = 0
 
     def _get_connection(self):
         if self._conn is not None:
@@ -177,6 +261,10 @@ class OracleVSUpserter:
         """Force writes to the given physical table (e.g., MY_DEMO_V1)."""
         self._table = table_name
 
+    def attach_checkpoint(self, checkpoint) -> None:
+        """Record every inserted chunk id in ``checkpoint`` within the inserting transaction."""
+        self._checkpoint = checkpoint
+
     def upsert_vectors(
         self,
         vectors: Iterable[Dict[str, Any]],
@@ -185,15 +273,130 @@ class OracleVSUpserter:
     ) -> Tuple[int, int]:
         """Insert vectors into Oracle, skipping duplicates when requested."""
 
-        inserted = 0
-        skipped = 0
-
         if dry_run:
+            skipped = 0
             for vector in vectors:
                 hash_norm = vector["metadata"].get("hash_norm")
                 skipped += 1 if dedupe and hash_norm else 0
-            return inserted, skipped
+            return 0, skipped
+        if self._mode == "bulk":
+            return self._upsert_bulk(list(vectors), dedupe)
+        return self._upsert_rows(vectors, dedupe)
+
+    def flush(self) -> None:
+        """Commit rows still pending from bulk writes (call once the job has written everything)."""
+        if self._conn is not None and self._uncommitted:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    @contextmanager
+    def transaction(self):
+        """Run the block's writes as one transaction: commit on success, roll back on error."""
+        conn = self._get_connection()
+        self.flush()
+        self._in_transaction = True
+        try:
+            yield conn
+            conn.commit()
+            self._uncommitted = 0
+        except Exception:
+            conn.rollback()
+            self._uncommitted = 0
+            raise
+        finally:
+            self._in_transaction = False
+
+    def fetch_existing_hashes(self, hashes: Iterable[str], exclude_doc_ids: Iterable[str] = ()) -> set:
+        """Return the subset of ``hashes`` already stored in the target table.
+
+        Rows of ``exclude_doc_ids`` are ignored (documents about to be rewritten).
+        """
+        unique = sorted({h for h in hashes if h})
+        if not unique:
+            return set()
+        with self._get_connection().cursor() as cur:
+            return self._existing_hashes(cur, unique, sorted(set(exclude_doc_ids)))
+
+    def _existing_hashes(self, cur, hashes: List[str], exclude_doc_ids: Sequence[str] = ()) -> set:
+        found: set = set()
+        for start in range(0, len(hashes), _MAX_IN_LIST):
+            chunk = hashes[start : start + _MAX_IN_LIST]
+            binds = ", ".join(f":{i + 1}" for i in range(len(chunk)))
+            sql = f"SELECT HASH_NORM FROM {self._table} WHERE HASH_NORM IN ({binds})"
+            # Positional binds continue after the hashes, one NOT IN list per 1000 doc ids.
+            pos = len(chunk)
+            for x_start in range(0, len(exclude_doc_ids), _MAX_IN_LIST):
+                x_chunk = exclude_doc_ids[x_start : x_start + _MAX_IN_LIST]
+                x_binds = ", ".join(f":{pos + i + 1}" for i in range(len(x_chunk)))
+                sql += f" AND NVL(JSON_VALUE(METADATA, '$.doc_id'), '#') NOT IN ({x_binds})"
+                pos += len(x_chunk)
+            cur.execute(sql, list(chunk) + list(exclude_doc_ids))
+            found.update(row[0] for row in cur.fetchall())
+        return found
+
+    def _upsert_bulk(self, vectors: List[Dict[str, Any]], dedupe: bool) -> Tuple[int, int]:
+        inserted = 0
+        skipped = 0
+        conn = self._get_connection()
+        oracledb = _lazy_import_oracledb()
+        with conn.cursor() as cur:
+            if dedupe:
+                hashes = sorted({v["metadata"].get("hash_norm") for v in vectors if v["metadata"].get("hash_norm")})
+                seen = self._existing_hashes(cur, hashes) if hashes else set()
+            rows: List[Tuple[Any, ...]] = []
+            row_chunk_ids: List[Optional[str]] = []
+            for vector in vectors:
+                meta = dict(vector["metadata"])
+                hash_norm = meta.get("hash_norm")
+                if dedupe and hash_norm:
+                    if hash_norm in seen:
+                        skipped += 1
+                        continue
+                    seen.add(hash_norm)
+                metric = (meta.get("distance_metric") or "dot_product").lower()
+                row_chunk_ids.append(meta.get("chunk_id"))
+                rows.append(
+                    (
+                        vector["text"],
+                        json.dumps(meta, ensure_ascii=False, separators=(",", ":")),
+                        array.array("f", vector.get("embedding") or []),
+                        hash_norm,
+                        metric,
+                    )
+                )
+            sql = (
+                f"INSERT INTO {self._table} (ID, TEXT, METADATA, EMBEDDING, HASH_NORM, DISTANCE_METRIC) "
+                f"VALUES (SYS_GUID(), :1, :2, :3, :4, :5)"
+            )
+            for start in range(0, len(rows), self._array_size):
+                chunk = rows[start : start + self._array_size]
+                longest = max(max(len(r[0].encode("utf-8")), len(r[1].encode("utf-8"))) for r in chunk)
+                str_type = oracledb.DB_TYPE_LONG if longest > _MAX_VARCHAR_BIND_BYTES else None
+                cur.setinputsizes(str_type, str_type, oracledb.DB_TYPE_VECTOR, None, None)
+                cur.executemany(sql, chunk, batcherrors=True)
+                errors = cur.getbatcherrors()
+                for err in errors[:5]:
+                    logger.warning("Bulk insert row %d failed: %s", start + err.offset, err.message)
+                if errors:
+                    logger.warning("Bulk insert: %d/%d rows failed in array of %d", len(errors), len(chunk), len(chunk))
+                self.batch_errors += len(errors)
+                if self._checkpoint is not None:
+                    failed_offsets = {err.offset for err in errors}
+                    self._checkpoint.record(
+                        conn,
+                        (cid for i, cid in enumerate(row_chunk_ids[start : start + len(chunk)]) if i not in failed_offsets),
+                    )
+                inserted += len(chunk) - len(errors)
+                self._uncommitted += len(chunk) - len(errors)
+                if self._uncommitted >= self._commit_every and not self._in_transaction:
+                    conn.commit()
+                    self._uncommitted = 0
+        return inserted, skipped
 
+    def _upsert_rows(self, vectors: Iterable[Dict[str, Any]], dedupe: bool) -> Tuple[int, int]:
+        inserted = 0
+        skipped = 0
+        written_chunk_ids: List[Optional[str]] = []
         conn = self._get_connection()
         with conn.cursor() as cur:
             oracledb = _lazy_import_oracledb()
@@ -244,7 +447,11 @@ class OracleVSUpserter:
                     binds,
                 )
                 inserted += 1
-            self._conn.commit()
+                written_chunk_ids.append(meta.get("chunk_id"))
+            if self._checkpoint is not None:
+                self._checkpoint.record(conn, written_chunk_ids)
+            if not self._in_transaction:
+                self._conn.commit()
         return inserted, skipped
 
 
@@ -572,6 +779,695 @@ def _evaluate_golden_queries(golden_path: Path, alias_name: str) -> Dict[str, An
     }
 
 
+def _dedupe_before_embed(
+    vector_buffer: List[Dict[str, Any]],
+    existing_hashes: Optional[set] = None,
+    seen: Optional[set] = None,
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Drop chunks whose ``hash_norm`` repeats within the job or already exists in the table.
+
+    Returns ``(kept, duplicates_in_job, already_stored)``; chunks without a hash are kept.
+    Pass the same ``seen`` set across calls to dedupe a job that arrives in windows.
+    """
+    existing = existing_hashes or set()
+    seen = set() if seen is None else seen
+    kept: List[Dict[str, Any]] = []
+    dup_in_job = 0
+    already_stored = 0
+    for item in vector_buffer:
+        hash_norm = item["metadata"].get("hash_norm")
+        if hash_norm:
+            if hash_norm in existing:
+                already_stored += 1
+                continue
+            if hash_norm in seen:
+                dup_in_job += 1
+                continue
+            seen.add(hash_norm)
+        kept.append(item)
+    return kept, dup_in_job, already_stored
+
+
+def _embed_one_batch(embedder, texts: List[str]) -> Tuple[List[List[float]], List[int], bool]:
+    """Embed one batch; returns (vectors, index_map, failed). Never raises."""
+    try:
+        embeddings_result = embedder.embed_documents(texts, input_type="search_document")
+    except Exception:
+        logger.exception("Embedding job crashed at adapter level")
+        return [], [], bool(texts)
+    if isinstance(embeddings_result, tuple) and len(embeddings_result) == 2:
+        ok_vecs = list(embeddings_result[0] or [])
+        raw_map = embeddings_result[1]
+        if isinstance(raw_map, dict):
+            out_map = [raw_map[k] for k in sorted(raw_map.keys())]
+        elif isinstance(raw_map, list):
+            out_map = list(raw_map)
+        else:
+            out_map = list(range(len(ok_vecs)))
+    else:
+        ok_vecs = list(embeddings_result or [])
+        out_map = list(range(len(ok_vecs)))
+    return ok_vecs, out_map, False
+
+
+def _embed_batches_concurrently(
+    embedder,
+    vector_buffer: Iterable[Dict[str, Any]],
+    batch_size: int,
+    workers: int,
+    keep_order: bool = False,
+) -> Iterator[Tuple[int, List[Dict[str, Any]], List[int], Tuple[List[List[float]], List[int], bool]]]:
+    """Yield ``(batch_no, batch, non_empty_idx, (vectors, index_map, failed))`` in batch order.
+
+    ``vector_buffer`` may be a lazy stream; it is only pulled as embedding slots free up. Up
+    to ``workers`` batches are embedded at once; at most ``2 * workers`` results are held in
+    memory waiting for the writer. Batches with no non-empty text are skipped.
+
+    Embedders with ``iter_batches`` (the OCI adapter) cut the stream into request-sized
+    batches by their token/byte budget; others get fixed ``batch_size`` batches. With
+    ``keep_order`` they keep the stream order instead of sorting by length, so chunks of one
+    document stay together (the incremental writer relies on that).
+    """
+    workers = max(1, int(workers))
+    pending: Deque[Tuple[int, List[Dict[str, Any]], List[int], Future]] = deque()
+    pack = getattr(embedder, "iter_batches", None)
+    if callable(pack):
+        pack_kwargs = {"keep_order": True} if keep_order else {}
+        source = pack(vector_buffer, lambda item: item.get("text") or "", **pack_kwargs)
+    else:
+        source = batched(vector_buffer, batch_size)
+
+    def _batches():
+        for batch_no, batch in enumerate(source, start=1):
+            # Filter out empty/whitespace-only texts to avoid OCI 400 errors
+            non_empty_idx = [i for i, item in enumerate(batch) if (item.get("text") or "").strip()]
+            if non_empty_idx:
+                yield batch_no, batch, non_empty_idx
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+        for batch_no, batch, non_empty_idx in _batches():
+            texts = [batch[i]["text"] for i in non_empty_idx]
+            pending.append((batch_no, batch, non_empty_idx, pool.submit(_embed_one_batch, embedder, texts)))
+            if len(pending) >= workers * 2:
+                done_no, done_batch, done_idx, future = pending.popleft()
+                yield done_no, done_batch, done_idx, future.result()
+        while pending:
+            done_no, done_batch, done_idx, future = pending.popleft()
+            yield done_no, done_batch, done_idx, future.result()
+
+
+@dataclass(frozen=True)
+class _ChunkingContext:
+    """Picklable job settings needed to chunk one file (shipped to parse workers)."""
+
+    profile_name: str
+    index_name: str
+    profile_cfg: Dict[str, Any]
+    dedupe_enabled: bool
+
+
+@dataclass
+class _ParsedFile:
+    """One manifest file moving through load -> prepare -> chunk, plus its counters."""
+
+    filepath: str
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+    # Positions in ``chunks`` whose ids take the job-wide sequence (structured chunkers); the
+    # ids are file-local (``<doc>_chunk_<pos+1>``) until _assign_job_chunk_ids shifts them.
+    sequenced: List[int] = field(default_factory=list)
+    content_counts: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    failed: bool = False
+    # Thread path only: lazily loaded items of a PDF chunked page by page (_iter_chunked_file).
+    pages: Optional[Iterator[Dict[str, Any]]] = None
+    # Set on every piece of a streamed file but the first, so the file counts as one document.
+    continued: bool = False
+
+
+def _content_type_key(content_type: Any) -> Optional[str]:
+    low = str(content_type or "").lower()
+    if "pdf" in low:
+        return "pdf"
+    if "presentation" in low or "ppt" in low:
+        return "pptx"
+    if "spreadsheet" in low or "xlsx" in low:
+        return "xlsx"
+    if "html" in low:
+        return "html"
+    if "wordprocessingml" in low or "docx" in low:
+        return "docx"
+    if "plain" in low or "markdown" in low or "txt" in low:
+        return "txt"
+    return None
+
+
+def _strip_repeated_doc_title_prefix(chunks_in: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], str | None]:
+    if len(chunks_in) < 2:
+        return chunks_in, None
+    first_lines: List[str] = []
+    for ch in chunks_in:
+        lines = (ch.get("text") or "").splitlines()
+        if not lines or not lines[0].strip():
+            return chunks_in, None
+        first_lines.append(lines[0].strip())
+    candidate = first_lines[0]
+    if not all(fl == candidate for fl in first_lines):
+        return chunks_in, None
+    cleaned: List[Dict[str, Any]] = []
+    for idx, ch in enumerate(chunks_in):
+        lines = (ch.get("text") or "").splitlines()
+        body = "\n".join(lines[1:]).strip()
+        meta = dict(ch.get("metadata") or {})
+        meta["doc_title"] = candidate
+        cleaned.append({"text": body if idx > 0 else ch.get("text") or "", "metadata": meta})
+    return cleaned, candidate
+
+
+def _streams_pages(filepath: str, ctx: _ChunkingContext) -> bool:
+    """PDFs chunked by structured_pdf can be loaded and chunked as a page stream."""
+    chunker_cfg = ctx.profile_cfg.get("chunker", {}) or {}
+    return (chunker_cfg.get("type") or "char").lower() == "structured_pdf" and Path(filepath).suffix.lower() == ".pdf"
+
+
+def _load_file(filepath: str, stream: bool = False) -> _ParsedFile:
+    parsed = _ParsedFile(filepath=filepath)
+    try:
+        if stream:
+            # Local import: pdfplumber is only needed once a PDF shows up.
+            from backend.ingest.loaders import pdf_loader
+
+            # Nothing is read yet; pages load as _iter_chunked_file pulls them.
+            parsed.pages = pdf_loader.iter_load(filepath)
+        else:
+            parsed.items = route_and_load(filepath)
+    except Exception as exc:  # noqa: BLE001
+        parsed.errors += 1
+        parsed.failed = True
+        logger.exception("Failed to load %s: %s", filepath, exc)
+    return parsed
+
+
+def _prepare_file(parsed: _ParsedFile) -> _ParsedFile:
+    """Normalize metadata, clean and sanitize every loaded item of one file (lazily if streamed)."""
+    if parsed.failed:
+        return parsed
+    if parsed.pages is not None:
+        parsed.pages = _iter_prepared_items(parsed, parsed.pages)
+    else:
+        parsed.items = list(_iter_prepared_items(parsed, parsed.items))
+    return parsed
+
+
+def _iter_prepared_items(parsed: _ParsedFile, items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    # Cleaning before sanitization
+    from backend.ingest.text_cleaner import clean_text  # local import to avoid startup cost elsewhere
+
+    filepath = parsed.filepath
+    doc_id_base = Path(filepath).stem
+    for item_idx, raw_item in enumerate(items, start=1):
+        try:
+            norm = normalize_metadata(raw_item)
+        except Exception as exc:  # noqa: BLE001
+            parsed.errors += 1
+            logger.warning("Invalid metadata for %s item %d: %s", filepath, item_idx, exc)
+            continue
+
+        preserve = False
+        ctype_for_clean = str(norm["metadata"].get("content_type", "")).lower()
+        if "spreadsheet" in ctype_for_clean or "xlsx" in ctype_for_clean:
+            preserve = True
+        text = clean_text(norm.get("text") or "", preserve_tables=preserve)
+        if not text:
+            continue
+
+        # Sanitization per item
+        if sanitize_if_enabled is not None:
+            try:
+                text, _san_counts = sanitize_if_enabled(text, doc_id_base)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Sanitizer failed for %s (%s); continuing without changes", filepath, exc)
+            else:
+                if _san_counts:
+                    print(f"[sanitizer:{os.path.basename(filepath)}] {_san_counts}")
+
+        norm["text"] = text
+        yield norm
+
+
+def _chunk_file(parsed: _ParsedFile, ctx: _ChunkingContext) -> _ParsedFile:
+    """Chunk the prepared items of one file; a chunker failure only drops this file."""
+    if parsed.failed:
+        return parsed
+    try:
+        _chunk_items(parsed, ctx)
+    except Exception as exc:  # noqa: BLE001
+        parsed.errors += 1
+        parsed.failed = True
+        parsed.chunks, parsed.sequenced, parsed.content_counts = [], [], {}
+        logger.exception("Failed to chunk %s: %s", parsed.filepath, exc)
+    # Items are no longer needed; keep what crosses the process boundary small.
+    parsed.items = []
+    return parsed
+
+
+def _append_chunks(
+    parsed: _ParsedFile,
+    chunks_in: Iterable[Dict[str, Any]],
+    base_ct: str,
+    ctx: _ChunkingContext,
+    local_idx_to_chunk_id: Dict[int, str],
+) -> int:
+    """Add structured chunker output to ``parsed`` with sequenced (job-wide) chunk ids."""
+    doc_id_base = Path(parsed.filepath).stem
+    content_counts = parsed.content_counts
+    file_chunks = parsed.chunks
+    appended = 0
+    for chunk in chunks_in:
+        ctext = (chunk.get("text") or "").strip()
+        if not ctext:
+            continue
+        cmeta_raw = dict(chunk.get("metadata") or {})
+        ct_key_local = _content_type_key(cmeta_raw.get("content_type") or base_ct) or base_ct
+        if ct_key_local:
+            content_counts[ct_key_local] = content_counts.get(ct_key_local, 0) + 1
+
+        # File-local sequence; shifted to the job-wide one in _assign_job_chunk_ids
+        chunk_id = f"{doc_id_base}_chunk_{len(file_chunks) + 1}"
+        local_idx = cmeta_raw.get("chunk_local_index") if isinstance(cmeta_raw.get("chunk_local_index"), int) else None
+        meta_out = dict(cmeta_raw)
+        meta_out.update(
+            {
+                "doc_id": doc_id_base,
+                "chunk_id": chunk_id,
+                "profile": ctx.profile_name,
+                "index_name": ctx.index_name,
+                "distance_metric": ctx.profile_cfg.get("distance_metric", "dot_product"),
+            }
+        )
+        if local_idx is not None and (meta_out.get("chunk_type") or "text") != "figure":
+            local_idx_to_chunk_id[local_idx] = chunk_id
+        parent_local_idx = meta_out.get("parent_chunk_local_index") or cmeta_raw.get("parent_chunk_local_index")
+        if parent_local_idx and parent_local_idx in local_idx_to_chunk_id:
+            meta_out["parent_chunk_id"] = local_idx_to_chunk_id[parent_local_idx]
+        if ctx.dedupe_enabled:
+            meta_out["hash_norm"] = _hash_normalize(ctext)
+        parsed.sequenced.append(len(file_chunks))
+        file_chunks.append({"text": ctext, "metadata": meta_out})
+        appended += 1
+    return appended
+
+
+def _chunk_items(parsed: _ParsedFile, ctx: _ChunkingContext) -> None:
+    profile_cfg = ctx.profile_cfg
+    chunker_cfg = profile_cfg.get("chunker", {}) or {}
+    chunker_type = (chunker_cfg.get("type") or "char").lower()
+    effective_max = _effective_max_tokens(chunker_cfg, profile_cfg)
+    doc_id_base = Path(parsed.filepath).stem
+    normalized_items = parsed.items
+    content_counts = parsed.content_counts
+    file_chunks = parsed.chunks
+    local_idx_to_chunk_id: Dict[int, str] = {}
+
+    handled_indices: set[int] = set()
+
+    # Structured chunking branches
+    if chunker_type == "structured_pdf":
+        pdf_items = [
+            it
+            for it in normalized_items
+            if "pdf" in str(it["metadata"].get("content_type", "")).lower()
+        ]
+        if pdf_items:
+            struct_chunks = chunk_structured_pdf_items(pdf_items, chunker_cfg, effective_max)
+            if PIPELINE_CHUNK_DEBUG:
+                logger.info(
+                    "PIPELINE_CHUNK_DEBUG structured_pdf items=%d chunks=%d",
+                    len(pdf_items),
+                    len(struct_chunks or []),
+                )
+            _append_chunks(parsed, struct_chunks, "pdf", ctx, local_idx_to_chunk_id)
+            handled_indices.update({id(it) for it in pdf_items})
+
+    if chunker_type == "structured_docx":
+        docx_items = [
+            it
+            for it in normalized_items
+            if (
+                "wordprocessingml" in str(it["metadata"].get("content_type", "")).lower()
+                or "docx" in str(it["metadata"].get("content_type", "")).lower()
+            )
+        ]
+        if docx_items:
+            if USE_TOC_SECTION_DOCX_CHUNKER:
+                toc_cfg = dict(chunker_cfg or {})
+                toc_cfg["effective_max_tokens"] = effective_max
+                struct_chunks = chunk_docx_toc_sections(docx_items, cfg=toc_cfg, source_meta={})
+                if PIPELINE_CHUNK_DEBUG:
+                    logger.info(
+                        "PIPELINE_CHUNK_DEBUG structured_docx items=%d chunks=%d DOCX chunker selected: toc_section_docx_chunker",
+                        len(docx_items),
+                        len(struct_chunks or []),
+                    )
+            else:
+                struct_chunks = chunk_structured_docx_items(docx_items, chunker_cfg, effective_max)
+                if PIPELINE_CHUNK_DEBUG:
+                    logger.info(
+                        "PIPELINE_CHUNK_DEBUG structured_docx items=%d chunks=%d DOCX chunker selected: structured_docx_chunker",
+                        len(docx_items),
+                        len(struct_chunks or []),
+                    )
+            doc_title_removed = None
+            if struct_chunks:
+                struct_chunks, doc_title_removed = _strip_repeated_doc_title_prefix(struct_chunks)
+            if PIPELINE_CHUNK_DEBUG:
+                if doc_title_removed:
+                    logger.info("PIPELINE_CHUNK_DEBUG docx doc_title prefix removed from chunks: %s", doc_title_removed)
+                else:
+                    logger.info("PIPELINE_CHUNK_DEBUG docx doc_title prefix not applied to chunks")
+            _append_chunks(parsed, struct_chunks, "docx", ctx, local_idx_to_chunk_id)
+            handled_indices.update({id(it) for it in docx_items})
+
+    # Fallback to existing fixed chunking for remaining items
+    for item_idx, norm in enumerate(normalized_items, start=1):
+        if id(norm) in handled_indices:
+            continue
+        meta = dict(norm["metadata"])
+        text = norm.get("text") or ""
+        chunks_text: List[str] = []
+        if chunker_type == "tokens":
+            max_tokens = int(chunker_cfg.get("size", 900) or 900)
+            ov = float(chunker_cfg.get("overlap", 0.15) or 0.0)
+            chunks_text = chunk_text_by_tokens(text, max_tokens=max_tokens, overlap=ov)
+        else:
+            size = int(chunker_cfg.get("size", 2000) or 2000)
+            ov = int(chunker_cfg.get("overlap", 100) or 0)
+            chunks_text = chunk_text(text, size=size, overlap=ov)
+
+        ct_key = _content_type_key(meta.get("content_type")) if isinstance(meta.get("content_type"), str) else None
+        if ct_key:
+            content_counts[ct_key] = content_counts.get(ct_key, 0) + len(chunks_text)
+
+        for idx, ctext in enumerate(chunks_text, start=1):
+            chunk_id = f"{doc_id_base}_chunk_{item_idx}_{idx}"
+            meta_out = dict(meta)
+            meta_out.update(
+                {
+                    "doc_id": doc_id_base,
+                    "chunk_id": chunk_id,
+                    "profile": ctx.profile_name,
+                    "index_name": ctx.index_name,
+                    "distance_metric": profile_cfg.get("distance_metric", "dot_product"),
+                }
+            )
+            if ctx.dedupe_enabled:
+                meta_out["hash_norm"] = _hash_normalize(ctext)
+            file_chunks.append({"text": ctext, "metadata": meta_out})
+
+
+def _iter_chunked_file(parsed: _ParsedFile, ctx: _ChunkingContext) -> Iterator[_ParsedFile]:
+    """Chunk stage of the thread path: one result per file, or pieces of a streamed PDF.
+
+    A streamed PDF is loaded, prepared and chunked page by page here, so its first chunks
+    reach the embedders while later pages are still being parsed. Each piece numbers its
+    chunks from 1, so _assign_job_chunk_ids continues the job sequence across pieces. A
+    failure mid-file ends it with a failed piece; chunks already handed on stay in the job
+    (incremental jobs keep the document's previous version instead).
+    """
+    if parsed.failed or parsed.pages is None:
+        yield _chunk_file(parsed, ctx)
+        return
+    profile_cfg = ctx.profile_cfg
+    chunker_cfg = profile_cfg.get("chunker", {}) or {}
+    effective_max = _effective_max_tokens(chunker_cfg, profile_cfg)
+    piece = _ParsedFile(filepath=parsed.filepath)
+    streamed = 0
+    try:
+        chunks = iter_structured_pdf_chunks(parsed.pages, chunker_cfg, effective_max)
+        for window in batched(chunks, _STREAM_PIECE_CHUNKS):
+            streamed += _append_chunks(piece, window, "pdf", ctx, {})
+            # Items dropped while preparing are reported with the piece they were read for.
+            piece.errors, parsed.errors = parsed.errors, 0
+            yield piece
+            piece = _ParsedFile(filepath=parsed.filepath, continued=True)
+    except Exception as exc:  # noqa: BLE001
+        piece.errors += 1
+        piece.failed = True
+        logger.exception("Failed to load or chunk %s: %s", parsed.filepath, exc)
+    if PIPELINE_CHUNK_DEBUG:
+        logger.info("PIPELINE_CHUNK_DEBUG structured_pdf streamed chunks=%d", streamed)
+    piece.errors += parsed.errors
+    parsed.pages = None
+    yield piece
+
+
+def _parse_and_chunk_file(filepath: str, ctx: _ChunkingContext) -> _ParsedFile:
+    """load -> prepare -> chunk for one file; runs inside a parse worker process."""
+    return _chunk_file(_prepare_file(_load_file(filepath)), ctx)
+
+
+def _assign_job_chunk_ids(parsed: _ParsedFile, offset: int) -> None:
+    """Shift structured chunk ids (and parent links to them) by the chunks of earlier files."""
+    if not offset or not parsed.sequenced:
+        return
+    doc_id_base = Path(parsed.filepath).stem
+    renamed: Dict[str, str] = {}
+    for pos in parsed.sequenced:
+        meta = parsed.chunks[pos]["metadata"]
+        new_id = f"{doc_id_base}_chunk_{offset + pos + 1}"
+        renamed[meta["chunk_id"]] = new_id
+        meta["chunk_id"] = new_id
+    for chunk in parsed.chunks:
+        parent = chunk["metadata"].get("parent_chunk_id")
+        if parent in renamed:
+            chunk["metadata"]["parent_chunk_id"] = renamed[parent]
+
+
+def _parse_files_in_processes(
+    files: Iterable[str],
+    ctx: _ChunkingContext,
+    workers: int,
+) -> Iterator[_ParsedFile]:
+    """Parse and chunk ``files`` in a process pool, yielding results in manifest order.
+
+    At most ``2 * workers`` files are in flight. A worker crash (or an unpicklable result)
+    is reported as an error on that file only.
+    """
+    pending: Deque[Tuple[str, Future]] = deque()
+
+    def _result(filepath: str, future: Future) -> _ParsedFile:
+        try:
+            return future.result()
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Parse worker failed on %s: %s", filepath, exc)
+            return _ParsedFile(filepath=filepath, errors=1, failed=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for filepath in files:
+            pending.append((filepath, pool.submit(_parse_and_chunk_file, filepath, ctx)))
+            if len(pending) >= workers * 2:
+                yield _result(*pending.popleft())
+        while pending:
+            yield _result(*pending.popleft())
+
+
+# Transient per-chunk key (manifest path) that groups streamed chunks by document in
+# incremental jobs; the upserter only reads text/metadata/embedding.
+_DOC_KEY = "_doc"
+
+
+def _env_setting(name: str, default: str) -> str:
+    return (os.getenv(name) or default).strip().lower()
+
+
+def _loader_settings(streams_pdf: bool) -> Dict[str, Any]:
+    """Effective loader settings (the loaders' env knobs and defaults) that shape chunks."""
+    truthy = {"1", "true", "yes", "on", "y", "t"}
+    return {
+        "pdf_ocr": [
+            _env_setting("PDF_OCR_MODE", "auto"),
+            _env_setting("PDF_OCR_LANGS", "eng"),
+            _env_setting("PDF_OCR_PAGE_LIMIT", "0"),
+            _env_setting("PDF_OCR_MIN_TEXT_CHARS", "50"),
+        ],
+        # Only the threaded path streams PDFs, cleaning them per window of pages.
+        "pdf_stream_window": _env_setting("PDF_STREAM_WINDOW", "50") if streams_pdf else None,
+        "docx_parser": "lxml" if _env_setting("DOCX_PARSER", "") == "lxml" else "python-docx",
+        "docx_figures": [
+            _env_setting(name, "") in truthy
+            for name in ("DOCX_EXTRACT_IMAGES", "DOCX_INLINE_FIGURE_PLACEHOLDERS", "DOCX_FIGURE_CHUNKS")
+        ],
+        "xlsx": [_env_setting("XLSX_ROW_GROUP_MAX_TOKENS", "400"), _env_setting("XLSX_HEADER_ROWS", "1")],
+    }
+
+
+def _sanitizer_settings() -> Dict[str, Any]:
+    """Sanitizer settings that change chunk text; off and shadow modes leave it untouched."""
+    if sanitize_if_enabled is None:
+        return {"enabled": "unavailable"}
+    from backend.common import sanitizer
+
+    if sanitizer.SAN_ENABLED != "on":
+        return {"enabled": sanitizer.SAN_ENABLED}
+    patterns = Path(sanitizer.SAN_CFG_DIR) / f"{sanitizer.SAN_PROFILE}.patterns.json"
+    try:
+        patterns_sha = file_sha256(str(patterns))
+    except OSError:
+        patterns_sha = None
+    return {
+        "enabled": "on",
+        "profile": sanitizer.SAN_PROFILE,
+        "patterns_sha256": patterns_sha,
+        "placeholder_mode": sanitizer.SAN_MODE,
+        # Pseudonyms hash with the salt; only its digest goes into the fingerprint.
+        "salt_sha256": hashlib.sha256(sanitizer.SAN_SALT.encode("utf-8")).hexdigest()
+        if sanitizer.SAN_MODE == "pseudonym"
+        else None,
+    }
+
+
+def _plan_incremental(
+    files: Sequence[str],
+    known: Dict[str, DocumentRecord],
+    fingerprint: str,
+) -> Tuple[List[str], Dict[str, DocumentRecord], int, List[DocumentRecord]]:
+    """Compare the manifest with the registry.
+
+    Returns ``(changed_files, plans, unchanged, removed)``: files that need (re)writing, the
+    registry record each will get, the number skipped as unchanged, and registry records of
+    documents no longer in the manifest.
+    """
+    changed: List[str] = []
+    plans: Dict[str, DocumentRecord] = {}
+    unchanged = 0
+    manifest_doc_ids = set()
+    for filepath in files:
+        doc_id = Path(filepath).stem
+        manifest_doc_ids.add(doc_id)
+        sha = file_sha256(filepath)
+        prev = known.get(doc_id)
+        if prev and prev.file_sha256 == sha and prev.config_fingerprint == fingerprint:
+            unchanged += 1
+            continue
+        plans[filepath] = DocumentRecord(
+            doc_id=doc_id, source=filepath, file_sha256=sha, config_fingerprint=fingerprint
+        )
+        changed.append(filepath)
+    removed = [rec for doc_id, rec in known.items() if doc_id not in manifest_doc_ids]
+    return changed, plans, unchanged, removed
+
+
+class _IncrementalWriter:
+    """Writes each changed document in one transaction: delete its previous chunks, insert
+    the new ones and update its registry row.
+
+    Chunks arrive in manifest order, so a document is complete once a chunk of the next one
+    (or the end of the stream) shows up. Documents that failed to load, chunk or embed keep
+    their previous chunks and registry row, so the next incremental run retries them.
+    """
+
+    def __init__(
+        self,
+        registry: DocumentRegistry,
+        upserter: OracleVSUpserter,
+        plans: Dict[str, DocumentRecord],
+        previous: Dict[str, DocumentRecord],
+        table_ready: bool,
+    ) -> None:
+        self._registry = registry
+        self._upserter = upserter
+        self._plans = plans
+        self._previous = previous
+        self.table_ready = table_ready
+        self._current: Optional[str] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._failed: set = set()
+        self._done: set = set()
+        self.inserted = 0
+        self.deleted_chunks = 0
+        self.docs_written = 0
+        self.docs_purged = 0
+        self.errors = 0
+
+    @property
+    def rewritten_doc_ids(self) -> List[str]:
+        return [plan.doc_id for plan in self._plans.values()]
+
+    def mark_failed(self, filepath: str) -> None:
+        self._failed.add(filepath)
+
+    def consume(self, batch: List[Dict[str, Any]], failed: bool) -> None:
+        for item in batch:
+            doc = item.get(_DOC_KEY)
+            if doc != self._current:
+                self._finish_current()
+                self._current = doc
+            if failed:
+                self._failed.add(doc)
+            vector = item.get("embedding")
+            if isinstance(vector, list) and vector:
+                self._pending.append(item)
+
+    def close(self) -> None:
+        self._finish_current()
+        # Documents that produced no embeddable chunks still replace their previous version.
+        for filepath in self._plans:
+            if filepath not in self._done:
+                self._write(filepath, [])
+
+    def purge(self, record: DocumentRecord) -> None:
+        try:
+            with self._upserter.transaction() as conn:
+                with conn.cursor() as cur:
+                    self.deleted_chunks += self._registry.delete_chunks(cur, record.doc_id, record.chunk_ids)
+                    self._registry.forget(cur, record.doc_id)
+        except Exception as exc:  # noqa: BLE001
+            self.errors += 1
+            logger.exception("Failed to purge removed document %s: %s", record.doc_id, exc)
+            return
+        self.docs_purged += 1
+        logger.info("Purged %s (no longer in the manifest)", record.doc_id)
+
+    def _finish_current(self) -> None:
+        if self._current is not None:
+            self._write(self._current, self._pending)
+        self._current = None
+        self._pending = []
+
+    def _write(self, filepath: str, items: List[Dict[str, Any]]) -> None:
+        self._done.add(filepath)
+        if filepath in self._failed:
+            logger.warning("Keeping previous chunks of %s; it failed to load, chunk or embed", filepath)
+            return
+        record = self._plans[filepath]
+        previous = self._previous.get(record.doc_id)
+        errors_before = self._upserter.batch_errors
+        try:
+            with self._upserter.transaction() as conn:
+                deleted = 0
+                if self.table_ready:
+                    with conn.cursor() as cur:
+                        # No previous record: adopt rows written before the registry existed.
+                        deleted = self._registry.delete_chunks(
+                            cur, record.doc_id, previous.chunk_ids if previous else None
+                        )
+                inserted = 0
+                if items:
+                    inserted, _ = self._upserter.upsert_vectors(items, False, dry_run=False)
+                    if self._upserter.batch_errors != errors_before:
+                        raise RuntimeError(f"{self._upserter.batch_errors - errors_before} rows failed to insert")
+                record.chunk_ids = [item["metadata"]["chunk_id"] for item in items]
+                with conn.cursor() as cur:
+                    self._registry.save(cur, record)
+        except Exception as exc:  # noqa: BLE001
+            self.errors += 1
+            logger.exception("Failed to rewrite %s; previous chunks kept: %s", filepath, exc)
+            return
+        self.inserted += inserted
+        self.deleted_chunks += deleted
+        self.docs_written += 1
+
+
 def run_embed_job(
     manifest_path: str,
     profile_name: Optional[str],
@@ -581,6 +1477,9 @@ def run_embed_job(
     batch_size_override: Optional[int] = None,
     max_workers: Optional[int] = None,
     evaluate_path: Optional[str] = None,
+    incremental: bool = False,
+    job_id: Optional[str] = None,
+    resume: Optional[str] = None,
 ) -> EmbeddingJobSummary:
     app_settings = deps_settings.app
     embeddings_cfg = app_settings.get("embeddings", {}) or {}
@@ -639,15 +1538,11 @@ def run_embed_job(
     dedupe_cfg = embeddings_cfg.get("dedupe", {}) or {}
     dedupe_enabled = bool(dedupe_cfg.get("by_hash", False))
     logger.info(
-        "Embedding config: batch_size=%s | workers_hint=%s | rate_limit_per_min=%s",
+        "Embedding config: batch_size=%s | workers=%s | rate_limit_per_min=%s",
         batch_size,
         effective_workers,
         effective_rate_limit or "disabled",
     )
-    logger.info(
-        "Worker pools not implemented; running single-threaded despite EMBED_WORKERS hint=%s",
-        effective_workers,
-    )
 
     strategy = _build_strategy(profile_name, app_settings)
     try:
@@ -659,16 +1554,13 @@ def run_embed_job(
         embedder = _DummyEmbedder()
     if hasattr(embedder, "configure_batching"):
         try:
-            embedder.configure_batching(
-                batch_size=batch_size,
-                rate_limit_per_min=effective_rate_limit,
-            )
+            embedder.configure_batching(rate_limit_per_min=effective_rate_limit)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to configure embedding adapter batching controls: %s", exc)
     oraclevs_cfg = deps_settings.providers.get("oraclevs")
     if not isinstance(oraclevs_cfg, dict):
         raise ValueError("providers.oraclevs configuration missing")
-    upserter = OracleVSUpserter(oraclevs_cfg)
+    upserter = OracleVSUpserter(oraclevs_cfg, embeddings_cfg.get("upsert"))
     conn = None
     if not dry_run:
         # Use the upserter's native Oracle connection targeting the physical table.
@@ -687,8 +1579,88 @@ def run_embed_job(
         raise RuntimeError(f"Failed to read manifest {manifest_path}: {exc}") from exc
     logger.info("Loaded %d files from manifest", len(resolved_files))
 
+    table_ready = False
+    if not dry_run:
+        from backend.providers.oracle_vs.index_admin import table_exists
+
+        table_ready = table_exists(conn, index_name)
+        if table_ready:
+            upserter.set_target_table(index_name)
+
+    raw_parse_workers = getattr(app_config, "EMBED_PARSE_WORKERS", 1) or 1
+    parse_workers = max(1, int(raw_parse_workers))
+
+    doc_writer: Optional[_IncrementalWriter] = None
+    incremental_summary: Optional[Dict[str, Any]] = None
+    if incremental and dry_run:
+        logger.warning("--incremental needs the document registry in Oracle; ignored during dry-run")
+    elif incremental:
+        ensure_registry_table(conn)
+        registry = DocumentRegistry(conn, index_name)
+        known = registry.load()
+        fingerprint = config_fingerprint(
+            {
+                "profile": profile_name,
+                "profile_cfg": profile_cfg,
+                "dedupe": dedupe_enabled,
+                "toc_section_docx": USE_TOC_SECTION_DOCX_CHUNKER,
+                "loaders": _loader_settings(streams_pdf=parse_workers == 1),
+                "sanitizer": _sanitizer_settings(),
+                "model_id": getattr(embedder, "_model_id", None),
+            }
+        )
+        resolved_files, plans, unchanged_docs, removed_docs = _plan_incremental(resolved_files, known, fingerprint)
+        doc_writer = _IncrementalWriter(registry, upserter, plans, known, table_ready)
+        for record in removed_docs:
+            doc_writer.purge(record)
+        incremental_summary = {
+            "unchanged": unchanged_docs,
+            "changed": sum(1 for plan in plans.values() if plan.doc_id in known),
+            "new": sum(1 for plan in plans.values() if plan.doc_id not in known),
+            "removed": len(removed_docs),
+        }
+        logger.info("Incremental plan for %s: %s", index_name, incremental_summary)
+
+    job_id = resume or job_id or f"embed-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    checkpoint: Optional[JobCheckpoint] = None
+    committed_chunk_ids: set = set()
+    checkpoint_cfg = embeddings_cfg.get("checkpoints", {}) or {}
+    if resume and dry_run:
+        logger.warning("--resume reads checkpoints from Oracle; ignored during dry-run")
+    elif not dry_run and bool(checkpoint_cfg.get("enabled", True)):
+        ensure_checkpoint_table(conn)
+        retention_days = float(checkpoint_cfg.get("retention_days", 7) or 0)
+        if retention_days > 0:
+            purge_expired_checkpoints(conn, retention_days, keep_job_id=job_id)
+        checkpoint = JobCheckpoint(
+            conn, job_id, manifest_fingerprint(str(manifest_path), profile_name, index_name), index_name
+        )
+        if resume:
+            committed_chunk_ids = checkpoint.load()
+            logger.info("Resuming job %s: %d chunks already committed", job_id, len(committed_chunk_ids))
+        upserter.attach_checkpoint(checkpoint)
+    elif resume:
+        # Ingest retries always ask to resume; without checkpoints that just means a fresh run.
+        logger.warning(
+            "--resume %s ignored: embeddings.checkpoints.enabled is off, so the job runs from the start",
+            job_id,
+        )
+    logger.info("Embed job id: %s", job_id)
+
+    pipeline_cfg = embeddings_cfg.get("pipeline", {}) or {}
+    file_queue_size = max(1, int(pipeline_cfg.get("file_queue", 2) or 2))
+    chunk_queue_size = max(batch_size, int(pipeline_cfg.get("chunk_queue", 1000) or 1000))
+
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("workers must be a positive integer")
+    if max_workers is not None:
+        logger.info("Using max_workers override: %d", max_workers)
+
+    # Ingest counters are written only by the ingest-chunk stage and read after it ends.
     total_docs = 0
+    ingest_errors = 0
     total_chunks = 0
+    chunk_seq = 0
     inserted = 0
     skipped = 0
     errors = 0
@@ -696,310 +1668,151 @@ def run_embed_job(
     embedding_embedded = 0
     embedding_failed_batches = 0
 
-    vector_buffer: List[Dict[str, Any]] = []
     # Per content_type counters
     content_counts: Dict[str, int] = {k: 0 for k in ("pdf", "docx", "pptx", "xlsx", "html", "txt")}
 
-    for filepath in resolved_files:
-        path_obj = Path(filepath)
-        total_docs += 1
-        doc_id_base = path_obj.stem
-        try:
-            items = route_and_load(filepath)
-        except Exception as exc:  # noqa: BLE001
-            errors += 1
-            logger.exception("Failed to load %s: %s", filepath, exc)
-            continue
-
-        normalized_items: List[Dict[str, Any]] = []
-        for item_idx, raw_item in enumerate(items, start=1):
-            try:
-                norm = normalize_metadata(raw_item)
-            except Exception as exc:  # noqa: BLE001
-                errors += 1
-                logger.warning("Invalid metadata for %s item %d: %s", filepath, item_idx, exc)
-                continue
-
-            # Cleaning before sanitization
-            from backend.ingest.text_cleaner import clean_text  # local import to avoid startup cost elsewhere
-            preserve = False
-            ctype_for_clean = str(norm["metadata"].get("content_type", "")).lower()
-            if "spreadsheet" in ctype_for_clean or "xlsx" in ctype_for_clean:
-                preserve = True
-            text = clean_text(norm.get("text") or "", preserve_tables=preserve)
-            if not text:
-                continue
-
-            # Sanitization per item
-            if sanitize_if_enabled is not None:
-                try:
-                    text, _san_counts = sanitize_if_enabled(text, doc_id_base)
-                except Exception as exc:  # noqa: BLE001
-                    logger.warning("Sanitizer failed for %s (%s); continuing without changes", filepath, exc)
-                else:
-                    if _san_counts:
-                        print(f"[sanitizer:{os.path.basename(filepath)}] {_san_counts}")
-
-            norm["text"] = text
-            normalized_items.append(norm)
-
-        # Build chunker selection
-        chunker_cfg = profile_cfg.get("chunker", {}) or {}
-        chunker_type = (chunker_cfg.get("type") or "char").lower()
-        effective_max = _effective_max_tokens(chunker_cfg, profile_cfg)
-        if CHUNKING_DIAGNOSTIC:
-            logger.info(
-                "CHUNKING_DIAGNOSTIC chunker_type=%s effective_max=%s profile=%s toc_section_docx=%s",
-                chunker_type,
-                effective_max,
-                profile_name,
-                USE_TOC_SECTION_DOCX_CHUNKER,
-            )
-
-        local_idx_to_chunk_id: Dict[int, str] = {}
+    chunker_cfg = profile_cfg.get("chunker", {}) or {}
+    if CHUNKING_DIAGNOSTIC:
+        logger.info(
+            "CHUNKING_DIAGNOSTIC chunker_type=%s effective_max=%s profile=%s toc_section_docx=%s",
+            (chunker_cfg.get("type") or "char").lower(),
+            _effective_max_tokens(chunker_cfg, profile_cfg),
+            profile_name,
+            USE_TOC_SECTION_DOCX_CHUNKER,
+        )
+    chunking_ctx = _ChunkingContext(
+        profile_name=profile_name,
+        index_name=index_name,
+        profile_cfg=profile_cfg,
+        dedupe_enabled=dedupe_enabled,
+    )
 
-        def _append_chunks(chunks_in: List[Dict[str, Any]], base_ct: str, starting_idx: int = 1) -> int:
-            nonlocal total_chunks
-            appended = 0
-            for idx, chunk in enumerate(chunks_in, start=starting_idx):
-                ctext = (chunk.get("text") or "").strip()
-                if not ctext:
-                    continue
-                cmeta_raw = dict(chunk.get("metadata") or {})
-                ct_key_local = base_ct
-                low_ct = str(cmeta_raw.get("content_type") or base_ct or "").lower()
-                if "pdf" in low_ct:
-                    ct_key_local = "pdf"
-                elif "presentation" in low_ct or "ppt" in low_ct:
-                    ct_key_local = "pptx"
-                elif "spreadsheet" in low_ct or "xlsx" in low_ct:
-                    ct_key_local = "xlsx"
-                elif "html" in low_ct:
-                    ct_key_local = "html"
-                elif "wordprocessingml" in low_ct or "docx" in low_ct:
-                    ct_key_local = "docx"
-                elif "plain" in low_ct or "markdown" in low_ct or "txt" in low_ct:
-                    ct_key_local = "txt"
-                if ct_key_local:
-                    content_counts[ct_key_local] = content_counts.get(ct_key_local, 0) + 1
-
-                chunk_id = f"{doc_id_base}_chunk_{len(vector_buffer) + 1}"
-                local_idx = cmeta_raw.get("chunk_local_index") if isinstance(cmeta_raw.get("chunk_local_index"), int) else None
-                meta_out = dict(cmeta_raw)
-                meta_out.update(
-                    {
-                        "doc_id": doc_id_base,
-                        "chunk_id": chunk_id,
-                        "profile": profile_name,
-                        "index_name": index_name,
-                        "distance_metric": profile_cfg.get("distance_metric", "dot_product"),
-                    }
-                )
-                if local_idx is not None and (meta_out.get("chunk_type") or "text") != "figure":
-                    local_idx_to_chunk_id[local_idx] = chunk_id
-                parent_local_idx = meta_out.get("parent_chunk_local_index") or cmeta_raw.get("parent_chunk_local_index")
-                if parent_local_idx and parent_local_idx in local_idx_to_chunk_id:
-                    meta_out["parent_chunk_id"] = local_idx_to_chunk_id[parent_local_idx]
-                if dedupe_enabled:
-                    meta_out["hash_norm"] = _hash_normalize(ctext)
-                vector_buffer.append({"text": ctext, "metadata": meta_out})
-                appended += 1
-            total_chunks += appended
-            return appended
-
-        def _strip_repeated_doc_title_prefix(chunks_in: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], str | None]:
-            if len(chunks_in) < 2:
-                return chunks_in, None
-            first_lines: List[str] = []
-            for ch in chunks_in:
-                lines = (ch.get("text") or "").splitlines()
-                if not lines or not lines[0].strip():
-                    return chunks_in, None
-                first_lines.append(lines[0].strip())
-            candidate = first_lines[0]
-            if not all(fl == candidate for fl in first_lines):
-                return chunks_in, None
-            cleaned: List[Dict[str, Any]] = []
-            for idx, ch in enumerate(chunks_in):
-                lines = (ch.get("text") or "").splitlines()
-                body = "\n".join(lines[1:]).strip()
-                meta = dict(ch.get("metadata") or {})
-                meta["doc_title"] = candidate
-                cleaned.append({"text": body if idx > 0 else ch.get("text") or "", "metadata": meta})
-            return cleaned, candidate
-
-        handled_indices: set[int] = set()
-
-        # Structured chunking branches
-        if chunker_type == "structured_pdf":
-            pdf_items = [
-                it
-                for it in normalized_items
-                if "pdf" in str(it["metadata"].get("content_type", "")).lower()
-            ]
-            if pdf_items:
-                struct_chunks = chunk_structured_pdf_items(pdf_items, chunker_cfg, effective_max)
-                if PIPELINE_CHUNK_DEBUG:
-                    logger.info(
-                        "PIPELINE_CHUNK_DEBUG structured_pdf items=%d chunks=%d",
-                        len(pdf_items),
-                        len(struct_chunks or []),
-                    )
-                _append_chunks(struct_chunks, "pdf")
-                handled_indices.update({id(it) for it in pdf_items})
-
-        if chunker_type == "structured_docx":
-            docx_items = [
-                it
-                for it in normalized_items
-                if (
-                    "wordprocessingml" in str(it["metadata"].get("content_type", "")).lower()
-                    or "docx" in str(it["metadata"].get("content_type", "")).lower()
+    def _collect_file(parsed: _ParsedFile) -> List[Dict[str, Any]]:
+        nonlocal total_docs, ingest_errors, total_chunks, chunk_seq
+        if not parsed.continued:
+            total_docs += 1
+        ingest_errors += parsed.errors
+        if doc_writer is not None:
+            if parsed.failed:
+                doc_writer.mark_failed(parsed.filepath)
+            for chunk in parsed.chunks:
+                chunk[_DOC_KEY] = parsed.filepath
+        _assign_job_chunk_ids(parsed, chunk_seq)
+        chunk_seq += len(parsed.chunks)
+        total_chunks += len(parsed.chunks)
+        for ct_key, count in parsed.content_counts.items():
+            content_counts[ct_key] = content_counts.get(ct_key, 0) + count
+        return parsed.chunks
+
+    # Parsing runs either in a process pool (EMBED_PARSE_WORKERS > 1) or as load -> clean/sanitize
+    # -> chunk threads; both stream files in manifest order through bounded queues. The threads
+    # also stream structured_pdf PDFs page by page, handing on their chunks in pieces. This
+    # thread dedupes, feeds the embedding workers and writes results as they complete.
+    if parse_workers > 1:
+        logger.info("Parsing manifest files with %d worker processes", parse_workers)
+        parsed_files: Iterable[_ParsedFile] = _parse_files_in_processes(resolved_files, chunking_ctx, parse_workers)
+    else:
+        parsed_files = staged(
+            staged(
+                staged(
+                    resolved_files,
+                    lambda fp: [_load_file(fp, stream=_streams_pages(fp, chunking_ctx))],
+                    maxsize=file_queue_size,
+                    name="ingest-load",
+                ),
+                lambda parsed: [_prepare_file(parsed)],
+                maxsize=file_queue_size,
+                name="ingest-prepare",
+            ),
+            lambda parsed: _iter_chunked_file(parsed, chunking_ctx),
+            maxsize=file_queue_size,
+            name="ingest-parse",
+        )
+    chunk_stream = staged(parsed_files, _collect_file, maxsize=chunk_queue_size, name="ingest-chunk")
+
+    skipped_before_embed = 0
+    dup_in_job = 0
+    already_stored = 0
+    prefetched_hashes = dedupe_enabled and not dry_run
+    check_table = prefetched_hashes and table_ready
+    # Rows of documents being rewritten are about to be deleted, so they must not count as stored.
+    rewritten_doc_ids = doc_writer.rewritten_doc_ids if doc_writer is not None else []
+
+    def _dedupe_stream(chunks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal dup_in_job, already_stored
+        seen: set = set()
+        # One HASH_NORM IN (...) lookup per window keeps the prefetch bounded like the queues.
+        for window in batched(chunks, _DEDUPE_WINDOW):
+            existing: set = set()
+            if check_table:
+                existing = upserter.fetch_existing_hashes(
+                    (v["metadata"].get("hash_norm") for v in window), exclude_doc_ids=rewritten_doc_ids
                 )
-            ]
-            if docx_items:
-                if USE_TOC_SECTION_DOCX_CHUNKER:
-                    toc_cfg = dict(chunker_cfg or {})
-                    toc_cfg["effective_max_tokens"] = effective_max
-                    struct_chunks = chunk_docx_toc_sections(docx_items, cfg=toc_cfg, source_meta={})
-                    if PIPELINE_CHUNK_DEBUG:
-                        logger.info(
-                            "PIPELINE_CHUNK_DEBUG structured_docx items=%d chunks=%d DOCX chunker selected: toc_section_docx_chunker",
-                            len(docx_items),
-                            len(struct_chunks or []),
-                        )
-                else:
-                    struct_chunks = chunk_structured_docx_items(docx_items, chunker_cfg, effective_max)
-                    if PIPELINE_CHUNK_DEBUG:
-                        logger.info(
-                            "PIPELINE_CHUNK_DEBUG structured_docx items=%d chunks=%d DOCX chunker selected: structured_docx_chunker",
-                            len(docx_items),
-                            len(struct_chunks or []),
-                        )
-                doc_title_removed = None
-                if struct_chunks:
-                    struct_chunks, doc_title_removed = _strip_repeated_doc_title_prefix(struct_chunks)
-                if PIPELINE_CHUNK_DEBUG:
-                    if doc_title_removed:
-                        logger.info("PIPELINE_CHUNK_DEBUG docx doc_title prefix removed from chunks: %s", doc_title_removed)
-                    else:
-                        logger.info("PIPELINE_CHUNK_DEBUG docx doc_title prefix not applied to chunks")
-                _append_chunks(struct_chunks, "docx")
-                handled_indices.update({id(it) for it in docx_items})
-
-        # Fallback to existing fixed chunking for remaining items
-        for item_idx, norm in enumerate(normalized_items, start=1):
-            if id(norm) in handled_indices:
+            kept, window_dups, window_stored = _dedupe_before_embed(window, existing, seen=seen)
+            dup_in_job += window_dups
+            already_stored += window_stored
+            yield from kept
+
+    resumed_chunks = 0
+
+    def _skip_committed(chunks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        nonlocal resumed_chunks
+        for item in chunks:
+            if item["metadata"].get("chunk_id") in committed_chunk_ids:
+                resumed_chunks += 1
                 continue
-            meta = dict(norm["metadata"])
-            text = norm.get("text") or ""
-            chunks_text: List[str] = []
-            if chunker_type == "tokens":
-                max_tokens = int(chunker_cfg.get("size", 900) or 900)
-                ov = float(chunker_cfg.get("overlap", 0.15) or 0.0)
-                chunks_text = chunk_text_by_tokens(text, max_tokens=max_tokens, overlap=ov)
-            else:
-                size = int(chunker_cfg.get("size", 2000) or 2000)
-                ov = int(chunker_cfg.get("overlap", 100) or 0)
-                chunks_text = chunk_text(text, size=size, overlap=ov)
-
-            ct_key = None
-            if isinstance(meta.get("content_type"), str):
-                low = meta["content_type"].lower()
-                if "pdf" in low:
-                    ct_key = "pdf"
-                elif "presentation" in low or "ppt" in low:
-                    ct_key = "pptx"
-                elif "spreadsheet" in low or "xlsx" in low:
-                    ct_key = "xlsx"
-                elif "html" in low:
-                    ct_key = "html"
-                elif "wordprocessingml" in low or "docx" in low:
-                    ct_key = "docx"
-                elif "plain" in low or "markdown" in low or "txt" in low:
-                    ct_key = "txt"
-            if ct_key:
-                content_counts[ct_key] = content_counts.get(ct_key, 0) + len(chunks_text)
-
-            for idx, ctext in enumerate(chunks_text, start=1):
-                chunk_id = f"{doc_id_base}_chunk_{item_idx}_{idx}"
-                meta_out = dict(meta)
-                meta_out.update(
-                    {
-                        "doc_id": doc_id_base,
-                        "chunk_id": chunk_id,
-                        "profile": profile_name,
-                        "index_name": index_name,
-                        "distance_metric": profile_cfg.get("distance_metric", "dot_product"),
-                    }
-                )
-                if dedupe_enabled:
-                    meta_out["hash_norm"] = _hash_normalize(ctext)
-                vector_buffer.append({"text": ctext, "metadata": meta_out})
-            total_chunks += len(chunks_text)
+            yield item
 
-    if max_workers is not None and max_workers <= 0:
-        raise ValueError("workers must be a positive integer")
-    if max_workers is not None:
-        logger.info("Using max_workers override: %d", max_workers)
-
-    logger.info("Prepared %d chunks. Embedding in batches of %d", len(vector_buffer), batch_size)
+    embed_stream: Iterable[Dict[str, Any]] = _skip_committed(chunk_stream) if committed_chunk_ids else chunk_stream
+    if dedupe_enabled:
+        embed_stream = _dedupe_stream(embed_stream)
+    logger.info(
+        "Streaming chunks into embedding batches of %s (file_queue=%d chunk_queue=%d)",
+        "token/byte budget" if callable(getattr(embedder, "iter_batches", None)) else batch_size,
+        file_queue_size,
+        chunk_queue_size,
+    )
 
     ensured_table = False
     logged_target_table = False
-    for offset in range(0, len(vector_buffer), batch_size):
-        batch = vector_buffer[offset : offset + batch_size]
-        # Filter out empty/whitespace-only texts to avoid OCI 400 errors
-        non_empty_idx = [i for i, item in enumerate(batch) if (item.get("text") or "").strip()]
-        if not non_empty_idx:
-            # Nothing to embed in this batch
-            continue
-        texts = [batch[i]["text"] for i in non_empty_idx]
-        prepared = len(texts)
+    # Workers embed batches concurrently (paced by the adapter's shared rate limiter); this
+    # thread is the single writer and consumes results in submission order.
+    for batch_no, batch, non_empty_idx, result in _embed_batches_concurrently(
+        embedder, embed_stream, batch_size, effective_workers, keep_order=doc_writer is not None
+    ):
+        prepared = len(non_empty_idx)
         embedding_prepared += prepared
-        ok_vecs: List[List[float]] = []
-        out_map: List[int] = []
-        try:
-            embeddings_result = embedder.embed_documents(texts, input_type="search_document")
-            if isinstance(embeddings_result, tuple) and len(embeddings_result) == 2:
-                ok_vecs = list(embeddings_result[0] or [])
-                raw_map = embeddings_result[1]
-                if isinstance(raw_map, dict):
-                    out_map = [raw_map[k] for k in sorted(raw_map.keys())]
-                elif isinstance(raw_map, list):
-                    out_map = list(raw_map)
-                else:
-                    out_map = list(range(len(ok_vecs)))
-            else:
-                ok_vecs = list(embeddings_result or [])
-                out_map = list(range(len(ok_vecs)))
-        except Exception:
-            logger.exception("Embedding job crashed at adapter level")
-            ok_vecs = []
-            out_map = []
-            if prepared:
-                embedding_failed_batches += 1
+        ok_vecs, out_map, failed = result
+        if checkpoint is not None:
+            checkpoint.batch_no = batch_no
+        if failed:
+            embedding_failed_batches += 1
 
         embedded_count = len(ok_vecs)
         embedding_embedded += embedded_count
         # Ensure physical table exists with proper embedding dimension, once we know it
         if not dry_run and not ensured_table:
-            if not ok_vecs:
-                continue
-            # Find first non-empty embedding to determine dimension
+            # Find first non-empty embedding to determine dimension; batches without valid
+            # vectors have nothing to upsert and leave the ensure for a later batch.
             dim = 0
             for _vec in ok_vecs:
                 if isinstance(_vec, list) and len(_vec) > 0:
                     dim = len(_vec)
                     break
-            if dim == 0:
-                # No valid vectors in this batch; skip table ensure for now
-                continue
-            from backend.providers.oracle_vs.index_admin import ensure_alias, ensure_index_table
-            ensure_index_table(conn, index_name, profile_cfg.get("distance_metric", "dot_product"), dim=dim)
-            ensured_table = True
-            # Ensure the upserter targets the physical table for all inserts
-            upserter.set_target_table(index_name)
+            if dim > 0:
+                from backend.providers.oracle_vs.index_admin import ensure_index_table
+                ensure_index_table(
+                    conn,
+                    index_name,
+                    profile_cfg.get("distance_metric", "dot_product"),
+                    dim=dim,
+                    unique_hash=bool(dedupe_cfg.get("unique_index", False)),
+                )
+                ensured_table = True
+                # Ensure the upserter targets the physical table for all inserts
+                upserter.set_target_table(index_name)
+                if doc_writer is not None:
+                    doc_writer.table_ready = True
 
         if not logged_target_table and not dry_run:
             logger.debug("Upserting into physical table: %s", index_name)
@@ -1017,19 +1830,55 @@ def run_embed_job(
         else:
             for idx, embedding in zip(non_empty_idx, ok_vecs):
                 batch[idx]["embedding"] = embedding
-        # Only upsert items that actually have embeddings
+        if doc_writer is not None:
+            # Incremental jobs write per document (one transaction each) instead of per batch.
+            doc_writer.consume(batch, failed)
+            logger.info("Processed batch %d (%d chunks embedded so far)", batch_no, embedding_embedded)
+            continue
         # Only upsert items with a non-empty embedding vector
         upsert_batch = [item for item in batch if ("embedding" in item and isinstance(item["embedding"], list) and len(item["embedding"]) > 0)]
         if not upsert_batch:
             continue
-        batch_inserted, batch_skipped = upserter.upsert_vectors(upsert_batch, dedupe_enabled, dry_run=dry_run)
+        # Hashes were already checked against the table before embedding.
+        batch_inserted, batch_skipped = upserter.upsert_vectors(
+            upsert_batch, dedupe_enabled and not prefetched_hashes, dry_run=dry_run
+        )
         inserted += batch_inserted
         skipped += batch_skipped
+        logger.info("Processed batch %d (%d chunks embedded so far)", batch_no, embedding_embedded)
+    errors += ingest_errors
+    if doc_writer is not None:
+        doc_writer.close()
+        inserted += doc_writer.inserted
+        errors += doc_writer.errors
+        incremental_summary.update(
+            {
+                "written": doc_writer.docs_written,
+                "purged": doc_writer.docs_purged,
+                "deleted_chunks": doc_writer.deleted_chunks,
+            }
+        )
+    logger.info("Loaded %d documents into %d chunks", total_docs, total_chunks)
+    if dedupe_enabled:
+        skipped_before_embed = dup_in_job + already_stored
         logger.info(
-            "Processed batch %d/%d",
-            (offset // batch_size) + 1,
-            (len(vector_buffer) + batch_size - 1) // batch_size,
+            "Dedupe before embedding: duplicates_in_job=%d already_in_%s=%d",
+            dup_in_job,
+            index_name,
+            already_stored,
         )
+    if not dry_run:
+        upserter.flush()
+        if upserter.batch_errors:
+            errors += upserter.batch_errors
+    if resumed_chunks:
+        logger.info("Skipped %d chunks committed by an earlier run of job %s", resumed_chunks, job_id)
+    if checkpoint is not None:
+        if errors or embedding_failed_batches:
+            # Keep what was committed so `--resume` only retries the rest.
+            logger.info("Job %s finished with errors; resume with --resume %s", job_id, job_id)
+        else:
+            checkpoint.clear()
 
     evaluation_metrics: Optional[Dict[str, Any]] = None
     if evaluate_path:
@@ -1058,6 +1907,15 @@ def run_embed_job(
         "skipped": embedding_skipped,
         "failed_batches": embedding_failed_batches,
     }
+    cache_stats_fn = getattr(embedder, "persistent_cache_stats", None)
+    if callable(cache_stats_fn):
+        embedding_summary["cache"] = cache_stats_fn()
+    batching_stats_fn = getattr(embedder, "batch_planner_stats", None)
+    if callable(batching_stats_fn):
+        embedding_summary["batching"] = batching_stats_fn()
+    rate_stats_fn = getattr(embedder, "rate_control_stats", None)
+    if callable(rate_stats_fn):
+        embedding_summary["rate_control"] = rate_stats_fn()
 
     summary = EmbeddingJobSummary(
         docs=total_docs,
@@ -1072,6 +1930,10 @@ def run_embed_job(
         token_limit_truncations=tl_truncs,
         skipped_token_limit=tl_skipped,
         embedding_summary=embedding_summary,
+        skipped_before_embed=skipped_before_embed,
+        incremental=incremental_summary,
+        job_id=job_id,
+        resumed_chunks=resumed_chunks,
     )
     logger.info(
         "Job summary: docs=%d chunks=%d inserted=%d skipped=%d errors=%d dry_run=%s",
@@ -1103,19 +1965,30 @@ def run_embed_job(
         from backend.ingest.loaders import pdf_loader as _pdf_loader  # type: ignore
 
         logger.info(
-            "PDF counters: pages_total=%s pages_ocr=%s pages_native_empty=%s",
+            "PDF counters: pages_total=%s pages_ocr=%s pages_native_empty=%s"
+            " ocr_runs=%s ocr_seconds=%.2f ocr_seconds_per_page=%s",
             getattr(_pdf_loader, "pages_total", "-"),
             getattr(_pdf_loader, "pages_ocr", "-"),
             getattr(_pdf_loader, "pages_native_empty", "-"),
+            getattr(_pdf_loader, "ocr_runs", 0),
+            float(getattr(_pdf_loader, "ocr_seconds", 0.0)),
+            _pdf_loader.ocr_seconds_per_page(),
         )
     except Exception:
         pass
 
     # Update alias only after successful inserts
-    if not dry_run and update_alias and alias_name and ensured_table:
+    if not dry_run and update_alias and alias_name and (ensured_table or (doc_writer is not None and table_ready)):
         from backend.providers.oracle_vs.index_admin import ensure_alias
         ensure_alias(conn, alias_name, index_name)
 
+    deleted_chunks = int((incremental_summary or {}).get("deleted_chunks", 0))
+    if not dry_run and (summary.inserted > 0 or deleted_chunks > 0):
+        # New or removed rows change what retrieval can return; drop cached /chat answers.
+        bump_index_epoch(
+            f"embed job inserted {summary.inserted} and deleted {deleted_chunks} rows in {index_name}"
+        )
+
     return summary
 
 
@@ -1137,6 +2010,13 @@ def _build_cli() -> argparse.ArgumentParser:
         dest="evaluate_path",
         help="Path to golden queries YAML for retrieval spot-checks",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip unchanged documents, rewrite changed ones and purge documents removed from the manifest",
+    )
+    parser.add_argument("--job-id", dest="job_id", help="Checkpoint key for this run (default: generated)")
+    parser.add_argument("--resume", metavar="JOB_ID", help="Resume a failed job, skipping chunks it already committed")
     return parser
 
 
@@ -1152,5 +2032,8 @@ if __name__ == "__main__":
         batch_size_override=args.batch_size,
         max_workers=args.workers,
         evaluate_path=args.evaluate_path,
+        incremental=args.incremental,
+        job_id=args.job_id,
+        resume=args.resume,
     )
     print(f"Job summary: {format_summary(summary)}")
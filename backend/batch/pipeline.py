@@ -0,0 +1,86 @@
+"""Bounded-queue stages for streaming ingestion (load -> prepare -> chunk -> embed -> upsert)."""
+from __future__ import annotations
+
+import queue
+import threading
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_DONE = object()
+_PUT_POLL_S = 0.1
+
+
+def staged(
+    source: Iterable[T],
+    fn: Callable[[T], Iterable[U]],
+    *,
+    maxsize: int,
+    name: str,
+) -> Iterator[U]:
+    """Run ``fn`` over ``source`` in a background thread and yield its outputs in order.
+
+    Outputs pass through a queue of at most ``maxsize`` items, so a slow consumer blocks the
+    stage (and, transitively, every stage feeding it) instead of letting results pile up.
+    Exceptions raised by the stage are re-raised to the consumer. Closing the returned
+    iterator early stops the stage and closes ``source``, so chained stages unwind together.
+    """
+    out: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(maxsize)))
+    stop = threading.Event()
+    failure: List[BaseException] = []
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=_PUT_POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run() -> None:
+        try:
+            for item in source:
+                for result in fn(item):
+                    if not _put(result):
+                        return
+        except BaseException as exc:  # noqa: BLE001 - handed to the consumer thread
+            failure.append(exc)
+        finally:
+            close = getattr(source, "close", None)
+            if callable(close):
+                close()
+            _put(_DONE)
+
+    def _consume() -> Iterator[U]:
+        thread = threading.Thread(target=_run, name=name, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = out.get()
+                if item is _DONE:
+                    break
+                yield item
+            thread.join()
+            if failure:
+                raise failure[0]
+        finally:
+            stop.set()
+
+    return _consume()
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group ``items`` into lists of ``size`` (the last one may be shorter)."""
+    size = max(1, int(size))
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+__all__ = ["batched", "staged"]
@@ -1,5 +1,20 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional
 
 class ChatModelPort(ABC):
     @abstractmethod
     def generate(self, prompt: str) -> str: ...
+
+    def generate_stream(self, prompt: str, usage: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Yield the completion as text deltas; adapters without streaming yield it whole.
+
+        ``usage`` is a per-call holder the adapter fills with provider-reported token
+        counts when available; adapters are shared across requests, so usage is never
+        kept on the instance.
+        """
+        yield self.generate(prompt)
+
+    async def agenerate(self, prompt: str) -> str:
+        """Async variant; adapters with a native async transport override this."""
+        return await asyncio.to_thread(self.generate, prompt)
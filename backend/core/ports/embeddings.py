@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -6,3 +7,7 @@ class EmbeddingsPort(ABC):
     def embed_documents(self, texts: List[str]) -> List[List[float]]: ...
     @abstractmethod
     def embed_query(self, text: str) -> List[float]: ...
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Async variant; adapters with a native async transport override this."""
+        return await asyncio.to_thread(self.embed_query, text)
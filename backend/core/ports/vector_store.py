@@ -1,6 +1,83 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class VectorDocument:
+    """Row returned by a vector store; duck-types LangChain's Document (page_content/metadata)."""
+
+    page_content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+    embedding: Optional[Sequence[float]] = None
+
+
+@dataclass
+class MetadataFilter:
+    """Structured predicate over chunk metadata, passed to searches as ``filters=``.
+
+    Stores with ``supports_filters`` evaluate it in the query; ``matches`` is the equivalent
+    in-process check for stores that cannot.
+    """
+
+    exclude_chunk_types: Sequence[str] = ()
+    exclude_block_types: Sequence[str] = ()
+    doc_ids: Sequence[str] = ()
+    exclude_doc_ids: Sequence[str] = ()
+    content_types: Sequence[str] = ()
+    langs: Sequence[str] = ()
+
+    def is_empty(self) -> bool:
+        return not any(
+            (
+                self.exclude_chunk_types,
+                self.exclude_block_types,
+                self.doc_ids,
+                self.exclude_doc_ids,
+                self.content_types,
+                self.langs,
+            )
+        )
+
+    def matches(self, meta: Dict[str, Any]) -> bool:
+        chunk_type = str(meta.get("chunk_type") or "").lower()
+        if chunk_type and chunk_type in {c.lower() for c in self.exclude_chunk_types}:
+            return False
+        block_type = str(meta.get("block_type") or "")
+        if block_type and block_type in self.exclude_block_types:
+            return False
+        doc_id = str(meta.get("doc_id") or "")
+        if self.doc_ids and doc_id not in self.doc_ids:
+            return False
+        if doc_id and doc_id in self.exclude_doc_ids:
+            return False
+        if self.content_types and str(meta.get("content_type") or "") not in self.content_types:
+            return False
+        if self.langs and str(meta.get("lang") or "").lower() not in {l.lower() for l in self.langs}:
+            return False
+        return True
+
 
 class VectorStorePort(ABC):
+    # Stores that can attach row embeddings (VectorDocument.embedding) when called with
+    # with_embeddings=True set this to True; RetrievalService uses them for embedding MMR.
+    supports_embeddings: bool = False
+    # Stores that apply ``filters=MetadataFilter(...)`` inside the search set this to True.
+    supports_filters: bool = False
+
     @abstractmethod
     def similarity_search_with_score(self, query: str, k: int) -> List[Tuple[Any, float]]: ...
+
+    async def asimilarity_search_with_score(self, query: str, k: int, **kwargs: Any) -> List[Tuple[Any, float]]:
+        """Async variant; stores with an async driver override this."""
+        return await asyncio.to_thread(self.similarity_search_with_score, query, k, **kwargs)
+
+    def resolve_physical_index(self, name: str) -> Optional[str]:
+        """Return the physical table behind an alias view (``name`` itself if it is a table)."""
+        return None
+
+    async def aresolve_physical_index(self, name: str) -> Optional[str]:
+        """Async variant; stores with an async driver override this."""
+        return await asyncio.to_thread(self.resolve_physical_index, name)
@@ -0,0 +1,217 @@
+"""Versioned answer cache for /chat.
+
+Entries are keyed on the normalized question, the retrieval target (alias view) and the
+physical index table the alias currently points to, plus an index *epoch*. The epoch is
+bumped whenever an alias is repointed or an embed job finishes (see ``bump_index_epoch``);
+because embed jobs run in a separate CLI process, the epoch is persisted in a small stamp
+file (``ANSWER_CACHE_EPOCH_FILE``, default ``<tmpdir>/rag_index_epoch``) that the API
+process stats on every lookup.
+"""
+from __future__ import annotations
+
+import copy
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ANSWER_CACHE_EPOCH_ENV = "ANSWER_CACHE_EPOCH_FILE"
+CACHEABLE_MODES = frozenset({"rag", "hybrid"})
+
+_LOCAL_EPOCH = 0
+_EPOCH_LOCK = threading.Lock()
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def epoch_file_path() -> Path:
+    raw = (os.getenv(ANSWER_CACHE_EPOCH_ENV) or "").strip()
+    if raw:
+        return Path(raw)
+    return Path(tempfile.gettempdir()) / "rag_index_epoch"
+
+
+def bump_index_epoch(reason: str = "") -> None:
+    """Invalidate cached answers in this process and in any process sharing the stamp file."""
+    global _LOCAL_EPOCH
+    with _EPOCH_LOCK:
+        _LOCAL_EPOCH += 1
+    path = epoch_file_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        tmp.write_text(str(time.time_ns()), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.debug("Answer cache epoch file not updated (%s): %s", path, exc)
+    logger.info("Answer cache invalidated%s", f" ({reason})" if reason else "")
+
+
+def current_index_epoch() -> str:
+    try:
+        stamp = epoch_file_path().read_text(encoding="utf-8").strip()
+    except OSError:
+        stamp = "0"
+    return f"{_LOCAL_EPOCH}:{stamp}"
+
+
+def normalize_question(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+class AnswerCache:
+    """LRU + TTL store of full /chat payloads.
+
+    ``resolve_ttl_seconds`` bounds how long the alias -> physical index resolution is
+    reused before asking the vector store again, so alias changes made outside the
+    backend (manual DDL) are picked up even without an epoch bump.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 900.0,
+        *,
+        resolve_ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.resolve_ttl_seconds = float(resolve_ttl_seconds)
+        self._clock = clock
+        self._data: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._resolved: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._epoch: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]]) -> Optional["AnswerCache"]:
+        cfg = cfg or {}
+        if not bool(cfg.get("enabled", True)):
+            return None
+        return cls(
+            max_entries=int(cfg.get("max_entries", 512) or 512),
+            ttl_seconds=float(cfg.get("ttl_seconds", 900) or 0),
+            resolve_ttl_seconds=float(cfg.get("resolve_ttl_seconds", 30) or 0),
+        )
+
+    def _sync_epoch(self) -> str:
+        epoch = current_index_epoch()
+        if epoch != self._epoch:
+            if self._epoch is not None:
+                self._data.clear()
+                self._resolved.clear()
+            self._epoch = epoch
+        return epoch
+
+    def make_key(
+        self,
+        question: str,
+        target_view: str,
+        resolve_index: Callable[[str], Optional[str]],
+    ) -> CacheKey:
+        """Build the cache key, resolving the physical index behind ``target_view``."""
+        epoch, physical = self._cached_physical(target_view)
+        if physical is None:
+            try:
+                physical = resolve_index(target_view) or target_view
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Alias resolution failed for %s: %s", target_view, exc)
+                physical = target_view
+            self._remember_physical(target_view, epoch, physical)
+        return (normalize_question(question), target_view or "", physical.upper(), epoch)
+
+    async def amake_key(
+        self,
+        question: str,
+        target_view: str,
+        resolve_index: Callable[[str], Awaitable[Optional[str]]],
+    ) -> CacheKey:
+        """``make_key`` with an async resolver (the store's async pool), for async handlers."""
+        epoch, physical = self._cached_physical(target_view)
+        if physical is None:
+            try:
+                physical = await resolve_index(target_view) or target_view
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Alias resolution failed for %s: %s", target_view, exc)
+                physical = target_view
+            self._remember_physical(target_view, epoch, physical)
+        return (normalize_question(question), target_view or "", physical.upper(), epoch)
+
+    def _cached_physical(self, target_view: str) -> Tuple[str, Optional[str]]:
+        with self._lock:
+            epoch = self._sync_epoch()
+            cached = self._resolved.get((target_view, epoch))
+            if cached is not None and (self._clock() - cached[0]) <= self.resolve_ttl_seconds:
+                return epoch, cached[1]
+        return epoch, None
+
+    def _remember_physical(self, target_view: str, epoch: str, physical: str) -> None:
+        with self._lock:
+            self._resolved[(target_view, epoch)] = (self._clock(), physical)
+
+    def get(self, key: CacheKey) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Return a deep copy of the cached payload and its age in seconds."""
+        with self._lock:
+            if key[3] != self._sync_epoch():
+                self.misses += 1
+                return None
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, payload = entry
+            age = self._clock() - stored_at
+            if self.ttl_seconds > 0 and age > self.ttl_seconds:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(payload), age
+
+    def put(self, key: CacheKey, payload: Dict[str, Any]) -> bool:
+        if str(payload.get("mode") or "") not in CACHEABLE_MODES:
+            return False
+        with self._lock:
+            if key[3] != self._sync_epoch():
+                return False
+            self._data[key] = (self._clock(), copy.deepcopy(payload))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._resolved.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "epoch": self._epoch,
+            }
+
+
+__all__ = [
+    "ANSWER_CACHE_EPOCH_ENV",
+    "AnswerCache",
+    "bump_index_epoch",
+    "current_index_epoch",
+    "epoch_file_path",
+    "normalize_question",
+]
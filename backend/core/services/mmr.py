@@ -0,0 +1,203 @@
+"""MMR (maximal marginal relevance) engines used by RetrievalService.select_context.
+
+Two interchangeable engines are provided:
+- ``EmbeddingMMR``: works on the chunk embeddings returned by the vector store. It builds a
+  NumPy cosine-similarity matrix once, keeps a running max-similarity array against the
+  selected set and enforces the per-doc cap with boolean masks, so each round is O(n).
+- ``token_jaccard_mmr``: the original pure-Python selection using Jaccard similarity over
+  regex-tokenized word sets. Used when embeddings (or NumPy) are unavailable.
+
+Both engines share the same contract: candidates are dicts carrying at least ``sim`` and
+``doc_id``; the selected dicts are returned in pick order with ``mmr_score`` filled in.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+try:  # Optional at import time; the token engine is used when NumPy is missing.
+    import numpy as np  # type: ignore
+
+    _NUMPY_AVAILABLE = True
+except Exception:  # pragma: no cover - graceful degradation if missing
+    np = None  # type: ignore[assignment]
+    _NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MMR_MODE_EMBEDDING = "embedding"
+MMR_MODE_TOKENS = "tokens"
+
+
+def numpy_available() -> bool:
+    return _NUMPY_AVAILABLE
+
+
+def _tokens(text: str) -> set:
+    words = re.sub(r"[^\w\s]", " ", (text or "").lower()).split()
+    return {w for w in words if w.isalpha()}
+
+
+def _jaccard(at: set, bt: set) -> float:
+    if not at or not bt:
+        return 0.0
+    inter = len(at & bt)
+    if inter == 0:
+        return 0.0
+    uni = len(at | bt)
+    return inter / float(uni or 1)
+
+
+def token_jaccard_mmr(
+    candidates: List[Dict[str, Any]],
+    *,
+    lam: float,
+    per_doc_cap: int,
+    max_keep: int,
+) -> List[Dict[str, Any]]:
+    """Token-Jaccard MMR over ``candidates`` (fallback engine)."""
+    for c in candidates:
+        c["tokens"] = _tokens(c.get("text") or "")
+
+    selected: List[Dict[str, Any]] = []
+    counts: Dict[str, int] = {}
+    pool = sorted(candidates, key=lambda x: x["sim"], reverse=True)
+    while pool and len(selected) < max_keep:
+        best = None
+        best_score = -1e9
+        for cand in pool:
+            doc_key = cand.get("doc_id") or ""
+            if counts.get(doc_key, 0) >= per_doc_cap:
+                continue
+            if not selected:
+                score = cand["sim"]
+            else:
+                max_div = 0.0
+                for s in selected:
+                    max_div = max(max_div, _jaccard(cand["tokens"], s["tokens"]))
+                score = lam * cand["sim"] - (1.0 - lam) * max_div
+            if score > best_score:
+                best_score = score
+                best = cand
+        if best is None:
+            break
+        best["mmr_score"] = float(best_score)
+        selected.append(best)
+        dk = best.get("doc_id") or ""
+        counts[dk] = counts.get(dk, 0) + 1
+        pool = [c for c in pool if c is not best]
+    return selected
+
+
+class EmbeddingMMR:
+    """Vectorized MMR over candidate embeddings.
+
+    ``embeddings`` is an (n, d) matrix aligned with ``relevance`` (normalized similarity to
+    the query) and ``doc_keys`` (per-doc cap grouping). Rows are L2-normalized so the
+    pairwise matrix holds cosine similarities regardless of how the index was populated.
+    """
+
+    def __init__(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        relevance: Sequence[float],
+        doc_keys: Sequence[str],
+    ) -> None:
+        if not _NUMPY_AVAILABLE:
+            raise RuntimeError("EmbeddingMMR requires numpy")
+        mat = np.asarray(embeddings, dtype=np.float32)
+        if mat.ndim != 2 or mat.shape[0] != len(relevance) or mat.shape[0] != len(doc_keys):
+            raise ValueError("embeddings, relevance and doc_keys must be aligned")
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        mat = mat / norms
+        self.sim_matrix = mat @ mat.T
+        self.relevance = np.asarray(relevance, dtype=np.float64)
+        _, self.doc_codes = np.unique(np.asarray(list(doc_keys), dtype=object), return_inverse=True)
+
+    def select(self, *, lam: float, per_doc_cap: int, max_keep: int) -> List[tuple[int, float]]:
+        """Return ``(row_index, mmr_score)`` pairs in pick order."""
+        n = int(self.relevance.shape[0])
+        if n == 0 or max_keep <= 0:
+            return []
+        max_sim = np.zeros(n, dtype=np.float64)
+        blocked = np.zeros(n, dtype=bool)
+        doc_counts = np.zeros(int(self.doc_codes.max()) + 1, dtype=np.int64)
+        picks: List[tuple[int, float]] = []
+        while len(picks) < max_keep:
+            if picks:
+                scores = lam * self.relevance - (1.0 - lam) * max_sim
+            else:
+                scores = self.relevance.copy()
+            scores[blocked] = -np.inf
+            best = int(np.argmax(scores))
+            best_score = float(scores[best])
+            if not np.isfinite(best_score):
+                break
+            picks.append((best, best_score))
+            blocked[best] = True
+            np.maximum(max_sim, self.sim_matrix[best], out=max_sim)
+            code = self.doc_codes[best]
+            doc_counts[code] += 1
+            if doc_counts[code] >= per_doc_cap:
+                blocked |= self.doc_codes == code
+        return picks
+
+
+def candidate_embedding(cand: Dict[str, Any]) -> Optional[Sequence[float]]:
+    """Return the embedding attached to a candidate's vector-store row, if any."""
+    doc = cand.get("doc")
+    vec = getattr(doc, "embedding", None)
+    if vec is None and isinstance(doc, dict):
+        vec = doc.get("embedding") or doc.get("EMBEDDING")
+    if vec is None:
+        return None
+    try:
+        if len(vec) == 0:
+            return None
+    except TypeError:
+        return None
+    return vec
+
+
+def embedding_mmr(
+    candidates: List[Dict[str, Any]],
+    *,
+    lam: float,
+    per_doc_cap: int,
+    max_keep: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """Embedding-space MMR; returns None when the candidates cannot be scored this way."""
+    if not _NUMPY_AVAILABLE or not candidates:
+        return None
+    pool = sorted(candidates, key=lambda x: x["sim"], reverse=True)
+    vectors = [candidate_embedding(c) for c in pool]
+    if any(v is None for v in vectors):
+        return None
+    dims = {len(v) for v in vectors}  # type: ignore[arg-type]
+    if len(dims) != 1:
+        logger.warning("Embedding MMR skipped: mixed embedding dimensions %s", sorted(dims))
+        return None
+    engine = EmbeddingMMR(
+        vectors,  # type: ignore[arg-type]
+        [c["sim"] for c in pool],
+        [c.get("doc_id") or "" for c in pool],
+    )
+    selected: List[Dict[str, Any]] = []
+    for idx, score in engine.select(lam=lam, per_doc_cap=per_doc_cap, max_keep=max_keep):
+        cand = pool[idx]
+        cand["mmr_score"] = score
+        selected.append(cand)
+    return selected
+
+
+__all__ = [
+    "MMR_MODE_EMBEDDING",
+    "MMR_MODE_TOKENS",
+    "EmbeddingMMR",
+    "candidate_embedding",
+    "embedding_mmr",
+    "numpy_available",
+    "token_jaccard_mmr",
+]
@@ -1,13 +1,23 @@
+import asyncio
 import logging
 logger = logging.getLogger(__name__)
 import math
 import re
 import os
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from backend.core.ports.chat_model import ChatModelPort
-from backend.core.ports.vector_store import VectorStorePort
+from backend.core.ports.vector_store import MetadataFilter, VectorStorePort
+from backend.core.services.mmr import (
+    MMR_MODE_EMBEDDING,
+    MMR_MODE_TOKENS,
+    embedding_mmr,
+    numpy_available,
+    token_jaccard_mmr,
+)
 
 
 def is_no_context_reply(text: str, cfg: Dict[str, Any]) -> Tuple[bool, str]:
@@ -106,6 +116,43 @@ def _dbg(label: str, obj: Any) -> None:
         return
 
 
+@dataclass
+class _AnswerPlan:
+    """Outcome of retrieval/gating: either a fallback (``prompt is None``) or a primary prompt."""
+
+    question: str
+    mode: str
+    metas: List[Dict[str, Any]]
+    used_chunks: List[Dict[str, Any]]
+    decision_score: Optional[float]
+    short_query: bool
+    llm_used: str = "primary"
+    reason: Optional[str] = None
+    prompt: Optional[str] = None
+    candidates: int = 0
+    sent: int = 0
+    extra: Optional[Dict[str, Any]] = None
+
+
+async def _agenerate(llm: ChatModelPort, prompt: str) -> str:
+    agen = getattr(llm, "agenerate", None)
+    if callable(agen):
+        return (await agen(prompt)) or ""
+    return (await asyncio.to_thread(llm.generate, prompt)) or ""
+
+
+def _stream_text(llm: ChatModelPort, prompt: str, usage: Dict[str, Any]) -> Iterator[str]:
+    """Stream from ``llm`` when it supports ``generate_stream``; otherwise yield one chunk.
+
+    Provider token counts for this call land in ``usage``.
+    """
+    stream = getattr(llm, "generate_stream", None)
+    if callable(stream):
+        yield from stream(prompt, usage=usage)
+        return
+    yield llm.generate(prompt) or ""
+
+
 class RetrievalService:
     def __init__(
         self,
@@ -170,6 +217,21 @@ class RetrievalService:
         self.top_k = int(retrieval_cfg.get("top_k", 8))
         self.dedupe_key = retrieval_cfg.get("dedupe_by", "doc_id")
 
+        # MMR engine: "embedding" uses row embeddings from the vector store (NumPy),
+        # "tokens" keeps the token-Jaccard selection. Embedding mode falls back to tokens
+        # per query when the store returns no embeddings.
+        mmr_cfg = retrieval_cfg.get("mmr", {}) or {}
+        mmr_mode = str(mmr_cfg.get("mode") or MMR_MODE_EMBEDDING).lower()
+        if mmr_mode not in {MMR_MODE_EMBEDDING, MMR_MODE_TOKENS}:
+            raise ValueError(f"retrieval.mmr.mode must be '{MMR_MODE_EMBEDDING}' or '{MMR_MODE_TOKENS}'")
+        if mmr_mode == MMR_MODE_EMBEDDING and not numpy_available():
+            log.warning("retrieval.mmr.mode=embedding requires numpy; using token MMR")
+            mmr_mode = MMR_MODE_TOKENS
+        self.mmr_mode = mmr_mode
+        self.mmr_lambda = float(mmr_cfg.get("lambda", 0.30))
+        self.mmr_per_doc_cap = int(mmr_cfg.get("per_doc_cap", 6))
+        self.mmr_max_keep = int(mmr_cfg.get("max_keep", 12))
+
         # No-context decision config
         self.llm_no_context_cfg = retrieval_cfg.get("llm_no_context", {}) or {}
         exclude_cfg = hybrid_cfg.get("exclude_chunk_types_from_llm")
@@ -179,6 +241,15 @@ class RetrievalService:
         else:
             self.exclude_chunk_types_from_llm = default_exclude
 
+        # Metadata filters evaluated by the vector store (JSON_VALUE predicates) rather than after
+        # a 4x over-fetch. Excluding LLM-ineligible chunks is opt-in because figure rows still feed
+        # retrieved_chunks_metadata (UI thumbnails).
+        pushdown_cfg = retrieval_cfg.get("filter_pushdown", {}) or {}
+        self.filter_pushdown_enabled = bool(pushdown_cfg.get("enabled", True))
+        self.filter_pushdown_excludes = bool(pushdown_cfg.get("exclude_llm_ineligible", False))
+        self.filter_pushdown_overfetch = max(1, int(pushdown_cfg.get("overfetch_factor", 2)))
+        self.search_filter = self._build_search_filter(pushdown_cfg)
+
         prompts_cfg = cfg.get("prompts", {}) or {}
         self.no_context_token = prompts_cfg.get("no_context_token", "__NO_CONTEXT__")
         self.rag_prompt = (prompts_cfg.get("rag", {}).get("system") or "").strip()
@@ -252,6 +323,45 @@ class RetrievalService:
 
         return meta
 
+    def _build_search_filter(self, pushdown_cfg: Dict[str, Any]) -> Optional[MetadataFilter]:
+        if not self.filter_pushdown_enabled:
+            return None
+
+        def _values(key: str) -> Tuple[str, ...]:
+            raw = pushdown_cfg.get(key) or []
+            return tuple(str(v) for v in raw) if isinstance(raw, (list, tuple)) else (str(raw),)
+
+        search_filter = MetadataFilter(
+            exclude_chunk_types=tuple(self.exclude_chunk_types_from_llm) if self.filter_pushdown_excludes else (),
+            exclude_block_types=("image",) if self.filter_pushdown_excludes else (),
+            doc_ids=_values("doc_ids"),
+            exclude_doc_ids=_values("exclude_doc_ids"),
+            content_types=_values("content_types"),
+            langs=_values("langs"),
+        )
+        return None if search_filter.is_empty() else search_filter
+
+    def _pushes_filters(self) -> bool:
+        return self.search_filter is not None and bool(getattr(self.vs, "supports_filters", False))
+
+    def _search_kwargs(self, target_view: Optional[str]) -> Dict[str, Any]:
+        vector_kwargs: Dict[str, Any] = {"target_view": target_view} if target_view else {}
+        if self.mmr_mode == MMR_MODE_EMBEDDING and getattr(self.vs, "supports_embeddings", False):
+            vector_kwargs["with_embeddings"] = True
+        if self._pushes_filters():
+            vector_kwargs["filters"] = self.search_filter
+        return vector_kwargs
+
+    def _apply_search_filter(self, results: List[Any]) -> List[Any]:
+        """Same filter semantics for stores that cannot evaluate it in the query."""
+        if self.search_filter is None or self._pushes_filters():
+            return results
+        return [item for item in results or [] if self.search_filter.matches(self._resolve_metadata(item[0]))]
+
+    def _search(self, query: str, k: int, target_view: Optional[str]) -> List[Any]:
+        results = self.vs.similarity_search_with_score(query, k=k, **self._search_kwargs(target_view))
+        return self._apply_search_filter(results)
+
     def _is_excluded_from_llm_context(self, meta: Dict[str, Any]) -> bool:
         ctype = str(meta.get("chunk_type") or "").lower()
         if ctype and ctype in self.exclude_chunk_types_from_llm:
@@ -273,10 +383,8 @@ class RetrievalService:
         - best3_chunks: top 3 by similarity from selected_chunks (for LLM)
         - explain_dict: {t_adapt, p90, sim_max, kept_n, cap_per_doc, mmr, gate_failed?}
         """
-        vector_kwargs = {"target_view": target_view} if target_view else {}
         if raw_results is None:
-            k_overfetch = max(self.top_k, self.top_k * 4)
-            raw_results = self.vs.similarity_search_with_score(query, k=k_overfetch, **vector_kwargs)
+            raw_results = self._search(query, self._overfetch_k(), target_view)
         if DEBUG_RETRIEVAL_METADATA:
             _dbg("VECTORSTORE_RETURN", raw_results)
         # Build candidate list with normalized similarity
@@ -418,61 +526,26 @@ class RetrievalService:
         if len(filtered_eligible) < min_text_keep:
             filtered_eligible = ranked_text_all[:min_text_keep]
 
-        # Tokenize helper for diversity
-        def _tokens(text: str) -> set:
-            words = re.sub(r"[^\w\s]", " ", (text or "").lower()).split()
-            return {w for w in words if w.isalpha()}
-
-        for c in filtered_eligible:
-            c["tokens"] = _tokens(c["text"])  # type: ignore[assignment]
-
         # MMR selection with per-doc cap
-        lam = 0.30
-        per_doc_cap = 6
-        max_keep = 12
-
-        def pair_sim(a: Dict[str, Any], b: Dict[str, Any]) -> float:
-            at = a.get("tokens") or set()
-            bt = b.get("tokens") or set()
-            if not at or not bt:
-                return 0.0
-            inter = len(at & bt)
-            if inter == 0:
-                return 0.0
-            uni = len(at | bt)
-            return inter / float(uni or 1)
-
-        def mmr_select(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-            selected_local: List[Dict[str, Any]] = []
-            counts_local: Dict[str, int] = {}
-            pool_local = sorted(candidates, key=lambda x: x["sim"], reverse=True)
-            while pool_local and len(selected_local) < max_keep:
-                best = None
-                best_score = -1e9
-                for cand in pool_local:
-                    doc_key = cand.get("doc_id") or ""
-                    if counts_local.get(doc_key, 0) >= per_doc_cap:
-                        continue
-                    if not selected_local:
-                        score = cand["sim"]
-                    else:
-                        max_div = 0.0
-                        for s in selected_local:
-                            max_div = max(max_div, pair_sim(cand, s))
-                        score = lam * cand["sim"] - (1.0 - lam) * max_div
-                    if score > best_score:
-                        best_score = score
-                        best = cand
-                if best is None:
-                    break
-                best["mmr_score"] = float(best_score)
-                selected_local.append(best)
-                dk = best.get("doc_id") or ""
-                counts_local[dk] = counts_local.get(dk, 0) + 1
-                pool_local = [c for c in pool_local if c is not best]
-            return selected_local
-
-        selected_text = mmr_select(filtered_eligible)
+        per_doc_cap = self.mmr_per_doc_cap
+        max_keep = self.mmr_max_keep
+        mmr_used = self.mmr_mode
+        selected_text: Optional[List[Dict[str, Any]]] = None
+        if self.mmr_mode == MMR_MODE_EMBEDDING:
+            selected_text = embedding_mmr(
+                filtered_eligible,
+                lam=self.mmr_lambda,
+                per_doc_cap=per_doc_cap,
+                max_keep=max_keep,
+            )
+        if selected_text is None:
+            mmr_used = MMR_MODE_TOKENS
+            selected_text = token_jaccard_mmr(
+                filtered_eligible,
+                lam=self.mmr_lambda,
+                per_doc_cap=per_doc_cap,
+                max_keep=max_keep,
+            )
 
         # Select LLM context candidates by similarity from text-only MMR set
         ranked_text = sorted(selected_text, key=lambda x: x["sim"], reverse=True)
@@ -513,6 +586,7 @@ class RetrievalService:
             "kept_n": int(len(selected_text)),
             "cap_per_doc": per_doc_cap,
             "mmr": True,
+            "mmr_mode": mmr_used,
             "hybrid_candidates": int(len(best7)),
             "hybrid_sent": int(len(best3)) if not gate_failed else 0,
             "ranked_candidates_total": int(len(candidates)),
@@ -555,6 +629,233 @@ class RetrievalService:
         return best7_payload, best3_payload, explain
 
     def answer(self, question: str, *, target_view: Optional[str] = None) -> Dict:
+        plan = self._plan_answer(question, target_view=target_view)
+        if plan.prompt is None:
+            return self._respond(plan)
+        answer = (self.llm_primary.generate(plan.prompt) or "").strip()
+        return self._finalize_primary(plan, answer)
+
+    async def answer_async(self, question: str, *, target_view: Optional[str] = None) -> Dict:
+        """Async ``answer``: awaits the vector search and LLM calls instead of blocking a thread.
+
+        Planning itself is CPU-only and runs inline, so ``_extra_explain`` is never shared
+        across an ``await``.
+        """
+        question = (question or "").strip()
+        effective_target = target_view or self.default_alias_view
+        raw_results = await self._asearch(question, self._overfetch_k(), effective_target)
+        plan = self._plan_answer(question, target_view=target_view, raw_results=raw_results)
+        if plan.prompt is None:
+            text = await _agenerate(self.llm_fallback, self._fallback_prompt_for(plan.question))
+            return self._respond(plan, answer=text.strip() or None)
+        answer = (await _agenerate(self.llm_primary, plan.prompt)).strip()
+        result = self._finalize_primary(plan, answer, defer_fallback=True)
+        if "_fallback_plan" in result:
+            fallback_plan = result.pop("_fallback_plan")
+            text = await _agenerate(self.llm_fallback, self._fallback_prompt_for(fallback_plan.question))
+            return self._respond(fallback_plan, answer=text.strip() or None)
+        return result
+
+    def _overfetch_k(self) -> int:
+        # Ineligible chunks filtered in the store no longer eat into the candidate budget; the
+        # remaining factor leaves headroom for the per-doc cap and MMR.
+        if self.filter_pushdown_excludes and self._pushes_filters():
+            return max(self.top_k, self.top_k * self.filter_pushdown_overfetch)
+        return max(self.top_k, self.top_k * 4)
+
+    async def _asearch(self, query: str, k: int, target_view: Optional[str]) -> List[Any]:
+        search_async = getattr(self.vs, "asimilarity_search_with_score", None)
+        if not callable(search_async):
+            return await asyncio.to_thread(self._search, query, k, target_view)
+        results = await search_async(query, k=k, **self._search_kwargs(target_view))
+        return self._apply_search_filter(results)
+
+    def answer_stream(self, question: str, *, target_view: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``(event, data)`` pairs for server-sent-event streaming.
+
+        Events: ``metadata`` (retrieval result, before any LLM call), ``token`` (text delta),
+        ``reset`` (discard streamed text; the primary answer turned out to be a no-context
+        reply and the fallback answer follows) and ``done`` (final payload plus ``usage``).
+        The first ``max_chars_for_exact_token`` characters of a primary answer are held back
+        so an exact NO_CONTEXT reply never reaches the client.
+        """
+        started = time.perf_counter()
+        plan = self._plan_answer(question, target_view=target_view)
+        yield "metadata", self._stream_metadata(plan)
+
+        first_token_ms: Optional[float] = None
+        llm = self.llm_fallback if plan.prompt is None else self.llm_primary
+        prompt = plan.prompt if plan.prompt is not None else self._fallback_prompt_for(plan.question)
+        hold_chars = int(self.llm_no_context_cfg.get("max_chars_for_exact_token", 64) or 64) if plan.prompt else 0
+        pieces: List[str] = []
+        provider_usage: Dict[str, Any] = {}
+        held = True
+        for delta in _stream_text(llm, prompt, provider_usage):
+            if not delta:
+                continue
+            pieces.append(delta)
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started) * 1000.0
+            if held and len("".join(pieces).strip()) <= hold_chars:
+                continue
+            if held:
+                held = False
+                yield "token", {"text": "".join(pieces)}
+            else:
+                yield "token", {"text": delta}
+        text = "".join(pieces).strip()
+
+        if plan.prompt is None:
+            result = self._respond(plan, answer=text or None)
+        else:
+            result = self._finalize_primary(plan, text, defer_fallback=True)
+            if "_fallback_plan" in result:
+                if not held:
+                    yield "reset", {"reason": "llm_returned_no_context"}
+                fallback_plan = result.pop("_fallback_plan")
+                yield "metadata", self._stream_metadata(fallback_plan)
+                llm = self.llm_fallback
+                prompt = self._fallback_prompt_for(fallback_plan.question)
+                pieces = []
+                provider_usage = {}
+                for delta in _stream_text(llm, prompt, provider_usage):
+                    if delta:
+                        pieces.append(delta)
+                        yield "token", {"text": delta}
+                result = self._respond(fallback_plan, answer="".join(pieces).strip() or None)
+            elif held and text:
+                yield "token", {"text": text}
+
+        usage = {
+            "llm": result.get("decision_explain", {}).get("used_llm"),
+            "elapsed_ms": int((time.perf_counter() - started) * 1000.0),
+            "first_token_ms": int(first_token_ms) if first_token_ms is not None else None,
+            "prompt_chars": len(prompt or ""),
+            "completion_chars": len(result.get("answer") or ""),
+        }
+        usage.update(provider_usage)
+        result["usage"] = usage
+        yield "done", result
+
+    def _stream_metadata(self, plan: "_AnswerPlan") -> Dict[str, Any]:
+        explain = dict(plan.extra or {})
+        explain.update({"mode": plan.mode, "short_query_active": bool(plan.short_query)})
+        if plan.reason:
+            explain["reason"] = plan.reason
+        return {
+            "question": plan.question,
+            "mode": plan.mode,
+            "retrieved_chunks_metadata": plan.metas,
+            "used_chunks": plan.used_chunks,
+            "decision_explain": explain,
+        }
+
+    def _fallback_prompt_for(self, question: str) -> str:
+        return f"{self.fallback_prompt}\n\n{question}" if self.fallback_prompt else question
+
+    def _respond(self, plan: "_AnswerPlan", answer: Optional[str] = None) -> Dict:
+        self._extra_explain = dict(plan.extra or {})
+        return self._build_response(
+            plan.question,
+            plan.mode,
+            plan.metas,
+            plan.used_chunks,
+            plan.decision_score,
+            plan.short_query,
+            answer=answer,
+            llm_used=plan.llm_used,
+            reason=plan.reason,
+        )
+
+    def _finalize_primary(self, plan: "_AnswerPlan", answer: str, *, defer_fallback: bool = False) -> Dict:
+        self._extra_explain = dict(plan.extra or {})
+        question = plan.question
+        retrieved_metas = plan.metas
+        used_chunks = plan.used_chunks
+        decision_score = plan.decision_score
+        short_query = plan.short_query
+        best7_count = plan.candidates
+        best3_sent = plan.sent
+
+        def _update_extra(**updates: Any) -> None:
+            extra = dict(self._extra_explain or {})
+            extra.update(updates)
+            self._extra_explain = extra
+
+        ans_clean = (answer or "").strip()
+        # Check explicit no-context token handling from config
+        flag, rule = is_no_context_reply(ans_clean, self.llm_no_context_cfg)
+        if (not ans_clean) or flag or (ans_clean == (self.no_context_token or "")):
+            # mark llm_returned when applicable
+            try:
+                extra = dict(self._extra_explain or {})
+                if flag or ans_clean.upper() == "NO_CONTEXT":
+                    extra["llm_returned"] = "NO_CONTEXT"
+                if flag and rule:
+                    extra["no_context_rule"] = rule
+                self._extra_explain = extra
+            except Exception:
+                pass
+            _update_extra(
+                gate_failed=None,
+                fallback_reason="llm_returned_no_context",
+                hybrid_candidates=int(best7_count),
+                hybrid_sent=int(best3_sent),
+            )
+            fallback_plan = _AnswerPlan(
+                question,
+                "fallback",
+                retrieved_metas,
+                [],
+                decision_score,
+                short_query,
+                llm_used="fallback",
+                reason="llm_returned_no_context",
+                extra=dict(self._extra_explain or {}),
+            )
+            if defer_fallback:
+                # The caller generates (streams/awaits) the fallback answer itself.
+                return {"decision_explain": dict(fallback_plan.extra), "_fallback_plan": fallback_plan}
+            return self._respond(fallback_plan)
+
+        _update_extra(
+            gate_failed=None,
+            fallback_reason=None,
+            hybrid_candidates=int(best7_count),
+            hybrid_sent=int(best3_sent),
+        )
+        return self._build_response(
+            question,
+            "hybrid",
+            retrieved_metas,
+            used_chunks,
+            decision_score,
+            short_query,
+            answer=answer,
+            llm_used="primary",
+        )
+
+    def _plan_answer(
+        self,
+        question: str,
+        *,
+        target_view: Optional[str] = None,
+        raw_results: Optional[List[Any]] = None,
+    ) -> "_AnswerPlan":
+        """Run retrieval, thresholds and gates; stop right before the LLM call."""
+        plan = self._build_plan(question, target_view=target_view, raw_results=raw_results)
+        if plan.extra is None:
+            plan.extra = dict(self._extra_explain or {})
+        self._extra_explain = {}
+        return plan
+
+    def _build_plan(
+        self,
+        question: str,
+        *,
+        target_view: Optional[str] = None,
+        raw_results: Optional[List[Any]] = None,
+    ) -> "_AnswerPlan":
         question = (question or "").strip()
         log.debug("retrieval question=%s", question[:120])
         self._extra_explain = {}
@@ -569,19 +870,18 @@ class RetrievalService:
         effective_target = target_view or self.default_alias_view
         _update_extra(retrieval_target=effective_target)
 
-        vector_kwargs = {"target_view": effective_target} if effective_target else {}
-        k_overfetch = max(self.top_k, self.top_k * 4)
-        raw_results = self.vs.similarity_search_with_score(question, k=k_overfetch, **vector_kwargs)
+        if raw_results is None:
+            raw_results = self._search(question, self._overfetch_k(), effective_target)
         if DEBUG_RETRIEVAL_METADATA:
             _dbg("VECTORSTORE_RETURN_ANSWER", raw_results)
         if not raw_results:
             _update_extra(hybrid_candidates=0, hybrid_sent=0, gate_failed=None, fallback_reason=None)
-            return self._build_response(question, "fallback", [], [], None, short_query, llm_used="fallback")
+            return _AnswerPlan(question, "fallback", [], [], None, short_query, llm_used="fallback")
 
         metas = self._build_metas(raw_results)
         if not metas:
             _update_extra(hybrid_candidates=0, hybrid_sent=0, gate_failed=None, fallback_reason=None)
-            return self._build_response(question, "fallback", [], [], None, short_query, llm_used="fallback")
+            return _AnswerPlan(question, "fallback", [], [], None, short_query, llm_used="fallback")
 
         for idx, meta in enumerate(metas, start=1):
             sim_val = float(meta.get("similarity", 0.0))
@@ -618,7 +918,7 @@ class RetrievalService:
 
         if mode == "fallback":
             _update_extra(hybrid_candidates=0, hybrid_sent=0, gate_failed=None, fallback_reason=None)
-            return self._build_response(question, mode, metas, [], decision_score, short_query, llm_used="fallback")
+            return _AnswerPlan(question, mode, metas, [], decision_score, short_query, llm_used="fallback")
 
         # Drive decision via select_context for hybrid-or-fallback
         selected_docs, best3_docs, explain = self.select_context(
@@ -673,7 +973,7 @@ class RetrievalService:
                 hybrid_candidates=int(best7_count),
                 hybrid_sent=0,
             )
-            return self._build_response(
+            return _AnswerPlan(
                 question,
                 "fallback",
                 retrieved_metas,
@@ -740,7 +1040,7 @@ class RetrievalService:
                 hybrid_candidates=int(best7_count),
                 hybrid_sent=0,
             )
-            return self._build_response(
+            return _AnswerPlan(
                 question,
                 "fallback",
                 retrieved_metas,
@@ -763,7 +1063,7 @@ class RetrievalService:
                     hybrid_candidates=int(best7_count),
                     hybrid_sent=0,
                 )
-                return self._build_response(
+                return _AnswerPlan(
                     question,
                     "fallback",
                     retrieved_metas,
@@ -782,7 +1082,7 @@ class RetrievalService:
                     hybrid_candidates=int(best7_count),
                     hybrid_sent=0,
                 )
-                return self._build_response(
+                return _AnswerPlan(
                     question,
                     "fallback",
                     retrieved_metas,
@@ -801,7 +1101,7 @@ class RetrievalService:
                     hybrid_candidates=int(best7_count),
                     hybrid_sent=0,
                 )
-                return self._build_response(
+                return _AnswerPlan(
                     question,
                     "fallback",
                     retrieved_metas,
@@ -818,54 +1118,16 @@ class RetrievalService:
             instruction = "If the provided context is insufficient to answer safely, reply with the single token: NO_CONTEXT"
             system_prompt = f"{base_prompt}\n{instruction}" if base_prompt else instruction
         prompt = self._compose_prompt(system_prompt, context_text, question)
-
-        answer = (self.llm_primary.generate(prompt) or "").strip()
-        ans_clean = (answer or "").strip()
-        # Check explicit no-context token handling from config
-        flag, rule = is_no_context_reply(ans_clean, self.llm_no_context_cfg)
-        if (not ans_clean) or flag or (ans_clean == (self.no_context_token or "")):
-            # mark llm_returned when applicable
-            try:
-                extra = dict(self._extra_explain or {})
-                if flag or ans_clean.upper() == "NO_CONTEXT":
-                    extra["llm_returned"] = "NO_CONTEXT"
-                if flag and rule:
-                    extra["no_context_rule"] = rule
-                self._extra_explain = extra
-            except Exception:
-                pass
-            _update_extra(
-                gate_failed=None,
-                fallback_reason="llm_returned_no_context",
-                hybrid_candidates=int(best7_count),
-                hybrid_sent=int(best3_sent),
-            )
-            return self._build_response(
-                question,
-                "fallback",
-                retrieved_metas,
-                [],
-                decision_score,
-                short_query,
-                llm_used="fallback",
-                reason="llm_returned_no_context",
-            )
-
-        _update_extra(
-            gate_failed=None,
-            fallback_reason=None,
-            hybrid_candidates=int(best7_count),
-            hybrid_sent=int(best3_sent),
-        )
-        return self._build_response(
+        return _AnswerPlan(
             question,
             "hybrid",
             retrieved_metas,
             used_chunks,
             decision_score,
             short_query,
-            answer=answer,
-            llm_used="primary",
+            prompt=prompt,
+            candidates=int(best7_count),
+            sent=int(best3_sent),
         )
 
     def _is_short_query(self, question: str) -> bool:
@@ -0,0 +1,316 @@
+"""Content-addressed store for extracted figure assets (DOCX images).
+
+Purpose
+- Keep one copy of each image under ``<RAG_ASSETS_DIR>/blobs/<aa>/<bb>/<sha256><ext>`` no
+  matter how many documents embed it. Putting a blob that is already stored costs one
+  ``utime`` (or nothing, when this process stored or touched it recently), so re-ingesting a
+  corpus does almost no image I/O. The touch marks the blob as in use for ``gc``.
+- Optionally hand writes to a background thread so parsing continues while blobs land.
+- Record the blobs each document references in ``refs/<doc_id>.json`` so that blobs no
+  document references any more can be garbage-collected.
+
+Contract
+- export: assets_root() -> Path  (``RAG_ASSETS_DIR``, default ``<repo>/data/rag-assets``)
+- export: get_store(root=None) -> AssetStore  (one per root per process)
+- AssetStore.put(data, ext, sha256=None) -> StoredAsset
+- AssetStore.record_refs(doc_id, source, hashes) / flush() / close() / stats()
+- AssetStore.gc(dry_run=False, min_age_seconds=3600, prune_missing_sources=False) -> dict
+
+``StoredAsset.ref`` is relative to the assets root, which is how ``image_ref`` has always
+been resolved by readers (``RAG_ASSETS_DIR / image_ref``).
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIR = "blobs"
+REFS_DIR = "refs"
+_QUEUE_SIZE = 256
+_DEFAULT_GC_MIN_AGE_S = 3600.0
+# Blobs this process reuses are touched again after this long, well inside gc's age guard.
+_RETOUCH_INTERVAL_S = _DEFAULT_GC_MIN_AGE_S / 4
+
+
+def _repo_root() -> Path:
+    try:
+        return Path(__file__).resolve().parents[2]
+    except Exception:
+        return Path.cwd()
+
+
+def assets_root() -> Path:
+    raw = os.getenv("RAG_ASSETS_DIR")
+    if raw:
+        path = Path(raw).expanduser()
+        if not path.is_absolute():
+            path = (_repo_root() / path).resolve()
+        return path
+    return _repo_root() / "data" / "rag-assets"
+
+
+def _normalize_ext(ext: Optional[str]) -> str:
+    ext = (ext or "").strip().lower()
+    if not ext:
+        return ".img"
+    return ext if ext.startswith(".") else f".{ext}"
+
+
+@dataclass(frozen=True)
+class StoredAsset:
+    sha256: str
+    ref: str
+    path: Path
+    written: bool
+
+
+class AssetStore:
+    """sha256-keyed blob store with two-level fan-out directories."""
+
+    def __init__(self, root: Path, background: bool = False) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        # ref -> monotonic time this process last wrote or touched the blob
+        self._known: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {"puts": 0, "written": 0, "skipped": 0, "failed": 0, "bytes_written": 0}
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=_QUEUE_SIZE)
+            self._thread = threading.Thread(target=self._drain, name="asset-store-writer", daemon=True)
+            self._thread.start()
+
+    @staticmethod
+    def ref_for(sha256: str, ext: str) -> str:
+        return f"{BLOBS_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}{_normalize_ext(ext)}"
+
+    def path_for(self, sha256: str, ext: str) -> Path:
+        return self.root / self.ref_for(sha256, ext)
+
+    def put(self, data: bytes, ext: str, sha256: Optional[str] = None) -> StoredAsset:
+        """Store ``data`` unless an identical blob is already present.
+
+        Synchronous writes raise ``OSError`` on failure; background writes log and count it.
+        """
+        digest = sha256 or hashlib.sha256(data).hexdigest()
+        ref = self.ref_for(digest, ext)
+        path = self.root / ref
+        now = time.monotonic()
+        with self._lock:
+            self._counts["puts"] += 1
+            seen = self._known.get(ref)
+            if seen is not None and now - seen < _RETOUCH_INTERVAL_S:
+                self._counts["skipped"] += 1
+                return StoredAsset(digest, ref, path, written=False)
+            self._known[ref] = now
+        if self._touch(path):
+            with self._lock:
+                self._counts["skipped"] += 1
+            return StoredAsset(digest, ref, path, written=False)
+        if self._queue is not None:
+            self._queue.put((ref, path, data))
+        else:
+            try:
+                self._write(path, data)
+            except OSError:
+                self._forget(ref)
+                raise
+        return StoredAsset(digest, ref, path, written=True)
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """Bump an existing blob's mtime so ``gc`` treats it as recently stored."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Read-only store: the blob is there, it just cannot be marked.
+            return path.exists()
+        return True
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._counts["written"] += 1
+            self._counts["bytes_written"] += len(data)
+
+    def _forget(self, ref: str) -> None:
+        with self._lock:
+            self._known.pop(ref, None)
+            self._counts["failed"] += 1
+
+    def _drain(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                ref, path, data = job
+                try:
+                    self._write(path, data)
+                except OSError as exc:
+                    self._forget(ref)
+                    logger.warning("Failed to write asset %s: %s", path, exc)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Block until queued background writes are on disk."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._queue is not None and self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._queue = None
+        self._thread = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def record_refs(self, doc_id: str, source: str, hashes: Iterable[str]) -> None:
+        """Replace the set of blobs ``doc_id`` references (an empty set drops the record)."""
+        assets = sorted(set(hashes))
+        path = self.root / REFS_DIR / f"{doc_id}.json"
+        try:
+            current = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            current = None
+        if not assets:
+            if current is not None:
+                path.unlink(missing_ok=True)
+            return
+        if isinstance(current, dict) and current.get("assets") == assets and current.get("source") == source:
+            return
+        payload = {"doc_id": doc_id, "source": source, "assets": assets, "updated_at": time.time()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def gc(
+        self,
+        dry_run: bool = False,
+        min_age_seconds: float = _DEFAULT_GC_MIN_AGE_S,
+        prune_missing_sources: bool = False,
+    ) -> Dict[str, object]:
+        """Delete blobs that no ``refs/*.json`` record references.
+
+        Blobs younger than ``min_age_seconds`` are kept so a concurrent ingestion that has
+        stored (or reused, which touches the blob) blobs but not yet written its refs record
+        is not collected. With
+        ``prune_missing_sources`` records whose source file no longer exists are dropped first.
+        """
+        referenced: Set[str] = set()
+        refs_pruned = 0
+        for ref_file in sorted((self.root / REFS_DIR).glob("*.json")):
+            try:
+                record = json.loads(ref_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                # Unreadable record: keep everything rather than risk deleting live blobs.
+                logger.warning("Skipping asset GC: unreadable refs record %s: %s", ref_file, exc)
+                return {"ok": False, "error": f"unreadable refs record: {ref_file}"}
+            source = record.get("source") if isinstance(record, dict) else None
+            if prune_missing_sources and source and not Path(source).exists():
+                refs_pruned += 1
+                if not dry_run:
+                    ref_file.unlink(missing_ok=True)
+                continue
+            referenced.update((record.get("assets") or []) if isinstance(record, dict) else [])
+
+        now = time.time()
+        kept = removed = recent = 0
+        bytes_freed = 0
+        blobs_dir = self.root / BLOBS_DIR
+        for blob in sorted(blobs_dir.glob("*/*/*")):
+            if not blob.is_file():
+                continue
+            try:
+                st = blob.stat()
+            except FileNotFoundError:
+                continue
+            stale_tmp = blob.name.startswith(".")
+            if not stale_tmp and blob.name.split(".", 1)[0] in referenced:
+                kept += 1
+                continue
+            if now - st.st_mtime < min_age_seconds:
+                recent += 1
+                continue
+            removed += 1
+            bytes_freed += st.st_size
+            if not dry_run:
+                blob.unlink(missing_ok=True)
+                with self._lock:
+                    self._known.pop(blob.relative_to(self.root).as_posix(), None)
+        if not dry_run:
+            for fan_dir in sorted(blobs_dir.glob("*/*"), reverse=True) + sorted(blobs_dir.glob("*"), reverse=True):
+                try:
+                    fan_dir.rmdir()
+                except OSError:
+                    pass
+        return {
+            "ok": True,
+            "dry_run": dry_run,
+            "referenced": len(referenced),
+            "kept": kept,
+            "removed": removed,
+            "bytes_freed": bytes_freed,
+            "skipped_recent": recent,
+            "refs_pruned": refs_pruned,
+        }
+
+
+# ---------- Process-wide registry ----------
+
+_stores: Dict[str, AssetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _background_writes() -> bool:
+    return (os.getenv("RAG_ASSETS_BACKGROUND_WRITES") or "").strip().lower() in {"1", "true", "yes", "on", "y", "t"}
+
+
+def get_store(root: Optional[Path] = None) -> AssetStore:
+    """Shared store for ``root`` (default: ``assets_root()``), so dedup state spans documents."""
+    resolved = Path(root) if root is not None else assets_root()
+    key = str(resolved)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = AssetStore(resolved, background=_background_writes())
+            _stores[key] = store
+        return store
+
+
+def close_all() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
+
+
+atexit.register(close_all)
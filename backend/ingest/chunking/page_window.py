@@ -0,0 +1,2 @@
+"""Compatibility shim; re-exports loader chunking page_window."""
+from backend.ingest.loaders.chunking.page_window import *  # noqa: F401,F403
@@ -3,10 +3,12 @@ from __future__ import annotations
 import os
 import re
 from collections import Counter, defaultdict
-from typing import Dict, Iterable, List, Tuple
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from backend.ingest.chunking.block_types import Block
 from backend.ingest.chunking import toc_utils
+from backend.ingest.chunking.page_window import iter_page_windows
 
 DEBUG_CLEAN = (os.getenv("BLOCK_CLEAN_DEBUG") or "").lower() in {"1", "true", "yes", "on"}
 
@@ -85,6 +87,10 @@ def _detect_repeated(lines_by_page: Dict[int, List[str]], threshold: float) -> s
     return repeated
 
 
+_BOILERPLATE_RE = re.compile(r"(page\s+\d+\s+of\s+\d+|confidential|restricted|internal use only)", re.IGNORECASE)
+_REPEATED_PAGE_RATIO = 0.6
+
+
 def _remove_repeated(blocks: List[Block], mode: str) -> tuple[List[Block], List[str]]:
     if not blocks or mode != "pdf":
         return blocks, []
@@ -97,10 +103,9 @@ def _remove_repeated(blocks: List[Block], mode: str) -> tuple[List[Block], List[
         for ln in blk.text.splitlines():
             lines_by_page[page].append(ln)
             lines_global.append(ln)
-    repeated = _detect_repeated(lines_by_page, 0.6 if mode == "pdf" else 0.6)
+    repeated = _detect_repeated(lines_by_page, _REPEATED_PAGE_RATIO)
 
-    boilerplate_re = re.compile(r"(page\s+\d+\s+of\s+\d+|confidential|restricted|internal use only)", re.IGNORECASE)
-    boiler_counts = Counter([_normalize_line(ln) for ln in lines_global if boilerplate_re.search(ln)])
+    boiler_counts = Counter([_normalize_line(ln) for ln in lines_global if _BOILERPLATE_RE.search(ln)])
     for ln, cnt in boiler_counts.items():
         if cnt > 1:
             repeated.add(ln)
@@ -124,6 +129,84 @@ def _remove_repeated(blocks: List[Block], mode: str) -> tuple[List[Block], List[
     return cleaned, removed
 
 
+def _normalize_whitespace(blk: Block) -> Optional[Block]:
+    if blk.type == "image":
+        return Block(type=blk.type, text=blk.text, meta=dict(blk.meta))
+    lines = [ln.rstrip() for ln in blk.text.splitlines()]
+    compact: List[str] = []
+    last_blank = False
+    for ln in lines:
+        if not ln.strip():
+            if last_blank:
+                continue
+            last_blank = True
+            continue
+        last_blank = False
+        compact.append(ln)
+    txt = "\n".join(compact).strip("\n")
+    return Block(type=blk.type, text=txt, meta=dict(blk.meta)) if txt else None
+
+
+def _page_line_stats(blk: Block) -> Tuple[set, Counter]:
+    """Distinct header/footer candidates on one page and its boilerplate line counts."""
+    if blk.type == "image":
+        return set(), Counter()
+    lines = [_normalize_line(ln) for ln in blk.text.splitlines()]
+    candidates = {ln for ln in lines if ln and not _is_numbered_list(ln)}
+    return candidates, Counter(ln for ln in lines if _BOILERPLATE_RE.search(ln))
+
+
+def _discount(counts: Counter, leaving: Counter) -> None:
+    # Drop keys that reach zero so the counters stay bounded by the window, not the document.
+    for key, n in leaving.items():
+        left = counts[key] - n
+        if left > 0:
+            counts[key] = left
+        else:
+            del counts[key]
+
+
+def iter_clean_pdf_blocks(blocks: Iterable[Block], window: int = 50) -> Iterator[Block]:
+    """Streaming ``clean_blocks("pdf", ...)`` for one block per page.
+
+    TOC stripping runs over the first ``window`` pages, where TOCs sit. Each page's repeated
+    headers/footers are detected against the ``window`` pages around it rather than the
+    whole document, so at most about ``window`` pages are held in memory. Documents no
+    longer than ``window`` pages are cleaned exactly like ``clean_blocks``.
+    """
+    source = iter(blocks)
+    head = _strip_toc(list(islice(source, max(1, int(window)))))
+    pages = ((blk, _page_line_stats(blk)) for blk in chain(head, source))
+    page_counts: Counter = Counter()
+    boiler_counts: Counter = Counter()
+    text_pages = 0
+    for (blk, _), entering, leaving, _size in iter_page_windows(pages, window):
+        for other, (candidates, boiler) in entering:
+            page_counts.update(candidates)
+            boiler_counts.update(boiler)
+            text_pages += other.type != "image"
+        for other, (candidates, boiler) in leaving:
+            _discount(page_counts, Counter(candidates))
+            _discount(boiler_counts, boiler)
+            text_pages -= other.type != "image"
+        if blk.type != "image":
+            kept_lines = []
+            for ln in blk.text.splitlines():
+                norm = _normalize_line(ln)
+                if norm and (
+                    page_counts[norm] >= text_pages * _REPEATED_PAGE_RATIO or boiler_counts[norm] > 1
+                ):
+                    continue
+                kept_lines.append(ln)
+            txt = "\n".join([ln for ln in kept_lines if ln.strip()]).strip()
+            if not txt:
+                continue
+            blk = Block(type=blk.type, text=txt, meta=dict(blk.meta))
+        cleaned = _normalize_whitespace(blk)
+        if cleaned is not None:
+            yield cleaned
+
+
 def clean_blocks(mode: str, blocks: Iterable[Block]) -> List[Block]:
     mode = (mode or "docx").lower()
     blist = list(blocks)
@@ -143,26 +226,7 @@ def clean_blocks(mode: str, blocks: Iterable[Block]) -> List[Block]:
     removed_samples["repeated"] = [ln[:200] for ln in rep_removed[:5]]
 
     # whitespace normalization
-    normalized: List[Block] = []
-    for blk in blist:
-        if blk.type == "image":
-            normalized.append(Block(type=blk.type, text=blk.text, meta=dict(blk.meta)))
-            continue
-        lines = [ln.rstrip() for ln in blk.text.splitlines()]
-        compact: List[str] = []
-        last_blank = False
-        for ln in lines:
-            if not ln.strip():
-                if last_blank:
-                    continue
-                last_blank = True
-                continue
-            last_blank = False
-            compact.append(ln)
-        txt = "\n".join(compact).strip("\n")
-        if txt:
-            normalized.append(Block(type=blk.type, text=txt, meta=dict(blk.meta)))
-    blist = normalized
+    blist = [norm for norm in (_normalize_whitespace(blk) for blk in blist) if norm is not None]
 
     removed_counts["empty_blocks"] = max(0, after_repeated_lines - sum(len(blk.text.splitlines()) for blk in blist))
 
@@ -0,0 +1,57 @@
+"""Sliding page windows for streaming cleaners and chunkers.
+
+Cross-page heuristics (repeated headers/footers) need to see pages around the one being
+processed. ``iter_page_windows`` provides that view over a page stream while buffering only
+about ``window`` pages, so documents are processed in one pass with bounded memory.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_page_windows(pages: Iterable[T], window: int) -> Iterator[Tuple[T, List[T], List[T], int]]:
+    """Yield ``(page, entering, leaving, size)`` for every page, in order.
+
+    The window for page ``i`` is ``window`` consecutive pages starting at ``i - window // 2``,
+    shifted to stay inside the document, so it always holds ``min(window, n_pages)`` pages.
+    ``entering``/``leaving`` are the pages that joined/left the window since the previous
+    yield, letting callers keep running counts instead of rescanning the window. A
+    document no longer than ``window`` pages sees one window covering all of it.
+    """
+    window = max(1, int(window))
+    half = window // 2
+    source = iter(pages)
+    buf: Dict[int, T] = {}
+    read = 0
+    exhausted = False
+    lo = hi = dropped = 0
+    i = 0
+    while True:
+        need = max(i + half, window - 1)
+        while not exhausted and read <= need:
+            try:
+                buf[read] = next(source)
+            except StopIteration:
+                exhausted = True
+                break
+            read += 1
+        if i >= read:
+            return
+        start = max(0, i - half)
+        if exhausted:
+            start = max(0, min(start, read - window))
+        end = min(read, start + window)
+        entering = [buf[k] for k in range(hi, end)]
+        leaving = [buf[k] for k in range(lo, start)]
+        lo, hi = start, end
+        yield buf[i], entering, leaving, end - start
+        i += 1
+        # Pages before both the window and the next page to yield are no longer needed.
+        while dropped < min(lo, i):
+            buf.pop(dropped, None)
+            dropped += 1
+
+
+__all__ = ["iter_page_windows"]
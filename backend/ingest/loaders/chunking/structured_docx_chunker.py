@@ -15,6 +15,7 @@ import re
 from collections import Counter
 from typing import Dict, List, Optional, Sequence
 
+from backend.ingest.tokenizer import get_tokenizer
 from backend.ingest.chunking.toc_utils import strip_toc_region, is_toc_like
 import os
 import logging
@@ -23,46 +24,17 @@ STRUCTURED_CHUNK_DEBUG = (os.getenv("STRUCTURED_CHUNK_DEBUG") or "").lower() in
 _log = logging.getLogger(__name__)
 
 
-def _estimate_tokens(text: str) -> int:
+def _tokens_for_chars(n_chars: int) -> int:
     # Heuristic: ~4 chars per token
-    return max(0, int(round(len(text) / 4))) if text else 0
+    return max(0, int(round(n_chars / 4)))
 
 
-def _split_to_token_limit(text: str, max_tokens: int) -> List[str]:
-    if _estimate_tokens(text) <= max_tokens:
-        return [text] if text.strip() else []
+def _estimate_tokens(text: str) -> int:
+    return _tokens_for_chars(len(text)) if text else 0
 
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    chunks: List[str] = []
-    buf: List[str] = []
-    for part in parts:
-        candidate = (" ".join(buf + [part])).strip()
-        if not candidate:
-            continue
-        if _estimate_tokens(candidate) <= max_tokens:
-            buf.append(part)
-            continue
-        if buf:
-            chunks.append(" ".join(buf).strip())
-            buf = [part]
-        else:
-            words = part.split()
-            wbuf: List[str] = []
-            for w in words:
-                candidate_w = " ".join(wbuf + [w]).strip()
-                if _estimate_tokens(candidate_w) <= max_tokens:
-                    wbuf.append(w)
-                else:
-                    if wbuf:
-                        chunks.append(" ".join(wbuf).strip())
-                    wbuf = [w]
-            if wbuf:
-                buf = [wbuf[-1]]
-            else:
-                buf = []
-    if buf:
-        chunks.append(" ".join(buf).strip())
-    return [c for c in chunks if c]
+
+def _split_to_token_limit(text: str, max_tokens: int) -> List[str]:
+    return get_tokenizer("heuristic").split(text, max_tokens)
 
 
 def _is_bullet(line: str) -> bool:
@@ -701,28 +673,32 @@ def chunk_structured_docx_items(
             continue
 
         chunk_lines: List[str] = []
+        chunk_chars = 0  # len("\n".join(chunk_lines)), kept in step so a fit check is O(1)
         chunk_prefixes: List[str] = []
         chunk_proc_titles: List[str] = []
         chunk_seq = 0
 
         def flush_chunk(prefixes_override: Optional[List[str]] = None, split_reason: Optional[str] = None, split_part: Optional[int] = None) -> None:
-            nonlocal chunk_lines, chunk_prefixes, chunk_seq, chunk_proc_titles
+            nonlocal chunk_lines, chunk_chars, chunk_prefixes, chunk_seq, chunk_proc_titles
             if not chunk_lines:
                 return
             text_val = "\n".join(chunk_lines).strip()
             if not text_val:
                 chunk_lines = []
+                chunk_chars = 0
                 chunk_prefixes = []
                 chunk_proc_titles = []
                 return
             lines_clean = [ln for ln in chunk_lines if ln.strip()]
             if major and lines_clean == [major]:
                 chunk_lines = []
+                chunk_chars = 0
                 chunk_prefixes = []
                 chunk_proc_titles = []
                 return
             if min_tokens > 0 and _estimate_tokens(text_val) < min_tokens:
                 chunk_lines = []
+                chunk_chars = 0
                 chunk_prefixes = []
                 chunk_proc_titles = []
                 return
@@ -765,6 +741,7 @@ def chunk_structured_docx_items(
                 )
             chunks.append({"text": text_val, "metadata": meta})
             chunk_lines = []
+            chunk_chars = 0
             chunk_prefixes = []
             chunk_proc_titles = []
 
@@ -822,15 +799,17 @@ def chunk_structured_docx_items(
 
             if not chunk_lines and major:
                 chunk_lines.append(major)
+                chunk_chars = len(major)
 
-            candidate_lines = list(chunk_lines) + [proc_text]
-            if chunk_lines and _estimate_tokens("\n".join(candidate_lines)) > effective_max_tokens:
+            candidate_chars = chunk_chars + (1 if chunk_lines else 0) + len(proc_text)
+            if chunk_lines and _tokens_for_chars(candidate_chars) > effective_max_tokens:
                 flush_chunk(split_reason="max_tokens")
                 if major:
                     chunk_lines.append(major)
-                candidate_lines = list(chunk_lines) + [proc_text]
+                    chunk_chars = len(major)
+                candidate_chars = chunk_chars + (1 if chunk_lines else 0) + len(proc_text)
 
-            if _estimate_tokens("\n".join(candidate_lines)) > effective_max_tokens:
+            if _tokens_for_chars(candidate_chars) > effective_max_tokens:
                 flush_chunk(split_reason="max_tokens")
                 parts = split_procedure(proc)
                 part_idx = 1
@@ -868,10 +847,13 @@ def chunk_structured_docx_items(
             if proc.get("title"):
                 context_lines.append(proc.get("title"))
             merged_lines = _prepend_context_lines(context_lines, [proc_text])
+            merged_text = "\n".join(merged_lines)
             if not chunk_lines:
                 chunk_lines.extend(merged_lines)
+                chunk_chars = len(merged_text)
             else:
-                chunk_lines.append("\n".join(merged_lines))
+                chunk_lines.append(merged_text)
+                chunk_chars += 1 + len(merged_text)
             if proc_prefix:
                 chunk_prefixes.append(proc_prefix)
             if proc.get("title"):
@@ -5,16 +5,22 @@ Goals
 - Remove repeated headers/footers across pages and TOC-like lines (dot leaders).
 - Reconstruct paragraphs/lists from wrapped lines.
 - Enforce an effective max token budget before embedding preflight.
+- Accept a page stream: repeated lines are detected within a sliding window of
+  ``repeated_lines_window`` pages (default 50), so chunks are yielded while later pages load.
+  A list of pages is still checked as a whole document.
 
 Exports
 - chunk_structured_pdf_items(items, chunker_cfg, effective_max_tokens) -> list[dict]
+- iter_structured_pdf_chunks(items, chunker_cfg, effective_max_tokens) -> iterator of dicts
 """
 from __future__ import annotations
 
 import re
 from collections import Counter
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
+from backend.ingest.tokenizer import get_tokenizer
+from backend.ingest.chunking.page_window import iter_page_windows
 from backend.ingest.chunking.toc_utils import strip_toc_region
 
 def _estimate_tokens(text: str) -> int:
@@ -22,38 +28,7 @@ def _estimate_tokens(text: str) -> int:
 
 
 def _split_to_token_limit(text: str, max_tokens: int) -> List[str]:
-    if _estimate_tokens(text) <= max_tokens:
-        return [text] if text.strip() else []
-
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    chunks: List[str] = []
-    buf: List[str] = []
-    for part in parts:
-        candidate = (" ".join(buf + [part])).strip()
-        if candidate and _estimate_tokens(candidate) <= max_tokens:
-            buf.append(part)
-            continue
-        if buf:
-            chunks.append(" ".join(buf).strip())
-            buf = [part]
-        else:
-            words = part.split()
-            wbuf: List[str] = []
-            for w in words:
-                candidate_w = " ".join(wbuf + [w]).strip()
-                if candidate_w and _estimate_tokens(candidate_w) <= max_tokens:
-                    wbuf.append(w)
-                else:
-                    if wbuf:
-                        chunks.append(" ".join(wbuf).strip())
-                    wbuf = [w]
-            if wbuf:
-                buf = [wbuf[-1]]
-            else:
-                buf = []
-    if buf:
-        chunks.append(" ".join(buf).strip())
-    return [c for c in chunks if c]
+    return get_tokenizer("heuristic").split(text, max_tokens)
 
 
 def _is_toc_line(line: str) -> bool:
@@ -139,6 +114,32 @@ def _find_repeated_lines(pages: Sequence[Dict]) -> set[str]:
     return {ln for ln, c in counts.items() if c >= threshold}
 
 
+def _repeated_line_counts(page: Dict) -> Counter[str]:
+    return Counter(
+        ln for ln in (raw.strip() for raw in (page.get("text") or "").splitlines()) if 1 <= len(ln) <= 120
+    )
+
+
+def _pages_with_repeated_lines(items: Iterable[Dict], window: int) -> Iterator[Tuple[Dict, set[str]]]:
+    """Pair each page with the lines repeated across the window of pages around it.
+
+    Same rule as ``_find_repeated_lines`` (at least 2 occurrences and 60% of the page count),
+    applied per window; documents no longer than ``window`` pages match it exactly.
+    """
+    counts: Counter[str] = Counter()
+    pages = ((page, _repeated_line_counts(page)) for page in items)
+    for (page, own), entering, leaving, size in iter_page_windows(pages, window):
+        for _, page_counts in entering:
+            counts.update(page_counts)
+        for _, page_counts in leaving:
+            for ln, n in page_counts.items():
+                counts[ln] -= n
+                if counts[ln] <= 0:
+                    del counts[ln]
+        threshold = max(2, int(size * 0.6))
+        yield page, {ln for ln in own if counts[ln] >= threshold}
+
+
 def _clean_lines(lines: List[str], *, drop_toc: bool, repeated: set[str]) -> List[str]:
     cleaned: List[str] = []
     for ln in lines:
@@ -215,10 +216,23 @@ def _explode_unit_on_strong_headings(text: str) -> List[str]:
 
 
 def chunk_structured_pdf_items(
-    items: Sequence[Dict],
+    items: Iterable[Dict],
     chunker_cfg: Dict,
     effective_max_tokens: int,
 ) -> List[Dict[str, object]]:
+    return list(iter_structured_pdf_chunks(items, chunker_cfg, effective_max_tokens))
+
+
+def iter_structured_pdf_chunks(
+    items: Iterable[Dict],
+    chunker_cfg: Dict,
+    effective_max_tokens: int,
+) -> Iterator[Dict[str, object]]:
+    """Yield chunks page by page; ``items`` may be a lazy page stream (e.g. pdf_loader.iter_load).
+
+    Repeated lines of a stream are detected per ``repeated_lines_window`` pages; a sequence
+    of pages is already in memory, so it is checked against the whole document.
+    """
     drop_toc = bool(chunker_cfg.get("drop_toc", True))
     toc_mode = str(chunker_cfg.get("toc_mode", "auto") or "auto").lower() if drop_toc else "off"
     toc_min_hits = int(chunker_cfg.get("toc_min_hits", 6) or 6)
@@ -228,6 +242,7 @@ def chunk_structured_pdf_items(
     min_tokens = int(chunker_cfg.get("min_tokens", 0) or 0)
     min_block_tokens = int(chunker_cfg.get("min_block_tokens", 20) or 20)
     overlap_tokens = int(chunker_cfg.get("overlap_tokens", 0) or 0)
+    repeated_window = int(chunker_cfg.get("repeated_lines_window", 50) or 50)
     pdf_cfg = {
         "drop_toc": drop_toc,
         "toc_mode": toc_mode,
@@ -236,10 +251,16 @@ def chunk_structured_pdf_items(
         "pdf_toc_max_pages": pdf_toc_max_pages,
     }
 
-    repeated_lines = _find_repeated_lines(items) if drop_repeated else set()
-    chunks: List[Dict[str, object]] = []
+    pages: Iterable[Tuple[Dict, set[str]]]
+    if not drop_repeated:
+        pages = ((page, set()) for page in items)
+    elif isinstance(items, Sequence):
+        repeated = _find_repeated_lines(items)
+        pages = ((page, repeated) for page in items)
+    else:
+        pages = _pages_with_repeated_lines(items, repeated_window)
 
-    for page in items:
+    for page, repeated_lines in pages:
         text = page.get("text") or ""
         meta = dict(page.get("metadata") or {})
         page_no = meta.get("page")
@@ -329,10 +350,7 @@ def chunk_structured_pdf_items(
                     chunk_meta["page_start"] = page_no
                     chunk_meta["page_end"] = page_no
                 chunk_meta["unit_type"] = unit_type
-                chunks.append(
-                    {
-                        "text": text_chunk,
-                        "metadata": chunk_meta,
-                    }
-                )
-    return chunks
+                yield {
+                    "text": text_chunk,
+                    "metadata": chunk_meta,
+                }
@@ -11,6 +11,7 @@ import re
 from typing import Dict, List, Tuple
 
 from backend.ingest.chunking.toc_utils import strip_toc_region
+from backend.ingest.tokenizer import LINE_BREAK, WORD_BREAK, get_tokenizer
 
 DOCX_TOC_DEBUG = (os.getenv("DOCX_TOC_DEBUG") or "").lower() in {"1", "true", "on", "yes"}
 DOCX_SECTION_CHUNK_DEBUG = (os.getenv("DOCX_SECTION_CHUNK_DEBUG") or "").lower() in {"1", "true", "on", "yes"}
@@ -852,19 +853,10 @@ def _split_heading1(items: List[Dict], inline_placeholders: bool) -> List[Dict]:
 
 
 def _split_to_limit(text: str, max_tokens: int, header: str) -> List[str]:
-    lines = text.splitlines()
-    chunks: List[str] = []
-    buf: List[str] = [header]
-    for ln in lines:
-        candidate = "\n".join(buf + [ln]).strip()
-        if _estimate_tokens(candidate) > max_tokens and len(buf) > 1:
-            chunks.append("\n".join(buf).strip())
-            buf = [header, ln]
-        else:
-            buf.append(ln)
-    if buf:
-        chunks.append("\n".join(buf).strip())
-    return chunks
+    """Split ``text`` at line breaks (words for overlong lines) and prefix every part with ``header``."""
+    budget = max(1, max_tokens - _estimate_tokens(header + "\n"))
+    parts = get_tokenizer("heuristic").split(text, budget, (LINE_BREAK, WORD_BREAK))
+    return [f"{header}\n{part}".strip() for part in parts] or [header.strip()]
 
 
 def _figures_for_part(text: str, figures: List[Dict], inline_placeholders: bool) -> List[Dict]:
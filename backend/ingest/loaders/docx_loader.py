@@ -3,6 +3,10 @@
 Purpose
 - Extract readable text blocks from `word/document.xml`. If `Heading1` paragraphs are present,
   split into sections by Heading1; otherwise return a single document item.
+- `DOCX_PARSER=lxml` swaps the python-docx DOM walk for the streaming reader in
+  `docx_stream` (same items, bounded memory).
+- `DOCX_EXTRACT_IMAGES` stores image bytes once per sha256 in `asset_store`; figure
+  `image_ref` is then `blobs/<aa>/<bb>/<sha256><ext>` under `RAG_ASSETS_DIR`.
 
 Contract
 - export: load(path: str) -> list[dict]
@@ -21,9 +25,11 @@ from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
+from backend.ingest.asset_store import assets_root as _assets_root, get_store
 from backend.ingest.text_cleaner import clean_text
 from backend.ingest.chunking.block_types import Block
 from backend.ingest.chunking.block_cleaner import clean_blocks
+from backend.ingest.loaders.docx_stream import DocxParagraph, iter_paragraphs
 
 _NSMAP = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
@@ -33,23 +39,6 @@ _NSMAP = {
 }
 
 
-def _repo_root() -> Path:
-    try:
-        return Path(__file__).resolve().parents[3]
-    except Exception:
-        return Path.cwd()
-
-
-def _assets_root() -> Path:
-    raw = os.getenv("RAG_ASSETS_DIR")
-    if raw:
-        path = Path(raw).expanduser()
-        if not path.is_absolute():
-            path = (_repo_root() / path).resolve()
-        return path
-    return _repo_root() / "data" / "rag-assets"
-
-
 def _env_flag(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
     if raw is None:
@@ -57,6 +46,13 @@ def _env_flag(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on", "y", "t"}
 
 
+
+def _docx_parser() -> str:
+    """DOCX backend: `python-docx` (default DOM walk) or `lxml` (streaming iterparse)."""
+    raw = (os.getenv("DOCX_PARSER") or "").strip().lower()
+    return "lxml" if raw == "lxml" else "python-docx"
+
+
 def _iter_run_image_rids(run) -> list[str]:
     blips = []
     try:
@@ -212,6 +208,37 @@ def _strip_heading_meta(meta: Dict[str, object]) -> Dict[str, object]:
     return downgraded
 
 
+
+def _dom_paragraph(paragraph, with_runs: bool) -> DocxParagraph:
+    text = paragraph.text or ""
+    runs = ()
+    if with_runs:
+        runs = tuple((run.text or "", tuple(_iter_run_image_rids(run))) for run in paragraph.runs)
+    if not text.strip() and not any(rids for _, rids in runs):
+        # Dropped by load(); skip the style and numbering lookups.
+        return DocxParagraph(text, "", None, None, None, runs)
+    style = getattr(paragraph, "style", None)
+    resolved_prefix, num_id, outline_level = _resolve_numbering_prefix(paragraph)
+    return DocxParagraph(
+        text=text,
+        style_name=(style.name if style else "") or "",
+        outline_number=resolved_prefix,
+        num_id=num_id,
+        ilvl=outline_level,
+        runs=runs,
+    )
+
+
+def _stream_paragraphs(abs_path: str, with_runs: bool, on_blip, images_zip: ZipFile | None):
+    try:
+        yield from iter_paragraphs(abs_path, images=with_runs, on_blip=on_blip)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(f"Failed to parse DOCX: {abs_path}: {exc}") from exc
+    finally:
+        if images_zip is not None:
+            images_zip.close()
+
+
 def load(path: str) -> List[Dict]:
     abs_path = os.path.abspath(path)
     doc_id = Path(abs_path).stem
@@ -232,6 +259,7 @@ def load(path: str) -> List[Dict]:
     embed_rids_count = 0
     rels_mapped = 0
     images_written = 0
+    images_deduped = 0
     image_blocks_emitted = 0
     failures = 0
     rid_to_target: Dict[str, str] = {}
@@ -243,10 +271,13 @@ def load(path: str) -> List[Dict]:
     zip_member_hit = 0
     zip_member_miss = 0
     bytes_read_ok = 0
-    try:
-        doc = Document(abs_path)
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError(f"Failed to parse DOCX: {abs_path}: {exc}") from exc
+    parser = _docx_parser()
+    doc = None
+    if parser == "python-docx":
+        try:
+            doc = Document(abs_path)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError(f"Failed to parse DOCX: {abs_path}: {exc}") from exc
 
     blocks: List[Block] = []
     counters: Dict[int, List[int]] = {}
@@ -256,155 +287,175 @@ def load(path: str) -> List[Dict]:
         "doc_id": doc_id,
     }
     figure_seq = 0
-    doc_assets_dir = assets_root / doc_id if extract_images else None
-    if emit_enabled:
+    asset_store = get_store(assets_root) if extract_images else None
+    stored_hashes: List[str] = []
+    seen_rids: set = set()
+
+    def _resolve_rid(zf: ZipFile, rid: str) -> None:
+        nonlocal targets_resolved, zip_member_miss, failures, rels_hit, zip_member_hit, bytes_read_ok
+        if rid in seen_rids:
+            return
+        seen_rids.add(rid)
+        target = rid_to_target.get(rid)
+        if target:
+            targets_resolved += 1
+        else:
+            zip_member_miss += 1
+            failures += 1
+            rid_payload[rid] = {"target": None, "member": None, "data": None, "ext": ".img", "candidates": []}
+            return
+        rels_hit += 1 if rid in rid_to_target else 0
+        candidates = []
+        raw_target = target
+        tgt = target.replace("\\", "/")
+        if tgt.startswith("/"):
+            tgt = tgt.lstrip("/")
+        if tgt.startswith("word/"):
+            candidates.append(tgt)
+            candidates.append(tgt[len("word/") :])
+        else:
+            candidates.append(f"word/{tgt}")
+            candidates.append(tgt)
+        try:
+            from urllib.parse import unquote
+            decoded = unquote(tgt)
+            if decoded != tgt:
+                if decoded.startswith("word/"):
+                    candidates.append(decoded)
+                else:
+                    candidates.append(f"word/{decoded}")
+        except Exception:
+            pass
+        # normalize ../
+        more_candidates = []
+        for cand in candidates:
+            parts = []
+            for part in PurePosixPath(cand).parts:
+                if part in ("", "."):
+                    continue
+                if part == "..":
+                    if parts:
+                        parts.pop()
+                    continue
+                parts.append(part)
+            norm = "/".join(parts)
+            if norm and norm not in more_candidates:
+                more_candidates.append(norm)
+        candidates = []
+        for cand in more_candidates:
+            if not cand.startswith("word/"):
+                candidates.append(f"word/{cand}")
+            candidates.append(cand)
+        chosen = None
+        for cand in candidates:
+            try:
+                zf.getinfo(cand)
+                chosen = cand
+                break
+            except KeyError:
+                continue
+        if not chosen:
+            zip_member_miss += 1
+            failures += 1
+            rid_payload[rid] = {"target": raw_target, "member": None, "data": None, "ext": ".img", "candidates": candidates}
+            if image_debug:
+                log.debug(
+                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s chosen=MISS",
+                    doc_id,
+                    rid,
+                    raw_target,
+                    candidates,
+                )
+            return
+        zip_member_hit += 1
+        try:
+            data = zf.read(chosen)
+            if data:
+                bytes_read_ok += 1
+            else:
+                failures += 1
+            ext = Path(chosen).suffix or ".img"
+            rid_payload[rid] = {
+                "target": raw_target,
+                "member": chosen,
+                "data": data,
+                "ext": ext,
+                "candidates": candidates,
+            }
+            if image_debug:
+                log.debug(
+                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s chosen=%s bytes=%s",
+                    doc_id,
+                    rid,
+                    raw_target,
+                    candidates,
+                    chosen,
+                    len(data) if data else 0,
+                )
+        except Exception as exc:
+            failures += 1
+            rid_payload[rid] = {
+                "target": raw_target,
+                "member": chosen,
+                "data": None,
+                "ext": ".img",
+                "candidates": candidates,
+            }
+            if image_debug:
+                log.debug(
+                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s read_failed=%s",
+                    doc_id,
+                    rid,
+                    raw_target,
+                    candidates,
+                    exc,
+                )
+
+    def _count_blip(zf: ZipFile, rid: str | None) -> None:
+        nonlocal blips_total, embed_rids_count
+        blips_total += 1
+        if rid:
+            embed_rids_count += 1
+            embed_order.append(rid)
+            _resolve_rid(zf, rid)
+
+    def _read_rels(zf: ZipFile) -> None:
+        nonlocal rels_total, rels_mapped
+        try:
+            rels_xml = zf.read("word/_rels/document.xml.rels")
+            rel_root = ET.fromstring(rels_xml)
+            rel_nodes = rel_root.findall(".//{http://schemas.openxmlformats.org/package/2006/relationships}Relationship")
+            rels_total = len(rel_nodes)
+            for rel in rel_nodes:
+                rid = rel.attrib.get("Id")
+                target = rel.attrib.get("Target")
+                if rid and target:
+                    rid_to_target[rid] = target
+            rels_mapped = len(rid_to_target)
+        except KeyError:
+            rels_mapped = 0
+
+    images_zip: ZipFile | None = None
+    if emit_enabled and doc is not None:
         try:
             with ZipFile(abs_path, "r") as zf:
-                try:
-                    rels_xml = zf.read("word/_rels/document.xml.rels")
-                    rel_root = ET.fromstring(rels_xml)
-                    rel_nodes = rel_root.findall(".//{http://schemas.openxmlformats.org/package/2006/relationships}Relationship")
-                    rels_total = len(rel_nodes)
-                    for rel in rel_nodes:
-                        rid = rel.attrib.get("Id")
-                        target = rel.attrib.get("Target")
-                        if rid and target:
-                            rid_to_target[rid] = target
-                    rels_mapped = len(rid_to_target)
-                except KeyError:
-                    rels_mapped = 0
+                _read_rels(zf)
                 try:
                     doc_xml = zf.read("word/document.xml")
                     doc_root = ET.fromstring(doc_xml)
                     for blip in doc_root.findall(".//{http://schemas.openxmlformats.org/drawingml/2006/main}blip"):
-                        blips_total += 1
-                        rid = blip.attrib.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed")
-                        if rid:
-                            embed_rids_count += 1
-                            embed_order.append(rid)
-                    seen_rids = set()
-                    for rid in embed_order:
-                        if rid in seen_rids:
-                            continue
-                        seen_rids.add(rid)
-                        target = rid_to_target.get(rid)
-                        if target:
-                            targets_resolved += 1
-                        else:
-                            zip_member_miss += 1
-                            failures += 1
-                            rid_payload[rid] = {"target": None, "member": None, "data": None, "ext": ".img", "candidates": []}
-                            continue
-                        rels_hit += 1 if rid in rid_to_target else 0
-                        candidates = []
-                        raw_target = target
-                        tgt = target.replace("\\", "/")
-                        if tgt.startswith("/"):
-                            tgt = tgt.lstrip("/")
-                        if tgt.startswith("word/"):
-                            candidates.append(tgt)
-                            candidates.append(tgt[len("word/") :])
-                        else:
-                            candidates.append(f"word/{tgt}")
-                            candidates.append(tgt)
-                        try:
-                            from urllib.parse import unquote
-                            decoded = unquote(tgt)
-                            if decoded != tgt:
-                                if decoded.startswith("word/"):
-                                    candidates.append(decoded)
-                                else:
-                                    candidates.append(f"word/{decoded}")
-                        except Exception:
-                            pass
-                        # normalize ../
-                        more_candidates = []
-                        for cand in candidates:
-                            parts = []
-                            for part in PurePosixPath(cand).parts:
-                                if part in ("", "."):
-                                    continue
-                                if part == "..":
-                                    if parts:
-                                        parts.pop()
-                                    continue
-                                parts.append(part)
-                            norm = "/".join(parts)
-                            if norm and norm not in more_candidates:
-                                more_candidates.append(norm)
-                        candidates = []
-                        for cand in more_candidates:
-                            if not cand.startswith("word/"):
-                                candidates.append(f"word/{cand}")
-                            candidates.append(cand)
-                        chosen = None
-                        for cand in candidates:
-                            try:
-                                zf.getinfo(cand)
-                                chosen = cand
-                                break
-                            except KeyError:
-                                continue
-                        if not chosen:
-                            zip_member_miss += 1
-                            failures += 1
-                            rid_payload[rid] = {"target": raw_target, "member": None, "data": None, "ext": ".img", "candidates": candidates}
-                            if image_debug:
-                                log.debug(
-                                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s chosen=MISS",
-                                    doc_id,
-                                    rid,
-                                    raw_target,
-                                    candidates,
-                                )
-                            continue
-                        zip_member_hit += 1
-                        try:
-                            data = zf.read(chosen)
-                            if data:
-                                bytes_read_ok += 1
-                            else:
-                                failures += 1
-                            ext = Path(chosen).suffix or ".img"
-                            rid_payload[rid] = {
-                                "target": raw_target,
-                                "member": chosen,
-                                "data": data,
-                                "ext": ext,
-                                "candidates": candidates,
-                            }
-                            if image_debug:
-                                log.debug(
-                                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s chosen=%s bytes=%s",
-                                    doc_id,
-                                    rid,
-                                    raw_target,
-                                    candidates,
-                                    chosen,
-                                    len(data) if data else 0,
-                                )
-                        except Exception as exc:
-                            failures += 1
-                            rid_payload[rid] = {
-                                "target": raw_target,
-                                "member": chosen,
-                                "data": None,
-                                "ext": ".img",
-                                "candidates": candidates,
-                            }
-                            if image_debug:
-                                log.debug(
-                                    "DOCX_IMAGE_DEBUG doc_id=%s rid=%s target=%s candidates=%s read_failed=%s",
-                                    doc_id,
-                                    rid,
-                                    raw_target,
-                                    candidates,
-                                    exc,
-                                )
+                        _count_blip(zf, blip.attrib.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"))
                 except KeyError:
                     pass
         except (BadZipFile, FileNotFoundError):
             pass
+    elif emit_enabled:
+        # Streaming backend: blips are counted and resolved as the parser reaches them.
+        try:
+            images_zip = ZipFile(abs_path, "r")
+            _read_rels(images_zip)
+        except (BadZipFile, FileNotFoundError):
+            images_zip = None
 
     def _iter_block_items(parent):
         if isinstance(parent, _Cell):
@@ -422,25 +473,30 @@ def load(path: str) -> List[Dict]:
                     for cell in row.cells:
                         yield from _iter_block_items(cell)
 
-    for p in _iter_block_items(doc):
-        raw_text = p.text or ""
-        text = raw_text.rstrip("\n")
-        run_rids = []
-        if emit_enabled:
-            for run in p.runs:
-                run_rids.extend(_iter_run_image_rids(run))
+    if doc is not None:
+        paragraphs = (_dom_paragraph(p, emit_enabled) for p in _iter_block_items(doc))
+    else:
+        paragraphs = _stream_paragraphs(
+            abs_path,
+            emit_enabled,
+            (lambda rid: _count_blip(images_zip, rid)) if images_zip is not None else None,
+            images_zip,
+        )
+
+    for p in paragraphs:
+        text = p.text.rstrip("\n")
+        run_rids = [rid for _, rids in p.runs for rid in rids] if emit_enabled else []
         has_image = emit_enabled and bool(run_rids)
         if not text.strip() and not has_image:
             continue
-        style = getattr(p, "style", None)
-        style_name = (style.name if style else "").strip().lower()
+        style_name = p.style_name.strip().lower()
         if style_name.startswith("toc"):
             continue
 
         block_type = "paragraph"
         heading_level = None
         numbering_prefix = None
-        resolved_prefix, num_id, outline_level = _resolve_numbering_prefix(p)
+        resolved_prefix, num_id, outline_level = p.outline_number, p.num_id, p.ilvl
         computed_prefix = None
 
         if style_name.startswith("heading"):
@@ -514,9 +570,7 @@ def load(path: str) -> List[Dict]:
 
         text_fragments: List[str] = []
         buffer = ""
-        for run in p.runs:
-            run_text = (run.text or "")
-            run_rid_list = _iter_run_image_rids(run)
+        for run_text, run_rid_list in p.runs:
             if run_text:
                 buffer += run_text
             if run_rid_list:
@@ -563,15 +617,10 @@ def load(path: str) -> List[Dict]:
                         "sha256": sha,
                     }
                 )
-                data = payload.get("data")
-                if extract_images and doc_assets_dir is not None and data:
-                    target = doc_assets_dir / fname
-                    target.parent.mkdir(parents=True, exist_ok=True)
+                if asset_store is not None:
                     images_write_attempted += 1
                     try:
-                        target.write_bytes(data)  # type: ignore[arg-type]
-                        images_written += 1
-                        img_meta["asset_path"] = str(target)
+                        stored = asset_store.put(data, ext, sha)  # type: ignore[arg-type]
                     except Exception as exc:  # noqa: BLE001
                         failures += 1
                         if image_debug:
@@ -581,9 +630,17 @@ def load(path: str) -> List[Dict]:
                                 figure_id,
                                 rid,
                                 exc,
-                                target,
+                                asset_store.path_for(sha, ext),
                             )
                         continue
+                    if stored.written:
+                        images_written += 1
+                    else:
+                        images_deduped += 1
+                    stored_hashes.append(sha)
+                    # Content-addressed: identical images share one blob across documents.
+                    img_meta["image_ref"] = stored.ref
+                    img_meta["asset_path"] = str(stored.path)
                 blocks.append(Block(type="image", text=figure_id, meta=img_meta))
                 image_blocks_emitted += 1
                 if image_debug:
@@ -623,6 +680,10 @@ def load(path: str) -> List[Dict]:
                 outline_level,
             )
 
+    if asset_store is not None:
+        asset_store.flush()
+        asset_store.record_refs(doc_id, abs_path, stored_hashes)
+
     log.info(
         "DOCX_IMAGE_FLAGS doc_id=%s extract_images=%s inline_placeholders=%s figure_chunks=%s rag_assets_dir=%s",
         doc_id,
@@ -632,9 +693,9 @@ def load(path: str) -> List[Dict]:
         str(assets_root) if extract_images else "",
     )
     if emit_enabled:
-        assets_dir_str = str(doc_assets_dir) if doc_assets_dir is not None else ""
+        assets_dir_str = str(asset_store.root) if asset_store is not None else ""
         log.info(
-            "DOCX_IMAGES_SUMMARY doc_id=%s blips_total=%s embed_rids=%s rels_total=%s rels_mapped=%s rels_hit=%s targets_resolved=%s zip_member_hit=%s zip_member_miss=%s bytes_read_ok=%s images_write_attempted=%s images_written=%s image_emit_attempted=%s image_blocks_emitted=%s image_emit_skipped=%s image_emit_skip_reason=%s failures=%s assets_dir=%s source=%s",
+            "DOCX_IMAGES_SUMMARY doc_id=%s blips_total=%s embed_rids=%s rels_total=%s rels_mapped=%s rels_hit=%s targets_resolved=%s zip_member_hit=%s zip_member_miss=%s bytes_read_ok=%s images_write_attempted=%s images_written=%s images_deduped=%s image_emit_attempted=%s image_blocks_emitted=%s image_emit_skipped=%s image_emit_skip_reason=%s failures=%s assets_dir=%s source=%s",
             doc_id,
             blips_total,
             embed_rids_count,
@@ -647,6 +708,7 @@ def load(path: str) -> List[Dict]:
             bytes_read_ok,
             images_write_attempted,
             images_written,
+            images_deduped,
             image_emit_attempted,
             image_blocks_emitted,
             image_emit_skipped,
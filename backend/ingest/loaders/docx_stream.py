@@ -0,0 +1,270 @@
+"""Streaming DOCX paragraph reader built on lxml iterparse.
+
+Purpose
+- Walk `word/document.xml` without building the python-docx object model and yield the
+  paragraph view `docx_loader` needs: body and table-cell paragraphs in reading order, with
+  run text, image rIds, style name and direct `w:numPr` numbering.
+- Resolve paragraph style names through a lookup table built once per file from
+  `word/styles.xml`, following python-docx rules (unknown ids and non-paragraph styles fall
+  back to the default paragraph style).
+- Table cells are repeated the way python-docx `row.cells` repeats them (once per spanned
+  grid column, vertically merged continuations repeat the cell above) so both backends
+  produce identical items.
+
+Contract
+- export: iter_paragraphs(path: str, images: bool = False, on_blip=None) -> Iterator[DocxParagraph]
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from zipfile import ZipFile
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_A_BLIP = "{http://schemas.openxmlformats.org/drawingml/2006/main}blip"
+_R_EMBED = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
+
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_VAL = f"{_W}val"
+_W_HYPERLINK = f"{_W}hyperlink"
+
+_ON_VALUES = {"1", "true", "on"}
+
+
+class DocxParagraph(NamedTuple):
+    text: str
+    style_name: str
+    outline_number: Optional[str]
+    num_id: Optional[int]
+    ilvl: Optional[int]
+    runs: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+
+
+def _load_style_names(zf: ZipFile) -> Tuple[Dict[str, str], str]:
+    """Return ({styleId: name} for paragraph styles, default paragraph style name)."""
+    names: Dict[str, str] = {}
+    non_paragraph: set = set()
+    default = ""
+    try:
+        fh = zf.open("word/styles.xml")
+    except KeyError:
+        return names, default
+    with fh:
+        for _, style in etree.iterparse(fh, events=("end",), tag=f"{_W}style"):
+            style_id = style.get(f"{_W}styleId")
+            style_type = style.get(f"{_W}type") or "paragraph"
+            name_el = style.find(f"{_W}name")
+            name = (name_el.get(_W_VAL) if name_el is not None else None) or ""
+            if style_type == "paragraph":
+                if (style.get(f"{_W}default") or "").lower() in _ON_VALUES:
+                    default = name
+                if style_id and style_id not in names and style_id not in non_paragraph:
+                    names[style_id] = name
+            elif style_id and style_id not in names:
+                non_paragraph.add(style_id)
+            style.clear()
+    return names, default
+
+
+def _int_val(el) -> Optional[int]:
+    if el is None:
+        return None
+    return int(el.get(_W_VAL))
+
+
+def _numbering(ppr) -> Tuple[Optional[int], Optional[int]]:
+    """(numId, ilvl) from direct w:numPr, mirroring docx_loader._resolve_numbering_prefix."""
+    num_pr = ppr.find(f"{_W}numPr") if ppr is not None else None
+    if num_pr is None:
+        return None, None
+    try:
+        num_id = _int_val(num_pr.find(f"{_W}numId"))
+    except (TypeError, ValueError):
+        return None, None
+    try:
+        ilvl = _int_val(num_pr.find(f"{_W}ilvl"))
+    except (TypeError, ValueError):
+        return num_id, None
+    return num_id, ilvl
+
+
+def _run_text(run) -> str:
+    parts: List[str] = []
+    for child in run:
+        tag = child.tag
+        if tag == f"{_W}t":
+            parts.append(child.text or "")
+        elif tag in (f"{_W}tab", f"{_W}ptab"):
+            parts.append("\t")
+        elif tag == f"{_W}br":
+            parts.append("\n" if (child.get(f"{_W}type") or "textWrapping") == "textWrapping" else "")
+        elif tag == f"{_W}cr":
+            parts.append("\n")
+        elif tag == f"{_W}noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def _run_rids(run) -> Tuple[str, ...]:
+    return tuple(rid for rid in (blip.get(_R_EMBED) for blip in run.iter("{*}blip")) if rid)
+
+
+def _paragraph(p, styles: Tuple[Dict[str, str], str], images: bool) -> DocxParagraph:
+    texts: List[str] = []
+    runs: List[Tuple[str, Tuple[str, ...]]] = []
+    for child in p:
+        if child.tag == _W_R:
+            run_text = _run_text(child)
+            texts.append(run_text)
+            if images:
+                runs.append((run_text, _run_rids(child)))
+        elif child.tag == _W_HYPERLINK:
+            texts.extend(_run_text(r) for r in child.iterchildren(_W_R))
+    ppr = p.find(f"{_W}pPr")
+    style_el = ppr.find(f"{_W}pStyle") if ppr is not None else None
+    style_id = style_el.get(_W_VAL) if style_el is not None else None
+    names, default = styles
+    num_id, ilvl = _numbering(ppr)
+    return DocxParagraph(
+        text="".join(texts),
+        style_name=names.get(style_id, default) if style_id else default,
+        outline_number=None,
+        num_id=num_id,
+        ilvl=ilvl,
+        runs=tuple(runs),
+    )
+
+
+def _tc_layout(tc) -> Tuple[int, bool]:
+    """(gridSpan, is vMerge continuation) for a w:tc element."""
+    tc_pr = tc.find(f"{_W}tcPr")
+    if tc_pr is None:
+        return 1, False
+    span_el = tc_pr.find(f"{_W}gridSpan")
+    span = int(span_el.get(_W_VAL) or 1) if span_el is not None else 1
+    merge_el = tc_pr.find(f"{_W}vMerge")
+    continued = merge_el is not None and (merge_el.get(_W_VAL) or "continue") == "continue"
+    return span, continued
+
+
+def _grid_before(tr) -> int:
+    tr_pr = tr.find(f"{_W}trPr")
+    el = tr_pr.find(f"{_W}gridBefore") if tr_pr is not None else None
+    return int(el.get(_W_VAL) or 0) if el is not None else 0
+
+
+class _Table:
+    __slots__ = ("el", "tr", "tc", "offset", "cell", "row", "prev_row", "row_out")
+
+    def __init__(self, el):
+        self.el = el
+        self.tr = None
+        self.tc = None
+        self.offset: Optional[int] = None
+        self.cell: List[DocxParagraph] = []
+        # grid offset -> (paragraphs of the cell rooted there, root gridSpan)
+        self.row: Dict[int, Tuple[List[DocxParagraph], int]] = {}
+        self.prev_row: Dict[int, Tuple[List[DocxParagraph], int]] = {}
+        self.row_out: List[DocxParagraph] = []
+
+    def close_cell(self) -> None:
+        span, continued = _tc_layout(self.tc)
+        if self.offset is None:
+            self.offset = _grid_before(self.tr)
+        if continued:
+            paragraphs, root_span = self.prev_row.get(self.offset, ([], 0))
+        else:
+            paragraphs, root_span = self.cell, span
+        self.row[self.offset] = (paragraphs, root_span)
+        for _ in range(root_span):
+            self.row_out.extend(paragraphs)
+        self.offset += span
+        self.tc = None
+        self.cell = []
+
+    def close_row(self) -> List[DocxParagraph]:
+        out = self.row_out
+        self.prev_row, self.row, self.row_out = self.row, {}, []
+        self.tr = None
+        self.offset = None
+        return out
+
+
+def _drop_parsed(el) -> None:
+    el.clear()
+    parent = el.getparent()
+    while el.getprevious() is not None:
+        del parent[0]
+
+
+def iter_paragraphs(
+    path: str,
+    images: bool = False,
+    on_blip: Optional[Callable[[Optional[str]], None]] = None,
+) -> Iterator[DocxParagraph]:
+    """Yield paragraphs from a DOCX file without materialising the document tree.
+
+    ``images`` fills ``DocxParagraph.runs`` with per-run text and image rIds; ``on_blip`` is
+    called for every ``a:blip`` in document order (including ones outside emitted paragraphs).
+    Body-level elements are released once handled, so memory stays bounded by the largest
+    top-level paragraph or table.
+    """
+    with ZipFile(path, "r") as zf:
+        styles = _load_style_names(zf)
+        with zf.open("word/document.xml") as fh:
+            body = None
+            tables: List[_Table] = []
+            events = etree.iterparse(
+                fh,
+                events=("start", "end"),
+                tag=(_W_BODY, _W_P, _W_TBL, _W_TR, _W_TC, _A_BLIP),
+            )
+            for event, el in events:
+                tag = el.tag
+                if event == "start":
+                    if tag == _W_BODY:
+                        body = el
+                    elif tag == _W_TBL:
+                        parent = el.getparent()
+                        if parent is body or (tables and parent is tables[-1].tc):
+                            tables.append(_Table(el))
+                    elif tag == _W_TR:
+                        if tables and el.getparent() is tables[-1].el:
+                            tables[-1].tr = el
+                    elif tag == _W_TC:
+                        if tables and tables[-1].tr is not None and el.getparent() is tables[-1].tr:
+                            tables[-1].tc = el
+                    continue
+
+                if tag == _A_BLIP:
+                    if on_blip is not None:
+                        on_blip(el.get(_R_EMBED))
+                elif tag == _W_P:
+                    parent = el.getparent()
+                    if parent is body:
+                        yield _paragraph(el, styles, images)
+                        _drop_parsed(el)
+                    elif tables and parent is tables[-1].tc:
+                        tables[-1].cell.append(_paragraph(el, styles, images))
+                elif tag == _W_TC:
+                    if tables and el is tables[-1].tc:
+                        tables[-1].close_cell()
+                elif tag == _W_TR:
+                    if tables and el is tables[-1].tr:
+                        rows = tables[-1].close_row()
+                        if len(tables) > 1:
+                            tables[-2].cell.extend(rows)
+                        else:
+                            yield from rows
+                elif tag == _W_TBL:
+                    if tables and el is tables[-1].el:
+                        tables.pop()
+                        if el.getparent() is body:
+                            _drop_parsed(el)
@@ -2,28 +2,37 @@
 
 Purpose
 - Use native PDF text extraction via pdfplumber as default.
-- When configured, selectively apply OCR: per-page (auto) or entire file (force).
+- When configured, selectively apply OCR: low-text pages only (auto) or entire file (force).
+- auto mode copies every low-text page into one PDF and OCRs it in a single ocrmypdf run
+  (``jobs`` workers), then maps the text back to the original page numbers.
 
 Environment controls
 - PDF_OCR_MODE: off | auto | force (default auto)
 - PDF_OCR_LANGS: language codes (default eng)
 - PDF_OCR_PAGE_LIMIT: int (0 = unlimited)
 - PDF_OCR_MIN_TEXT_CHARS: per-page native text threshold (default 50)
+- PDF_OCR_JOBS: ocrmypdf worker processes per run (default: CPU count)
+- PDF_STREAM_WINDOW: pages held by iter_load for cleaning and per OCR run (default 50)
 
 Contract
 - export: load(path: str) -> list[dict]
+- export: iter_load(path: str, window: int | None = None) -> iterator of the same items,
+  yielded page by page; headers/footers and TOC are cleaned within a sliding window of
+  pages instead of the whole document, so memory and time-to-first-item stay flat.
 - Each returned item includes:
   - "text": str (skip if empty)
   - "metadata": dict with: `source` (abs), `content_type`, `page` (int), `has_ocr` (bool)
 """
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 import logging
 import os
+import time
+from itertools import islice
 from tempfile import TemporaryDirectory
 from backend.ingest.text_cleaner import clean_text
 from backend.ingest.chunking.block_types import Block
-from backend.ingest.chunking.block_cleaner import clean_blocks
+from backend.ingest.chunking.block_cleaner import clean_blocks, iter_clean_pdf_blocks
 
 import pdfplumber  # type: ignore
 
@@ -33,58 +42,34 @@ logger = logging.getLogger(__name__)
 pages_total = 0
 pages_ocr = 0
 pages_native_empty = 0
+# OCR cost: ocrmypdf invocations, pages sent to them and wall-clock seconds spent
+ocr_runs = 0
+ocr_pages_attempted = 0
+ocr_seconds = 0.0
 
 
-def _extract_native_texts(abs_path: str) -> List[str]:
-    texts: List[str] = []
-    with pdfplumber.open(abs_path) as pdf:
-        for page in pdf.pages:
-            try:
-                txt = page.extract_text() or ""
-            except Exception:  # noqa: BLE001
-                txt = ""
-            texts.append((txt or "").replace("\r", "\n").strip())
-    return texts
+def ocr_seconds_per_page() -> float:
+    return round(ocr_seconds / ocr_pages_attempted, 3) if ocr_pages_attempted else 0.0
 
 
-def _ocr_single_page(ocr, src_pdf: str, page_number: int, langs: str) -> str:
-    """Run OCR on a single page by creating one-page PDF and reading OCR result."""
+def _ocr_jobs() -> int:
     try:
-        from PyPDF2 import PdfReader, PdfWriter  # type: ignore
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("PyPDF2 unavailable for per-page OCR: %s", exc)
-        return ""
+        jobs = int(os.getenv("PDF_OCR_JOBS", "0") or "0")
+    except Exception:
+        jobs = 0
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
 
-    with TemporaryDirectory() as td:
-        single_in = os.path.join(td, "in.pdf")
-        single_out = os.path.join(td, "out.pdf")
-        try:
-            reader = PdfReader(src_pdf)
-            writer = PdfWriter()
-            # page_number is 1-based
-            src_idx = max(0, page_number - 1)
-            if src_idx >= len(reader.pages):
-                return ""
-            writer.add_page(reader.pages[src_idx])
-            with open(single_in, "wb") as f:
-                writer.write(f)
-            # ocrmypdf.ocr
-            ocr.ocr(single_in, single_out, language=langs, force_ocr=True, progress_bar=False)
-            # read OCR text
-            with pdfplumber.open(single_out) as ocr_pdf:
-                page = ocr_pdf.pages[0]
-                return (page.extract_text() or "").replace("\r", "\n").strip()
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("OCR single-page failed (page=%d): %s", page_number, exc)
-            return ""
 
+def _stream_window() -> int:
+    try:
+        window = int(os.getenv("PDF_STREAM_WINDOW", "50") or "50")
+    except Exception:
+        window = 50
+    return max(1, window)
 
-def load(path: str) -> List[Dict]:
-    """Load a PDF file and return a list of items with text and metadata."""
-    global pages_total, pages_ocr, pages_native_empty
-    abs_path = os.path.abspath(path)
 
-    # env knobs
+def _ocr_settings() -> Tuple[str, str, int, int]:
+    """(mode, langs, page_limit, min_chars) from the PDF_OCR_* environment."""
     mode = (os.getenv("PDF_OCR_MODE", "auto") or "auto").lower()
     langs = os.getenv("PDF_OCR_LANGS", "eng") or "eng"
     try:
@@ -95,20 +80,105 @@ def load(path: str) -> List[Dict]:
         min_chars = int(os.getenv("PDF_OCR_MIN_TEXT_CHARS", "50") or "50")
     except Exception:
         min_chars = 50
+    return mode, langs, page_limit, min_chars
+
+
+def _page_text(page) -> str:
+    try:
+        txt = page.extract_text() or ""
+    except Exception:  # noqa: BLE001
+        txt = ""
+    return (txt or "").replace("\r", "\n").strip()
+
+
+def _iter_native_texts(abs_path: str) -> Iterator[str]:
+    with pdfplumber.open(abs_path) as pdf:
+        for page in pdf.pages:
+            yield _page_text(page)
+            # Release the page's parsed objects; pdfplumber otherwise keeps every page cached.
+            close = getattr(page, "close", None)
+            if callable(close):
+                close()
+
+
+def _extract_native_texts(abs_path: str) -> List[str]:
+    return list(_iter_native_texts(abs_path))
 
-    native_texts = _extract_native_texts(abs_path)
-    n_pages = len(native_texts)
-    pages_total += n_pages
-    # mark native-empty pages
-    native_empty_flags = [len(t) < min_chars for t in native_texts]
-    pages_native_empty += sum(1 for f in native_empty_flags if f)
 
-    ocr_texts: List[str] = [""] * n_pages
-    performed_ocr = 0
+def _record_ocr(pages: int, seconds: float) -> None:
+    global ocr_runs, ocr_pages_attempted, ocr_seconds
+    ocr_runs += 1
+    ocr_pages_attempted += pages
+    ocr_seconds += seconds
+
+
+def _ocr_run(ocr, reader, page_numbers: Sequence[int], langs: str, jobs: int) -> Optional[Dict[int, str]]:
+    """OCR the given 1-based pages of ``reader`` in one ocrmypdf run; None if the run fails."""
+    from PyPDF2 import PdfWriter  # type: ignore
+
+    with TemporaryDirectory() as td:
+        batch_in = os.path.join(td, "in.pdf")
+        batch_out = os.path.join(td, "out.pdf")
+        started = time.perf_counter()
+        try:
+            writer = PdfWriter()
+            for pno in page_numbers:
+                writer.add_page(reader.pages[pno - 1])
+            with open(batch_in, "wb") as f:
+                writer.write(f)
+            ocr.ocr(batch_in, batch_out, language=langs, force_ocr=True, progress_bar=False, jobs=jobs)
+            # Page k of the OCR output is page_numbers[k] of the source
+            with pdfplumber.open(batch_out) as ocr_pdf:
+                return {
+                    pno: (page.extract_text() or "").replace("\r", "\n").strip()
+                    for pno, page in zip(page_numbers, ocr_pdf.pages)
+                }
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("OCR failed (pages=%s): %s", list(page_numbers)[:10], exc)
+            return None
+        finally:
+            _record_ocr(len(page_numbers), time.perf_counter() - started)
 
-    if mode == "off":
-        pass  # no OCR
-    else:
+
+def _open_reader(src_pdf: str):
+    try:
+        from PyPDF2 import PdfReader  # type: ignore
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("PyPDF2 unavailable for page OCR: %s", exc)
+        return None
+    try:
+        return PdfReader(src_pdf)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("OCR skipped; cannot read %s: %s", src_pdf, exc)
+        return None
+
+
+def _ocr_pages(ocr, reader, page_numbers: Sequence[int], langs: str, jobs: int) -> Dict[int, str]:
+    """OCR ``page_numbers`` (1-based) of an already parsed source in one ocrmypdf run."""
+    pages = [pno for pno in page_numbers if 1 <= pno <= len(reader.pages)]
+    if not pages:
+        return {}
+    texts = _ocr_run(ocr, reader, pages, langs, jobs)
+    if texts is None and len(pages) > 1:
+        # One unreadable page fails the whole run; retry page by page so the others still get text.
+        texts = {}
+        for pno in pages:
+            texts.update(_ocr_run(ocr, reader, [pno], langs, 1) or {})
+    return texts or {}
+
+
+def _iter_page_texts(abs_path: str, ocr_group_pages: int = 0) -> Iterator[Tuple[str, bool]]:
+    """Yield ``(text, has_ocr)`` per page, in order, updating the module counters.
+
+    In auto mode the low-text pages of every ``ocr_group_pages`` pages (0 = whole document)
+    are OCRed together in one run; the source is parsed for OCR at most once per document.
+    """
+    global pages_total, pages_ocr, pages_native_empty
+    mode, langs, page_limit, min_chars = _ocr_settings()
+    jobs = _ocr_jobs()
+
+    ocr = None
+    if mode != "off":
         # Try import lazily
         try:
             import ocrmypdf as ocr  # type: ignore
@@ -116,56 +186,111 @@ def load(path: str) -> List[Dict]:
             logger.warning("OCR disabled (ocrmypdf unavailable): %s", exc)
             ocr = None
 
-        if ocr is not None:
-            if mode == "force":
-                with TemporaryDirectory() as td:
-                    out_pdf = os.path.join(td, "ocr_full.pdf")
-                    try:
-                        ocr.ocr(abs_path, out_pdf, language=langs, force_ocr=True, progress_bar=False)
-                        with pdfplumber.open(out_pdf) as pdf:
-                            for i, page in enumerate(pdf.pages):
-                                if page_limit > 0 and i >= page_limit:
-                                    break
-                                txt = (page.extract_text() or "").replace("\r", "\n").strip()
-                                ocr_texts[i] = txt
-                                performed_ocr += 1
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning("OCR full-file failed: %s", exc)
-                        performed_ocr = performed_ocr  # no-op; keep native
-            else:  # auto
-                # build list of pages to OCR
-                to_ocr = [i + 1 for i, flag in enumerate(native_empty_flags) if flag]
-                if page_limit > 0:
-                    to_ocr = to_ocr[:page_limit]
-                for pno in to_ocr:
-                    txt = _ocr_single_page(ocr, abs_path, pno, langs)
-                    if txt:
-                        ocr_texts[pno - 1] = txt
-                        performed_ocr += 1
-
-    pages_ocr += performed_ocr
-
-    blocks: List[Block] = []
-    for idx in range(n_pages):
-        text = ocr_texts[idx] or native_texts[idx] or ""
-        blocks.append(
-            Block(
-                type="paragraph",
-                text=text,
-                meta={
-                    "source": abs_path,
-                    "content_type": "application/pdf",
-                    "page": idx + 1,
-                    "has_ocr": bool(ocr_texts[idx]),
-                },
-            )
-        )
-
-    cleaned = clean_blocks("pdf", blocks)
-    items: List[Dict] = []
-    for blk in cleaned:
+    native = _iter_native_texts(abs_path)
+    if ocr is not None and mode == "force":
+        yield from _iter_force_ocr(ocr, abs_path, native, langs, page_limit, min_chars, jobs)
+        return
+
+    reader = None
+    ocr_budget = page_limit if page_limit > 0 else None
+    first_page = 1
+    while True:
+        group = list(islice(native, ocr_group_pages)) if ocr_group_pages > 0 else list(native)
+        if not group:
+            return
+        pages_total += len(group)
+        native_empty = [first_page + i for i, t in enumerate(group) if len(t) < min_chars]
+        pages_native_empty += len(native_empty)
+        ocr_texts: Dict[int, str] = {}
+        to_ocr = native_empty if ocr_budget is None else native_empty[:ocr_budget]
+        if ocr is not None and to_ocr:
+            if reader is None:
+                reader = _open_reader(abs_path)
+            if reader is not None:
+                ocr_texts = {pno: txt for pno, txt in _ocr_pages(ocr, reader, to_ocr, langs, jobs).items() if txt}
+            pages_ocr += len(ocr_texts)
+            if ocr_budget is not None:
+                ocr_budget -= len(to_ocr)
+        for i, text in enumerate(group):
+            ocr_text = ocr_texts.get(first_page + i, "")
+            yield (ocr_text or text), bool(ocr_text)
+        first_page += len(group)
+        if ocr_group_pages <= 0:
+            return
+
+
+def _iter_force_ocr(
+    ocr, abs_path: str, native: Iterable[str], langs: str, page_limit: int, min_chars: int, jobs: int
+) -> Iterator[Tuple[str, bool]]:
+    """Force mode: OCR the whole file once, then pair its pages with the native text."""
+    global pages_total, pages_ocr, pages_native_empty
+    with TemporaryDirectory() as td:
+        out_pdf = os.path.join(td, "ocr_full.pdf")
+        started = time.perf_counter()
+        ocr_pdf = None
+        try:
+            ocr.ocr(abs_path, out_pdf, language=langs, force_ocr=True, progress_bar=False, jobs=jobs)
+            ocr_pdf = pdfplumber.open(out_pdf)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("OCR full-file failed: %s", exc)
+        finally:
+            _record_ocr(len(ocr_pdf.pages) if ocr_pdf is not None else 0, time.perf_counter() - started)
+        try:
+            ocr_pages = ocr_pdf.pages if ocr_pdf is not None else []
+            for idx, text in enumerate(native):
+                pages_total += 1
+                pages_native_empty += len(text) < min_chars
+                ocr_text = ""
+                if idx < len(ocr_pages) and not (page_limit > 0 and idx >= page_limit):
+                    ocr_text = _page_text(ocr_pages[idx])
+                    pages_ocr += 1
+                yield (ocr_text or text), bool(ocr_text)
+        finally:
+            if ocr_pdf is not None:
+                ocr_pdf.close()
+
+
+def _page_block(abs_path: str, page_no: int, text: str, has_ocr: bool) -> Block:
+    return Block(
+        type="paragraph",
+        text=text,
+        meta={
+            "source": abs_path,
+            "content_type": "application/pdf",
+            "page": page_no,
+            "has_ocr": has_ocr,
+        },
+    )
+
+
+def _to_items(blocks: Iterable[Block]) -> Iterator[Dict]:
+    for blk in blocks:
         text_clean = clean_text(blk.text, preserve_tables=False)
         if not text_clean:
             continue
-        items.append({"text": text_clean, "metadata": blk.meta})
-    return items
+        yield {"text": text_clean, "metadata": blk.meta}
+
+
+def load(path: str) -> List[Dict]:
+    """Load a PDF file and return a list of items with text and metadata."""
+    abs_path = os.path.abspath(path)
+    blocks = [
+        _page_block(abs_path, page_no, text, has_ocr)
+        for page_no, (text, has_ocr) in enumerate(_iter_page_texts(abs_path), start=1)
+    ]
+    return list(_to_items(clean_blocks("pdf", blocks)))
+
+
+def iter_load(path: str, window: Optional[int] = None) -> Iterator[Dict]:
+    """Yield the items ``load`` returns, page by page, holding about ``window`` pages.
+
+    Pages are read lazily, OCRed in groups of ``window`` pages and cleaned against a sliding
+    window, so items from early pages are available while later pages are still parsed.
+    """
+    abs_path = os.path.abspath(path)
+    window = window or _stream_window()
+    blocks = (
+        _page_block(abs_path, page_no, text, has_ocr)
+        for page_no, (text, has_ocr) in enumerate(_iter_page_texts(abs_path, window), start=1)
+    )
+    yield from _to_items(iter_clean_pdf_blocks(blocks, window))
@@ -1,88 +1,355 @@
-"""XLSX loader using zipfile + XML (dimension-based summary).
+"""XLSX loader streaming worksheet cells with zipfile + ElementTree iterparse.
 
 Purpose
-- Produce a concise summary per sheet: sheet name and dimensions (n_rows x n_cols). Avoids heavy parsing.
+- Emit the cell values of every worksheet as row-group items sized for the chunker. Each
+  item repeats the sheet's header row(s) so a chunk stays readable on its own:
+
+      Sheet: Orders
+      Columns: OrderId | Customer | Amount
+      Row 2: 1001 | ACME | 12.5
+      Row 3: 1002 | Globex | 7
+
+- Sheets are mapped to their names through `xl/workbook.xml` + `xl/_rels/workbook.xml.rels`.
+- `xl/sharedStrings.xml` and date number formats (`xl/styles.xml`) are indexed once per file;
+  worksheet XML is parsed row by row and each row is dropped once rendered, so memory stays
+  flat on 100k-row sheets.
+
+Environment
+- XLSX_ROW_GROUP_MAX_TOKENS: token budget per item, header lines included (default 400)
+- XLSX_HEADER_ROWS: leading non-empty rows per sheet treated as headers (default 1; 0 = none)
 
 Contract
 - export: load(path: str) -> list[dict]
+- export: iter_load(path: str) -> iterator of the same items, yielded as row groups fill.
+- Item metadata: source, content_type, sheet_name, sheet_index, n_rows, n_cols, row_start,
+  row_end. `n_rows`/`n_cols` come from the sheet `<dimension>` when present.
 """
 
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import datetime as _dt
 import os
+import re
 import zipfile
 import xml.etree.ElementTree as ET
+from pathlib import PurePosixPath
 from backend.ingest.text_cleaner import clean_text
+from backend.ingest.tokenizer import get_tokenizer
+
+_X = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_WORKSHEET_REL = "/worksheet"
+_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
+# Built-in numFmtIds that render as dates/times (ECMA-376 18.8.30).
+_BUILTIN_DATE_FMTS = set(range(14, 23)) | set(range(45, 48))
+_DATE_TOKENS_RE = re.compile(r"[dmyhs]", re.IGNORECASE)
+_FMT_LITERALS_RE = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+_CELL_REF_RE = re.compile(r"^([A-Za-z]+)(\d+)$")
+_TOKENIZER = get_tokenizer("heuristic")
 
-def _sheet_dims(xml_bytes: bytes) -> tuple[int, int]:
+
+def _env_int(name: str, default: int, minimum: int) -> int:
     try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
+        value = int(os.getenv(name, str(default)) or default)
+    except Exception:
+        value = default
+    return max(minimum, value)
+
+
+def _col_to_num(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch.upper()) - ord("A") + 1)
+    return n
+
+
+def _parse_ref(ref: str) -> Tuple[int, int]:
+    """("AB12") -> (row 12, col 28); (0, 0) when unparsable."""
+    m = _CELL_REF_RE.match(ref or "")
+    if not m:
         return 0, 0
-    dim = root.find(".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}dimension")
-    if dim is not None:
-        ref = dim.get("ref") or ""
-        # Examples: "A1:C10" or single cell "A1"
-        if ":" in ref:
-            _, max_ref = ref.split(":", 1)
+    return int(m.group(2)), _col_to_num(m.group(1))
+
+
+def _dims_from_ref(ref: str) -> Tuple[int, int]:
+    # Examples: "A1:C10" or single cell "A1"
+    max_ref = ref.split(":", 1)[1] if ":" in ref else ref
+    return _parse_ref(max_ref)
+
+
+def _text_of(el: ET.Element) -> str:
+    """Concatenated `<t>` text of a string item / inline string, skipping phonetic runs."""
+    parts: List[str] = []
+    for child in el:
+        if child.tag == f"{_X}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_X}r":
+            parts.extend(t.text or "" for t in child.iter(f"{_X}t"))
+    return "".join(parts)
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    strings: List[str] = []
+    try:
+        fh = zf.open("xl/sharedStrings.xml")
+    except KeyError:
+        return strings
+    root: Optional[ET.Element] = None
+    with fh:
+        for event, el in ET.iterparse(fh, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = el
+            elif el.tag == f"{_X}si":
+                strings.append(_text_of(el))
+                el.clear()
+                if root is not None:
+                    root.remove(el)
+    return strings
+
+
+def _date_styles(zf: zipfile.ZipFile) -> Set[int]:
+    """Indexes into `cellXfs` whose number format renders a date or time."""
+    try:
+        root = ET.fromstring(zf.read("xl/styles.xml"))
+    except (KeyError, ET.ParseError):
+        return set()
+    custom = {}
+    for fmt in root.iter(f"{_X}numFmt"):
+        try:
+            custom[int(fmt.get("numFmtId") or -1)] = fmt.get("formatCode") or ""
+        except ValueError:
+            continue
+    date_styles: Set[int] = set()
+    cell_xfs = root.find(f"{_X}cellXfs")
+    for idx, xf in enumerate(cell_xfs if cell_xfs is not None else []):
+        try:
+            fmt_id = int(xf.get("numFmtId") or 0)
+        except ValueError:
+            continue
+        if fmt_id in _BUILTIN_DATE_FMTS:
+            date_styles.add(idx)
+        elif fmt_id in custom and _DATE_TOKENS_RE.search(_FMT_LITERALS_RE.sub("", custom[fmt_id])):
+            date_styles.add(idx)
+    return date_styles
+
+
+def _sheet_parts(zf: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], bool]:
+    """([(sheet name, worksheet part)], date1904) in workbook order."""
+    wb_root = ET.fromstring(zf.read("xl/workbook.xml"))
+    targets: Dict[str, str] = {}
+    try:
+        rels_root = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        for rel in rels_root.iter(_REL):
+            if (rel.get("Type") or "").endswith(_WORKSHEET_REL) and rel.get("Id") and rel.get("Target"):
+                targets[rel.get("Id")] = rel.get("Target")
+    except (KeyError, ET.ParseError):
+        pass
+    sheets: List[Tuple[str, str]] = []
+    for idx, sheet in enumerate(wb_root.iter(f"{_X}sheet"), start=1):
+        name = sheet.get("name") or f"Sheet{idx}"
+        target = targets.get(sheet.get(_R_ID) or "")
+        if not target:
+            continue
+        if target.startswith("/"):
+            part = target.lstrip("/")
         else:
-            max_ref = ref
-        # Convert column letters to number and row digits to int
-        col_letters = "".join(ch for ch in max_ref if ch.isalpha())
-        row_digits = "".join(ch for ch in max_ref if ch.isdigit())
-        def col_to_num(s: str) -> int:
-            n = 0
-            for ch in s:
-                n = n * 26 + (ord(ch.upper()) - ord('A') + 1)
-            return n
-        n_cols = col_to_num(col_letters) if col_letters else 0
-        n_rows = int(row_digits) if row_digits else 0
-        return n_rows, n_cols
-    return 0, 0
+            parts: List[str] = ["xl"]
+            for seg in PurePosixPath(target).parts:
+                if seg == "..":
+                    if parts:
+                        parts.pop()
+                elif seg not in ("", "."):
+                    parts.append(seg)
+            part = "/".join(parts)
+        sheets.append((name, part))
+    wb_pr = wb_root.find(f"{_X}workbookPr")
+    date1904 = wb_pr is not None and (wb_pr.get("date1904") or "").lower() in {"1", "true"}
+    return sheets, date1904
 
 
-def load(path: str) -> List[Dict]:
+def _format_number(raw: str) -> str:
+    try:
+        return format(float(raw), ".15g")
+    except ValueError:
+        return raw
+
+
+def _format_date(raw: str, date1904: bool) -> str:
+    try:
+        serial = float(raw)
+    except ValueError:
+        return raw
+    base = _dt.datetime(1904, 1, 1) if date1904 else _dt.datetime(1899, 12, 30)
+    try:
+        value = base + _dt.timedelta(days=serial)
+    except OverflowError:
+        return raw
+    if serial < 1 and not date1904:
+        return value.time().isoformat(timespec="seconds")
+    if serial == int(serial):
+        return value.date().isoformat()
+    return value.isoformat(sep=" ", timespec="seconds")
+
+
+class _CellReader:
+    def __init__(self, shared: List[str], date_styles: Set[int], date1904: bool) -> None:
+        self.shared = shared
+        self.date_styles = date_styles
+        self.date1904 = date1904
+
+    def value(self, c: ET.Element) -> str:
+        ctype = c.get("t") or "n"
+        if ctype == "inlineStr":
+            is_el = c.find(f"{_X}is")
+            return _text_of(is_el).strip() if is_el is not None else ""
+        v = c.find(f"{_X}v")
+        raw = (v.text or "") if v is not None else ""
+        if not raw:
+            return ""
+        if ctype == "s":
+            try:
+                return self.shared[int(raw)].strip()
+            except (ValueError, IndexError):
+                return ""
+        if ctype == "b":
+            return "TRUE" if raw == "1" else "FALSE"
+        if ctype in ("str", "e", "d"):
+            return raw.strip()
+        try:
+            style = int(c.get("s") or 0)
+        except ValueError:
+            style = 0
+        if style in self.date_styles:
+            return _format_date(raw, self.date1904)
+        return _format_number(raw)
+
+    def row(self, row_el: ET.Element) -> List[str]:
+        values: Dict[int, str] = {}
+        next_col = 1
+        for c in row_el.iter(f"{_X}c"):
+            _, col = _parse_ref(c.get("r") or "")
+            col = col or next_col
+            next_col = col + 1
+            text = self.value(c)
+            if text:
+                values[col] = " ".join(text.split())
+        if not values:
+            return []
+        return [values.get(col, "") for col in range(1, max(values) + 1)]
+
+
+def _iter_rows(fh, reader: _CellReader) -> Iterator[Tuple[str, object]]:
+    """Yield ("dims", (n_rows, n_cols)) once, then ("row", (row_number, values)) per row."""
+    sheet_data: Optional[ET.Element] = None
+    next_row = 1
+    for event, el in ET.iterparse(fh, events=("start", "end")):
+        tag = el.tag
+        if event == "start":
+            if tag == f"{_X}sheetData":
+                sheet_data = el
+            continue
+        if tag == f"{_X}dimension":
+            yield "dims", _dims_from_ref(el.get("ref") or "")
+        elif tag == f"{_X}row":
+            try:
+                row_no = int(el.get("r") or next_row)
+            except ValueError:
+                row_no = next_row
+            next_row = row_no + 1
+            values = reader.row(el)
+            el.clear()
+            if sheet_data is not None:
+                sheet_data.remove(el)
+            if values:
+                yield "row", (row_no, values)
+
+
+def _iter_sheet_items(
+    abs_path: str,
+    fh,
+    sheet_name: str,
+    sheet_index: int,
+    reader: _CellReader,
+    max_tokens: int,
+    header_rows: int,
+) -> Iterator[Dict]:
+    n_rows = n_cols = 0
+    headers: List[str] = []
+    prefix_tokens = 0
+    group: List[str] = []
+    group_tokens = 0
+    group_cols = 0
+    row_start = row_end = 0
+
+    def _item() -> Optional[Dict]:
+        lines = [f"Sheet: {sheet_name}", *headers, *group]
+        text = clean_text("\n".join(lines), preserve_tables=True)
+        if not text:
+            return None
+        return {
+            "text": text,
+            "metadata": {
+                "source": abs_path,
+                "content_type": _CONTENT_TYPE,
+                "sheet_name": sheet_name,
+                "sheet_index": sheet_index,
+                "n_rows": n_rows or row_end,
+                "n_cols": n_cols or group_cols,
+                "row_start": row_start,
+                "row_end": row_end,
+            },
+        }
+
+    for kind, payload in _iter_rows(fh, reader):
+        if kind == "dims":
+            n_rows, n_cols = payload  # type: ignore[misc]
+            continue
+        row_no, values = payload  # type: ignore[misc]
+        if len(headers) < header_rows:
+            headers.append("Columns: " + " | ".join(values))
+            prefix_tokens = _TOKENIZER.count("\n".join([f"Sheet: {sheet_name}", *headers]))
+            group_cols = max(group_cols, len(values))
+            continue
+        line = f"Row {row_no}: " + " | ".join(values)
+        line_tokens = _TOKENIZER.count(line)
+        if group and prefix_tokens + group_tokens + line_tokens > max_tokens:
+            item = _item()
+            if item:
+                yield item
+            group, group_tokens, group_cols = [], 0, 0
+        if not group:
+            row_start = row_no
+        group.append(line)
+        group_tokens += line_tokens
+        group_cols = max(group_cols, len(values))
+        row_end = row_no
+    if group or headers:
+        item = _item()
+        if item:
+            yield item
+
+
+def iter_load(path: str) -> Iterator[Dict]:
+    """Yield row-group items sheet by sheet without loading whole worksheets."""
     abs_path = os.path.abspath(path)
-    items: List[Dict] = []
+    max_tokens = _env_int("XLSX_ROW_GROUP_MAX_TOKENS", 400, 32)
+    header_rows = _env_int("XLSX_HEADER_ROWS", 1, 0)
     with zipfile.ZipFile(abs_path) as zf:
-        # Parse workbook for sheet list
         try:
-            wb_xml = zf.read("xl/workbook.xml")
-            wb_root = ET.fromstring(wb_xml)
+            sheets, date1904 = _sheet_parts(zf)
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError(f"Failed to parse XLSX workbook: {abs_path}: {exc}") from exc
-
-        ns = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        sheets = wb_root.findall(".//x:sheets/x:sheet", ns)
-        for s in sheets:
-            name = s.get("name") or "Sheet"
-            r_id = s.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-            # sheetN.xml usually aligns with index order; attempt standard path
-            # When relationships differ, a deeper rels parse would be needed; keep simple mapping here.
-            # Try by position first
-        sheet_files = sorted(
-            (n for n in zf.namelist() if n.startswith("xl/worksheets/sheet") and n.endswith(".xml"))
-        )
-        if not sheet_files:
-            return items
-        for sf in sheet_files:
+        reader = _CellReader(_shared_strings(zf), _date_styles(zf), date1904)
+        for sheet_index, (sheet_name, part) in enumerate(sheets, start=1):
             try:
-                s_xml = zf.read(sf)
+                fh = zf.open(part)
             except KeyError:
                 continue
-            n_rows, n_cols = _sheet_dims(s_xml)
-            sheet_name = os.path.splitext(os.path.basename(sf))[0]
-            text = clean_text(f"Sheet {sheet_name}: size {n_rows} x {n_cols}", preserve_tables=True)
-            items.append(
-                {
-                    "text": text,
-                    "metadata": {
-                        "source": abs_path,
-                        "content_type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        "sheet_name": sheet_name,
-                        "n_rows": n_rows,
-                        "n_cols": n_cols,
-                    },
-                }
-            )
-    return items
+            with fh:
+                yield from _iter_sheet_items(abs_path, fh, sheet_name, sheet_index, reader, max_tokens, header_rows)
+
+
+def load(path: str) -> List[Dict]:
+    return list(iter_load(path))
@@ -0,0 +1,164 @@
+"""Shared token counting, splitting and truncation.
+
+Purpose
+- Give the embeddings adapter and the chunkers one cached tokenizer per estimator.
+- Split and truncate oversized text with a single encode, using token start offsets,
+  instead of re-encoding a growing prefix for every word or search step.
+
+Contract
+- export: get_tokenizer(estimator: str = "auto") -> Tokenizer
+- Tokenizer.count(text) / count_batch(texts) / encode_batch(texts) / offsets(text)
+- Tokenizer.truncate(text, max_tokens) -> str
+- Tokenizer.split(text, max_tokens, boundaries=DEFAULT_BOUNDARIES) -> list[str]
+
+Estimators
+- "auto": tiktoken ``cl100k_base`` when tiktoken is installed, otherwise the heuristic.
+- "heuristic": ~4 characters per token (rounded up).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Iterable, List, Pattern, Sequence
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4
+_TIKTOKEN_ENCODING = "cl100k_base"
+
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+LINE_BREAK = re.compile(r"\n+")
+WORD_BREAK = re.compile(r"\s+")
+DEFAULT_BOUNDARIES: Sequence[Pattern[str]] = (SENTENCE_BREAK, WORD_BREAK)
+
+
+class Tokenizer:
+    """Heuristic tokenizer; token ``i`` covers characters ``[4*i, 4*i + 4)``."""
+
+    name = "heuristic"
+
+    def offsets(self, text: str) -> List[int]:
+        """Character offset at which each token of ``text`` starts."""
+        return list(range(0, len(text or ""), _CHARS_PER_TOKEN))
+
+    def encode_batch(self, texts: Iterable[str]) -> List[List[int]]:
+        """Token ids per text (for the heuristic, the ids are the token start offsets)."""
+        return [self.offsets(t) for t in texts]
+
+    def count(self, text: str) -> int:
+        return -(-len(text) // _CHARS_PER_TOKEN) if text else 0
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        return [self.count(t) for t in texts]
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of ``text`` that fits in ``max_tokens``."""
+        if max_tokens <= 0 or not text:
+            return ""
+        offsets = self.offsets(text)
+        if len(offsets) <= max_tokens:
+            return text
+        return text[: offsets[max_tokens]]
+
+    def split(
+        self,
+        text: str,
+        max_tokens: int,
+        boundaries: Sequence[Pattern[str]] = DEFAULT_BOUNDARIES,
+    ) -> List[str]:
+        """Split ``text`` into stripped pieces of at most ``max_tokens`` tokens.
+
+        Each piece is cut at the last match of the first pattern in ``boundaries`` that
+        matches inside the budget (sentence end, then whitespace by default); without one
+        the piece is cut at the token boundary. The text is encoded once and every cut is a
+        bisect over the token offsets, so the cost is linear in the text length.
+        """
+        if not text:
+            return []
+        max_tokens = max(1, int(max_tokens))
+        offsets = self.offsets(text)
+        total = len(offsets)
+        if total <= max_tokens:
+            return [text.strip()] if text.strip() else []
+
+        spans = [[(m.start(), m.end()) for m in pattern.finditer(text)] for pattern in boundaries]
+        starts = [[s for s, _ in found] for found in spans]
+
+        pieces: List[str] = []
+        pos = 0
+        while pos < len(text):
+            # The token containing ``pos`` counts against this piece even if it began earlier.
+            first = max(0, bisect_right(offsets, pos) - 1)
+            limit = first + max_tokens
+            while limit < total and offsets[limit] <= pos:
+                limit += 1
+            if limit >= total:
+                pieces.append(text[pos:])
+                break
+            cut = offsets[limit]
+            end, nxt = cut, cut
+            for found, found_starts in zip(spans, starts):
+                idx = bisect_right(found_starts, cut) - 1
+                if idx >= 0 and found_starts[idx] > pos:
+                    end, nxt = found[idx]
+                    break
+            pieces.append(text[pos:end])
+            pos = nxt
+        return [p.strip() for p in pieces if p.strip()]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by a tiktoken encoding; special-token text is encoded as ordinary text."""
+
+    def __init__(self, encoding) -> None:
+        self._enc = encoding
+        self.name = encoding.name
+
+    def offsets(self, text: str) -> List[int]:
+        if not text:
+            return []
+        _, offsets = self._enc.decode_with_offsets(self._enc.encode_ordinary(text))
+        return list(offsets)
+
+    def encode_batch(self, texts: Iterable[str]) -> List[List[int]]:
+        return self._enc.encode_ordinary_batch(list(texts))
+
+    def count(self, text: str) -> int:
+        return len(self._enc.encode_ordinary(text)) if text else 0
+
+    def count_batch(self, texts: Iterable[str]) -> List[int]:
+        return [len(ids) for ids in self.encode_batch(texts)]
+
+
+_HEURISTIC = Tokenizer()
+
+
+def get_tokenizer(estimator: str = "auto") -> Tokenizer:
+    """Cached tokenizer for ``estimator`` ("auto" or "heuristic"); safe to share across threads."""
+    return _load_tokenizer(str(estimator or "auto").strip().lower())
+
+
+@lru_cache(maxsize=None)
+def _load_tokenizer(estimator: str) -> Tokenizer:
+    if estimator == "auto":
+        try:
+            import tiktoken  # type: ignore
+
+            return TiktokenTokenizer(tiktoken.get_encoding(_TIKTOKEN_ENCODING))
+        except Exception as exc:  # noqa: BLE001
+            logger.info("tiktoken unavailable (%s); estimating ~%d chars per token", exc, _CHARS_PER_TOKEN)
+    return _HEURISTIC
+
+
+__all__ = [
+    "DEFAULT_BOUNDARIES",
+    "LINE_BREAK",
+    "SENTENCE_BREAK",
+    "TiktokenTokenizer",
+    "Tokenizer",
+    "WORD_BREAK",
+    "get_tokenizer",
+]
@@ -0,0 +1,475 @@
+# backend/providers/oci/adaptive_limiter.py
+"""Adaptive (AIMD) concurrency and rate control for OCI Generative AI calls.
+
+One controller exists per ``(endpoint, model_id)`` and is shared by every adapter talking
+to it: the embeddings adapter, both chat adapters, sync and async paths. Limits grow
+additively while calls succeed at a steady latency and are cut multiplicatively on 429;
+a ``Retry-After`` pauses all callers of that endpoint/model. Learned limits are written to
+a small JSON file so the next job starts at the last known ceiling instead of re-probing.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import math
+import os
+import pathlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_STATE_FILE = os.path.join("~", ".cache", "ai-assistant", "oci_limits.json")
+_PERSIST_INTERVAL_S = 60.0
+_ASYNC_POLL_S = 0.05
+
+
+@dataclass(frozen=True)
+class Permit:
+    """Issued by ``acquire``; hand it back to ``release`` when the call finishes."""
+
+    started_at: float
+
+
+def is_throttled(exc: BaseException) -> bool:
+    status = getattr(exc, "status", getattr(exc, "status_code", None))
+    return str(status) == "429" or str(getattr(exc, "code", "")) == "429"
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """``Retry-After`` (seconds) from an SDK/httpx error's headers, if present."""
+    for headers in (getattr(exc, "headers", None), getattr(getattr(exc, "response", None), "headers", None)):
+        if not headers:
+            continue
+        try:
+            value = headers.get("retry-after") or headers.get("Retry-After")
+        except AttributeError:
+            continue
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            continue
+        if seconds > 0:
+            return seconds
+    return None
+
+
+class AdaptiveRateController:
+    """AIMD limiter over in-flight requests and request rate.
+
+    ``acquire`` blocks until fewer than ``concurrency`` calls are in flight and the next rate
+    slot (``60 / rate_per_min`` seconds apart) has arrived. On ``release``:
+
+    - 429: ``rate_per_min`` and ``concurrency`` are multiplied by ``decrease_factor``, at most
+      once per congestion event (calls started before the last cut do not cut again), and a
+      ``Retry-After`` blocks new calls until it expires.
+    - success: after ``concurrency`` successes in a row (about one round of in-flight calls)
+      concurrency grows by one and the rate by ``rate_step_per_min``, unless the latency EWMA
+      has climbed past ``latency_factor`` times the best latency seen, which signals queueing
+      upstream; growth then holds until latency recovers.
+
+    Safe to share between threads and event loops.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        initial_rate_per_min: float = 60.0,
+        min_rate_per_min: float = 6.0,
+        max_rate_per_min: float = 3000.0,
+        rate_step_per_min: float = 6.0,
+        initial_concurrency: int = 2,
+        min_concurrency: int = 1,
+        max_concurrency: int = 16,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 3.0,
+        on_change: Optional[Callable[["AdaptiveRateController", bool], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.key = key
+        self.min_rate_per_min = max(0.1, float(min_rate_per_min))
+        self.max_rate_per_min = max(self.min_rate_per_min, float(max_rate_per_min))
+        self.rate_step_per_min = max(0.0, float(rate_step_per_min))
+        self.min_concurrency = max(1, int(min_concurrency))
+        self.max_concurrency = max(self.min_concurrency, int(max_concurrency))
+        self.decrease_factor = min(0.95, max(0.05, float(decrease_factor)))
+        self.latency_factor = float(latency_factor)
+        self._on_change = on_change
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self.rate_per_min = self._clamp_rate(initial_rate_per_min)
+        self.concurrency = self._clamp_concurrency(initial_concurrency)
+        self.in_flight = 0
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._successes = 0
+        self.latency_ewma: Optional[float] = None
+        self.latency_best: Optional[float] = None
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self.waited_s = 0.0
+
+    def _clamp_rate(self, value: float) -> float:
+        return min(self.max_rate_per_min, max(self.min_rate_per_min, float(value)))
+
+    def _clamp_concurrency(self, value: float) -> int:
+        return min(self.max_concurrency, max(self.min_concurrency, int(value)))
+
+    def restore(self, rate_per_min: float, concurrency: int) -> None:
+        """Start from previously learned limits (clamped to the configured bounds)."""
+        with self._cond:
+            self.rate_per_min = self._clamp_rate(rate_per_min)
+            self.concurrency = self._clamp_concurrency(concurrency)
+            self._cond.notify_all()
+
+    def _try_reserve(self) -> Optional[float]:
+        """Claim an in-flight slot and a rate slot; returns the seconds to wait, or None if full."""
+        if self.in_flight >= self.concurrency:
+            return None
+        now = self._clock()
+        start = max(now, self._next_slot, self._blocked_until)
+        self._next_slot = start + 60.0 / self.rate_per_min
+        self.in_flight += 1
+        self.requests += 1
+        wait = start - now
+        self.waited_s += wait
+        return wait
+
+    def acquire(self) -> Permit:
+        with self._cond:
+            wait = self._try_reserve()
+            while wait is None:
+                self._cond.wait(timeout=1.0)
+                wait = self._try_reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return Permit(started_at=self._clock())
+
+    async def aacquire(self) -> Permit:
+        while True:
+            with self._cond:
+                wait = self._try_reserve()
+            if wait is not None:
+                break
+            await asyncio.sleep(_ASYNC_POLL_S)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return Permit(started_at=self._clock())
+
+    def release(
+        self,
+        permit: Permit,
+        *,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+        error: bool = False,
+    ) -> None:
+        now = self._clock()
+        latency = max(0.0, now - permit.started_at)
+        changed = decreased = False
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            if throttled:
+                self.throttled += 1
+                self._successes = 0
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, now + float(retry_after))
+                if permit.started_at >= self._last_decrease:
+                    self.rate_per_min = self._clamp_rate(self.rate_per_min * self.decrease_factor)
+                    self.concurrency = self._clamp_concurrency(math.floor(self.concurrency * self.decrease_factor))
+                    self._last_decrease = now
+                    self.decreases += 1
+                    changed = decreased = True
+            elif error:
+                self.errors += 1
+            else:
+                self._observe_latency(latency)
+                self._successes += 1
+                if self._successes >= self.concurrency:
+                    self._successes = 0
+                    if not self._latency_degraded():
+                        rate = self._clamp_rate(self.rate_per_min + self.rate_step_per_min)
+                        concurrency = self._clamp_concurrency(self.concurrency + 1)
+                        if rate != self.rate_per_min or concurrency != self.concurrency:
+                            self.rate_per_min, self.concurrency = rate, concurrency
+                            self.increases += 1
+                            changed = True
+            self._cond.notify_all()
+        if decreased:
+            logger.warning(
+                "OCI throttled (%s): rate_per_min=%.1f concurrency=%d retry_after=%s",
+                self.key,
+                self.rate_per_min,
+                self.concurrency,
+                retry_after,
+            )
+        if changed and self._on_change is not None:
+            self._on_change(self, decreased)
+
+    def _observe_latency(self, latency: float) -> None:
+        self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+        if self.latency_best is None or latency < self.latency_best:
+            self.latency_best = latency
+
+    def _latency_degraded(self) -> bool:
+        if self.latency_factor <= 0 or not self.latency_best or self.latency_ewma is None:
+            return False
+        return self.latency_ewma > self.latency_best * self.latency_factor
+
+    def call(self, fn: Callable[[], T], throttle_retries: int = 0) -> T:
+        """Run ``fn`` under a permit, feeding its outcome back into the controller.
+
+        A 429 is retried up to ``throttle_retries`` times; each retry waits for a fresh permit,
+        so it is paced by the cut limits and any ``Retry-After``.
+        """
+        attempt = 0
+        while True:
+            permit = self.acquire()
+            try:
+                result = fn()
+            except Exception as exc:
+                throttled = is_throttled(exc)
+                self.release(permit, throttled=throttled, retry_after=retry_after_seconds(exc), error=True)
+                if throttled and attempt < throttle_retries:
+                    attempt += 1
+                    continue
+                raise
+            self.release(permit)
+            return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]], throttle_retries: int = 0) -> T:
+        attempt = 0
+        while True:
+            permit = await self.aacquire()
+            try:
+                result = await fn()
+            except Exception as exc:
+                throttled = is_throttled(exc)
+                self.release(permit, throttled=throttled, retry_after=retry_after_seconds(exc), error=True)
+                if throttled and attempt < throttle_retries:
+                    attempt += 1
+                    continue
+                raise
+            self.release(permit)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "rate_per_min": round(self.rate_per_min, 2),
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "waited_s": round(self.waited_s, 3),
+                "latency_ewma_s": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+                "latency_best_s": round(self.latency_best, 3) if self.latency_best is not None else None,
+                "blocked_for_s": round(max(0.0, self._blocked_until - self._clock()), 3),
+            }
+
+
+class LimitStateStore:
+    """JSON file of learned limits keyed by ``endpoint|model_id``; writes are atomic."""
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(os.path.expanduser(path))
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Any]] = {}
+        try:
+            with self.path.open("r", encoding="utf-8") as fh:
+                loaded = json.load(fh)
+            if isinstance(loaded, dict):
+                self._data = {k: v for k, v in loaded.items() if isinstance(v, dict)}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable OCI limit state %s: %s", self.path, exc)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            return dict(entry) if entry else None
+
+    def save(self, controllers: Dict[str, AdaptiveRateController]) -> None:
+        with self._lock:
+            for key, controller in controllers.items():
+                self._data[key] = {
+                    "rate_per_min": round(controller.rate_per_min, 2),
+                    "concurrency": controller.concurrency,
+                    "updated_at": time.time(),
+                }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+                with tmp.open("w", encoding="utf-8") as fh:
+                    json.dump(self._data, fh, indent=2, sort_keys=True)
+                os.replace(tmp, self.path)
+            except OSError as exc:
+                logger.warning("Failed to persist OCI limit state to %s: %s", self.path, exc)
+
+
+# ---------- Process-wide registry ----------
+_REGISTRY_LOCK = threading.Lock()
+_CONTROLLERS: Dict[str, AdaptiveRateController] = {}
+_CONFIG: Optional[Dict[str, Any]] = None
+_STORE: Optional[LimitStateStore] = None
+_DIRTY = False
+_LAST_PERSIST = 0.0
+_ATEXIT_REGISTERED = False
+
+_CONTROLLER_KEYS = (
+    "initial_rate_per_min",
+    "min_rate_per_min",
+    "max_rate_per_min",
+    "rate_step_per_min",
+    "initial_concurrency",
+    "min_concurrency",
+    "max_concurrency",
+    "decrease_factor",
+    "latency_factor",
+)
+
+
+def _load_app_config() -> Dict[str, Any]:
+    try:
+        import yaml  # type: ignore
+
+        app_yaml = pathlib.Path(__file__).resolve().parents[2] / "config" / "app.yaml"
+        if not app_yaml.exists():
+            return {}
+        with app_yaml.open("r", encoding="utf-8") as fh:
+            data = yaml.safe_load(fh) or {}
+        section = data.get("oci_rate_control") if isinstance(data, dict) else None
+        return section if isinstance(section, dict) else {}
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("oci_rate_control config load failed; using defaults: %s", exc)
+        return {}
+
+
+def configure(cfg: Optional[Dict[str, Any]]) -> None:
+    """Replace the registry config (``oci_rate_control`` in app.yaml) and drop existing controllers."""
+    global _CONFIG, _STORE
+    with _REGISTRY_LOCK:
+        _CONFIG = dict(cfg or {})
+        _CONTROLLERS.clear()
+        state_file = _CONFIG.get("state_file")
+        _STORE = LimitStateStore(str(state_file)) if state_file else None
+
+
+def _persist(controller: AdaptiveRateController, decreased: bool) -> None:
+    global _DIRTY, _LAST_PERSIST
+    with _REGISTRY_LOCK:
+        store = _STORE
+        _DIRTY = True
+        now = time.monotonic()
+        if store is None or not (decreased or now - _LAST_PERSIST >= _PERSIST_INTERVAL_S):
+            return
+        _DIRTY = False
+        _LAST_PERSIST = now
+        snapshot = dict(_CONTROLLERS)
+    store.save(snapshot)
+
+
+def flush() -> None:
+    """Write learned limits now if anything changed since the last write."""
+    global _DIRTY
+    with _REGISTRY_LOCK:
+        if _STORE is None or not _DIRTY:
+            return
+        _DIRTY = False
+        store, snapshot = _STORE, dict(_CONTROLLERS)
+    store.save(snapshot)
+
+
+def get_controller(endpoint: str, model_id: str) -> Optional[AdaptiveRateController]:
+    """Shared controller for ``endpoint``/``model_id``; None when ``oci_rate_control.enabled`` is false."""
+    global _ATEXIT_REGISTERED
+    if _CONFIG is None:
+        cfg = _load_app_config()
+        cfg.setdefault("state_file", _DEFAULT_STATE_FILE)
+        configure(cfg)
+    with _REGISTRY_LOCK:
+        cfg = _CONFIG or {}
+        if not bool(cfg.get("enabled", False)):
+            return None
+        key = f"{str(endpoint or '').rstrip('/')}|{model_id or ''}"
+        controller = _CONTROLLERS.get(key)
+        if controller is not None:
+            return controller
+        kwargs = {name: cfg[name] for name in _CONTROLLER_KEYS if cfg.get(name) is not None}
+        controller = AdaptiveRateController(key, on_change=_persist, **kwargs)
+        learned = _STORE.get(key) if _STORE is not None else None
+        if learned:
+            try:
+                controller.restore(float(learned["rate_per_min"]), int(learned["concurrency"]))
+                logger.info(
+                    "OCI limits for %s restored: rate_per_min=%.1f concurrency=%d",
+                    key,
+                    controller.rate_per_min,
+                    controller.concurrency,
+                )
+            except (KeyError, TypeError, ValueError):
+                pass
+        _CONTROLLERS[key] = controller
+        if not _ATEXIT_REGISTERED:
+            atexit.register(flush)
+            _ATEXIT_REGISTERED = True
+        return controller
+
+
+def sdk_retry_strategy(controller: Optional[AdaptiveRateController]) -> Any:
+    """Retry strategy for OCI SDK clients whose calls go through ``controller``.
+
+    The SDK default retries 429s itself (up to 8 attempts / 600 s), so throttling would only
+    reach the controller once the SDK gave up. With a controller, the SDK keeps retrying
+    timeouts, connection errors and 5xx but raises 429s to the caller.
+    """
+    import oci  # type: ignore
+
+    if controller is None:
+        return oci.retry.DEFAULT_RETRY_STRATEGY
+    statuses = {
+        status: codes
+        for status, codes in oci.retry.retry_checkers.RETRYABLE_STATUSES_AND_CODES.items()
+        if status != 429
+    }
+    return oci.retry.RetryStrategyBuilder(service_error_retry_config=statuses).get_retry_strategy()
+
+
+def controller_stats() -> Dict[str, Dict[str, Any]]:
+    """Current state of every controller, keyed by ``endpoint|model_id`` (for monitoring)."""
+    with _REGISTRY_LOCK:
+        controllers = dict(_CONTROLLERS)
+    return {key: controller.stats() for key, controller in controllers.items()}
+
+
+__all__ = [
+    "AdaptiveRateController",
+    "LimitStateStore",
+    "Permit",
+    "configure",
+    "controller_stats",
+    "flush",
+    "get_controller",
+    "is_throttled",
+    "retry_after_seconds",
+    "sdk_retry_strategy",
+]
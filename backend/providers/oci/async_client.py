@@ -0,0 +1,90 @@
+# backend/providers/oci/async_client.py
+"""Async transport for OCI Generative AI Inference.
+
+The OCI Python SDK is blocking. This client reuses a configured SDK client's endpoint,
+request signer and model serializer, signs each request the same way the SDK does and
+sends it with ``httpx.AsyncClient`` so the event loop is never blocked on network I/O.
+Errors are raised as ``oci.exceptions.ServiceError`` so existing status/code handling
+(429 back-off, transient 5xx) keeps working unchanged.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import oci
+import requests
+
+try:  # Optional: callers fall back to running the sync SDK in a worker thread.
+    import httpx  # type: ignore
+
+    _HTTPX_AVAILABLE = True
+except Exception:  # pragma: no cover - graceful degradation if missing
+    httpx = None  # type: ignore[assignment]
+    _HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CHAT_PATH = "/actions/chat"
+EMBED_TEXT_PATH = "/actions/embedText"
+
+
+def httpx_available() -> bool:
+    return _HTTPX_AVAILABLE
+
+
+class OciAsyncInferenceClient:
+    def __init__(self, sync_client: Any, *, timeout: Tuple[float, float] = (10, 240)) -> None:
+        if not _HTTPX_AVAILABLE:
+            raise RuntimeError("OciAsyncInferenceClient requires httpx")
+        base = sync_client.base_client
+        self._endpoint = str(base.endpoint).rstrip("/")
+        self._signer = base.signer
+        self._serialize = base.sanitize_for_serialization
+        self._timeout = httpx.Timeout(float(timeout[1]), connect=float(timeout[0]))
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def _http(self) -> "httpx.AsyncClient":
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+        return self._client
+
+    def _signed_request(self, path: str, details: Any) -> requests.PreparedRequest:
+        body = json.dumps(self._serialize(details))
+        prepared = requests.Request(
+            "POST",
+            f"{self._endpoint}{path}",
+            data=body,
+            headers={"content-type": "application/json", "accept": "application/json"},
+        ).prepare()
+        self._signer(prepared)
+        return prepared
+
+    async def post(self, path: str, details: Any) -> Dict[str, Any]:
+        prepared = self._signed_request(path, details)
+        resp = await self._http().post(
+            prepared.url,
+            content=prepared.body,
+            headers=dict(prepared.headers),
+        )
+        if resp.status_code >= 400:
+            try:
+                err = resp.json()
+            except ValueError:
+                err = {}
+            raise oci.exceptions.ServiceError(
+                resp.status_code,
+                err.get("code") or str(resp.status_code),
+                dict(resp.headers),
+                err.get("message") or resp.text[:500],
+            )
+        return resp.json()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+__all__ = ["CHAT_PATH", "EMBED_TEXT_PATH", "OciAsyncInferenceClient", "httpx_available"]
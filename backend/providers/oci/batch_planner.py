@@ -0,0 +1,166 @@
+# backend/providers/oci/batch_planner.py
+"""Pack embedding inputs into requests by token and byte budget instead of by count."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# OCI GenAI embedTextDetails accepts at most 96 inputs per request.
+DEFAULT_MAX_ITEMS = 96
+DEFAULT_MAX_TOKENS = 16000
+DEFAULT_MAX_BYTES = 200_000
+# Stream packing plans this many requests' worth of items at a time.
+DEFAULT_WINDOW_REQUESTS = 4
+
+
+class EmbedBatchPlanner:
+    """Greedy first-fit packer for embedding requests.
+
+    Inputs are ordered by estimated token count so similar-length texts share a request,
+    then packed until adding the next one would exceed ``max_items``, ``max_tokens`` or
+    ``max_bytes``. An input that alone exceeds a budget still gets its own request (the
+    adapter's token-limit handling caps single inputs). ``plan`` returns index lists into
+    the caller's inputs; callers keep their own index maps, so reordering is safe.
+
+    Shape counters accumulate across calls and threads; see ``stats``.
+    """
+
+    def __init__(
+        self,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        *,
+        sort_by_length: bool = True,
+    ) -> None:
+        self.max_items = max(1, int(max_items))
+        self.max_tokens = max(1, int(max_tokens))
+        self.max_bytes = max(1, int(max_bytes))
+        self.sort_by_length = bool(sort_by_length)
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.tokens = 0
+        self.bytes = 0
+        self.max_batch_items = 0
+        self._fill_sum = 0.0
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]]) -> "EmbedBatchPlanner":
+        """Build from ``embeddings.batching`` in app.yaml; missing or invalid keys use defaults."""
+        cfg = cfg or {}
+
+        def _int(key: str, default: int) -> int:
+            try:
+                return int(cfg.get(key, default) or default)
+            except (TypeError, ValueError):
+                return default
+
+        return cls(
+            max_items=_int("max_items", DEFAULT_MAX_ITEMS),
+            max_tokens=_int("max_tokens", DEFAULT_MAX_TOKENS),
+            max_bytes=_int("max_bytes", DEFAULT_MAX_BYTES),
+            sort_by_length=bool(cfg.get("sort_by_length", True)),
+        )
+
+    def plan(
+        self,
+        token_counts: Sequence[int],
+        byte_sizes: Sequence[int],
+        max_items: Optional[int] = None,
+        *,
+        keep_order: bool = False,
+    ) -> List[List[int]]:
+        """Group input indices into requests; ``max_items`` further caps items per request.
+
+        ``keep_order`` packs inputs in the given order even when ``sort_by_length`` is set.
+        """
+        item_cap = self.max_items if max_items is None else max(1, min(self.max_items, int(max_items)))
+        order = list(range(len(token_counts)))
+        if self.sort_by_length and not keep_order:
+            order.sort(key=lambda i: token_counts[i])
+        batches: List[List[int]] = []
+        current: List[int] = []
+        cur_tokens = cur_bytes = 0
+        for i in order:
+            tokens, size = token_counts[i], byte_sizes[i]
+            if current and (
+                len(current) >= item_cap
+                or cur_tokens + tokens > self.max_tokens
+                or cur_bytes + size > self.max_bytes
+            ):
+                batches.append(current)
+                current, cur_tokens, cur_bytes = [], 0, 0
+            current.append(i)
+            cur_tokens += tokens
+            cur_bytes += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def iter_stream(
+        self,
+        items: Iterable[T],
+        measure: Callable[[T], Tuple[int, int]],
+        window: Optional[int] = None,
+        *,
+        keep_order: bool = False,
+    ) -> Iterator[List[T]]:
+        """Pack a stream into request-sized batches, planning ``window`` items at a time.
+
+        ``measure`` returns ``(tokens, bytes)`` for an item. Each window is grouped like
+        ``plan`` (so length sorting applies within it) and only ``window`` items are held.
+        ``keep_order`` yields items in stream order, for consumers that rely on grouping
+        (e.g. chunks of one document arriving together).
+        """
+        size = max(self.max_items, int(window or DEFAULT_WINDOW_REQUESTS * self.max_items))
+        buf: List[T] = []
+        tokens: List[int] = []
+        sizes: List[int] = []
+
+        def _drain() -> Iterator[List[T]]:
+            for group in self.plan(tokens, sizes, keep_order=keep_order):
+                yield [buf[i] for i in group]
+
+        for item in items:
+            n_tokens, n_bytes = measure(item)
+            buf.append(item)
+            tokens.append(n_tokens)
+            sizes.append(n_bytes)
+            if len(buf) >= size:
+                yield from _drain()
+                buf, tokens, sizes = [], [], []
+        if buf:
+            yield from _drain()
+
+    def record(self, items: int, tokens: int, size: int, max_items: Optional[int] = None) -> None:
+        """Count one sent request; fill is its share of the tightest of the three budgets."""
+        item_cap = self.max_items if max_items is None else max(1, min(self.max_items, int(max_items)))
+        fill = min(1.0, max(items / item_cap, tokens / self.max_tokens, size / self.max_bytes))
+        with self._lock:
+            self.batches += 1
+            self.items += items
+            self.tokens += tokens
+            self.bytes += size
+            self.max_batch_items = max(self.max_batch_items, items)
+            self._fill_sum += fill
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            batches = self.batches
+            return {
+                "batches": batches,
+                "items": self.items,
+                "tokens": self.tokens,
+                "bytes": self.bytes,
+                "avg_items": round(self.items / batches, 2) if batches else 0.0,
+                "avg_tokens": round(self.tokens / batches, 1) if batches else 0.0,
+                "max_items": self.max_batch_items,
+                "fill_ratio": round(self._fill_sum / batches, 3) if batches else 0.0,
+                "limits": {"items": self.max_items, "tokens": self.max_tokens, "bytes": self.max_bytes},
+            }
+
+
+__all__ = ["EmbedBatchPlanner"]
@@ -1,6 +1,17 @@
-﻿from langchain_community.llms import OCIGenAI
+﻿from typing import Any, Dict, Iterator, Optional
+
+from langchain_community.llms import OCIGenAI
 
 from backend.core.ports.chat_model import ChatModelPort
+from backend.providers.oci.adaptive_limiter import (
+    get_controller,
+    is_throttled,
+    retry_after_seconds,
+    sdk_retry_strategy,
+)
+
+# 429s the SDK no longer retries when rate control is on; each retry waits for a new permit.
+_THROTTLE_RETRIES = 4
 
 
 class OciChatModel(ChatModelPort):
@@ -40,7 +51,49 @@ class OciChatModel(ChatModelPort):
             }.items()
             if v is not None
         }
+        self._rate_controller = get_controller(endpoint, model_id)
+        client = getattr(self._llm, "client", None)
+        if self._rate_controller is not None and client is not None:
+            # OCIGenAI builds its client with the SDK default strategy, which retries 429s itself.
+            client.retry_strategy = sdk_retry_strategy(self._rate_controller)
 
     def generate(self, prompt: str) -> str:
         # Pass any configured generation kwargs to the underlying client
-        return self._llm.invoke(prompt, **self._gen_kwargs).strip()
+        controller = getattr(self, "_rate_controller", None)
+        if controller is None:
+            return self._llm.invoke(prompt, **self._gen_kwargs).strip()
+        return controller.call(
+            lambda: self._llm.invoke(prompt, **self._gen_kwargs), throttle_retries=_THROTTLE_RETRIES
+        ).strip()
+
+    async def agenerate(self, prompt: str) -> str:
+        controller = getattr(self, "_rate_controller", None)
+        if controller is None:
+            return (await self._llm.ainvoke(prompt, **self._gen_kwargs)).strip()
+        result = await controller.acall(
+            lambda: self._llm.ainvoke(prompt, **self._gen_kwargs), throttle_retries=_THROTTLE_RETRIES
+        )
+        return result.strip()
+
+    def generate_stream(self, prompt: str, usage: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        controller = getattr(self, "_rate_controller", None)
+        permit = controller.acquire() if controller is not None else None
+        try:
+            for chunk in self._llm.stream(prompt, **self._gen_kwargs):
+                if permit is not None:
+                    # The request has been accepted once the first chunk arrives.
+                    controller.release(permit)
+                    permit = None
+                text = chunk if isinstance(chunk, str) else getattr(chunk, "text", "")
+                if text:
+                    yield text
+        except Exception as exc:
+            if permit is not None:
+                controller.release(
+                    permit, throttled=is_throttled(exc), retry_after=retry_after_seconds(exc), error=True
+                )
+                permit = None
+            raise
+        finally:
+            if permit is not None:
+                controller.release(permit)
@@ -1,6 +1,7 @@
 ﻿from __future__ import annotations
 
-from typing import Any
+import json
+from typing import Any, Dict, Iterator, Optional
 
 import oci
 from oci.generative_ai_inference import GenerativeAiInferenceClient
@@ -13,7 +14,17 @@ from oci.generative_ai_inference.models import (
     TextContent,
 )
 
+try:  # Older SDKs do not expose stream options; usage is then omitted from streams.
+    from oci.generative_ai_inference.models import StreamOptions as _StreamOptions
+except Exception:  # pragma: no cover
+    _StreamOptions = None
+
 from backend.core.ports.chat_model import ChatModelPort
+from backend.providers.oci.adaptive_limiter import get_controller, sdk_retry_strategy
+from backend.providers.oci.async_client import CHAT_PATH, OciAsyncInferenceClient, httpx_available
+
+# 429s the SDK no longer retries when rate control is on; each retry waits for a new permit.
+_THROTTLE_RETRIES = 4
 
 
 class OciChatModelChat(ChatModelPort):
@@ -49,16 +60,26 @@ class OciChatModelChat(ChatModelPort):
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("Failed to load OCI configuration for chat model") from exc
 
+        self._rate_controller = get_controller(endpoint, model_id)
         try:
             self._client = GenerativeAiInferenceClient(
                 config=config,
                 service_endpoint=endpoint,
-                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY,
+                retry_strategy=sdk_retry_strategy(self._rate_controller),
             )
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("Failed to initialize OCI Generative AI Inference client") from exc
+        self._async_client: OciAsyncInferenceClient | None = (
+            OciAsyncInferenceClient(self._client) if httpx_available() else None
+        )
 
-    def generate(self, prompt: str) -> str:
+    def _chat(self, details: ChatDetails) -> Any:
+        controller = getattr(self, "_rate_controller", None)
+        if controller is None:
+            return self._client.chat(details)
+        return controller.call(lambda: self._client.chat(details), throttle_retries=_THROTTLE_RETRIES)
+
+    def _build_details(self, prompt: str, *, stream: bool = False) -> ChatDetails:
         message = Message(
             role="USER",
             content=[TextContent(text=prompt)],
@@ -68,6 +89,10 @@ class OciChatModelChat(ChatModelPort):
             api_format=BaseChatRequest.API_FORMAT_GENERIC,
             messages=[message],
         )
+        if stream:
+            chat_request.is_stream = True
+            if _StreamOptions is not None:
+                chat_request.stream_options = _StreamOptions(is_include_usage=True)
 
         params = self._generation_params
         if params["max_tokens"] is not None:
@@ -83,14 +108,17 @@ class OciChatModelChat(ChatModelPort):
         if params["presence_penalty"] is not None:
             chat_request.presence_penalty = params["presence_penalty"]
 
-        details = ChatDetails(
+        return ChatDetails(
             chat_request=chat_request,
             compartment_id=self._compartment_id,
             serving_mode=OnDemandServingMode(model_id=self._model_id),
         )
 
+    def generate(self, prompt: str) -> str:
+        details = self._build_details(prompt)
+
         try:
-            response = self._client.chat(details)
+            response = self._chat(details)
         except Exception as exc:  # noqa: BLE001
             raise RuntimeError("OCI chat generation request failed") from exc
 
@@ -112,3 +140,58 @@ class OciChatModelChat(ChatModelPort):
 
         text = getattr(content[0], "text", "") if content else ""
         return (text or "").strip()
+
+    async def agenerate(self, prompt: str) -> str:
+        async_client = getattr(self, "_async_client", None)
+        if async_client is None:
+            return await super().agenerate(prompt)
+        details = self._build_details(prompt)
+        controller = getattr(self, "_rate_controller", None)
+        try:
+            if controller is not None:
+                data = await controller.acall(
+                    lambda: async_client.post(CHAT_PATH, details), throttle_retries=_THROTTLE_RETRIES
+                )
+            else:
+                data = await async_client.post(CHAT_PATH, details)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError("OCI chat generation request failed") from exc
+
+        choices = (data.get("chatResponse") or {}).get("choices") or []
+        if not choices:
+            return ""
+        content = (choices[0].get("message") or {}).get("content") or []
+        text = content[0].get("text", "") if content else ""
+        return (text or "").strip()
+
+    def generate_stream(self, prompt: str, usage: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Stream text deltas via the chat API (``is_stream=True`` server-sent events).
+
+        Token counts from the final event are written into ``usage`` when given.
+        """
+        details = self._build_details(prompt, stream=True)
+        try:
+            # Rate control covers opening the stream; reading events is not a new request.
+            response = self._chat(details)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError("OCI chat streaming request failed") from exc
+
+        for event in response.data.events():
+            try:
+                payload = json.loads(event.data)
+            except (TypeError, ValueError):
+                continue
+            reported = payload.get("usage")
+            if isinstance(reported, dict) and usage is not None:
+                usage.update(
+                    {
+                        "prompt_tokens": reported.get("promptTokens"),
+                        "completion_tokens": reported.get("completionTokens"),
+                        "total_tokens": reported.get("totalTokens"),
+                    }
+                )
+            message = payload.get("message") or {}
+            for part in message.get("content") or []:
+                text = part.get("text") if isinstance(part, dict) else None
+                if text:
+                    yield text
@@ -0,0 +1,162 @@
+# backend/providers/oci/embedding_store.py
+"""On-disk, content-addressed cache of document embeddings (SQLite, float32 blobs).
+
+Unlike the in-process query cache, this one survives across embed jobs, so reindexing into a
+new ``index_name`` or domain only pays OCI for chunks whose text actually changed.
+"""
+from __future__ import annotations
+
+import array
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key       TEXT PRIMARY KEY,
+    dim       INTEGER NOT NULL,
+    vector    BLOB NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+_SQLITE_MAX_VARS = 900
+
+
+def embedding_key(text: str, model_id: str, input_type: str, dimensions: int = 0, token_handling: str = "") -> str:
+    """sha256 over the exact text plus everything that changes the resulting vector.
+
+    ``token_handling`` describes how over-long inputs are split or truncated before the call
+    (budget, strategy, estimator); the stored vector for such a text depends on it.
+    """
+    digest = hashlib.sha256()
+    for part in (model_id, input_type, str(int(dimensions or 0)), token_handling, text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class PersistentEmbeddingCache:
+    """SQLite-backed LRU cache of float32 vectors bounded by ``max_bytes``.
+
+    Safe to share between threads (one connection guarded by a lock). Eviction removes the
+    least recently used rows until the stored vectors fit in 90% of ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024**3) -> None:
+        path = Path(os.path.expanduser(directory))
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path / "embeddings.sqlite3"
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._bytes = int(self._conn.execute("SELECT COALESCE(SUM(dim), 0) * 4 FROM embeddings").fetchone()[0])
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, cfg: Optional[Dict[str, Any]]) -> Optional["PersistentEmbeddingCache"]:
+        if not isinstance(cfg, dict) or not bool(cfg.get("enabled", False)):
+            return None
+        directory = cfg.get("dir") or os.path.join("~", ".cache", "ai-assistant", "embeddings")
+        max_mb = float(cfg.get("max_mb", 2048) or 2048)
+        try:
+            cache = cls(str(directory), max_bytes=int(max_mb * 1024 * 1024))
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Persistent embedding cache disabled (%s): %s", directory, exc)
+            return None
+        logger.info("Persistent embedding cache at %s (max_mb=%s)", cache.path, max_mb)
+        return cache
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique), _SQLITE_MAX_VARS):
+                chunk = unique[start : start + _SQLITE_MAX_VARS]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", chunk)
+                for key, blob in rows:
+                    vec = array.array("f")
+                    vec.frombytes(blob)
+                    found[key] = vec.tolist()
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+                )
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, Sequence[float]]]) -> None:
+        now = time.time()
+        rows = [(key, len(vec), array.array("f", vec).tobytes(), now) for key, vec in items if vec]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for key, dim, blob, ts in rows:
+                    old = self._conn.execute("SELECT dim FROM embeddings WHERE key = ?", (key,)).fetchone()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO embeddings (key, dim, vector, last_used) VALUES (?, ?, ?, ?)",
+                        (key, dim, blob, ts),
+                    )
+                    self._bytes += dim * 4 - (old[0] * 4 if old else 0)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.writes += len(rows)
+            if self._bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        target = int(self.max_bytes * 0.9)
+        while self._bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, dim FROM embeddings ORDER BY last_used LIMIT ?", (_SQLITE_MAX_VARS,)
+            ).fetchall()
+            if not rows:
+                self._bytes = 0
+                break
+            victims: List[str] = []
+            for key, dim in rows:
+                if self._bytes <= target:
+                    break
+                victims.append(key)
+                self._bytes -= dim * 4
+            self._conn.executemany("DELETE FROM embeddings WHERE key = ?", [(key,) for key in victims])
+            self.evictions += len(victims)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "bytes": self._bytes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["PersistentEmbeddingCache", "embedding_key"]
@@ -1,16 +1,18 @@
 # backend/providers/oci/embeddings_adapter.py
 from __future__ import annotations
 
+import asyncio
 import inspect
 import os
 import random
 import time
 from http.client import RemoteDisconnected
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
-import math
 import re
 import pathlib
+import threading
+from collections import deque
 
 logger = logging.getLogger(__name__)
 log = logger
@@ -26,6 +28,14 @@ try:
 except Exception as exc:  # pragma: no cover
     raise
 
+from backend.ingest.tokenizer import Tokenizer, get_tokenizer
+from backend.providers.oci.adaptive_limiter import get_controller, sdk_retry_strategy
+from backend.providers.oci.async_client import EMBED_TEXT_PATH, OciAsyncInferenceClient, httpx_available
+from backend.providers.oci.batch_planner import EmbedBatchPlanner
+from backend.providers.oci.embedding_store import PersistentEmbeddingCache, embedding_key
+from backend.providers.oci.query_cache import QueryEmbeddingCache
+from backend.providers.oci.rate_limiter import TokenBucketRateLimiter
+
 
 class EmbeddingError(Exception):
     def __init__(
@@ -65,7 +75,6 @@ class OCIEmbeddingsAdapter(Embeddings):
         auth_profile: str,
         doc_input_type: str = "search_document",
         query_input_type: str = "search_query",
-        batch_size: Optional[int] = None,
     ) -> None:
         # Store config
         self._model_id = model_id
@@ -77,31 +86,46 @@ class OCIEmbeddingsAdapter(Embeddings):
         self._max_input_tokens = 512
         self._on_token_limit = "split"  # split | truncate | skip
         self._token_estimator = "auto"   # auto | heuristic
+        # Query embedding cache (embeddings.query_cache in app.yaml)
+        self._query_cache_cfg: Dict[str, Any] = {}
+        # Document embedding cache on disk (embeddings.persistent_cache in app.yaml)
+        self._persistent_cache_cfg: Dict[str, Any] = {}
+        # Request packing limits (embeddings.batching in app.yaml)
+        self._batching_cfg: Dict[str, Any] = {}
         self._load_token_limit_config()
-        # Metrics
+        self._batch_planner = EmbedBatchPlanner.from_config(self._batching_cfg)
+        self._query_cache = self._build_query_cache(self._query_cache_cfg)
+        self._persistent_cache = PersistentEmbeddingCache.from_config(self._persistent_cache_cfg)
+        self._cache_dimensions = int(self._persistent_cache_cfg.get("dimensions", 0) or 0)
+        # Metrics (bumped from concurrent embedding workers; see _bump)
+        self._metrics_lock = threading.Lock()
         self.errors_token_limit = 0
         self.token_limit_splits = 0
         self.token_limit_truncations = 0
         self.skipped_token_limit = 0
-        self._batch_size = batch_size if batch_size is not None else getattr(self, "_batch_size", 32)
-        log.info("OCIEmbeddingsAdapter initialized with batch_size=%s", self._batch_size)
+        log.info("OCIEmbeddingsAdapter initialized with batching limits %s", self._batch_planner.stats()["limits"])
         self._rate_limit_per_min: Optional[int] = None
-        self._next_allowed_ts = 0.0
+        # Shared by every thread calling embed_documents, so concurrent workers stay within quota.
+        self._rate_limiter: Optional[TokenBucketRateLimiter] = None
+        # AIMD concurrency/rate control shared with every adapter on this endpoint/model
+        # (oci_rate_control in app.yaml); replaces the static limiter when enabled.
+        self._rate_controller = get_controller(service_endpoint, model_id)
         # Ensure OCI SDK picks up the desired config file/profile as a baseline
         if auth_file_location:
             os.environ["OCI_CONFIG_FILE"] = auth_file_location
         if auth_profile:
             os.environ["OCI_CONFIG_PROFILE"] = auth_profile
         # Build OCI Generative AI client using explicit file+profile
-        cfg = oci.config.from_file(
+        self._oci_config = oci.config.from_file(
             file_location=os.environ.get("OCI_CONFIG_FILE"),
             profile_name=os.environ.get("OCI_CONFIG_PROFILE", "DEFAULT"),
         )
-        self._client = oci.generative_ai_inference.GenerativeAiInferenceClient(
-            config=cfg,
-            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY,
-            timeout=(10, 240),
-            service_endpoint=self._endpoint,
+        self._client = self._new_sdk_client()
+        # OCI SDK clients are not thread-safe; worker threads get their own (see _thread_client).
+        self._client_owner = threading.get_ident()
+        self._thread_local = threading.local()
+        self._async_client: Optional[OciAsyncInferenceClient] = (
+            OciAsyncInferenceClient(self._client, timeout=(10, 240)) if httpx_available() else None
         )
         # SDK models import and signature detection
         from oci.generative_ai_inference import models as _models
@@ -110,6 +134,28 @@ class OCIEmbeddingsAdapter(Embeddings):
             inspect.signature(_models.EmbedTextDetails.__init__).parameters.keys()
         )
 
+    def _new_sdk_client(self):
+        return oci.generative_ai_inference.GenerativeAiInferenceClient(
+            config=self._oci_config,
+            # With rate control on, 429s reach _embed_with_retry through the controller.
+            retry_strategy=sdk_retry_strategy(getattr(self, "_rate_controller", None)),
+            timeout=(10, 240),
+            service_endpoint=self._endpoint,
+        )
+
+    def _thread_client(self):
+        if threading.get_ident() == getattr(self, "_client_owner", None) or not hasattr(self, "_thread_local"):
+            return self._client
+        client = getattr(self._thread_local, "client", None)
+        if client is None:
+            client = self._new_sdk_client()
+            self._thread_local.client = client
+        return client
+
+    def _bump(self, counter: str, amount: int = 1) -> None:
+        with self._metrics_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
     # Methods expected by LangChain:
 
     def embed_documents(self, texts: List[str], input_type: str | None = None):
@@ -119,25 +165,47 @@ class OCIEmbeddingsAdapter(Embeddings):
         else:
             serving_mode = self._models.OnDemandServingMode(model_id=self._model_id)
 
+        resolved_type = input_type or self._doc_input_type
+        cache = getattr(self, "_persistent_cache", None)
         embeddings: List[List[float]] = []
         index_map: List[int] = []
-        batch_size = 96
-        for i in range(0, len(texts), batch_size):
-            original_batch = texts[i : i + batch_size]
+        texts = list(texts)
+        keys: List[str] = []
+        cached: Dict[str, List[float]] = {}
+        if cache is not None:
+            handling = self._token_handling_key()
+            keys = [embedding_key(t, self._model_id, resolved_type, self._cache_dimensions, handling) for t in texts]
+            cached = cache.get_many(keys)
+        # Only texts without a cached vector go to OCI
+        pending = [j for j in range(len(texts)) if not keys or keys[j] not in cached]
+        fresh_by_pos: Dict[int, List[float]] = {}
+        if pending:
+            to_embed = [texts[j] for j in pending]
             # Preflight transform each text to fit within token budget
-            expanded, exp_map = self._preflight_expand_batch(original_batch)
-            # Perform provider call with retry on token-limit 400s (tracking mapping)
-            flat_vecs, out_map = self._embed_with_retry(serving_mode, expanded, input_type or self._doc_input_type, exp_map)
+            expanded, exp_map = self._preflight_expand_batch(to_embed)
+            # Provider calls packed by token/byte budget, with retry on token-limit 400s (tracking mapping)
+            flat_vecs, out_map = self._embed_with_retry(serving_mode, expanded, resolved_type, exp_map)
             # Reassemble per original position (average when split, empty vector when skipped)
-            batch_vecs = self._reassemble_by_map(flat_vecs, out_map, len(original_batch))
-            for local_idx, vec in enumerate(batch_vecs):
-                if not isinstance(vec, list) or not vec:
-                    continue
-                embeddings.append(vec)
-                index_map.append(i + local_idx)
+            fresh = self._reassemble_by_map(flat_vecs, out_map, len(to_embed))
+            if cache is not None:
+                cache.put_many((keys[j], vec) for j, vec in zip(pending, fresh) if isinstance(vec, list) and vec)
+            fresh_by_pos = dict(zip(pending, fresh))
+        for pos in range(len(texts)):
+            vec = fresh_by_pos[pos] if pos in fresh_by_pos else cached[keys[pos]]
+            if not isinstance(vec, list) or not vec:
+                continue
+            embeddings.append(vec)
+            index_map.append(pos)
         return embeddings, index_map
 
     def embed_query(self, text: str, input_type: str | None = None) -> List[float]:
+        resolved_type = input_type or self._query_input_type
+        cache_key = None
+        if self._query_cache is not None:
+            cache_key = QueryEmbeddingCache.make_key(text, resolved_type, self._model_id)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
         # Same handling as documents but with single item
         if self._model_id.startswith("ocid1.generativeaiendpoint"):
             serving_mode = self._models.DedicatedServingMode(endpoint_id=self._model_id)
@@ -150,7 +218,7 @@ class OCIEmbeddingsAdapter(Embeddings):
                 code="invalid_input",
                 retryable=False,
             )
-        vecs, out_map = self._embed_with_retry(serving_mode, expanded, input_type or self._query_input_type, exp_map)
+        vecs, out_map = self._embed_with_retry(serving_mode, expanded, resolved_type, exp_map)
         reassembled = self._reassemble_by_map(vecs, out_map, 1)
         if not reassembled or not isinstance(reassembled[0], list) or not reassembled[0]:
             raise EmbeddingError(
@@ -158,28 +226,124 @@ class OCIEmbeddingsAdapter(Embeddings):
                 code="service_unavailable",
                 retryable=False,
             )
+        if cache_key is not None:
+            self._query_cache.put(cache_key, reassembled[0])
         return reassembled[0]
 
-    def configure_batching(
-        self,
-        *,
-        batch_size: Optional[int] = None,
-        rate_limit_per_min: Optional[int] = None,
-    ) -> None:
-        if batch_size is not None:
+    async def aembed_query(self, text: str, input_type: str | None = None) -> List[float]:
+        """Async query embedding over httpx; same cache, preflight and retry policy as embed_query."""
+        resolved_type = input_type or self._query_input_type
+        cache_key = None
+        if self._query_cache is not None:
+            cache_key = QueryEmbeddingCache.make_key(text, resolved_type, self._model_id)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        expanded, exp_map = self._preflight_expand_batch([text])
+        if getattr(self, "_async_client", None) is None or len(expanded) != 1:
+            # No async transport, or the query was split/skipped: reuse the sync path.
+            return await asyncio.to_thread(self.embed_query, text, input_type)
+        serving_mode = self._serving_mode()
+        details = self._build_embed_payload(expanded, resolved_type, serving_mode)
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                self._batch_size = max(_EMBED_MIN_BATCH, int(batch_size))
-            except Exception:
-                self._batch_size = max(_EMBED_MIN_BATCH, 32)
-        if rate_limit_per_min is not None and rate_limit_per_min > 0:
+                controller = getattr(self, "_rate_controller", None)
+                if controller is not None:
+                    data = await controller.acall(lambda: self._async_client.post(EMBED_TEXT_PATH, details))
+                else:
+                    data = await self._async_client.post(EMBED_TEXT_PATH, details)
+                break
+            except Exception as exc:  # noqa: BLE001
+                status = getattr(exc, "status", None)
+                retryable = status in (429, 500, 502, 503, 504) or (
+                    isinstance(exc, _CONNECTION_ERROR_TYPES) if _CONNECTION_ERROR_TYPES else False
+                )
+                if retryable and attempt <= _EMBED_MAX_RETRIES:
+                    delay = self._compute_retry_delay(exc, attempt, honor_retry_after=status == 429)
+                    logger.warning("Async query embedding retry (status=%s) attempt=%s sleeping=%.2fs", status, attempt, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                raise EmbeddingError(
+                    "Query embedding failed",
+                    code="throttled" if status == 429 else "service_error",
+                    status=status,
+                    retryable=False,
+                    cause=exc,
+                ) from exc
+        vectors = data.get("embeddings") or []
+        if not vectors or not isinstance(vectors[0], list) or not vectors[0]:
+            raise EmbeddingError(
+                "Embeddings service returned no vector for query",
+                code="service_unavailable",
+                retryable=False,
+            )
+        if cache_key is not None:
+            self._query_cache.put(cache_key, vectors[0])
+        return vectors[0]
+
+    def _serving_mode(self):
+        if self._model_id.startswith("ocid1.generativeaiendpoint"):
+            return self._models.DedicatedServingMode(endpoint_id=self._model_id)
+        return self._models.OnDemandServingMode(model_id=self._model_id)
+
+    def query_cache_stats(self) -> Dict[str, Any]:
+        if self._query_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._query_cache.stats()}
+
+    def persistent_cache_stats(self) -> Dict[str, Any]:
+        cache = getattr(self, "_persistent_cache", None)
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.stats()}
+
+    def rate_control_stats(self) -> Dict[str, Any]:
+        controller = getattr(self, "_rate_controller", None)
+        if controller is None:
+            return {"enabled": False}
+        return {"enabled": True, "key": controller.key, **controller.stats()}
+
+    def batch_planner_stats(self) -> Dict[str, Any]:
+        return self._planner().stats()
+
+    def _planner(self) -> EmbedBatchPlanner:
+        planner = getattr(self, "_batch_planner", None)
+        if planner is None:
+            planner = self._batch_planner = EmbedBatchPlanner()
+        return planner
+
+    def iter_batches(
+        self, items: Iterable[Any], text_of: Callable[[Any], str], keep_order: bool = False
+    ) -> Iterator[List[Any]]:
+        """Cut a stream of items into request-sized batches by the planner's token/byte budget.
+
+        ``keep_order`` turns off length sorting so batches follow the stream order.
+        """
+        tokenizer = self._tokenizer()
+
+        def _measure(item: Any) -> Tuple[int, int]:
+            text = text_of(item) or ""
+            return tokenizer.count(text), len(text.encode("utf-8"))
+
+        return self._planner().iter_stream(items, _measure, keep_order=keep_order)
+
+    def configure_batching(self, *, rate_limit_per_min: Optional[int] = None) -> None:
+        controller = getattr(self, "_rate_controller", None)
+        if rate_limit_per_min is not None and rate_limit_per_min > 0 and controller is None:
             self._rate_limit_per_min = int(rate_limit_per_min)
+            self._rate_limiter = TokenBucketRateLimiter(self._rate_limit_per_min)
         else:
+            if rate_limit_per_min and controller is not None:
+                logger.info(
+                    "Ignoring static rate_limit_per_min=%s; adaptive rate control is enabled", rate_limit_per_min
+                )
             self._rate_limit_per_min = None
-        self._next_allowed_ts = 0.0
+            self._rate_limiter = None
         logger.info(
-            "Embedding adapter configured: batch_size=%s rate_limit_per_min=%s",
-            self._batch_size,
-            self._rate_limit_per_min or "disabled",
+            "Embedding adapter configured: rate_limit_per_min=%s",
+            "adaptive" if controller is not None else (self._rate_limit_per_min or "disabled"),
         )
 
     # ---------- Token handling helpers ----------
@@ -200,98 +364,61 @@ class OCIEmbeddingsAdapter(Embeddings):
             self._max_input_tokens = int(prof.get("max_input_tokens", 512) or 512)
             self._on_token_limit = str(prof.get("on_token_limit", "split") or "split").lower()
             self._token_estimator = str(prof.get("token_estimator", "auto") or "auto").lower()
+            qcache = emb.get("query_cache") if isinstance(emb, dict) else None
+            if isinstance(qcache, dict):
+                self._query_cache_cfg = qcache
+            pcache = emb.get("persistent_cache") if isinstance(emb, dict) else None
+            if isinstance(pcache, dict):
+                self._persistent_cache_cfg = pcache
+            batching = emb.get("batching") if isinstance(emb, dict) else None
+            if isinstance(batching, dict):
+                self._batching_cfg = batching
         except Exception as exc:  # noqa: BLE001
             logger.debug("Token-limit config load failed; using defaults: %s", exc)
 
-    def _estimate_tokens(self, text: str) -> int:
-        if not text:
-            return 0
-        if self._token_estimator == "auto":
-            try:
-                import tiktoken  # type: ignore
+    @staticmethod
+    def _build_query_cache(cfg: Dict[str, Any]) -> Optional[QueryEmbeddingCache]:
+        if not bool(cfg.get("enabled", True)):
+            logger.info("Query embedding cache disabled (embeddings.query_cache.enabled=false)")
+            return None
+        try:
+            max_entries = int(cfg.get("max_entries", 1024) or 1024)
+            ttl_seconds = float(cfg.get("ttl_seconds", 3600) or 0)
+        except (TypeError, ValueError):
+            max_entries, ttl_seconds = 1024, 3600.0
+        return QueryEmbeddingCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def _tokenizer(self) -> Tokenizer:
+        return get_tokenizer(getattr(self, "_token_estimator", "auto"))
+
+    def _token_handling_key(self) -> str:
+        """Token-limit settings that shape the vector of an over-long text (persistent cache key)."""
+        # "auto" resolves to tiktoken or the heuristic depending on what is installed.
+        return "{}/{}/{}".format(
+            getattr(self, "_max_input_tokens", 512),
+            getattr(self, "_on_token_limit", "split"),
+            type(self._tokenizer()).__name__,
+        )
 
-                try:
-                    enc = tiktoken.encoding_for_model("gpt-3.5-turbo")
-                except Exception:
-                    enc = tiktoken.get_encoding("cl100k_base")
-                return len(enc.encode(text))
-            except Exception:
-                pass
-        # Heuristic fallback
-        return int(math.ceil(len(text) / 4))
+    def _estimate_tokens(self, text: str) -> int:
+        return self._tokenizer().count(text)
 
     def _split_text_to_token_budget(self, text: str, max_tokens: int) -> List[str]:
         if not text:
             return [""]
-        import re as _re
-
-        sentences = _re.split(r"(?<=[.!?])\s+", text)
-        chunks: List[str] = []
-        current: List[str] = []
-        cur_tokens = 0
-        for sent in sentences:
-            t = self._estimate_tokens(sent)
-            if t > max_tokens:
-                # Fallback: word window inside this long sentence
-                words = sent.split()
-                wbuf: List[str] = []
-                wtok = 0
-                for w in words:
-                    wt = self._estimate_tokens((wbuf + [w]) and (" ".join(wbuf + [w])))
-                    if wt <= max_tokens:
-                        wbuf.append(w)
-                        wtok = wt
-                    else:
-                        if wbuf:
-                            chunks.append(" ".join(wbuf))
-                        # If a single word is too big (rare), hard truncate the word
-                        if self._estimate_tokens(w) > max_tokens:
-                            hard = self._truncate_to_budget(w, max_tokens)
-                            chunks.append(hard)
-                        else:
-                            wbuf = [w]
-                            wtok = self._estimate_tokens(w)
-                        wbuf = []
-                        wtok = 0
-                if wbuf:
-                    chunks.append(" ".join(wbuf))
-                continue
-            if cur_tokens + t <= max_tokens:
-                current.append(sent)
-                cur_tokens += t
-            else:
-                if current:
-                    chunks.append(" ".join(current))
-                current = [sent]
-                cur_tokens = t
-        if current:
-            chunks.append(" ".join(current))
-        return [c for c in chunks if c]
+        return self._tokenizer().split(text, max_tokens)
 
     def _truncate_to_budget(self, text: str, max_tokens: int) -> str:
         if not text:
             return ""
-        # Binary search over character length guided by token estimate
-        lo, hi = 0, len(text)
-        best = ""
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            candidate = text[:mid]
-            t = self._estimate_tokens(candidate)
-            if t <= max_tokens:
-                best = candidate
-                lo = mid + 1
-            else:
-                hi = mid - 1
-        if best and best != text:
-            try:
-                before = self._estimate_tokens(text)
-                after = self._estimate_tokens(best)
-                logger.warning("Token limit: truncate from ~%d → %d tokens", before, after)
-                self.token_limit_truncations += 1
-            except Exception:
-                self.token_limit_truncations += 1
-        return best or text[: max(1, min(len(text), int(max_tokens * 4)))]
+        tokenizer = self._tokenizer()
+        best = tokenizer.truncate(text, max(1, max_tokens))
+        if best != text:
+            logger.warning(
+                "Token limit: truncate from ~%d → %d tokens", tokenizer.count(text), tokenizer.count(best)
+            )
+            self._bump("token_limit_truncations")
+        return best
 
     def _preflight_expand_batch(self, batch: List[str]) -> Tuple[List[str], List[int]]:
         """
@@ -300,8 +427,8 @@ class OCIEmbeddingsAdapter(Embeddings):
         """
         expanded: List[str] = []
         exp_map: List[int] = []  # maps expanded index -> original index
-        for idx, text in enumerate(batch):
-            t = self._estimate_tokens(text)
+        counts = self._tokenizer().count_batch(batch)
+        for idx, (text, t) in enumerate(zip(batch, counts)):
             if t <= self._max_input_tokens:
                 expanded.append(text)
                 exp_map.append(idx)
@@ -311,19 +438,19 @@ class OCIEmbeddingsAdapter(Embeddings):
                 parts = self._split_text_to_token_budget(text, self._max_input_tokens)
                 if parts:
                     logger.warning("Token limit: split item[%d] into %d parts (<=%d tokens each)", idx, len(parts), self._max_input_tokens)
-                    self.token_limit_splits += len(parts)
+                    self._bump("token_limit_splits", len(parts))
                     expanded.extend(parts)
                     exp_map.extend([idx] * len(parts))
                 else:
                     logger.warning("Token limit: skip item[%d] (~%d tokens)", idx, t)
-                    self.skipped_token_limit += 1
+                    self._bump("skipped_token_limit")
             elif action == "truncate":
                 trimmed = self._truncate_to_budget(text, self._max_input_tokens)
                 expanded.append(trimmed)
                 exp_map.append(idx)
             else:  # skip
                 logger.warning("Token limit: skip item[%d] (~%d tokens)", idx, t)
-                self.skipped_token_limit += 1
+                self._bump("skipped_token_limit")
         return expanded, exp_map
 
     def _embed_with_retry(self, serving_mode, inputs: List[str], input_type: str | None, exp_map: List[int]) -> Tuple[List[List[float]], List[int]]:
@@ -333,37 +460,43 @@ class OCIEmbeddingsAdapter(Embeddings):
         flat_vecs: List[List[float]] = []
         vec_map: List[int] = []
 
-        configured = getattr(self, "_batch_size", 32) or 32
-        batch_size = max(int(configured), _EMBED_MIN_BATCH)
-
-        total = len(inputs)
-        idx = 0
-
-        while idx < total:
-            chunk_end = min(total, idx + batch_size)
-            chunk = list(inputs[idx:chunk_end])
-            chunk_map = list(exp_map[idx:chunk_end])
-            span = chunk_end - idx
+        # Requests are packed by estimated tokens and payload bytes (embeddings.batching).
+        planner = self._planner()
+        batch_size = planner.max_items
+        token_counts = self._tokenizer().count_batch(inputs)
+        byte_sizes = [len(t.encode("utf-8")) for t in inputs]
+        planned = deque(planner.plan(token_counts, byte_sizes, max_items=batch_size))
+        controller = getattr(self, "_rate_controller", None)
+
+        while planned:
+            members = planned.popleft()
+            chunk = [inputs[m] for m in members]
+            chunk_map = [exp_map[m] for m in members]
+            span = len(members)
             if not chunk or not chunk_map:
-                idx += span
                 continue
 
             attempt = 0
             while chunk:
                 attempt += 1
                 try:
-                    if getattr(self, "_rate_limit_per_min", None):
-                        interval = 60.0 / float(self._rate_limit_per_min)
-                        now = time.monotonic()
-                        if self._next_allowed_ts > 0 and now < self._next_allowed_ts:
-                            sleep_for = self._next_allowed_ts - now
-                            logger.debug("Embedding pacing sleep %.3fs to respect rate limit", sleep_for)
-                            time.sleep(sleep_for)
-                            now = time.monotonic()
-                        self._next_allowed_ts = max(self._next_allowed_ts, now) + interval
+                    limiter = getattr(self, "_rate_limiter", None)
+                    if limiter is not None:
+                        waited = limiter.acquire()
+                        if waited > 0:
+                            logger.debug("Embedding pacing waited %.3fs to respect rate limit", waited)
                     details = self._build_embed_payload(chunk, input_type, serving_mode)
-                    resp = self._client.embed_text(details)
+                    if controller is not None:
+                        resp = controller.call(lambda: self._thread_client().embed_text(details))
+                    else:
+                        resp = self._thread_client().embed_text(details)
                     vectors = self._extract_vectors(resp)
+                    planner.record(
+                        span,
+                        sum(token_counts[m] for m in members),
+                        sum(byte_sizes[m] for m in members),
+                        max_items=batch_size,
+                    )
                     if not vectors:
                         logger.warning("Embedding call returned no vectors for chunk span=%s", span)
                     for local_idx, vector in enumerate(vectors):
@@ -380,7 +513,7 @@ class OCIEmbeddingsAdapter(Embeddings):
                     status = getattr(exc, "status", getattr(exc, "status_code", None))
                     status_400 = ("400" in msg) or (status == 400)
                     if status_400 and idx_match:
-                        self.errors_token_limit += 1
+                        self._bump("errors_token_limit")
                         bad_idx = int(idx_match.group(1))
                         logger.warning(
                             "Token limit provider error on chunk item %d (attempt %d); applying strategy",
@@ -417,9 +550,20 @@ class OCIEmbeddingsAdapter(Embeddings):
                             delay,
                         )
                         time.sleep(delay)
-                        if attempt >= 2 and batch_size > _EMBED_MIN_BATCH:
+                        # The adaptive controller already cut concurrency and rate for everyone;
+                        # without it, shrink requests for the rest of this call instead.
+                        if controller is None and attempt >= 2 and batch_size > _EMBED_MIN_BATCH:
                             batch_size = max(_EMBED_MIN_BATCH, batch_size // 2)
                             logger.warning("Reducing embedding batch_size to %s due to repeated 429", batch_size)
+                            remaining = [m for queued in planned for m in queued]
+                            planned = deque(
+                                [remaining[k] for k in group]
+                                for group in planner.plan(
+                                    [token_counts[m] for m in remaining],
+                                    [byte_sizes[m] for m in remaining],
+                                    max_items=batch_size,
+                                )
+                            )
                         if attempt <= _EMBED_MAX_RETRIES:
                             continue
                         logger.error(
@@ -455,8 +599,6 @@ class OCIEmbeddingsAdapter(Embeddings):
                         cause=exc,
                     )
 
-            idx += span
-
         return flat_vecs, vec_map
 
     def _build_embed_payload(self, inputs: List[str], input_type: str | None, serving_mode):
@@ -508,9 +650,9 @@ class OCIEmbeddingsAdapter(Embeddings):
             parts = self._split_text_to_token_budget(text, self._max_input_tokens)
             if not parts:
                 # remove item
-                self.skipped_token_limit += 1
+                self._bump("skipped_token_limit")
                 return inputs[:bad_idx] + inputs[bad_idx + 1 :], idx_map[:bad_idx] + idx_map[bad_idx + 1 :]
-            self.token_limit_splits += len(parts)
+            self._bump("token_limit_splits", len(parts))
             new_inputs = inputs[:bad_idx] + parts + inputs[bad_idx + 1 :]
             new_map = idx_map[:bad_idx] + [idx_map[bad_idx]] * len(parts) + idx_map[bad_idx + 1 :]
             return new_inputs, new_map
@@ -518,7 +660,7 @@ class OCIEmbeddingsAdapter(Embeddings):
             trimmed = self._truncate_to_budget(text, self._max_input_tokens)
             return inputs[:bad_idx] + [trimmed] + inputs[bad_idx + 1 :], idx_map
         # skip
-        self.skipped_token_limit += 1
+        self._bump("skipped_token_limit")
         return inputs[:bad_idx] + inputs[bad_idx + 1 :], idx_map[:bad_idx] + idx_map[bad_idx + 1 :]
 
     def _reassemble_by_map(self, flat_vectors: List[List[float]], vec_map: List[int], original_len: int) -> List[List[float]]:
@@ -0,0 +1,92 @@
+# backend/providers/oci/query_cache.py
+"""Bounded in-process cache for query embeddings (LRU + TTL)."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+
+def normalize_query_text(text: str) -> str:
+    """Collapse whitespace so trivially different spellings of a question share a key."""
+    return " ".join((text or "").split())
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU cache with per-entry TTL.
+
+    Keys are ``(normalized_text, input_type, model_id)``. Entries older than ``ttl_seconds``
+    are treated as misses and dropped; once ``max_entries`` is reached the least recently
+    used entry is evicted. ``ttl_seconds <= 0`` disables expiry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._data: "OrderedDict[CacheKey, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(text: str, input_type: str, model_id: str) -> CacheKey:
+        return (normalize_query_text(text), input_type or "", model_id or "")
+
+    def get(self, key: CacheKey) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, vector = entry
+            if self.ttl_seconds > 0 and (self._clock() - stored_at) > self.ttl_seconds:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return list(vector)
+
+    def put(self, key: CacheKey, vector: List[float]) -> None:
+        if not vector:
+            return
+        with self._lock:
+            self._data[key] = (self._clock(), list(vector))
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+__all__ = ["QueryEmbeddingCache", "normalize_query_text"]
@@ -0,0 +1,64 @@
+# backend/providers/oci/rate_limiter.py
+"""Thread-safe token bucket shared by concurrent embedding workers."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict
+
+
+class TokenBucketRateLimiter:
+    """Token bucket refilled at ``rate_per_min`` tokens per minute.
+
+    ``acquire`` blocks until a token is available. The bucket starts full. It holds at most
+    ``burst`` tokens, so idle time never buys more than ``burst`` back-to-back calls. Workers
+    reserve their slot under the lock and sleep outside it, so waiting callers queue in
+    arrival order without serializing on the sleep.
+    """
+
+    def __init__(
+        self,
+        rate_per_min: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_min <= 0:
+            raise ValueError("rate_per_min must be positive")
+        self.rate_per_min = float(rate_per_min)
+        self.burst = max(1, int(burst))
+        self._interval = 60.0 / self.rate_per_min
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self.acquired = 0
+        self.waited_s = 0.0
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed; returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) / self._interval)
+            self._updated = now
+            self._tokens -= 1.0
+            # A negative balance is this caller's place in the queue.
+            wait = max(0.0, -self._tokens * self._interval)
+            self.acquired += 1
+            self.waited_s += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "rate_per_min": self.rate_per_min,
+                "acquired": self.acquired,
+                "waited_s": round(self.waited_s, 3),
+            }
+
+
+__all__ = ["TokenBucketRateLimiter"]
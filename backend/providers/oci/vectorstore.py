@@ -1,13 +1,19 @@
+import array
+import asyncio
 import json
 import logging
 import os
+import re
+import threading
+from contextlib import asynccontextmanager
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_community.vectorstores.oraclevs import OracleVS
 from langchain_community.vectorstores.utils import DistanceStrategy
 
-from backend.core.ports.vector_store import VectorStorePort
+from backend.core.ports.vector_store import MetadataFilter, VectorDocument, VectorStorePort
+from backend.core.services.answer_cache import current_index_epoch
 from backend.providers.oci.embeddings_adapter import EmbeddingError
 
 
@@ -23,10 +29,185 @@ def _lazy_import_oracledb():
 
 
 logger = logging.getLogger(__name__)
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_$#]*(\.[A-Za-z][A-Za-z0-9_$#]*)?$")
 DEBUG_RETRIEVAL_METADATA = (os.getenv("DEBUG_RETRIEVAL_METADATA") or "false").lower() in {"1", "true", "yes", "on"}
 
+# "native" issues one VECTOR_DISTANCE query per search; "langchain" keeps the OracleVS code path.
+SEARCH_MODE_NATIVE = "native"
+SEARCH_MODE_LANGCHAIN = "langchain"
+
+# The table an alias view reads from; filtered searches go there (see _filter_table).
+_PHYSICAL_TABLE_SQL = """
+    SELECT referenced_name
+      FROM user_dependencies
+     WHERE name = :name
+       AND type = 'VIEW'
+       AND referenced_type = 'TABLE'
+"""
+
+
+POOL_DEFAULTS: Dict[str, Any] = {
+    "min": 1,
+    "max": 8,
+    "increment": 1,
+    "stmtcachesize": 50,
+    # Seconds a pooled session may sit idle before checkout pings it; 0 pings on every checkout.
+    "ping_interval": 0,
+    "wait_timeout_ms": 5000,
+}
+
+_TIMED_POOL_CLASS = None
+_TIMED_ASYNC_POOL_CLASS = None
+
+
+class _AcquireWaits:
+    """Acquire counters read by ``pool_stats``; mixed into the timed pool classes."""
+
+    def _init_waits(self) -> None:
+        self._wait_lock = threading.Lock()
+        self.acquires = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record_wait(self, waited_ms: float) -> None:
+        with self._wait_lock:
+            self.acquires += 1
+            self.wait_ms_total += waited_ms
+            self.wait_ms_max = max(self.wait_ms_max, waited_ms)
+
+
+def _timed_pool_class():
+    """ConnectionPool subclass that records how long callers wait in ``acquire``.
+
+    A real subclass (not a wrapper) so LangChain's OracleVS still recognises it as a pool.
+    """
+    global _TIMED_POOL_CLASS
+    if _TIMED_POOL_CLASS is None:
+        oracledb = _lazy_import_oracledb()
+
+        class TimedConnectionPool(_AcquireWaits, oracledb.ConnectionPool):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._init_waits()
+
+            def acquire(self, *args, **kwargs):
+                started = perf_counter()
+                conn = super().acquire(*args, **kwargs)
+                self.record_wait((perf_counter() - started) * 1000.0)
+                return conn
+
+        _TIMED_POOL_CLASS = TimedConnectionPool
+    return _TIMED_POOL_CLASS
+
+
+def _timed_async_pool_class():
+    """AsyncConnectionPool subclass carrying wait counters; ``acquire_async`` records them."""
+    global _TIMED_ASYNC_POOL_CLASS
+    if _TIMED_ASYNC_POOL_CLASS is None:
+        oracledb = _lazy_import_oracledb()
+
+        class TimedAsyncConnectionPool(_AcquireWaits, oracledb.AsyncConnectionPool):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._init_waits()
+
+        _TIMED_ASYNC_POOL_CLASS = TimedAsyncConnectionPool
+    return _TIMED_ASYNC_POOL_CLASS
+
+
+def connect_params(dsn: str, user: str, password: str) -> Dict[str, Any]:
+    oracledb = _lazy_import_oracledb()
+    params: Dict[str, Any] = {
+        "user": user,
+        "password": password,
+        "dsn": dsn,
+    }
+    # Only connect AS SYSDBA/SYSOPER when explicitly requested or when using SYS.
+    auth_mode_env = (os.getenv("ORACLE_AUTH_MODE") or "").strip().upper()
+    if user and user.strip().upper() == "SYS":
+        params["mode"] = getattr(oracledb, "AUTH_MODE_SYSDBA")
+    elif auth_mode_env in {"SYSDBA", "SYSOPER"}:
+        params["mode"] = getattr(oracledb, f"AUTH_MODE_{auth_mode_env}")
+    return params
+
+
+def resolve_pool_config(pool_cfg: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    cfg = dict(POOL_DEFAULTS)
+    for key, value in (pool_cfg or {}).items():
+        if key in cfg and value not in (None, ""):
+            cfg[key] = int(value)
+    cfg["max"] = max(cfg["max"], cfg["min"], 1)
+    return cfg
+
+
+def _pool_params(dsn: str, user: str, password: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+    oracledb = _lazy_import_oracledb()
+    return dict(
+        min=cfg["min"],
+        max=cfg["max"],
+        increment=cfg["increment"],
+        stmtcachesize=cfg["stmtcachesize"],
+        ping_interval=cfg["ping_interval"],
+        getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+        wait_timeout=cfg["wait_timeout_ms"],
+        **connect_params(dsn, user, password),
+    )
+
+
+def create_vector_pool(dsn: str, user: str, password: str, pool_cfg: Optional[Dict[str, Any]] = None):
+    """Create the session pool used by the sync vector read path (alias checks, /chat/stream)."""
+    oracledb = _lazy_import_oracledb()
+    cfg = resolve_pool_config(pool_cfg)
+    pool = oracledb.create_pool(pool_class=_timed_pool_class(), **_pool_params(dsn, user, password, cfg))
+    logger.info(
+        "Oracle vector pool created min=%d max=%d increment=%d stmtcachesize=%d ping_interval=%ds",
+        cfg["min"],
+        cfg["max"],
+        cfg["increment"],
+        cfg["stmtcachesize"],
+        cfg["ping_interval"],
+    )
+    return pool
+
+
+def create_vector_pool_async(dsn: str, user: str, password: str, pool_cfg: Optional[Dict[str, Any]] = None):
+    """Async twin of ``create_vector_pool`` (same sizing, wait timeout and stats) for /chat."""
+    oracledb = _lazy_import_oracledb()
+    cfg = resolve_pool_config(pool_cfg)
+    pool = oracledb.create_pool_async(pool_class=_timed_async_pool_class(), **_pool_params(dsn, user, password, cfg))
+    logger.info("Oracle async vector pool created min=%d max=%d", cfg["min"], cfg["max"])
+    return pool
+
+
+@asynccontextmanager
+async def acquire_async(pool: Any):
+    """``async with pool.acquire()`` that records the wait on pools from ``create_vector_pool_async``."""
+    started = perf_counter()
+    async with pool.acquire() as conn:
+        record = getattr(pool, "record_wait", None)
+        if callable(record):
+            record((perf_counter() - started) * 1000.0)
+        yield conn
+
+
+def pool_stats(pool: Any) -> Dict[str, Any]:
+    acquires = int(getattr(pool, "acquires", 0) or 0)
+    wait_total = float(getattr(pool, "wait_ms_total", 0.0) or 0.0)
+    return {
+        "open": int(getattr(pool, "opened", 0) or 0),
+        "busy": int(getattr(pool, "busy", 0) or 0),
+        "min": int(getattr(pool, "min", 0) or 0),
+        "max": int(getattr(pool, "max", 0) or 0),
+        "acquires": acquires,
+        "wait_ms_avg": round(wait_total / acquires, 3) if acquires else 0.0,
+        "wait_ms_max": round(float(getattr(pool, "wait_ms_max", 0.0) or 0.0), 3),
+    }
+
 
 class OracleVSStore(VectorStorePort):
+    supports_embeddings = True
+    supports_filters = True
+
     def __init__(
         self,
         dsn: str,
@@ -35,35 +216,281 @@ class OracleVSStore(VectorStorePort):
         table: str,
         embeddings,
         distance: str = "dot_product",
+        pool: Any = None,
+        pool_config: Optional[Dict[str, Any]] = None,
+        search_mode: str = SEARCH_MODE_NATIVE,
+        approximate: bool = True,
+        target_accuracy: Optional[int] = None,
     ):
-        oracledb = _lazy_import_oracledb()
-        params = {
-            "user": user,
-            "password": password,
-            "dsn": dsn,
-        }
-        # Only connect AS SYSDBA/SYSOPER when explicitly requested or when using SYS.
-        auth_mode_env = (os.getenv("ORACLE_AUTH_MODE") or "").strip().upper()
-        if user and user.strip().upper() == "SYS":
-            params["mode"] = getattr(oracledb, "AUTH_MODE_SYSDBA")
-        elif auth_mode_env in {"SYSDBA", "SYSOPER"}:
-            params["mode"] = getattr(oracledb, f"AUTH_MODE_{auth_mode_env}")
-
-        self.conn = oracledb.connect(**params)
+        if search_mode not in (SEARCH_MODE_NATIVE, SEARCH_MODE_LANGCHAIN):
+            raise ValueError(f"Unsupported oraclevs search_mode: {search_mode!r}")
+        self._search_mode = search_mode
+        # Approximate top-k uses the HNSW/IVF vector index when one exists (exact scan otherwise).
+        self._approximate = bool(approximate)
+        self._target_accuracy = int(target_accuracy) if target_accuracy else None
+        self._pool_config = resolve_pool_config(pool_config)
+        self.pool = pool if pool is not None else create_vector_pool(dsn, user, password, self._pool_config)
+        self._credentials = (dsn, user, password)
+        self._async_pool = None
+        self._async_pool_lock = asyncio.Lock()
+        # view/table name -> physical table, valid for one index epoch (aliases move between epochs)
+        self._physical_tables: Dict[str, str] = {}
+        self._physical_epoch: Optional[str] = None
         strategy = (
             DistanceStrategy.DOT_PRODUCT
             if distance == "dot_product"
             else DistanceStrategy.COSINE
         )
         self._distance_label = distance
+        self._embeddings = embeddings
+        self.table_name = table
+        # OracleVS acquires a pooled session per call when given a ConnectionPool.
         self.vs = OracleVS(
             embedding_function=embeddings,
-            client=self.conn,
+            client=self.pool,
             table_name=table,
             distance_strategy=strategy,
         )
 
-    def similarity_search_with_score(self, query: str, k: int, target_view: Optional[str] = None) -> List[Tuple[Any, float]]:
+    def pool_stats(self) -> Dict[str, Any]:
+        """Sync pool (alias checks, /chat/stream) and async pool (/chat), created on first use."""
+        return {
+            "sync": pool_stats(self.pool),
+            "async": pool_stats(self._async_pool) if self._async_pool is not None else None,
+        }
+
+    def resolve_physical_index(self, name: str) -> Optional[str]:
+        if not name:
+            return None
+        with self.pool.acquire() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_PHYSICAL_TABLE_SQL, {"name": name.upper()})
+                rows = cur.fetchall()
+        if len(rows) == 1:
+            return str(rows[0][0])
+        return name
+
+    def _cached_physical(self, name: str) -> Optional[str]:
+        epoch = current_index_epoch()
+        if epoch != self._physical_epoch:
+            self._physical_tables = {}
+            self._physical_epoch = epoch
+        return self._physical_tables.get(name.upper())
+
+    def _filter_table(self, table: str, filters: Optional[MetadataFilter]) -> str:
+        """Table a search with ``filters`` should read: the physical table behind an alias view.
+
+        The alias view projects ``JSON_SERIALIZE(METADATA)``, so JSON_VALUE predicates against it
+        cannot use the metadata indexes (ensure_metadata_indexes); the table's raw JSON can.
+        """
+        if filters is None or filters.is_empty():
+            return table
+        physical = self._cached_physical(table)
+        if physical is None:
+            try:
+                physical = self.resolve_physical_index(table) or table
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Filtered search stays on %s; physical table lookup failed: %s", table, exc)
+                return table
+            self._physical_tables[table.upper()] = physical
+        return physical
+
+    async def aresolve_physical_index(self, name: str) -> Optional[str]:
+        """``resolve_physical_index`` on the async pool, so /chat never touches the sync pool."""
+        if not name:
+            return None
+        pool = await self._get_async_pool()
+        async with acquire_async(pool) as conn:
+            with conn.cursor() as cur:
+                await cur.execute(_PHYSICAL_TABLE_SQL, {"name": name.upper()})
+                rows = await cur.fetchall()
+        if len(rows) == 1:
+            return str(rows[0][0])
+        return name
+
+    async def _afilter_table(self, table: str, filters: Optional[MetadataFilter]) -> str:
+        """Async ``_filter_table``: the lookup runs on the async pool."""
+        if filters is None or filters.is_empty():
+            return table
+        physical = self._cached_physical(table)
+        if physical is None:
+            try:
+                physical = await self.aresolve_physical_index(table) or table
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Filtered search stays on %s; physical table lookup failed: %s", table, exc)
+                return table
+            self._physical_tables[table.upper()] = physical
+        return physical
+
+    def _search_returning_embeddings(self, query: str, k: int) -> List[Tuple[Any, float]]:
+        """Search via OracleVS but keep each row's EMBEDDING for embedding-space MMR."""
+        query_vec = self._embeddings.embed_query(query)
+        rows = self.vs.similarity_search_by_vector_returning_embeddings(query_vec, k=k)
+        results: List[Tuple[Any, float]] = []
+        for doc, score, embedding in rows:
+            results.append(
+                (
+                    VectorDocument(
+                        page_content=getattr(doc, "page_content", "") or "",
+                        metadata=getattr(doc, "metadata", None) or {},
+                        id=getattr(doc, "id", None),
+                        embedding=embedding,
+                    ),
+                    score,
+                )
+            )
+        return results
+
+    def _search_sql(
+        self,
+        table: Optional[str],
+        with_embeddings: bool,
+        filters: Optional[MetadataFilter] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return the search statement and its filter binds (``:qv``/``:k`` are bound by the caller)."""
+        # The view name is interpolated (identifiers cannot be bound), so validate it first.
+        if not _IDENTIFIER_RE.match(table or ""):
+            raise ValueError(f"Invalid vector table/view name: {table!r}")
+        metric = "DOT" if self._distance_label == "dot_product" else "COSINE"
+        embedding_col = ", EMBEDDING" if with_embeddings else ""
+        where, binds = self._filter_predicates(filters)
+        if self._approximate:
+            fetch = "FETCH APPROX FIRST :k ROWS ONLY"
+            if self._target_accuracy:
+                fetch += f" WITH TARGET ACCURACY {self._target_accuracy}"
+        else:
+            fetch = "FETCH EXACT FIRST :k ROWS ONLY"
+        sql = (
+            f"SELECT ID, TEXT, METADATA{embedding_col}, "
+            f"VECTOR_DISTANCE(EMBEDDING, :qv, {metric}) AS DISTANCE "
+            f"FROM {table}{where} ORDER BY DISTANCE {fetch}"
+        )
+        return sql, binds
+
+    @staticmethod
+    def _filter_predicates(filters: Optional[MetadataFilter]) -> Tuple[str, Dict[str, Any]]:
+        """Translate a MetadataFilter into JSON_VALUE predicates with bind variables."""
+        if filters is None or filters.is_empty():
+            return "", {}
+        clauses: List[str] = []
+        binds: Dict[str, Any] = {}
+
+        def _in_list(prefix: str, values, lower: bool = False) -> str:
+            names = []
+            for idx, value in enumerate(values):
+                name = f"{prefix}{idx}"
+                binds[name] = str(value).lower() if lower else str(value)
+                names.append(f":{name}")
+            return ", ".join(names)
+
+        # Missing keys must survive NOT IN, hence the NVL sentinel.
+        if filters.exclude_chunk_types:
+            clauses.append(
+                "NVL(LOWER(JSON_VALUE(METADATA, '$.chunk_type')), '#') "
+                f"NOT IN ({_in_list('xct', filters.exclude_chunk_types, lower=True)})"
+            )
+        if filters.exclude_block_types:
+            clauses.append(
+                "NVL(JSON_VALUE(METADATA, '$.block_type'), '#') "
+                f"NOT IN ({_in_list('xbt', filters.exclude_block_types)})"
+            )
+        if filters.doc_ids:
+            clauses.append(f"JSON_VALUE(METADATA, '$.doc_id') IN ({_in_list('did', filters.doc_ids)})")
+        if filters.exclude_doc_ids:
+            clauses.append(
+                "NVL(JSON_VALUE(METADATA, '$.doc_id'), '#') "
+                f"NOT IN ({_in_list('xdid', filters.exclude_doc_ids)})"
+            )
+        if filters.content_types:
+            clauses.append(
+                f"JSON_VALUE(METADATA, '$.content_type') IN ({_in_list('cty', filters.content_types)})"
+            )
+        if filters.langs:
+            clauses.append(
+                f"LOWER(JSON_VALUE(METADATA, '$.lang')) IN ({_in_list('lang', filters.langs, lower=True)})"
+            )
+        return " WHERE " + " AND ".join(clauses), binds
+
+    @staticmethod
+    def _rows_to_results(rows, with_embeddings: bool) -> List[Tuple[Any, float]]:
+        """Turn ``(ID, TEXT, METADATA[, EMBEDDING], DISTANCE)`` rows into typed results.
+
+        METADATA arrives as a string (CLOBs are fetched inline), so it is parsed exactly once here.
+        """
+        results: List[Tuple[Any, float]] = []
+        for row in rows:
+            row_id, text, metadata = row[0], row[1], row[2]
+            if isinstance(metadata, str):
+                try:
+                    metadata = json.loads(metadata)
+                except ValueError:
+                    metadata = {}
+            results.append(
+                (
+                    VectorDocument(
+                        page_content=text or "",
+                        metadata=metadata if isinstance(metadata, dict) else {},
+                        id=row_id.hex() if isinstance(row_id, (bytes, bytearray)) else row_id,
+                        embedding=row[3] if with_embeddings else None,
+                    ),
+                    float(row[-1]),
+                )
+            )
+        return results
+
+    def _native_search(
+        self,
+        query_vec: List[float],
+        k: int,
+        table: str,
+        with_embeddings: bool,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[Tuple[Any, float]]:
+        sql, binds = self._search_sql(table, with_embeddings, filters)
+        with self.pool.acquire() as conn:
+            with conn.cursor() as cur:
+                # Cursor-scoped so pooled sessions handed to OracleVS keep their LOB behaviour.
+                cur.outputtypehandler = self._clob_as_string
+                # Fetch all k rows (plus the end-of-fetch marker) in a single round trip.
+                cur.arraysize = max(int(k), 1)
+                cur.prefetchrows = cur.arraysize + 1
+                cur.execute(sql, {"qv": array.array("f", query_vec), "k": int(k), **binds})
+                rows = cur.fetchall()
+        return self._rows_to_results(rows, with_embeddings)
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int,
+        target_view: Optional[str] = None,
+        with_embeddings: bool = False,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[Tuple[Any, float]]:
+        if self._search_mode == SEARCH_MODE_LANGCHAIN:
+            results = self._langchain_search(query, k, target_view, with_embeddings)
+            if filters is None:
+                return results
+            return [(doc, score) for doc, score in results if filters.matches(doc.metadata or {})]
+        start = perf_counter()
+        try:
+            query_vec = self._embeddings.embed_query(query)
+        except EmbeddingError as exc:
+            logger.warning("Vector search skipped because embeddings are unavailable: %s", exc)
+            return []
+        if not query_vec:
+            logger.error("Vector search skipped: query embedding has zero dimensions")
+            return []
+        table = self._filter_table(target_view or self.table_name, filters)
+        raw_results = self._native_search(query_vec, k, table, with_embeddings, filters)
+        return self._enrich_results(query, k, raw_results, start, presorted=True)
+
+    def _langchain_search(
+        self,
+        query: str,
+        k: int,
+        target_view: Optional[str],
+        with_embeddings: bool,
+    ) -> List[Tuple[Any, float]]:
         start = perf_counter()
         original_table = getattr(self.vs, "table_name", None)
         if target_view:
@@ -72,7 +499,10 @@ class OracleVSStore(VectorStorePort):
             except Exception:
                 pass
         try:
-            raw_results = self.vs.similarity_search_with_score(query, k=k)
+            if with_embeddings:
+                raw_results = self._search_returning_embeddings(query, k)
+            else:
+                raw_results = self.vs.similarity_search_with_score(query, k=k)
         except EmbeddingError as exc:
             logger.warning("Vector search skipped because embeddings are unavailable: %s", exc)
             return []
@@ -92,6 +522,16 @@ class OracleVSStore(VectorStorePort):
                 except Exception:
                     pass
 
+        return self._enrich_results(query, k, raw_results, start)
+
+    def _enrich_results(
+        self,
+        query: str,
+        k: int,
+        raw_results,
+        start: float,
+        presorted: bool = False,
+    ) -> List[Tuple[Any, float]]:
         # Oracle VECTOR_DISTANCE returns a distance for both DOT and COSINE
         # (smaller = more similar). Keep ascending order for all metrics.
         order = "ASC"
@@ -149,8 +589,9 @@ class OracleVSStore(VectorStorePort):
             doc.metadata = metadata
             enriched.append((doc, raw_score))
 
-        # Always sort by ascending distance (lower is better)
-        enriched.sort(key=lambda item: item[1])
+        # Always sort by ascending distance (lower is better); native SQL already returns that order.
+        if not presorted:
+            enriched.sort(key=lambda item: item[1])
 
         elapsed_ms = (perf_counter() - start) * 1000.0
         preview = query if len(query) <= 120 else f"{query[:117]}..."
@@ -172,3 +613,57 @@ class OracleVSStore(VectorStorePort):
             preview,
         )
         return enriched
+
+    async def _get_async_pool(self):
+        if self._async_pool is None:
+            async with self._async_pool_lock:
+                if self._async_pool is None:
+                    self._async_pool = create_vector_pool_async(*self._credentials, self._pool_config)
+        return self._async_pool
+
+    @staticmethod
+    def _clob_as_string(cursor, metadata):
+        # Per-cursor equivalent of fetch_lobs=False: CLOBs arrive inline, no LOB locator round trips.
+        oracledb = _lazy_import_oracledb()
+        if metadata.type_code is oracledb.DB_TYPE_CLOB:
+            return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+        return None
+
+    async def asimilarity_search_with_score(
+        self,
+        query: str,
+        k: int,
+        target_view: Optional[str] = None,
+        with_embeddings: bool = False,
+        filters: Optional[MetadataFilter] = None,
+    ) -> List[Tuple[Any, float]]:
+        """Async search over python-oracledb's async (thin) driver; no worker thread is held."""
+        start = perf_counter()
+        table = await self._afilter_table(target_view or self.table_name, filters)
+        sql, binds = self._search_sql(table, with_embeddings, filters)
+        try:
+            embed_async = getattr(self._embeddings, "aembed_query", None)
+            if callable(embed_async):
+                query_vec = await embed_async(query)
+            else:
+                query_vec = await asyncio.to_thread(self._embeddings.embed_query, query)
+        except EmbeddingError as exc:
+            logger.warning("Vector search skipped because embeddings are unavailable: %s", exc)
+            return []
+        if not query_vec:
+            logger.error("Vector search skipped: query embedding has zero dimensions")
+            return []
+        pool = await self._get_async_pool()
+        async with acquire_async(pool) as conn:
+            with conn.cursor() as cur:
+                cur.outputtypehandler = self._clob_as_string
+                cur.arraysize = max(int(k), 1)
+                cur.prefetchrows = cur.arraysize + 1
+                await cur.execute(sql, {"qv": array.array("f", query_vec), "k": int(k), **binds})
+                rows = await cur.fetchall()
+        return self._enrich_results(query, k, self._rows_to_results(rows, with_embeddings), start, presorted=True)
+
+    async def aclose(self) -> None:
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
@@ -0,0 +1,139 @@
+"""Commit checkpoints for resumable embed jobs.
+
+Every chunk the upserter writes is recorded in ``RAG_EMBED_CHECKPOINTS`` inside the same
+transaction as the row itself, so the checkpoint never claims more (or less) than Oracle
+actually committed. ``--resume <job_id>`` reloads the recorded chunk ids and skips them.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = "RAG_EMBED_CHECKPOINTS"
+
+
+def ensure_checkpoint_table(conn: Any, table: str = CHECKPOINT_TABLE) -> bool:
+    """Create the checkpoint table if missing; returns True when created."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :1", (table.upper(),))
+        if cur.fetchone()[0] > 0:
+            return False
+        cur.execute(
+            f"CREATE TABLE {table} (\n"
+            f"  JOB_ID VARCHAR2(128) NOT NULL,\n"
+            f"  CHUNK_ID VARCHAR2(512) NOT NULL,\n"
+            f"  MANIFEST_FP VARCHAR2(64) NOT NULL,\n"
+            f"  INDEX_NAME VARCHAR2(128),\n"
+            f"  BATCH_NO NUMBER,\n"
+            f"  COMMITTED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,\n"
+            f"  CONSTRAINT {table}_PK PRIMARY KEY (JOB_ID, CHUNK_ID)\n"
+            f")"
+        )
+    logger.info("Created embed checkpoint table %s", table)
+    return True
+
+
+def purge_expired_checkpoints(
+    conn: Any, retention_days: float, keep_job_id: Optional[str] = None, table: str = CHECKPOINT_TABLE
+) -> int:
+    """Delete checkpoints older than ``retention_days``; returns the number of rows removed.
+
+    Clean runs clear their own rows, but jobs that fail and are never resumed (or crash before
+    clearing) would otherwise leave theirs behind for good. ``keep_job_id`` is spared so a late
+    ``--resume`` still finds what it committed.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            f"DELETE FROM {table} WHERE COMMITTED_AT < SYSTIMESTAMP - NUMTODSINTERVAL(:1, 'DAY') "
+            f"AND JOB_ID <> :2",
+            (retention_days, keep_job_id or ""),
+        )
+        removed = int(cur.rowcount or 0)
+    conn.commit()
+    if removed:
+        logger.info("Purged %d embed checkpoints older than %g days from %s", removed, retention_days, table)
+    return removed
+
+
+def manifest_fingerprint(manifest_path: str, profile_name: str, index_name: str) -> str:
+    """sha256 of the manifest bytes plus the profile and target table."""
+    digest = hashlib.sha256(Path(manifest_path).read_bytes())
+    digest.update(f"\x00{profile_name}\x00{index_name}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class JobCheckpoint:
+    """Committed chunk ids of one embed job.
+
+    ``batch_no`` is set by the job before each write and stored with the chunk ids, so a
+    checkpoint shows how far the job got as well as what it wrote.
+    """
+
+    def __init__(self, conn: Any, job_id: str, fingerprint: str, index_name: str, table: str = CHECKPOINT_TABLE) -> None:
+        self._conn = conn
+        self.job_id = job_id
+        self.fingerprint = fingerprint
+        self.index_name = index_name
+        self.table = table
+        self.batch_no = 0
+        self.recorded = 0
+
+    def load(self) -> Set[str]:
+        """Chunk ids committed by an earlier run of this job.
+
+        Checkpoints written for a different manifest fingerprint cannot be trusted (chunk ids
+        would not line up), so they are dropped and the job starts over.
+        """
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE JOB_ID = :1 AND MANIFEST_FP <> :2",
+                (self.job_id, self.fingerprint),
+            )
+            stale = cur.fetchone()[0]
+            if stale:
+                logger.warning(
+                    "Job %s: manifest or profile changed since its checkpoints were written; "
+                    "discarding %d checkpointed chunks and starting over",
+                    self.job_id,
+                    stale,
+                )
+                cur.execute(f"DELETE FROM {self.table} WHERE JOB_ID = :1", (self.job_id,))
+                self._conn.commit()
+                return set()
+            cur.execute(f"SELECT CHUNK_ID FROM {self.table} WHERE JOB_ID = :1", (self.job_id,))
+            return {row[0] for row in cur.fetchall()}
+
+    def record(self, conn: Any, chunk_ids: Iterable[str]) -> None:
+        """Record ``chunk_ids`` on ``conn`` without committing (the caller's commit covers them)."""
+        rows = [(self.job_id, cid, self.fingerprint, self.index_name, self.batch_no) for cid in chunk_ids if cid]
+        if not rows:
+            return
+        with conn.cursor() as cur:
+            cur.executemany(
+                f"INSERT INTO {self.table} (JOB_ID, CHUNK_ID, MANIFEST_FP, INDEX_NAME, BATCH_NO) "
+                f"VALUES (:1, :2, :3, :4, :5)",
+                rows,
+                batcherrors=True,
+            )
+            # A chunk id seen twice (e.g. two files with the same stem) only needs one row.
+            duplicates = len(cur.getbatcherrors())
+        self.recorded += len(rows) - duplicates
+
+    def clear(self) -> None:
+        """Drop this job's checkpoints once it has finished; they are only needed to resume."""
+        with self._conn.cursor() as cur:
+            cur.execute(f"DELETE FROM {self.table} WHERE JOB_ID = :1", (self.job_id,))
+        self._conn.commit()
+
+
+__all__ = [
+    "CHECKPOINT_TABLE",
+    "JobCheckpoint",
+    "ensure_checkpoint_table",
+    "manifest_fingerprint",
+    "purge_expired_checkpoints",
+]
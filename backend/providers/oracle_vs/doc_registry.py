@@ -0,0 +1,163 @@
+"""Per-document registry backing incremental embed jobs.
+
+One row per (index table, doc_id) records the source file's sha256, the fingerprint of the
+loader/chunker settings that produced its chunks, and the chunk ids written. An incremental
+job compares the manifest against it to skip unchanged documents, rewrite changed ones and
+purge documents that left the manifest.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_TABLE = "RAG_DOC_REGISTRY"
+# Oracle's limit on expressions in an IN list.
+_MAX_IN_LIST = 1000
+_HASH_BLOCK = 1024 * 1024
+
+
+@dataclass
+class DocumentRecord:
+    doc_id: str
+    source: str
+    file_sha256: str
+    config_fingerprint: str
+    chunk_ids: List[str] = field(default_factory=list)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def config_fingerprint(settings: Dict[str, Any]) -> str:
+    """Stable sha256 of everything (besides the file bytes) that shapes a document's chunks."""
+    payload = json.dumps(settings, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def ensure_registry_table(conn: Any, table: str = REGISTRY_TABLE) -> bool:
+    """Create the registry table if missing; returns True when created."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :1", (table.upper(),))
+        if cur.fetchone()[0] > 0:
+            return False
+        cur.execute(
+            f"CREATE TABLE {table} (\n"
+            f"  INDEX_NAME VARCHAR2(128) NOT NULL,\n"
+            f"  DOC_ID VARCHAR2(512) NOT NULL,\n"
+            f"  SOURCE VARCHAR2(2000),\n"
+            f"  FILE_SHA256 VARCHAR2(64) NOT NULL,\n"
+            f"  CONFIG_FINGERPRINT VARCHAR2(64) NOT NULL,\n"
+            f"  CHUNK_IDS CLOB,\n"
+            f"  UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,\n"
+            f"  CONSTRAINT {table}_PK PRIMARY KEY (INDEX_NAME, DOC_ID)\n"
+            f")"
+        )
+    logger.info("Created document registry table %s", table)
+    return True
+
+
+class DocumentRegistry:
+    """Registry rows for one physical index table.
+
+    Write methods take a cursor and never commit, so callers can delete old chunks, insert new
+    ones and update the registry row in a single transaction.
+    """
+
+    def __init__(self, conn: Any, index_name: str, table: str = REGISTRY_TABLE) -> None:
+        self._conn = conn
+        self.index_name = index_name.upper()
+        self.table = table
+
+    def load(self) -> Dict[str, DocumentRecord]:
+        records: Dict[str, DocumentRecord] = {}
+        with self._conn.cursor() as cur:
+            cur.execute(
+                f"SELECT DOC_ID, SOURCE, FILE_SHA256, CONFIG_FINGERPRINT, CHUNK_IDS "
+                f"FROM {self.table} WHERE INDEX_NAME = :1",
+                (self.index_name,),
+            )
+            for doc_id, source, sha, fingerprint, chunk_ids in cur:
+                raw = chunk_ids.read() if hasattr(chunk_ids, "read") else chunk_ids
+                records[doc_id] = DocumentRecord(
+                    doc_id=doc_id,
+                    source=source or "",
+                    file_sha256=sha,
+                    config_fingerprint=fingerprint,
+                    chunk_ids=list(json.loads(raw)) if raw else [],
+                )
+        return records
+
+    def save(self, cur: Any, record: DocumentRecord) -> None:
+        cur.execute(
+            f"""
+            MERGE INTO {self.table} r
+            USING (SELECT :idx AS index_name, :doc_id AS doc_id FROM dual) s
+               ON (r.INDEX_NAME = s.index_name AND r.DOC_ID = s.doc_id)
+             WHEN MATCHED THEN UPDATE SET
+                  SOURCE = :source, FILE_SHA256 = :sha, CONFIG_FINGERPRINT = :fp,
+                  CHUNK_IDS = :chunk_ids, UPDATED_AT = CURRENT_TIMESTAMP
+             WHEN NOT MATCHED THEN INSERT
+                  (INDEX_NAME, DOC_ID, SOURCE, FILE_SHA256, CONFIG_FINGERPRINT, CHUNK_IDS)
+                  VALUES (:idx, :doc_id, :source, :sha, :fp, :chunk_ids)
+            """,
+            {
+                "idx": self.index_name,
+                "doc_id": record.doc_id,
+                "source": record.source[:2000],
+                "sha": record.file_sha256,
+                "fp": record.config_fingerprint,
+                "chunk_ids": json.dumps(record.chunk_ids),
+            },
+        )
+
+    def forget(self, cur: Any, doc_id: str) -> None:
+        cur.execute(
+            f"DELETE FROM {self.table} WHERE INDEX_NAME = :1 AND DOC_ID = :2",
+            (self.index_name, doc_id),
+        )
+
+    def delete_chunks(self, cur: Any, doc_id: str, chunk_ids: Optional[Iterable[str]] = None) -> int:
+        """Delete a document's rows from the index table; returns the number of rows deleted.
+
+        With ``chunk_ids`` only those chunks go (the ids recorded by the previous run). Without
+        them every row whose metadata carries ``doc_id`` is removed, which adopts documents
+        written before the registry existed.
+        """
+        deleted = 0
+        doc_pred = "JSON_VALUE(METADATA, '$.doc_id') = :doc_id"
+        if chunk_ids is None:
+            cur.execute(f"DELETE FROM {self.index_name} WHERE {doc_pred}", {"doc_id": doc_id})
+            return cur.rowcount or 0
+        ids = list(chunk_ids)
+        for start in range(0, len(ids), _MAX_IN_LIST):
+            chunk = ids[start : start + _MAX_IN_LIST]
+            binds: Dict[str, Any] = {"doc_id": doc_id}
+            binds.update({f"c{i}": cid for i, cid in enumerate(chunk)})
+            placeholders = ", ".join(f":c{i}" for i in range(len(chunk)))
+            cur.execute(
+                f"DELETE FROM {self.index_name} WHERE {doc_pred} "
+                f"AND JSON_VALUE(METADATA, '$.chunk_id') IN ({placeholders})",
+                binds,
+            )
+            deleted += cur.rowcount or 0
+        return deleted
+
+
+__all__ = [
+    "DocumentRecord",
+    "DocumentRegistry",
+    "REGISTRY_TABLE",
+    "config_fingerprint",
+    "ensure_registry_table",
+    "file_sha256",
+]
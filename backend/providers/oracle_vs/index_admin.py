@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+from backend.core.services.answer_cache import bump_index_epoch
 
 
 def _lazy_import_oracledb():
@@ -17,7 +19,39 @@ def _lazy_import_oracledb():
     return oracledb
 
 
-def ensure_index_table(conn: Any, index_name: str, distance_metric: str, dim: Optional[int] = None) -> None:
+def table_exists(conn: Any, table_name: str) -> bool:
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :1", (table_name.upper(),))
+        return cur.fetchone()[0] > 0
+
+
+def ensure_hash_unique_index(conn: Any, index_name: str) -> bool:
+    """Create ``<TABLE>_HASH_UX`` (unique on HASH_NORM) if missing; returns True when created.
+
+    NULL hashes (jobs without dedupe) are not indexed, so they never collide. Creation fails if
+    the table already holds duplicate hashes; that is logged and left for the operator.
+    """
+    name = f"{index_name}_HASH_UX".upper()[:128]
+    with conn.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM user_indexes WHERE index_name = :1", (name,))
+        if cur.fetchone()[0] > 0:
+            return False
+        try:
+            cur.execute(f"CREATE UNIQUE INDEX {name} ON {index_name} (HASH_NORM)")
+        except Exception as exc:  # noqa: BLE001 - typically ORA-01452 (duplicate keys)
+            logger.warning("Could not create unique HASH_NORM index %s on %s: %s", name, index_name, exc)
+            return False
+    logger.info("Created unique HASH_NORM index %s on %s", name, index_name)
+    return True
+
+
+def ensure_index_table(
+    conn: Any,
+    index_name: str,
+    distance_metric: str,
+    dim: Optional[int] = None,
+    unique_hash: bool = False,
+) -> None:
     """Ensure a legacy‑compatible physical table exists with VECTOR embeddings.
 
     The table is created with the following shape:
@@ -31,7 +65,8 @@ def ensure_index_table(conn: Any, index_name: str, distance_metric: str, dim: Op
         CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         UPDATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 
-    If the table already exists, validates that EMBEDDING is VECTOR(dim).
+    If the table already exists, validates that EMBEDDING is VECTOR(dim). With ``unique_hash``
+    a unique index on HASH_NORM is ensured as well, so the database enforces dedupe.
     """
 
     if dim is None or int(dim) <= 0:
@@ -113,6 +148,159 @@ def ensure_index_table(conn: Any, index_name: str, distance_metric: str, dim: Op
                     distance_metric,
                 )
 
+    if unique_hash:
+        ensure_hash_unique_index(conn, index_name)
+
+
+VECTOR_INDEX_DEFAULTS: Dict[str, Any] = {
+    "type": "hnsw",
+    "target_accuracy": 95,
+    # HNSW graph shape
+    "neighbors": 32,
+    "efconstruction": 200,
+    # IVF partition count
+    "neighbor_partitions": 100,
+    "parallel": None,
+}
+VECTOR_INDEX_TYPES = ("hnsw", "ivf")
+VECTOR_INDEX_ACTIONS = ("ensure", "rebuild", "drop")
+_METRIC_SQL = {"dot_product": "DOT", "dot": "DOT", "cosine": "COSINE", "euclidean": "EUCLIDEAN"}
+
+
+def resolve_vector_index_config(
+    embeddings_cfg: Dict[str, Any],
+    profile_name: Optional[str] = None,
+    domain_key: Optional[str] = None,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Merge ``vector_index`` settings: defaults < embeddings < profile < domain < overrides."""
+    cfg = dict(VECTOR_INDEX_DEFAULTS)
+    layers = [embeddings_cfg.get("vector_index")]
+    profiles = embeddings_cfg.get("profiles") or {}
+    if profile_name and isinstance(profiles.get(profile_name), dict):
+        layers.append(profiles[profile_name].get("vector_index"))
+    domains = embeddings_cfg.get("domains") or {}
+    if domain_key and isinstance(domains.get(domain_key), dict):
+        layers.append(domains[domain_key].get("vector_index"))
+    layers.append(overrides)
+    for layer in layers:
+        if not isinstance(layer, dict):
+            continue
+        for key, value in layer.items():
+            if key in cfg and value is not None:
+                cfg[key] = value
+    cfg["type"] = str(cfg["type"]).lower()
+    if cfg["type"] not in VECTOR_INDEX_TYPES:
+        raise ValueError(f"vector_index.type must be one of {VECTOR_INDEX_TYPES}, got {cfg['type']!r}")
+    accuracy = int(cfg["target_accuracy"])
+    if not 0 < accuracy <= 100:
+        raise ValueError(f"vector_index.target_accuracy must be in (0, 100], got {accuracy}")
+    cfg["target_accuracy"] = accuracy
+    return cfg
+
+
+def vector_index_name(index_name: str) -> str:
+    return f"{index_name}_VIDX".upper()
+
+
+def build_vector_index_ddl(index_name: str, distance_metric: str, cfg: Dict[str, Any]) -> str:
+    """CREATE VECTOR INDEX statement for an in-memory neighbor graph (HNSW) or neighbor partitions (IVF)."""
+    metric = _METRIC_SQL.get((distance_metric or "").lower())
+    if metric is None:
+        raise ValueError(f"Unsupported distance metric for vector index: {distance_metric!r}")
+    if cfg["type"] == "hnsw":
+        organization = "INMEMORY NEIGHBOR GRAPH"
+        params = f"TYPE HNSW, NEIGHBORS {int(cfg['neighbors'])}, EFCONSTRUCTION {int(cfg['efconstruction'])}"
+    else:
+        organization = "NEIGHBOR PARTITIONS"
+        params = f"TYPE IVF, NEIGHBOR PARTITIONS {int(cfg['neighbor_partitions'])}"
+    ddl = (
+        f"CREATE VECTOR INDEX {vector_index_name(index_name)} ON {index_name} (EMBEDDING) "
+        f"ORGANIZATION {organization} DISTANCE {metric} "
+        f"WITH TARGET ACCURACY {int(cfg['target_accuracy'])} PARAMETERS ({params})"
+    )
+    if cfg.get("parallel"):
+        ddl += f" PARALLEL {int(cfg['parallel'])}"
+    return ddl
+
+
+def _existing_vector_index(cur: Any, index_name: str) -> Optional[str]:
+    cur.execute(
+        "SELECT index_name FROM user_indexes WHERE table_name = :1 AND index_type = 'VECTOR'",
+        (index_name.upper(),),
+    )
+    row = cur.fetchone()
+    return str(row[0]) if row else None
+
+
+def ensure_vector_index(
+    conn: Any,
+    index_name: str,
+    distance_metric: str,
+    cfg: Dict[str, Any],
+    action: str = "ensure",
+) -> Dict[str, Any]:
+    """Create, rebuild or drop the vector index on ``index_name`` (the physical chunk table).
+
+    ``ensure`` leaves an existing vector index untouched; ``rebuild`` drops and recreates it with
+    the given parameters (e.g. after bulk loads or when changing HNSW/IVF settings).
+    """
+    if action not in VECTOR_INDEX_ACTIONS:
+        raise ValueError(f"action must be one of {VECTOR_INDEX_ACTIONS}, got {action!r}")
+    _lazy_import_oracledb()
+    result: Dict[str, Any] = {"table": index_name.upper(), "action": action, "index": None, "changed": False}
+    with conn.cursor() as cur:
+        existing = _existing_vector_index(cur, index_name)
+        result["index"] = existing
+        if existing and action == "ensure":
+            logger.info("Vector index %s already exists on %s; leaving as is", existing, index_name)
+            return result
+        if existing and action in ("rebuild", "drop"):
+            cur.execute(f"DROP INDEX {existing}")
+            result.update(index=None, changed=True)
+            logger.info("Dropped vector index %s on %s", existing, index_name)
+        if action == "drop":
+            return result
+        ddl = build_vector_index_ddl(index_name, distance_metric, cfg)
+        cur.execute(ddl)
+        result.update(index=vector_index_name(index_name), changed=True, ddl=ddl)
+        logger.info(
+            "Created %s vector index %s on %s (target_accuracy=%d)",
+            cfg["type"].upper(),
+            vector_index_name(index_name),
+            index_name,
+            int(cfg["target_accuracy"]),
+        )
+    return result
+
+
+METADATA_INDEX_KEYS = ("doc_id", "content_type")
+
+
+def ensure_metadata_indexes(conn: Any, index_name: str, keys=METADATA_INDEX_KEYS) -> Dict[str, Any]:
+    """Create function-based indexes on ``JSON_VALUE(METADATA, '$.<key>')`` for filtered searches.
+
+    Only the ``doc_ids`` and ``content_types`` allow-lists are pushed down as a plain
+    ``JSON_VALUE(METADATA, '$.<key>') IN (...)``, which these indexes can serve because filtered
+    searches read this table rather than the alias view (whose METADATA is serialized). Exclusions
+    (``chunk_type``, ``block_type``, ``exclude_doc_ids``) are ``NVL(...) NOT IN`` predicates that
+    a B-tree index cannot resolve, so they are not indexed by default.
+    """
+    _lazy_import_oracledb()
+    created = []
+    with conn.cursor() as cur:
+        for key in keys:
+            if not key.isidentifier():
+                raise ValueError(f"Invalid metadata key for index: {key!r}")
+            name = f"{index_name}_MD_{key}".upper()[:128]
+            cur.execute("SELECT COUNT(*) FROM user_indexes WHERE index_name = :1", (name,))
+            if cur.fetchone()[0] > 0:
+                continue
+            cur.execute(f"CREATE INDEX {name} ON {index_name} (JSON_VALUE(METADATA, '$.{key}'))")
+            created.append(name)
+            logger.info("Created metadata index %s on %s ($.%s)", name, index_name, key)
+    return {"table": index_name.upper(), "created": created}
+
 
 def ensure_alias(conn: Any, alias_name: str, index_name: str) -> None:
     """Create or replace a projection view exposing the legacy 4-column shape.
@@ -145,4 +333,5 @@ def ensure_alias(conn: Any, alias_name: str, index_name: str) -> None:
         cur.execute(stmt)
     conn.commit()
     logger.info("alias %s -> %s", alias_name, index_name)
+    bump_index_epoch(f"alias {alias_name} -> {index_name}")
 logger = logging.getLogger(__name__)
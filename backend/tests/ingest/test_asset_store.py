@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+from backend.ingest.asset_store import AssetStore
+
+
+def _age(path, seconds):
+    st = path.stat()
+    os.utime(path, (st.st_atime - seconds, st.st_mtime - seconds))
+
+
+def test_blobs_are_content_addressed_with_fan_out_and_written_once(tmp_path):
+    store = AssetStore(tmp_path)
+    data = b"logo bytes"
+    sha = hashlib.sha256(data).hexdigest()
+
+    first = store.put(data, ".PNG")
+    assert first.written and first.sha256 == sha
+    assert first.ref == f"blobs/{sha[:2]}/{sha[2:4]}/{sha}.png"
+    assert (tmp_path / first.ref).read_bytes() == data
+
+    # Same process and a fresh process (new store instance) both skip the write.
+    assert not store.put(data, ".png", sha).written
+    again = AssetStore(tmp_path)
+    assert not again.put(data, ".png").written
+    assert store.stats()["written"] == 1 and store.stats()["skipped"] == 1
+    assert again.stats() == {"puts": 1, "written": 0, "skipped": 1, "failed": 0, "bytes_written": 0}
+
+
+def test_background_writer_flushes_queued_blobs(tmp_path):
+    store = AssetStore(tmp_path, background=True)
+    try:
+        refs = [store.put(f"icon {i}".encode(), ".emf").ref for i in range(20)]
+        store.put(b"icon 0", ".emf")
+        store.flush()
+        assert all((tmp_path / ref).exists() for ref in refs)
+        assert store.stats()["written"] == 20 and store.stats()["skipped"] == 1
+    finally:
+        store.close()
+
+
+def test_gc_removes_only_old_unreferenced_blobs(tmp_path):
+    store = AssetStore(tmp_path)
+    kept = store.put(b"shared logo", ".png")
+    dropped = store.put(b"figure from an old revision", ".png")
+    fresh = store.put(b"written by a running ingest", ".png")
+    store.record_refs("SOP_A", str(tmp_path / "SOP_A.docx"), [kept.sha256])
+    store.record_refs("SOP_B", str(tmp_path / "SOP_B.docx"), [kept.sha256, dropped.sha256])
+    store.record_refs("SOP_B", str(tmp_path / "SOP_B.docx"), [kept.sha256])
+    for asset in (kept, dropped):
+        _age(asset.path, 7200)
+
+    dry = store.gc(dry_run=True)
+    assert (dry["removed"], dry["kept"], dry["skipped_recent"]) == (1, 1, 1)
+    assert dropped.path.exists()
+
+    result = store.gc()
+    assert result["removed"] == 1 and result["bytes_freed"] == len(b"figure from an old revision")
+    assert kept.path.exists() and fresh.path.exists() and not dropped.path.exists()
+    assert not dropped.path.parent.exists()
+
+    store.record_refs("SOP_A", str(tmp_path / "SOP_A.docx"), [])
+    assert not (tmp_path / "refs" / "SOP_A.json").exists()
+    assert json.loads((tmp_path / "refs" / "SOP_B.json").read_text())["assets"] == [kept.sha256]
+    pruned = store.gc(prune_missing_sources=True, min_age_seconds=0)
+    assert pruned["refs_pruned"] == 1 and pruned["removed"] == 2
+
+
+def test_reused_old_blob_survives_gc_before_its_refs_are_recorded(tmp_path, monkeypatch):
+    from backend.ingest import asset_store
+
+    old = AssetStore(tmp_path).put(b"logo from last year", ".png")
+    _age(old.path, 7200)
+
+    # A fresh process re-ingests a document embedding the same image; GC runs before record_refs.
+    store = AssetStore(tmp_path)
+    assert not store.put(b"logo from last year", ".png").written
+    assert store.gc()["skipped_recent"] == 1 and old.path.exists()
+
+    # Blobs this process already knows are touched again once the retouch interval has passed.
+    monkeypatch.setattr(asset_store, "_RETOUCH_INTERVAL_S", 0)
+    _age(old.path, 7200)
+    assert not store.put(b"logo from last year", ".png").written
+    assert store.gc()["skipped_recent"] == 1 and old.path.exists()
+
+
+def test_reingesting_docx_reuses_blobs(tmp_path, monkeypatch):
+    docx = pytest.importorskip("docx")
+    from io import BytesIO
+
+    from backend.ingest import asset_store
+    from backend.ingest.loaders import docx_loader
+    from backend.tests.ingest.test_docx_loader_images import PNG_BYTES
+
+    assets_dir = tmp_path / "assets"
+    monkeypatch.setenv("DOCX_EXTRACT_IMAGES", "1")
+    monkeypatch.setenv("RAG_ASSETS_DIR", str(assets_dir))
+    monkeypatch.setattr(asset_store, "_stores", {})
+    paths = []
+    for name in ("SOP_one", "SOP_two"):
+        doc = docx.Document()
+        doc.add_paragraph(f"{name} header")
+        doc.add_picture(BytesIO(PNG_BYTES))
+        paths.append(tmp_path / f"{name}.docx")
+        doc.save(paths[-1])
+
+    refs = []
+    for path in paths * 2:
+        items = docx_loader.load(str(path))
+        refs += [it["metadata"]["image_ref"] for it in items if it["metadata"].get("block_type") == "image"]
+
+    assert len(set(refs)) == 1 and len(refs) == 4
+    assert len(list((assets_dir / "blobs").glob("*/*/*"))) == 1
+    assert asset_store.get_store(assets_dir).stats()["written"] == 1
+    assert sorted(p.name for p in (assets_dir / "refs").iterdir()) == ["SOP_one.json", "SOP_two.json"]
@@ -31,10 +31,10 @@ def test_docx_image_extraction_and_block_order(tmp_path, monkeypatch):
 
     items = docx_loader.load(str(doc_path))
 
-    written = list((assets_dir / "sample").glob("img_*.png"))
-    assert written, "image files should be written to assets dir"
+    written = list((assets_dir / "blobs").glob("*/*/*.png"))
+    assert len(written) == 1, "image blob should be written to the assets store"
     figure_id = "sample_img_001"
-    expected_ref = f"sample/{written[0].name}"
+    expected_ref = written[0].relative_to(assets_dir).as_posix()
     figure_items = [it for it in items if (it.get("metadata") or {}).get("block_type") == "image"]
     assert figure_items, "image item should be emitted"
     assert figure_items[0]["text"] == figure_id
@@ -58,5 +58,5 @@ def test_docx_images_skipped_when_flag_off(tmp_path, monkeypatch):
 
     items = docx_loader.load(str(doc_path))
 
-    assert not (assets_dir / "sample").exists()
+    assert not (assets_dir / "blobs").exists()
     assert all((it.get("metadata") or {}).get("block_type") != "image" for it in items)
@@ -0,0 +1,114 @@
+import base64
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("lxml")
+docx = pytest.importorskip("docx")
+
+from docx.enum.style import WD_STYLE_TYPE  # noqa: E402
+from docx.oxml import parse_xml  # noqa: E402
+from docx.oxml.ns import nsdecls  # noqa: E402
+
+from backend.ingest.loaders import docx_loader  # noqa: E402
+from backend.ingest.loaders.docx_stream import iter_paragraphs  # noqa: E402
+
+PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAoAAAAKCAQAAACEN8SrAAAAJElEQVR42mP8z/D/PwMDAwMjI+P///8ZGBgY/j8GhgYGBgYGAF6VBi3G1tF/AAAAAElFTkSuQmCC"
+)
+SAMPLES = sorted(p for p in (Path(__file__).resolve().parents[3] / "data" / "docs" / "docx").glob("*.docx") if not p.name.startswith("~$"))
+
+
+def _numbered(doc, text, num_id, ilvl, style=None):
+    para = doc.add_paragraph(text, style=style)
+    para._p.get_or_add_pPr().append(
+        parse_xml(f'<w:numPr {nsdecls("w")}><w:ilvl w:val="{ilvl}"/><w:numId w:val="{num_id}"/></w:numPr>')
+    )
+    return para
+
+
+def _build_sop(tmp_path: Path) -> Path:
+    doc = docx.Document()
+    doc.styles.add_style("TOC 1", WD_STYLE_TYPE.PARAGRAPH)
+    doc.add_paragraph("Monthly Bill Run SOP", style="Title")
+    doc.add_paragraph("Scope ........ 2", style="TOC 1")
+    doc.add_heading("Purpose", level=1)
+    _numbered(doc, "Check the billing queue", 7, 0)
+    _numbered(doc, "Confirm the cycle date", 7, 1)
+    _numbered(doc, "Escalate to L2", 7, 0, style="List Number")
+    doc.add_paragraph("")
+    linked = doc.add_paragraph("See ")
+    linked._p.append(
+        parse_xml(
+            f'<w:hyperlink {nsdecls("w", "r")} r:id="rIdX"><w:r><w:t>the runbook</w:t></w:r></w:hyperlink>'
+        )
+    )
+    tabbed = doc.add_paragraph()
+    run = tabbed.add_run("Step\t1")
+    run.add_break()
+    run.add_text("continues")
+    doc.add_heading("2 Scope", level=2)
+    _numbered(doc, "Heading from numbering", 9, 1, style="Heading 2")
+    doc.add_picture(BytesIO(PNG_BYTES))
+    doc.add_paragraph("- bullet like text")
+
+    table = doc.add_table(rows=3, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"r{r}c{c}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    inner = table.cell(2, 0).add_table(rows=1, cols=2)
+    inner.cell(0, 0).text = "nested a"
+    inner.cell(0, 1).text = "nested b"
+    doc.add_paragraph("After the table")
+
+    path = tmp_path / "SOP_sample.docx"
+    doc.save(path)
+    return path
+
+
+def _load(path, monkeypatch, parser):
+    if parser:
+        monkeypatch.setenv("DOCX_PARSER", parser)
+    else:
+        monkeypatch.delenv("DOCX_PARSER", raising=False)
+    return docx_loader.load(str(path))
+
+
+@pytest.mark.parametrize("extract_images", ["0", "1"])
+def test_streaming_backend_matches_python_docx(tmp_path, monkeypatch, extract_images):
+    path = _build_sop(tmp_path)
+    monkeypatch.setenv("RAG_ASSETS_DIR", str(tmp_path / "assets"))
+    monkeypatch.setenv("DOCX_EXTRACT_IMAGES", extract_images)
+
+    expected = _load(path, monkeypatch, None)
+    assert _load(path, monkeypatch, "lxml") == expected
+
+    text = "\n".join(it["text"] for it in expected)
+    assert "Scope ........ 2" not in text
+    assert "the runbook" in text and "r0c0\nr0c1\nr0c0\nr0c1" in text and "nested b" in text
+    assert any(it["metadata"].get("numbering_prefix_of_section") for it in expected)
+    if extract_images == "1":
+        assert any(it["metadata"].get("block_type") == "image" for it in expected)
+
+
+def test_stream_reader_resolves_styles_and_numbering(tmp_path):
+    path = _build_sop(tmp_path)
+    blips = []
+    paragraphs = [p for p in iter_paragraphs(str(path), images=True, on_blip=blips.append) if p.text or p.runs]
+
+    by_text = {p.text: p for p in paragraphs}
+    assert by_text["Purpose"].style_name.lower() == "heading 1"
+    assert by_text["Scope ........ 2"].style_name == "TOC 1"
+    assert (by_text["Confirm the cycle date"].num_id, by_text["Confirm the cycle date"].ilvl) == (7, 1)
+    assert by_text["Step\t1\ncontinues"].style_name == "Normal"
+    assert len(blips) == 1 and any(blips[0] in rids for p in paragraphs for _, rids in p.runs)
+
+
+@pytest.mark.parametrize("sample", SAMPLES, ids=[p.name for p in SAMPLES])
+def test_streaming_backend_matches_python_docx_on_sample_docs(sample, tmp_path, monkeypatch):
+    monkeypatch.setenv("RAG_ASSETS_DIR", str(tmp_path / "assets"))
+    monkeypatch.setenv("DOCX_INLINE_FIGURE_PLACEHOLDERS", "1")
+    assert _load(sample, monkeypatch, "lxml") == _load(sample, monkeypatch, None)
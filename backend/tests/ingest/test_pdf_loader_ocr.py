@@ -0,0 +1,84 @@
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from backend.ingest.loaders import pdf_loader
+
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+
+class FakePdf:
+    def __init__(self, pages):
+        self.pages = [FakePage(t) for t in pages]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    """Source PDF with three pages; pages 2 and 3 have no native text."""
+    source = ["Native page one with enough text to skip OCR entirely.", "", ""]
+    written = {}
+    reads = []
+    ocr_calls = []
+
+    class PdfReader:
+        def __init__(self, path):
+            reads.append(path)
+            self.pages = list(range(1, len(source) + 1))
+
+    class PdfWriter:
+        def __init__(self):
+            self.pages = []
+
+        def add_page(self, page):
+            self.pages.append(page)
+
+        def write(self, fh):
+            written[fh.name] = list(self.pages)
+
+    def open_pdf(path):
+        if path in ocr_outputs:
+            return FakePdf([f"ocr text for page {p}" for p in ocr_outputs[path]])
+        return FakePdf(source)
+
+    ocr_outputs = {}
+
+    def ocr(src, dst, **kwargs):
+        ocr_calls.append(kwargs)
+        ocr_outputs[dst] = written[src]
+
+    monkeypatch.setitem(sys.modules, "PyPDF2", types.SimpleNamespace(PdfReader=PdfReader, PdfWriter=PdfWriter))
+    monkeypatch.setitem(sys.modules, "ocrmypdf", types.SimpleNamespace(ocr=ocr))
+    monkeypatch.setattr(pdf_loader.pdfplumber, "open", open_pdf)
+    monkeypatch.setenv("PDF_OCR_MODE", "auto")
+    monkeypatch.setenv("PDF_OCR_JOBS", "3")
+    monkeypatch.setattr(pdf_loader, "clean_blocks", lambda kind, blocks: blocks)
+    return types.SimpleNamespace(reads=reads, ocr_calls=ocr_calls)
+
+
+def test_auto_ocr_runs_once_for_all_low_text_pages(fake_pdf):
+    runs_before = pdf_loader.ocr_runs
+    items = pdf_loader.load("/tmp/manual.pdf")
+
+    assert len(fake_pdf.reads) == 1
+    assert len(fake_pdf.ocr_calls) == 1 and fake_pdf.ocr_calls[0]["jobs"] == 3
+    by_page = {it["metadata"]["page"]: it for it in items}
+    assert by_page[2]["text"] == "ocr text for page 2" and by_page[2]["metadata"]["has_ocr"]
+    assert by_page[3]["text"] == "ocr text for page 3" and by_page[3]["metadata"]["has_ocr"]
+    assert not by_page[1]["metadata"]["has_ocr"]
+    assert pdf_loader.ocr_runs == runs_before + 1
+    assert pdf_loader.ocr_seconds_per_page() >= 0.0
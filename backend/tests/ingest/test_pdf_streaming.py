@@ -0,0 +1,115 @@
+import pytest
+
+from backend.ingest.chunking.block_cleaner import clean_blocks, iter_clean_pdf_blocks
+from backend.ingest.chunking.block_types import Block
+from backend.ingest.chunking.structured_pdf_chunker import chunk_structured_pdf_items, iter_structured_pdf_chunks
+
+
+def _pages(n, header="ACME Router Guide"):
+    return [
+        Block(
+            type="paragraph",
+            text=f"{header}\nBody text for page {i} about configuring port {i}.\nPage {i} of {n}",
+            meta={"page": i},
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _texts(blocks):
+    return [(b.meta["page"], b.text) for b in blocks]
+
+
+def test_streaming_cleaner_matches_whole_document_when_it_fits_the_window():
+    blocks = _pages(6)
+    blocks[0] = Block(type="paragraph", text="Contents\nIntro ..... 2\nSetup ..... 4", meta={"page": 1})
+    assert _texts(iter_clean_pdf_blocks(iter(blocks), window=10)) == _texts(clean_blocks("pdf", blocks))
+
+
+def test_streaming_cleaner_drops_headers_with_bounded_lookahead():
+    consumed = []
+
+    def source():
+        for blk in _pages(40):
+            consumed.append(blk.meta["page"])
+            yield blk
+
+    stream = iter_clean_pdf_blocks(source(), window=6)
+    first = next(stream)
+    assert len(consumed) <= 6
+    assert first.text.splitlines()[0] == "Body text for page 1 about configuring port 1."
+    rest = list(stream)
+    assert len(rest) == 39 and all("ACME Router Guide" not in b.text for b in rest)
+
+
+def test_structured_pdf_chunks_stream_from_a_generator():
+    items = [{"text": b.text, "metadata": {"page": b.meta["page"], "content_type": "pdf"}} for b in _pages(30)]
+    cfg = {"drop_repeated_headers_footers": True, "repeated_lines_window": 5, "min_block_tokens": 0}
+    pulled = []
+
+    def source():
+        for it in items:
+            pulled.append(it["metadata"]["page"])
+            yield it
+
+    stream = iter_structured_pdf_chunks(source(), cfg, effective_max_tokens=200)
+    first = next(stream)
+    assert first["metadata"]["page_start"] == 1 and len(pulled) <= 5
+    chunks = [first, *stream]
+    assert all("ACME Router Guide" not in c["text"] for c in chunks)
+    assert len(chunks) == 30
+    # A short document sees one window, the same as the list API.
+    short = items[:4]
+    assert chunk_structured_pdf_items(iter(short), cfg, 200) == chunk_structured_pdf_items(short, cfg, 200)
+
+
+def test_iter_load_yields_before_reading_every_page(monkeypatch):
+    pytest.importorskip("pdfplumber")
+    from backend.ingest.loaders import pdf_loader
+
+    read = []
+
+    class FakePage:
+        def __init__(self, n):
+            self.n = n
+
+        def extract_text(self):
+            read.append(self.n)
+            return f"ACME Router Guide\nPage {self.n} has plenty of native text to skip any OCR."
+
+    class FakePdf:
+        @property
+        def pages(self):
+            return (FakePage(n) for n in range(1, 101))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(pdf_loader.pdfplumber, "open", lambda path: FakePdf())
+    monkeypatch.setenv("PDF_OCR_MODE", "off")
+    stream = pdf_loader.iter_load("/tmp/big.pdf", window=8)
+    first = next(stream)
+    assert first["metadata"]["page"] == 1 and "ACME Router Guide" not in first["text"]
+    assert len(read) <= 16
+    assert len(list(stream)) == 99
+
+
+def test_page_lists_keep_whole_document_repeated_line_detection():
+    # The notice sits on every other page: under 60% of the document, but often within 4 pages.
+    items = [
+        {
+            "text": ("Export controlled\n" if i % 2 else "") + f"Body text for page {i} about configuring port {i}.",
+            "metadata": {"page": i, "content_type": "pdf"},
+        }
+        for i in range(1, 31)
+    ]
+    cfg = {"drop_repeated_headers_footers": True, "repeated_lines_window": 4, "min_block_tokens": 0}
+
+    whole = chunk_structured_pdf_items(items, cfg, 200)
+    streamed = chunk_structured_pdf_items(iter(items), cfg, 200)
+
+    assert sum("Export controlled" in c["text"] for c in whole) == 15
+    assert sum("Export controlled" in c["text"] for c in streamed) < 15
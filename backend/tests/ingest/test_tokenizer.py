@@ -0,0 +1,51 @@
+from backend.ingest.loaders.chunking import structured_docx_chunker, structured_pdf_chunker, toc_section_docx_chunker
+from backend.ingest.loaders.chunking.toc_section_docx_chunker import _split_to_limit
+from backend.ingest.tokenizer import Tokenizer, get_tokenizer
+
+
+class CountingTokenizer(Tokenizer):
+    def __init__(self):
+        self.encodes = 0
+
+    def offsets(self, text):
+        self.encodes += 1
+        return super().offsets(text)
+
+
+def test_get_tokenizer_is_cached_and_heuristic_rounds_up():
+    tok = get_tokenizer("heuristic")
+    assert tok is get_tokenizer("HEURISTIC")
+    assert [tok.count(t) for t in ("", "abc", "abcd", "abcde")] == [0, 1, 1, 2]
+    assert tok.count_batch(["abcd", "abcdefghi"]) == [1, 3]
+
+
+def test_split_prefers_sentences_then_words_and_encodes_once():
+    tok = CountingTokenizer()
+    text = "First sentence here. Second one! " + " ".join(f"word{i}" for i in range(200))
+    parts = tok.split(text, 10)
+    assert tok.encodes == 1
+    assert parts[0] == "First sentence here. Second one!"
+    assert all(tok.count(p) <= 10 for p in parts)
+    assert " ".join(parts[1:]).split() == [f"word{i}" for i in range(200)]
+
+
+def test_split_hard_cuts_unbroken_text_and_truncate_fits_budget():
+    tok = get_tokenizer("heuristic")
+    assert tok.split("x" * 30, 4) == ["x" * 16, "x" * 14]
+    assert tok.truncate("abcdefghij", 2) == "abcdefgh"
+    assert tok.truncate("short", 10) == "short"
+    assert tok.split("   ", 1) == []
+
+
+def test_split_to_limit_repeats_header_and_breaks_on_lines():
+    body = "\n".join(f"line {i} " + "x" * 20 for i in range(6))
+    parts = _split_to_limit(body, 20, "Procedure: 1. Start")
+    assert len(parts) > 1
+    assert all(p.startswith("Procedure: 1. Start\nline ") for p in parts)
+    assert all(get_tokenizer("heuristic").count(p) <= 20 for p in parts)
+
+
+def test_chunker_budgets_keep_rounded_estimate():
+    # Chunk boundaries depend on round(len / 4), not the tokenizer's rounded-up count.
+    for mod in (structured_docx_chunker, structured_pdf_chunker, toc_section_docx_chunker):
+        assert [mod._estimate_tokens("x" * n) for n in (0, 5, 6, 10, 11)] == [0, 1, 2, 2, 3]
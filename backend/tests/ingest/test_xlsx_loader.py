@@ -0,0 +1,111 @@
+import tracemalloc
+import zipfile
+
+from backend.ingest.loaders import xlsx_loader
+
+NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+R_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+WS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+
+WORKBOOK = f"""<workbook {NS} {R_NS}><sheets>
+<sheet name="Orders" sheetId="1" r:id="rId7"/>
+<sheet name="Notes" sheetId="2" r:id="rId3"/>
+</sheets></workbook>"""
+RELS = f"""<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId3" Type="{WS_REL}" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId7" Type="{WS_REL}" Target="/xl/worksheets/sheet2.xml"/>
+</Relationships>"""
+SHARED = f"""<sst {NS}><si><t>OrderId</t></si><si><t>Customer</t></si><si><t>Shipped</t></si>
+<si><r><t>ACME </t></r><r><rPr><b/></rPr><t>Corp</t></r><rPh><t>x</t></rPh></si></sst>"""
+STYLES = f"""<styleSheet {NS}><numFmts><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/></numFmts>
+<cellXfs><xf numFmtId="0"/><xf numFmtId="164"/><xf numFmtId="4"/></cellXfs></styleSheet>"""
+ORDERS = f"""<worksheet {NS}><dimension ref="A1:D3"/><sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c><c r="D1" t="inlineStr"><is><t>Total</t></is></c></row>
+<row r="2"><c r="A2"><v>1001</v></c><c r="B2" t="s"><v>3</v></c><c r="C2" s="1"><v>45292</v></c><c r="D2" s="2"><v>12.50</v></c></row>
+<row r="3"><c r="A3"><v>1002</v></c><c r="C3" t="b"><v>0</v></c></row>
+</sheetData></worksheet>"""
+NOTES = f"""<worksheet {NS}><sheetData><row r="1"><c r="A1" t="str"><v>Reconcile the invoice totals</v></c></row></sheetData></worksheet>"""
+
+
+def _write_xlsx(path, sheets, shared=SHARED):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("xl/workbook.xml", WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", RELS)
+        zf.writestr("xl/sharedStrings.xml", shared)
+        zf.writestr("xl/styles.xml", STYLES)
+        for part, xml in sheets.items():
+            if isinstance(xml, str):
+                zf.writestr(part, xml)
+            else:
+                with zf.open(part, "w") as fh:
+                    for chunk in xml:
+                        fh.write(chunk.encode("utf-8"))
+    return str(path)
+
+
+def test_cells_resolve_through_shared_strings_styles_and_sheet_rels(tmp_path):
+    path = _write_xlsx(tmp_path / "orders.xlsx", {"xl/worksheets/sheet1.xml": NOTES, "xl/worksheets/sheet2.xml": ORDERS})
+
+    items = xlsx_loader.load(path)
+
+    assert [it["metadata"]["sheet_name"] for it in items] == ["Orders", "Notes"]
+    assert items[0]["text"] == "\n".join(
+        [
+            "Sheet: Orders",
+            "Columns: OrderId | Customer | Shipped | Total",
+            "Row 2: 1001 | ACME Corp | 2024-01-01 | 12.5",
+            "Row 3: 1002 | | FALSE",
+        ]
+    )
+    meta = items[0]["metadata"]
+    assert (meta["sheet_index"], meta["n_rows"], meta["n_cols"], meta["row_start"], meta["row_end"]) == (1, 3, 4, 2, 3)
+    assert "Reconcile the invoice totals" in items[1]["text"]
+
+
+def test_row_groups_respect_budget_and_carry_headers(tmp_path, monkeypatch):
+    monkeypatch.setenv("XLSX_ROW_GROUP_MAX_TOKENS", "64")
+    rows = "".join(
+        f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="B{r}" t="inlineStr"><is><t>ticket {r} closed by billing ops</t></is></c></row>'
+        for r in range(2, 42)
+    )
+    header = '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+    sheet = f"<worksheet {NS}><sheetData>{header}{rows}</sheetData></worksheet>"
+    path = _write_xlsx(tmp_path / "tickets.xlsx", {"xl/worksheets/sheet1.xml": NOTES, "xl/worksheets/sheet2.xml": sheet})
+
+    items = [it for it in xlsx_loader.iter_load(path) if it["metadata"]["sheet_name"] == "Orders"]
+
+    assert len(items) > 1
+    tok = xlsx_loader._TOKENIZER
+    for it in items:
+        assert it["text"].startswith("Sheet: Orders\nColumns: OrderId | Customer\nRow ")
+        assert tok.count(it["text"]) <= 64
+    spans = [(it["metadata"]["row_start"], it["metadata"]["row_end"]) for it in items]
+    assert spans[0][0] == 2 and spans[-1][1] == 41
+    assert all(nxt[0] == prev[1] + 1 for prev, nxt in zip(spans, spans[1:]))
+
+
+def test_large_sheet_streams_with_bounded_memory(tmp_path):
+    n = 30_000
+
+    def rows():
+        yield f"<worksheet {NS}><dimension ref=\"A1:C{n}\"/><sheetData>"
+        yield '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c></row>'
+        for r in range(2, n + 1):
+            yield f'<row r="{r}"><c r="A{r}"><v>{r}</v></c><c r="B{r}" t="s"><v>3</v></c><c r="C{r}" t="b"><v>1</v></c></row>'
+        yield "</sheetData></worksheet>"
+
+    path = _write_xlsx(tmp_path / "big.xlsx", {"xl/worksheets/sheet1.xml": NOTES, "xl/worksheets/sheet2.xml": rows()})
+
+    tracemalloc.start()
+    try:
+        last_row = count = 0
+        for item in xlsx_loader.iter_load(path):
+            if item["metadata"]["sheet_name"] == "Orders":
+                count += 1
+                last_row = item["metadata"]["row_end"]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert last_row == n and count > 100
+    assert peak < 8 * 1024 * 1024
@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+
+from backend.core.ports.chat_model import ChatModelPort
+from backend.core.services.retrieval_service import RetrievalService
+
+
+class SyncVS:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def similarity_search_with_score(self, question, k):
+        return self.docs
+
+
+class AsyncVS(SyncVS):
+    def __init__(self, docs):
+        super().__init__(docs)
+        self.async_calls = 0
+
+    async def asimilarity_search_with_score(self, question, k, **kwargs):
+        self.async_calls += 1
+        return self.docs
+
+
+class AsyncLLM(ChatModelPort):
+    def __init__(self, text):
+        self.text = text
+        self.async_calls = 0
+
+    def generate(self, prompt: str) -> str:
+        return self.text
+
+    async def agenerate(self, prompt: str) -> str:
+        self.async_calls += 1
+        return self.text
+
+
+class SyncOnlyLLM:
+    def __init__(self, text):
+        self.text = text
+
+    def generate(self, prompt: str) -> str:
+        return self.text
+
+
+CFG = {
+    "retrieval": {
+        "distance": "cosine",
+        "score_mode": "normalized",
+        "thresholds": {"low": 0.0, "high": 0.0},
+        "hybrid": {"max_context_chars": 8000, "max_chunks": 6, "min_tokens_per_chunk": 1},
+        "top_k": 3,
+    },
+    "prompts": {"hybrid": {"system": ""}, "rag": {"system": ""}, "fallback": {"system": ""}},
+}
+
+
+def _docs():
+    meta = {"doc_id": "doc-1", "source": "sop.docx", "chunk_id": "c1"}
+    return [(SimpleNamespace(page_content="paragraph " * 50, metadata=meta), 0.9)]
+
+
+def test_answer_async_matches_sync_answer():
+    vs = AsyncVS(_docs())
+    primary = AsyncLLM("async answer")
+    service = RetrievalService(vs, primary, AsyncLLM("fallback"), CFG)
+    result = asyncio.run(service.answer_async("how to restart"))
+    expected = RetrievalService(SyncVS(_docs()), AsyncLLM("async answer"), AsyncLLM("fallback"), CFG).answer(
+        "how to restart"
+    )
+    assert result == expected
+    assert vs.async_calls == 1 and primary.async_calls == 1
+
+
+def test_answer_async_offloads_sync_only_dependencies():
+    service = RetrievalService(SyncVS([]), SyncOnlyLLM("x"), SyncOnlyLLM("general answer"), CFG)
+    result = asyncio.run(service.answer_async("q"))
+    assert result["mode"] == "fallback"
+    assert result["answer"] == "general answer"
+
+
+def test_answer_async_no_context_uses_async_fallback():
+    fallback = AsyncLLM("general answer")
+    service = RetrievalService(AsyncVS(_docs()), AsyncLLM("__NO_CONTEXT__"), fallback, CFG)
+    result = asyncio.run(service.answer_async("q"))
+    assert result["mode"] == "fallback"
+    assert result["answer"] == "general answer"
+    assert fallback.async_calls == 1
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+from backend.core.ports.chat_model import ChatModelPort
+from backend.core.services.retrieval_service import RetrievalService
+
+
+class StubVS:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def similarity_search_with_score(self, question, k):
+        return self.docs
+
+
+class StreamingLLM(ChatModelPort):
+    def __init__(self, pieces, usage=None):
+        self.pieces = list(pieces)
+        self.usage = usage
+        self.prompts = []
+
+    def generate(self, prompt: str) -> str:
+        return "".join(self.pieces)
+
+    def generate_stream(self, prompt: str, usage=None):
+        self.prompts.append(prompt)
+        yield from self.pieces
+        if usage is not None and self.usage:
+            usage.update(self.usage)
+
+
+class BlockingLLM(ChatModelPort):
+    def __init__(self, text):
+        self.text = text
+
+    def generate(self, prompt: str) -> str:
+        return self.text
+
+
+def make_service(primary, fallback, docs=None):
+    meta = {"doc_id": "doc-1", "source": "sop.docx", "chunk_id": "c1"}
+    doc = SimpleNamespace(page_content="paragraph " * 50, metadata=meta)
+    cfg = {
+        "retrieval": {
+            "distance": "cosine",
+            "score_mode": "normalized",
+            "thresholds": {"low": 0.0, "high": 0.0},
+            "hybrid": {"max_context_chars": 8000, "max_chunks": 6, "min_tokens_per_chunk": 1},
+            "top_k": 3,
+            "llm_no_context": {
+                "enabled": True,
+                "precedence": ["exact_token"],
+                "exact_token": {"value": "NO_CONTEXT", "case_insensitive": True, "strip_whitespace": True},
+                "max_chars_for_exact_token": 16,
+            },
+        },
+        "prompts": {"hybrid": {"system": ""}, "rag": {"system": ""}, "fallback": {"system": ""}},
+    }
+    return RetrievalService(StubVS(docs if docs is not None else [(doc, 0.9)]), primary, fallback, cfg)
+
+
+def test_stream_emits_metadata_tokens_and_done():
+    primary = StreamingLLM(["Restart ", "the service ", "and verify the status page."])
+    service = make_service(primary, BlockingLLM("unused"))
+    events = list(service.answer_stream("how to restart"))
+
+    names = [name for name, _ in events]
+    assert names[0] == "metadata" and names[-1] == "done"
+    assert events[0][1]["retrieved_chunks_metadata"][0]["chunk_id"] == "c1"
+    streamed = "".join(data["text"] for name, data in events if name == "token")
+    done = events[-1][1]
+    assert streamed == done["answer"] == "Restart the service and verify the status page."
+    assert done["mode"] == "hybrid"
+    assert done["usage"]["llm"] == "primary"
+
+
+def test_stream_matches_blocking_answer():
+    pieces = ["Restart ", "the service ", "and verify the status page."]
+    streamed = list(make_service(StreamingLLM(pieces), BlockingLLM("x")).answer_stream("q"))[-1][1]
+    blocking = make_service(StreamingLLM(pieces), BlockingLLM("x")).answer("q")
+    streamed.pop("usage")
+    assert streamed == blocking
+
+
+def test_no_context_reply_is_held_back_and_replaced_by_fallback():
+    primary = StreamingLLM(["NO_", "CONTEXT"], usage={"total_tokens": 40})
+    fallback = StreamingLLM(["general ", "guidance"], usage={"total_tokens": 9})
+    events = list(make_service(primary, fallback).answer_stream("q"))
+
+    tokens = [data["text"] for name, data in events if name == "token"]
+    assert tokens == ["general ", "guidance"]
+    assert "reset" not in [name for name, _ in events]
+    done = events[-1][1]
+    assert done["mode"] == "fallback"
+    assert done["decision_explain"]["fallback_reason"] == "llm_returned_no_context"
+    assert done["usage"]["total_tokens"] == 9
+    assert done["usage"]["prompt_chars"] == len(fallback.prompts[0])
+
+
+def test_fallback_without_results_uses_blocking_adapter():
+    events = list(make_service(BlockingLLM("unused"), BlockingLLM("fallback answer"), docs=[]).answer_stream("q"))
+    assert events[0][1]["mode"] == "fallback"
+    assert [data["text"] for name, data in events if name == "token"] == ["fallback answer"]
+    assert events[-1][1]["answer"] == "fallback answer"
@@ -0,0 +1,104 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.core.ports.vector_store import VectorDocument
+from backend.core.services.mmr import EmbeddingMMR, embedding_mmr, token_jaccard_mmr
+from backend.core.services.retrieval_service import RetrievalService
+
+
+class StubVS:
+    supports_embeddings = True
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+
+    def similarity_search_with_score(self, question, k, **kwargs):
+        self.calls.append(kwargs)
+        return self.docs
+
+
+class StubLLM:
+    def generate(self, prompt: str) -> str:
+        return "answer"
+
+
+def _cfg(mode="embedding"):
+    return {
+        "retrieval": {
+            "distance": "cosine",
+            "score_mode": "normalized",
+            "thresholds": {"low": 0.0, "high": 0.0},
+            "hybrid": {"max_context_chars": 8000, "max_chunks": 6, "min_tokens_per_chunk": 1},
+            "top_k": 3,
+            "mmr": {"mode": mode, "lambda": 0.3, "per_doc_cap": 2, "max_keep": 4},
+        },
+        "prompts": {"hybrid": {"system": ""}, "rag": {"system": ""}, "fallback": {"system": ""}},
+    }
+
+
+def _cand(doc_id, sim, vec, text="alpha beta"):
+    doc = VectorDocument(page_content=text, metadata={"doc_id": doc_id}, embedding=vec)
+    return {"doc": doc, "doc_id": doc_id, "sim": sim, "text": text}
+
+
+def test_embedding_mmr_prefers_diverse_vectors():
+    cands = [
+        _cand("a", 0.95, [1.0, 0.0, 0.0]),
+        _cand("b", 0.94, [0.99, 0.01, 0.0]),
+        _cand("c", 0.80, [0.0, 1.0, 0.0]),
+    ]
+    picked = embedding_mmr(cands, lam=0.3, per_doc_cap=6, max_keep=2)
+    assert [c["doc_id"] for c in picked] == ["a", "c"]
+    assert picked[0]["mmr_score"] == pytest.approx(0.95)
+
+
+def test_embedding_mmr_enforces_per_doc_cap():
+    rng = np.random.default_rng(7)
+    vecs = rng.normal(size=(6, 8))
+    engine = EmbeddingMMR(vecs, [0.9, 0.8, 0.7, 0.6, 0.5, 0.4], ["x", "x", "x", "y", "y", "z"])
+    picks = engine.select(lam=0.5, per_doc_cap=1, max_keep=6)
+    assert sorted(idx for idx, _ in picks) == [0, 3, 5]
+
+
+def test_embedding_mmr_returns_none_without_embeddings():
+    cands = [_cand("a", 0.9, None), _cand("b", 0.8, [1.0, 0.0])]
+    assert embedding_mmr(cands, lam=0.3, per_doc_cap=6, max_keep=4) is None
+
+
+def test_token_mmr_keeps_first_pick_by_similarity():
+    cands = [
+        {"doc_id": "a", "sim": 0.5, "text": "router reboot steps"},
+        {"doc_id": "b", "sim": 0.9, "text": "router reboot steps"},
+    ]
+    picked = token_jaccard_mmr(cands, lam=0.3, per_doc_cap=6, max_keep=1)
+    assert picked[0]["doc_id"] == "b"
+
+
+def _docs():
+    return [
+        (VectorDocument(page_content="alpha " * 40, metadata={"doc_id": "d1", "chunk_id": "c1"}, embedding=[1.0, 0.0]), 0.1),
+        (VectorDocument(page_content="beta " * 40, metadata={"doc_id": "d2", "chunk_id": "c2"}, embedding=[0.0, 1.0]), 0.2),
+    ]
+
+
+def test_service_requests_embeddings_and_reports_mode():
+    vs = StubVS(_docs())
+    service = RetrievalService(vs, StubLLM(), StubLLM(), _cfg())
+    _, _, explain = service.select_context("question")
+    assert vs.calls[0].get("with_embeddings") is True
+    assert explain["mmr_mode"] == "embedding"
+
+
+def test_service_token_mode_skips_embeddings():
+    vs = StubVS(_docs())
+    service = RetrievalService(vs, StubLLM(), StubLLM(), _cfg(mode="tokens"))
+    _, _, explain = service.select_context("question")
+    assert "with_embeddings" not in vs.calls[0]
+    assert explain["mmr_mode"] == "tokens"
+
+
+def test_invalid_mmr_mode_rejected():
+    with pytest.raises(ValueError):
+        RetrievalService(StubVS([]), StubLLM(), StubLLM(), _cfg(mode="bogus"))
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from backend.core.ports.vector_store import MetadataFilter
+from backend.core.services.retrieval_service import RetrievalService
+
+
+def _doc(chunk_id, doc_id, chunk_type="text", lang="en"):
+    meta = {"chunk_id": chunk_id, "doc_id": doc_id, "chunk_type": chunk_type, "lang": lang}
+    return SimpleNamespace(page_content=f"content for {chunk_id} " * 10, metadata=meta)
+
+
+class RecordingVS:
+    def __init__(self, supports_filters):
+        self.supports_filters = supports_filters
+        self.calls = []
+
+    def similarity_search_with_score(self, question, k, **kwargs):
+        self.calls.append({"k": k, **kwargs})
+        return [
+            (_doc("t1", "doc-a"), 0.9),
+            (_doc("f1", "doc-a", chunk_type="figure"), 0.85),
+            (_doc("t2", "doc-b", lang="es"), 0.8),
+        ]
+
+
+class DummyLLM:
+    def generate(self, prompt):
+        return "answer"
+
+
+def _service(vs, pushdown):
+    cfg = {
+        "retrieval": {
+            "distance": "cosine",
+            "score_mode": "normalized",
+            "thresholds": {"low": 0.0, "high": 0.1},
+            "hybrid": {"max_context_chars": 8000, "max_chunks": 6, "min_tokens_per_chunk": 0},
+            "mmr": {"mode": "tokens"},
+            "top_k": 5,
+            "filter_pushdown": pushdown,
+        },
+        "prompts": {"hybrid": {"system": ""}, "rag": {"system": ""}, "fallback": {"system": ""}},
+    }
+    return RetrievalService(vs, DummyLLM(), DummyLLM(), cfg)
+
+
+def test_filters_are_pushed_to_capable_store_with_smaller_overfetch():
+    vs = RecordingVS(supports_filters=True)
+    svc = _service(vs, {"exclude_llm_ineligible": True, "overfetch_factor": 2, "langs": ["en"]})
+    svc.answer("how do I restart the node")
+
+    call = vs.calls[0]
+    assert call["k"] == 10
+    assert call["filters"] == MetadataFilter(
+        exclude_chunk_types=("figure",), exclude_block_types=("image",), langs=("en",)
+    )
+
+
+def test_default_config_keeps_figures_and_overfetch():
+    vs = RecordingVS(supports_filters=True)
+    result = _service(vs, {}).answer("how do I restart the node")
+    assert vs.calls[0]["k"] == 20 and "filters" not in vs.calls[0]
+    assert any(m.get("chunk_type") == "figure" for m in result["retrieved_chunks_metadata"])
+
+
+def test_store_without_filter_support_gets_same_semantics_in_process():
+    vs = RecordingVS(supports_filters=False)
+    result = _service(vs, {"langs": ["en"]}).answer("how do I restart the node")
+    assert "filters" not in vs.calls[0]
+    chunk_ids = {m.get("chunk_id") for m in result["retrieved_chunks_metadata"]}
+    assert "t2" not in chunk_ids and "t1" in chunk_ids
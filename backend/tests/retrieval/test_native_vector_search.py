@@ -0,0 +1,160 @@
+import array
+import json
+
+import pytest
+
+from backend.core.ports.vector_store import VectorDocument
+from backend.providers.oci.vectorstore import OracleVSStore, SEARCH_MODE_NATIVE
+
+
+class FakeCursor:
+    def __init__(self, rows, log):
+        self.rows = rows
+        self.log = log
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.outputtypehandler = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        if "user_dependencies" in sql:
+            self.log["lookups"] = self.log.get("lookups", 0) + 1
+            self.lookup = params["name"]
+            return
+        self.lookup = None
+        self.log.update(sql=sql, params=params, arraysize=self.arraysize, prefetchrows=self.prefetchrows)
+
+    def fetchall(self):
+        if self.lookup is not None:
+            return [("MY_DEMO_V2",)] if self.lookup == "MY_DEMO" else []
+        return self.rows
+
+
+class FakeConn:
+    def __init__(self, rows, log):
+        self.rows = rows
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return FakeCursor(self.rows, self.log)
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.log = {}
+
+    def acquire(self):
+        return FakeConn(self.rows, self.log)
+
+
+class FakeEmbeddings:
+    def embed_query(self, text):
+        return [0.1, 0.2, 0.3]
+
+
+def make_store(rows, distance="cosine"):
+    store = OracleVSStore.__new__(OracleVSStore)
+    store.pool = FakePool(rows)
+    store._embeddings = FakeEmbeddings()
+    store._distance_label = distance
+    store._search_mode = SEARCH_MODE_NATIVE
+    store._approximate = True
+    store._target_accuracy = None
+    store.table_name = "MY_DEMO"
+    store._physical_tables = {}
+    store._physical_epoch = None
+    return store
+
+
+ROWS = [
+    (b"\x01\x02", "first chunk", json.dumps({"doc_id": "d1", "chunk_id": "c1", "source": "a.docx"}), 0.12),
+    (b"\x03\x04", "second chunk", json.dumps({"doc_id": "d2", "chunk_id": "c2"}), 0.34),
+]
+
+
+def test_native_search_binds_float32_vector_and_targets_view():
+    store = make_store(ROWS)
+    results = store.similarity_search_with_score("restart", k=2, target_view="OTHER_VIEW")
+
+    log = store.pool.log
+    assert "FROM OTHER_VIEW" in log["sql"] and "FETCH APPROX FIRST :k ROWS ONLY" in log["sql"]
+    assert "COSINE" in log["sql"]
+    assert isinstance(log["params"]["qv"], array.array) and log["params"]["qv"].typecode == "f"
+    assert log["params"]["k"] == 2
+    assert log["arraysize"] == 2 and log["prefetchrows"] == 3
+    assert store.table_name == "MY_DEMO"
+
+    doc, score = results[0]
+    assert isinstance(doc, VectorDocument)
+    assert doc.id == "0102" and score == pytest.approx(0.12)
+    assert doc.metadata["chunk_id"] == "c1" and doc.metadata["raw_score"] == pytest.approx(0.12)
+    assert doc.metadata["text_preview"] == "first chunk"
+    assert results[1][0].metadata["source"] == ""
+
+
+def test_native_search_returns_embeddings_when_requested():
+    rows = [(row[0], row[1], row[2], array.array("f", [1.0, 0.0, 0.0]), row[3]) for row in ROWS]
+    store = make_store(rows, distance="dot_product")
+    results = store.similarity_search_with_score("q", k=2, with_embeddings=True)
+
+    assert ", EMBEDDING" in store.pool.log["sql"] and "DOT" in store.pool.log["sql"]
+    assert list(results[0][0].embedding) == [1.0, 0.0, 0.0]
+
+
+def test_native_search_rejects_unsafe_view_names():
+    store = make_store(ROWS)
+    with pytest.raises(ValueError):
+        store.similarity_search_with_score("q", k=2, target_view="MY_DEMO; DROP TABLE X")
+
+
+def test_search_sql_honours_exact_and_target_accuracy():
+    store = make_store(ROWS)
+    store._target_accuracy = 90
+    assert store._search_sql("MY_DEMO", False)[0].endswith("FETCH APPROX FIRST :k ROWS ONLY WITH TARGET ACCURACY 90")
+    store._approximate = False
+    assert store._search_sql("MY_DEMO", False)[0].endswith("FETCH EXACT FIRST :k ROWS ONLY")
+
+
+def test_filters_become_bound_json_value_predicates():
+    from backend.core.ports.vector_store import MetadataFilter
+
+    store = make_store(ROWS)
+    filters = MetadataFilter(exclude_chunk_types=("Figure",), doc_ids=("d1", "d2"), langs=("EN",))
+    store.similarity_search_with_score("q", k=5, filters=filters)
+
+    sql, params = store.pool.log["sql"], store.pool.log["params"]
+    assert "WHERE NVL(LOWER(JSON_VALUE(METADATA, '$.chunk_type')), '#') NOT IN (:xct0)" in sql
+    assert "JSON_VALUE(METADATA, '$.doc_id') IN (:did0, :did1)" in sql
+    assert "LOWER(JSON_VALUE(METADATA, '$.lang')) IN (:lang0)" in sql
+    assert sql.index("WHERE") < sql.index("ORDER BY")
+    assert params["xct0"] == "figure" and params["did1"] == "d2" and params["lang0"] == "en"
+
+
+def test_filtered_search_reads_the_physical_table_behind_the_alias():
+    from backend.core.ports.vector_store import MetadataFilter
+
+    store = make_store(ROWS)
+    filters = MetadataFilter(doc_ids=("d1",))
+    store.similarity_search_with_score("q", k=2)
+    assert "FROM MY_DEMO " in store.pool.log["sql"] and "lookups" not in store.pool.log
+
+    store.similarity_search_with_score("q", k=2, filters=filters)
+    store.similarity_search_with_score("q", k=2, filters=filters)
+    assert "FROM MY_DEMO_V2 WHERE JSON_VALUE(METADATA, '$.doc_id') IN (:did0)" in store.pool.log["sql"]
+    assert store.pool.log["lookups"] == 1
+
+    # Not a view: the name itself is the table.
+    store.similarity_search_with_score("q", k=2, target_view="PLAIN_TABLE", filters=filters)
+    assert "FROM PLAIN_TABLE WHERE" in store.pool.log["sql"]
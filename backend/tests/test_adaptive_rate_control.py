@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from backend.providers.oci import adaptive_limiter
+from backend.providers.oci.adaptive_limiter import AdaptiveRateController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class Throttled(Exception):
+    status = 429
+
+    def __init__(self, retry_after=None):
+        super().__init__("429")
+        self.headers = {"retry-after": str(retry_after)} if retry_after else {}
+
+
+def make(clock, **kwargs):
+    return AdaptiveRateController("ep|model", clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_additive_increase_after_a_round_of_successes():
+    clock = FakeClock()
+    ctl = make(clock, initial_rate_per_min=60, rate_step_per_min=10, initial_concurrency=2)
+    for _ in range(2):
+        ctl.release(ctl.acquire())
+    assert (ctl.rate_per_min, ctl.concurrency) == (70, 3)
+    # Second call waited one rate slot (60/min -> 1s apart).
+    assert clock.slept == [1.0]
+
+
+def test_multiplicative_decrease_once_per_congestion_event_and_retry_after_blocks():
+    clock = FakeClock()
+    ctl = make(clock, initial_rate_per_min=600, initial_concurrency=8)
+    permits = [ctl.acquire() for _ in range(3)]
+    clock.now += 1
+    for permit in permits:
+        ctl.release(permit, throttled=True, retry_after=5)
+    assert (ctl.rate_per_min, ctl.concurrency, ctl.decreases) == (300, 4, 1)
+    clock.slept.clear()
+    ctl.acquire()
+    assert clock.slept == [pytest.approx(5.0)]
+    with pytest.raises(Throttled):
+        ctl.call(lambda: (_ for _ in ()).throw(Throttled()))
+    assert ctl.decreases == 2 and ctl.stats()["throttled"] == 4
+
+
+def test_growth_holds_while_latency_is_degraded():
+    clock = FakeClock()
+    ctl = make(clock, initial_rate_per_min=6000, initial_concurrency=1, latency_factor=2.0)
+    for latency in (0.1, 1.0, 1.0, 1.0):
+        permit = ctl.acquire()
+        clock.now += latency
+        ctl.release(permit)
+    assert ctl.concurrency == 2
+    assert ctl.increases == 1
+
+
+def test_learned_limits_persist_per_endpoint_and_model(tmp_path):
+    state = tmp_path / "limits.json"
+    adaptive_limiter.configure(
+        {"enabled": True, "state_file": str(state), "initial_rate_per_min": 100, "initial_concurrency": 4}
+    )
+    try:
+        ctl = adaptive_limiter.get_controller("https://inference/", "cohere.embed")
+        assert adaptive_limiter.get_controller("https://inference", "cohere.embed") is ctl
+        ctl.release(ctl.acquire(), throttled=True)
+        saved = json.loads(state.read_text())
+        assert saved["https://inference|cohere.embed"]["rate_per_min"] == 50
+
+        adaptive_limiter.configure({"enabled": True, "state_file": str(state)})
+        restored = adaptive_limiter.get_controller("https://inference", "cohere.embed")
+        assert restored is not ctl
+        assert (restored.rate_per_min, restored.concurrency) == (50, 2)
+        assert "https://inference|cohere.embed" in adaptive_limiter.controller_stats()
+
+        adaptive_limiter.configure({"enabled": False})
+        assert adaptive_limiter.get_controller("https://inference", "cohere.embed") is None
+    finally:
+        adaptive_limiter.configure({"enabled": False})
+
+
+def test_call_retries_throttles_after_a_fresh_permit():
+    clock = FakeClock()
+    ctl = make(clock, initial_rate_per_min=600, initial_concurrency=4)
+    outcomes = [Throttled(retry_after=2), "ok"]
+
+    def fn():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert ctl.call(fn, throttle_retries=1) == "ok"
+    assert ctl.decreases == 1 and pytest.approx(2.0) in clock.slept
+
+
+def test_sdk_strategy_leaves_429_to_the_controller():
+    oci = pytest.importorskip("oci")
+    ctl = make(FakeClock())
+
+    def retries(strategy, status):
+        error = oci.exceptions.ServiceError(status, "TooManyRequests" if status == 429 else "InternalError", {}, "")
+        return strategy.checkers.should_retry(exception=error, current_attempt=1, total_elapsed_time_in_seconds=0)
+
+    assert retries(adaptive_limiter.sdk_retry_strategy(None), 429)
+    assert not retries(adaptive_limiter.sdk_retry_strategy(ctl), 429)
+    assert retries(adaptive_limiter.sdk_retry_strategy(ctl), 503)
@@ -0,0 +1,71 @@
+import pytest
+
+from backend.core.services import answer_cache as ac
+
+
+@pytest.fixture(autouse=True)
+def _epoch_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(ac.ANSWER_CACHE_EPOCH_ENV, str(tmp_path / "epoch"))
+
+
+def _payload(mode="rag"):
+    return {"question": "q", "answer": "a", "mode": mode, "decision_explain": {"mode": mode}}
+
+
+def test_hit_returns_copy_and_age():
+    cache = ac.AnswerCache(max_entries=4, ttl_seconds=60)
+    key = cache.make_key("How  do I reset?", "MY_DEMO", lambda view: "MY_DEMO_V1")
+    assert cache.get(key) is None
+    assert cache.put(key, _payload())
+    hit = cache.get(cache.make_key("How do I reset?", "MY_DEMO", lambda view: "MY_DEMO_V1"))
+    assert hit is not None
+    payload, age = hit
+    assert payload["answer"] == "a" and age >= 0
+    payload["decision_explain"]["answer_cache"] = {"hit": True}
+    again, _ = cache.get(key)
+    assert "answer_cache" not in again["decision_explain"]
+
+
+def test_fallback_answers_are_not_cached():
+    cache = ac.AnswerCache()
+    key = cache.make_key("q", "MY_DEMO", lambda view: None)
+    assert cache.put(key, _payload("fallback")) is False
+    assert cache.get(key) is None
+
+
+def test_key_tracks_physical_index():
+    cache = ac.AnswerCache(resolve_ttl_seconds=0)
+    k1 = cache.make_key("q", "MY_DEMO", lambda view: "MY_DEMO_V1")
+    k2 = cache.make_key("q", "MY_DEMO", lambda view: "MY_DEMO_V2")
+    assert k1 != k2
+
+
+def test_epoch_bump_invalidates_entries():
+    cache = ac.AnswerCache()
+    key = cache.make_key("q", "MY_DEMO", lambda view: "MY_DEMO_V1")
+    cache.put(key, _payload())
+    ac.bump_index_epoch("test")
+    assert cache.get(key) is None
+    fresh = cache.make_key("q", "MY_DEMO", lambda view: "MY_DEMO_V1")
+    assert fresh != key and cache.get(fresh) is None
+
+
+def test_disabled_config_returns_none():
+    assert ac.AnswerCache.from_config({"enabled": False}) is None
+    assert isinstance(ac.AnswerCache.from_config(None), ac.AnswerCache)
+
+
+def test_async_key_matches_sync_key_and_reuses_the_resolution():
+    import asyncio
+
+    cache = ac.AnswerCache()
+    calls = []
+
+    async def resolve(view):
+        calls.append(view)
+        return "MY_DEMO_V1"
+
+    key = asyncio.run(cache.amake_key("q", "MY_DEMO", resolve))
+    assert key == cache.make_key("q", "MY_DEMO", lambda view: "OTHER")
+    assert asyncio.run(cache.amake_key("q", "MY_DEMO", resolve)) == key
+    assert calls == ["MY_DEMO"]
@@ -0,0 +1,117 @@
+import array
+from types import SimpleNamespace
+
+import oracledb
+
+from backend.batch.embed_job import OracleVSUpserter
+
+
+class FakeCursor:
+    def __init__(self, existing_hashes=(), failing_offsets=()):
+        self.existing_hashes = set(existing_hashes)
+        self.failing_offsets = set(failing_offsets)
+        self.executemany_calls = []
+        self.input_sizes = []
+        self._last_errors = []
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        assert sql.startswith("SELECT HASH_NORM FROM MY_DEMO_V1 WHERE HASH_NORM IN (")
+        self._rows = [(h,) for h in params if h in self.existing_hashes]
+
+    def fetchall(self):
+        return self._rows
+
+    def setinputsizes(self, *sizes):
+        self.input_sizes.append(sizes)
+
+    def executemany(self, sql, rows, batcherrors=False):
+        assert batcherrors
+        self.executemany_calls.append((sql, list(rows)))
+        self._last_errors = [
+            SimpleNamespace(offset=i, message="ORA-51805") for i in range(len(rows)) if i in self.failing_offsets
+        ]
+
+    def getbatcherrors(self):
+        return self._last_errors
+
+
+class FakeConn:
+    def __init__(self, cursor):
+        self.cur = cursor
+        self.commits = 0
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        self.commits += 1
+
+
+def make_upserter(cursor, **options):
+    upserter = OracleVSUpserter({"table": "MY_DEMO_V1", "dsn": "x", "user": "u", "password": "p"}, options)
+    conn = FakeConn(cursor)
+    upserter.attach_connection(conn)
+    return upserter, conn
+
+
+def vec(i, hash_norm=None, text=None):
+    meta = {"chunk_id": f"c{i}", "distance_metric": "cosine"}
+    if hash_norm:
+        meta["hash_norm"] = hash_norm
+    return {"text": text or f"chunk {i}", "metadata": meta, "embedding": [0.5, float(i)]}
+
+
+def test_bulk_insert_binds_native_vectors_in_arrays():
+    cursor = FakeCursor()
+    upserter, conn = make_upserter(cursor, array_size=2, commit_every=10)
+    inserted, skipped = upserter.upsert_vectors([vec(i) for i in range(5)], dedupe=False, dry_run=False)
+
+    assert (inserted, skipped) == (5, 0)
+    assert [len(rows) for _, rows in cursor.executemany_calls] == [2, 2, 1]
+    row = cursor.executemany_calls[0][1][1]
+    assert row[0] == "chunk 1" and isinstance(row[2], array.array) and row[2].typecode == "f"
+    assert row[4] == "cosine"
+    assert cursor.input_sizes[0] == (None, None, oracledb.DB_TYPE_VECTOR, None, None)
+    assert conn.commits == 0
+    upserter.flush()
+    assert conn.commits == 1
+
+
+def test_bulk_dedupes_against_table_and_within_batch():
+    cursor = FakeCursor(existing_hashes={"h1"})
+    upserter, _ = make_upserter(cursor)
+    vectors = [vec(1, "h1"), vec(2, "h2"), vec(3, "h2"), vec(4)]
+    inserted, skipped = upserter.upsert_vectors(vectors, dedupe=True, dry_run=False)
+    assert (inserted, skipped) == (2, 2)
+    assert [r[0] for r in cursor.executemany_calls[0][1]] == ["chunk 2", "chunk 4"]
+
+
+def test_batch_errors_are_counted_and_long_text_binds_as_long():
+    cursor = FakeCursor(failing_offsets={0})
+    upserter, conn = make_upserter(cursor, commit_every=1)
+    inserted, _ = upserter.upsert_vectors([vec(1), vec(2, text="x" * 5000)], dedupe=False, dry_run=False)
+    assert inserted == 1 and upserter.batch_errors == 1
+    assert cursor.input_sizes[0][0] is oracledb.DB_TYPE_LONG
+    assert conn.commits == 1
+
+
+def test_dedupe_before_embed_collapses_job_and_table_duplicates():
+    from backend.batch.embed_job import _dedupe_before_embed
+
+    buffer = [vec(1, "h1"), vec(2, "h2"), vec(3, "h2"), vec(4), vec(5, "h3")]
+    kept, dup_in_job, already_stored = _dedupe_before_embed(buffer, {"h3"})
+    assert [v["metadata"]["chunk_id"] for v in kept] == ["c1", "c2", "c4"]
+    assert (dup_in_job, already_stored) == (1, 1)
+
+
+def test_fetch_existing_hashes_batches_in_lists():
+    cursor = FakeCursor(existing_hashes={"h2"})
+    upserter, _ = make_upserter(cursor)
+    assert upserter.fetch_existing_hashes(["h1", "h2", None, "h2"]) == {"h2"}
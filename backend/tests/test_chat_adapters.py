@@ -50,3 +50,33 @@ def test_primary_ocid_raises(monkeypatch):
             auth_file_location="/fake/path",
             auth_profile="DEFAULT",
         )
+
+
+def test_chat_adapter_stream_parses_events():
+    events = [
+        SimpleNamespace(data='{"index": 0, "message": {"role": "ASSISTANT", "content": [{"type": "TEXT", "text": "Hel"}]}}'),
+        SimpleNamespace(data='{"index": 0, "message": {"role": "ASSISTANT", "content": [{"type": "TEXT", "text": "lo"}]}}'),
+        SimpleNamespace(data='{"finishReason": "stop", "usage": {"promptTokens": 5, "completionTokens": 2, "totalTokens": 7}}'),
+    ]
+    captured = {}
+
+    class FakeClient:
+        def chat(self, details):
+            captured["is_stream"] = details.chat_request.is_stream
+            return SimpleNamespace(data=SimpleNamespace(events=lambda: iter(events)))
+
+    model = OciChatModelChat.__new__(OciChatModelChat)
+    model._compartment_id = "ocid1.compartment.oc1..example"
+    model._model_id = "ocid1.generativeaimodel.oc1..example"
+    model._generation_params = dict.fromkeys(
+        ["max_tokens", "temperature", "top_p", "top_k", "frequency_penalty", "presence_penalty"]
+    )
+    model._client = FakeClient()
+
+    usage = {}
+    assert list(model.generate_stream("hi", usage=usage)) == ["Hel", "lo"]
+    assert captured["is_stream"] is True
+    assert usage["total_tokens"] == 7
+    assert not hasattr(model, "last_usage")
+    # Without a holder the usage event is simply dropped.
+    assert list(model.generate_stream("hi")) == ["Hel", "lo"]
@@ -0,0 +1,63 @@
+import pytest
+
+from backend.providers.oci.batch_planner import EmbedBatchPlanner
+
+
+def test_packs_by_token_budget_and_groups_similar_lengths():
+    planner = EmbedBatchPlanner(max_items=96, max_tokens=1000, max_bytes=10**6)
+    tokens = [500, 10, 480, 12, 11, 20]
+    batches = planner.plan(tokens, [1] * len(tokens))
+    assert batches == [[1, 4, 3, 5, 2], [0]]
+    assert all(sum(tokens[i] for i in b) <= 1000 for b in batches)
+
+
+def test_item_and_byte_caps_and_oversized_input_gets_own_request():
+    planner = EmbedBatchPlanner(max_items=3, max_tokens=100, max_bytes=50, sort_by_length=False)
+    assert planner.plan([1] * 7, [1] * 7) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert planner.plan([1] * 7, [1] * 7, max_items=2) == [[0, 1], [2, 3], [4, 5], [6]]
+    assert planner.plan([1, 1, 1], [30, 30, 5]) == [[0], [1, 2]]
+    assert planner.plan([5, 500, 5], [1, 1, 1]) == [[0], [1], [2]]
+
+
+def test_stream_packs_full_requests_within_bounded_windows():
+    planner = EmbedBatchPlanner(max_items=4, max_tokens=10, max_bytes=10**6)
+    items = [("a", 1), ("b", 9), ("c", 1), ("d", 1), ("e", 8), ("f", 1), ("g", 2), ("h", 1), ("i", 1)]
+    batches = list(planner.iter_stream(iter(items), lambda item: (item[1], 1), window=8))
+
+    assert [[name for name, _ in b] for b in batches] == [["a", "c", "d", "f"], ["h", "g"], ["e"], ["b"], ["i"]]
+    assert all(len(b) <= 4 and sum(t for _, t in b) <= 10 for b in batches)
+
+
+def test_stats_report_shape_and_fill_ratio():
+    planner = EmbedBatchPlanner(max_items=10, max_tokens=100, max_bytes=1000)
+    planner.record(5, 80, 100)
+    planner.record(1, 20, 100)
+    stats = planner.stats()
+    assert stats["batches"] == 2 and stats["items"] == 6 and stats["max_items"] == 5
+    assert stats["avg_items"] == 3.0
+    assert stats["fill_ratio"] == pytest.approx((0.8 + 0.2) / 2)
+
+
+def test_adapter_sends_planned_requests():
+    pytest.importorskip("oci")
+    pytest.importorskip("langchain_community")
+    from backend.providers.oci.embeddings_adapter import OCIEmbeddingsAdapter
+
+    adapter = OCIEmbeddingsAdapter.__new__(OCIEmbeddingsAdapter)
+    adapter._token_estimator = "heuristic"
+    adapter._batch_planner = EmbedBatchPlanner(max_items=96, max_tokens=60, max_bytes=10**6)
+    sent = []
+
+    class Client:
+        def embed_text(self, details):
+            sent.append(list(details))
+            return type("Resp", (), {"data": type("Data", (), {"embeddings": [[1.0]] * len(details)})})()
+
+    adapter._thread_client = lambda: Client()
+    adapter._build_embed_payload = lambda inputs, input_type, serving_mode: inputs
+    inputs = ["x" * 200, "a", "b" * 8, "y" * 160]
+    vecs, vec_map = adapter._embed_with_retry(None, inputs, "search_document", [0, 1, 2, 3])
+
+    assert sent == [["a", "b" * 8, "y" * 160], ["x" * 200]]
+    assert sorted(vec_map) == [0, 1, 2, 3] and len(vecs) == 4
+    assert adapter.batch_planner_stats()["batches"] == 2
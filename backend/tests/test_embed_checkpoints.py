@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+from backend.app.services.embed_runner import _build_embed_command
+from backend.providers.oracle_vs.checkpoints import JobCheckpoint, purge_expired_checkpoints
+from backend.tests.test_bulk_upsert import FakeCursor, make_upserter, vec
+
+
+class CheckpointCursor:
+    def __init__(self, stale=0, chunk_ids=(), duplicates=0):
+        self.stale = stale
+        self.chunk_ids = list(chunk_ids)
+        self.duplicates = duplicates
+        self.executed = []
+        self.params = []
+        self.inserted = []
+        self.rowcount = 0
+        self._one = None
+        self._all = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self.executed.append(sql)
+        self.params.append(params)
+        if "COUNT(*)" in sql:
+            self._one = (self.stale,)
+        elif sql.startswith("SELECT CHUNK_ID"):
+            self._all = [(cid,) for cid in self.chunk_ids]
+
+    def fetchone(self):
+        return self._one
+
+    def fetchall(self):
+        return self._all
+
+    def executemany(self, sql, rows, batcherrors=False):
+        assert batcherrors
+        self.inserted.extend(rows)
+
+    def getbatcherrors(self):
+        return [SimpleNamespace(offset=i) for i in range(self.duplicates)]
+
+
+class CheckpointConn:
+    def __init__(self, cursor):
+        self.cur = cursor
+        self.commits = 0
+
+    def cursor(self):
+        return self.cur
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_load_returns_committed_chunk_ids():
+    conn = CheckpointConn(CheckpointCursor(chunk_ids=["a", "b"]))
+    assert JobCheckpoint(conn, "job-1", "fp", "MY_DEMO_V1").load() == {"a", "b"}
+    assert conn.commits == 0
+
+
+def test_load_discards_checkpoints_from_a_different_manifest():
+    cursor = CheckpointCursor(stale=3, chunk_ids=["a"])
+    conn = CheckpointConn(cursor)
+    assert JobCheckpoint(conn, "job-1", "fp", "MY_DEMO_V1").load() == set()
+    assert cursor.executed[-1].startswith("DELETE FROM RAG_EMBED_CHECKPOINTS")
+    assert conn.commits == 1
+
+
+def test_purge_drops_expired_rows_of_other_jobs():
+    cursor = CheckpointCursor()
+    cursor.rowcount = 12
+    conn = CheckpointConn(cursor)
+    assert purge_expired_checkpoints(conn, 7, keep_job_id="job-1") == 12
+    assert cursor.executed[0].startswith("DELETE FROM RAG_EMBED_CHECKPOINTS WHERE COMMITTED_AT <")
+    assert cursor.params[0] == (7, "job-1")
+    assert conn.commits == 1
+
+
+def test_record_does_not_commit_and_counts_new_rows():
+    cursor = CheckpointCursor(duplicates=1)
+    conn = CheckpointConn(cursor)
+    checkpoint = JobCheckpoint(conn, "job-1", "fp", "MY_DEMO_V1")
+    checkpoint.batch_no = 4
+    checkpoint.record(conn, ["a", "b", ""])
+    assert cursor.inserted == [("job-1", "a", "fp", "MY_DEMO_V1", 4), ("job-1", "b", "fp", "MY_DEMO_V1", 4)]
+    assert checkpoint.recorded == 1 and conn.commits == 0
+
+
+class RecordingCheckpoint:
+    def __init__(self):
+        self.recorded = []
+
+    def record(self, conn, chunk_ids):
+        self.recorded.extend(chunk_ids)
+
+
+def test_upserter_checkpoints_only_rows_oracle_accepted():
+    upserter, _ = make_upserter(FakeCursor(failing_offsets={1}), array_size=3)
+    checkpoint = RecordingCheckpoint()
+    upserter.attach_checkpoint(checkpoint)
+    inserted, _ = upserter.upsert_vectors([vec(i) for i in range(3)], dedupe=False, dry_run=False)
+    assert inserted == 2
+    assert checkpoint.recorded == ["c0", "c2"]
+
+
+def test_embed_command_resumes_with_the_job_id(tmp_path):
+    manifest = tmp_path / "m.jsonl"
+    fresh = _build_embed_command(manifest, "legacy_profile", False, False, job_id="job-7")
+    resumed = _build_embed_command(manifest, "legacy_profile", False, False, job_id="job-7", resume=True)
+    assert fresh[fresh.index("--job-id") + 1] == "job-7" and "--resume" not in fresh
+    assert resumed[resumed.index("--resume") + 1] == "job-7" and "--job-id" not in resumed
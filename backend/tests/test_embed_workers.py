@@ -0,0 +1,80 @@
+import threading
+import time
+
+from backend.batch.embed_job import _embed_batches_concurrently
+from backend.providers.oci.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def test_token_bucket_queues_callers_at_the_configured_rate():
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(120, clock=clock, sleep=clock.sleep)
+    waits = [limiter.acquire() for _ in range(3)]
+    assert waits == [0.0, 0.5, 1.0]
+    clock.now = 10.0
+    assert limiter.acquire() == 0.0
+    assert limiter.stats()["acquired"] == 4
+
+
+class SlowEmbedder:
+    """Later batches finish first, so ordering must come from the pool, not completion."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def embed_documents(self, texts, input_type=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        delay = 0.05 if texts[0].endswith("0") else 0.01
+        time.sleep(delay)
+        with self.lock:
+            self.active -= 1
+        if texts[0] == "boom-0":
+            raise RuntimeError("provider down")
+        return [[float(len(t))] for t in texts], list(range(len(texts)))
+
+
+def test_batches_embed_concurrently_and_come_back_in_order():
+    buffer = [{"text": f"t{i}-{i % 2}"} for i in range(8)] + [{"text": "  "}, {"text": ""}]
+    embedder = SlowEmbedder()
+    results = list(_embed_batches_concurrently(embedder, buffer, batch_size=2, workers=3))
+
+    assert [batch_no for batch_no, *_ in results] == [1, 2, 3, 4]
+    assert embedder.max_active > 1
+    for batch_no, batch, non_empty_idx, (vecs, out_map, failed) in results:
+        assert not failed and len(vecs) == len(non_empty_idx) == 2
+        assert batch[0]["text"] == f"t{(batch_no - 1) * 2}-0"
+
+
+def test_failed_batch_is_reported_not_raised():
+    buffer = [{"text": "boom-0"}, {"text": "ok-1"}]
+    results = list(_embed_batches_concurrently(SlowEmbedder(), buffer, batch_size=1, workers=2))
+    assert results[0][3] == ([], [], True)
+    assert results[1][3][2] is False
+
+
+class PackingEmbedder(SlowEmbedder):
+    def iter_batches(self, items, text_of):
+        items = list(items)
+        yield items[:3]
+        yield items[3:]
+
+
+def test_embedders_with_request_packing_form_their_own_batches():
+    buffer = [{"text": f"t{i}-1"} for i in range(5)]
+    results = list(_embed_batches_concurrently(PackingEmbedder(), buffer, batch_size=1, workers=2))
+    assert [len(batch) for _, batch, _, _ in results] == [3, 2]
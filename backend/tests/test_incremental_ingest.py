@@ -0,0 +1,144 @@
+from contextlib import contextmanager
+
+from backend.batch.embed_job import _DOC_KEY, _IncrementalWriter, _plan_incremental
+from backend.providers.oracle_vs.doc_registry import DocumentRecord, config_fingerprint, file_sha256
+
+
+def test_plan_skips_unchanged_and_finds_removed(tmp_path):
+    same = tmp_path / "same.docx"
+    edited = tmp_path / "edited.docx"
+    fresh = tmp_path / "fresh.docx"
+    for path in (same, edited, fresh):
+        path.write_bytes(path.name.encode())
+    fp = config_fingerprint({"profile": "p", "chunker": {"size": 900}})
+    known = {
+        "same": DocumentRecord("same", str(same), file_sha256(str(same)), fp, ["same_chunk_1"]),
+        "edited": DocumentRecord("edited", str(edited), "0" * 64, fp, ["edited_chunk_1"]),
+        "gone": DocumentRecord("gone", "/old/gone.docx", "1" * 64, fp, ["gone_chunk_1"]),
+    }
+    files = [str(same), str(edited), str(fresh)]
+
+    changed, plans, unchanged, removed = _plan_incremental(files, known, fp)
+
+    assert changed == [str(edited), str(fresh)]
+    assert unchanged == 1
+    assert [r.doc_id for r in removed] == ["gone"]
+    assert plans[str(fresh)].file_sha256 == file_sha256(str(fresh))
+    # A chunker change re-plans every document.
+    changed, _, unchanged, _ = _plan_incremental(files, known, config_fingerprint({"profile": "p"}))
+    assert unchanged == 0 and len(changed) == 3
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.log = []
+
+    def delete_chunks(self, cur, doc_id, chunk_ids=None):
+        self.log.append(("delete", doc_id, None if chunk_ids is None else list(chunk_ids)))
+        return len(chunk_ids or [])
+
+    def save(self, cur, record):
+        self.log.append(("save", record.doc_id, list(record.chunk_ids)))
+
+    def forget(self, cur, doc_id):
+        self.log.append(("forget", doc_id))
+
+
+class FakeConn:
+    def cursor(self):
+        @contextmanager
+        def _cur():
+            yield object()
+
+        return _cur()
+
+
+class FakeUpserter:
+    def __init__(self, log):
+        self.log = log
+        self.batch_errors = 0
+
+    @contextmanager
+    def transaction(self):
+        self.log.append(("begin",))
+        yield FakeConn()
+        self.log.append(("commit",))
+
+    def upsert_vectors(self, items, dedupe, dry_run):
+        self.log.append(("insert", [i["metadata"]["chunk_id"] for i in items]))
+        return len(items), 0
+
+
+def chunk(doc, cid, embedded=True):
+    item = {"text": cid, "metadata": {"chunk_id": cid}, _DOC_KEY: doc}
+    if embedded:
+        item["embedding"] = [0.1]
+    return item
+
+
+def test_writer_replaces_each_document_in_its_own_transaction():
+    registry = FakeRegistry()
+    upserter = FakeUpserter(registry.log)
+    plans = {
+        path: DocumentRecord(path.strip("/"), path, "sha", "fp")
+        for path in ("/a", "/b", "/c", "/empty")
+    }
+    previous = {"a": DocumentRecord("a", "/a", "old", "fp", ["a_chunk_1"])}
+    writer = _IncrementalWriter(registry, upserter, plans, previous, table_ready=True)
+
+    writer.consume([chunk("/a", "a1"), chunk("/a", "a2"), chunk("/b", "b1")], failed=False)
+    writer.consume([chunk("/b", "b2", embedded=False), chunk("/c", "c1")], failed=True)
+    writer.close()
+
+    assert registry.log == [
+        ("begin",), ("delete", "a", ["a_chunk_1"]), ("insert", ["a1", "a2"]), ("save", "a", ["a1", "a2"]), ("commit",),
+        # b and c share the failed batch: previous chunks and registry rows are kept.
+        ("begin",), ("delete", "empty", None), ("save", "empty", []), ("commit",),
+    ]
+    assert writer.docs_written == 2 and writer.inserted == 2 and writer.deleted_chunks == 1
+
+
+def test_purge_deletes_recorded_chunks_and_registry_row():
+    registry = FakeRegistry()
+    writer = _IncrementalWriter(registry, FakeUpserter(registry.log), {}, {}, table_ready=True)
+    writer.purge(DocumentRecord("gone", "/gone", "sha", "fp", ["gone_chunk_1", "gone_chunk_2"]))
+    assert registry.log == [
+        ("begin",), ("delete", "gone", ["gone_chunk_1", "gone_chunk_2"]), ("forget", "gone"), ("commit",),
+    ]
+    assert writer.docs_purged == 1 and writer.deleted_chunks == 2
+
+
+def test_planned_batches_keep_each_document_in_one_write():
+    from backend.providers.oci.batch_planner import EmbedBatchPlanner
+
+    registry = FakeRegistry()
+    plans = {path: DocumentRecord(path.strip("/"), path, "sha", "fp") for path in ("/a", "/b")}
+    writer = _IncrementalWriter(registry, FakeUpserter(registry.log), plans, {}, table_ready=True)
+    # Lengths alternate so length sorting would interleave the two documents.
+    stream = [chunk(doc, f"{doc.strip('/')}{i}" + "x" * (40 if i % 2 else 1)) for doc in ("/a", "/b") for i in range(4)]
+
+    planner = EmbedBatchPlanner(max_items=3)
+    for batch in planner.iter_stream(iter(stream), lambda item: (len(item["text"]), 1), keep_order=True):
+        writer.consume(batch, failed=False)
+    writer.close()
+
+    saves = [entry for entry in registry.log if entry[0] == "save"]
+    assert [(doc, len(ids)) for _, doc, ids in saves] == [("a", 4), ("b", 4)]
+    assert [entry[0] for entry in registry.log].count("delete") == 2
+
+
+def test_loader_settings_change_the_fingerprint(monkeypatch):
+    from backend.batch.embed_job import _loader_settings
+
+    for name in ("PDF_OCR_MODE", "DOCX_EXTRACT_IMAGES", "XLSX_ROW_GROUP_MAX_TOKENS"):
+        monkeypatch.delenv(name, raising=False)
+    base = config_fingerprint({"loaders": _loader_settings(streams_pdf=False)})
+    monkeypatch.setenv("PDF_OCR_MODE", "Auto")
+    assert config_fingerprint({"loaders": _loader_settings(streams_pdf=False)}) == base
+
+    for name, value in (("PDF_OCR_MODE", "off"), ("DOCX_EXTRACT_IMAGES", "1"), ("XLSX_ROW_GROUP_MAX_TOKENS", "800")):
+        monkeypatch.setenv(name, value)
+        changed = config_fingerprint({"loaders": _loader_settings(streams_pdf=False)})
+        assert changed != base
+        base = changed
+    assert config_fingerprint({"loaders": _loader_settings(streams_pdf=True)}) != base
@@ -0,0 +1,173 @@
+import threading
+import time
+
+import pytest
+
+from backend.batch.pipeline import batched, staged
+
+
+def test_chained_stages_preserve_order():
+    loaded = staged(range(20), lambda n: [n], maxsize=2, name="t-load")
+    chunked = staged(loaded, lambda n: [(n, 0), (n, 1)], maxsize=3, name="t-chunk")
+    assert list(chunked) == [(n, part) for n in range(20) for part in (0, 1)]
+
+
+def test_bounded_queue_applies_backpressure():
+    produced = []
+    lock = threading.Lock()
+
+    def fn(n):
+        with lock:
+            produced.append(n)
+        return [n]
+
+    stream = staged(range(100), fn, maxsize=3, name="t-bp")
+    assert next(stream) == 0
+    time.sleep(0.3)
+    # One item consumed, three queued, at most one more blocked on put.
+    assert len(produced) <= 5
+    stream.close()
+
+
+def test_stage_errors_reach_the_consumer():
+    def fn(n):
+        if n == 3:
+            raise ValueError("bad file")
+        return [n]
+
+    stream = staged(range(10), fn, maxsize=2, name="t-err")
+    with pytest.raises(ValueError, match="bad file"):
+        list(stream)
+
+
+def test_closing_consumer_stops_upstream_stage():
+    source_closed = threading.Event()
+
+    def source():
+        try:
+            for n in range(10_000):
+                yield n
+        finally:
+            source_closed.set()
+
+    stream = staged(source(), lambda n: [n], maxsize=1, name="t-close")
+    next(stream)
+    stream.close()
+    assert source_closed.wait(2.0)
+
+
+def test_batched_keeps_remainder():
+    assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def _ctx():
+    from backend.batch.embed_job import _ChunkingContext
+
+    return _ChunkingContext(
+        profile_name="p",
+        index_name="IDX",
+        profile_cfg={"chunker": {"type": "char", "size": 200, "overlap": 0}},
+        dedupe_enabled=True,
+    )
+
+
+def test_process_pool_parses_in_manifest_order_and_isolates_failures(tmp_path):
+    from backend.batch.embed_job import _parse_and_chunk_file, _parse_files_in_processes
+
+    files = []
+    for name in ("b", "a", "c"):
+        path = tmp_path / f"{name}.txt"
+        path.write_text(f"Procedure {name}. " * 40, encoding="utf-8")
+        files.append(str(path))
+    files.insert(1, str(tmp_path / "missing.txt"))
+
+    results = list(_parse_files_in_processes(files, _ctx(), workers=2))
+
+    assert [r.filepath for r in results] == files
+    assert results[1].failed and results[1].errors == 1 and not results[1].chunks
+    expected = _parse_and_chunk_file(files[0], _ctx())
+    assert results[0].chunks == expected.chunks
+    assert all(c["metadata"]["doc_id"] == "c" for c in results[3].chunks)
+
+
+def test_structured_chunk_ids_continue_the_job_sequence():
+    from backend.batch.embed_job import _ParsedFile, _assign_job_chunk_ids
+
+    parsed = _ParsedFile(
+        filepath="/docs/sop.docx",
+        chunks=[
+            {"text": "a", "metadata": {"chunk_id": "sop_chunk_1"}},
+            {"text": "b", "metadata": {"chunk_id": "sop_chunk_2", "parent_chunk_id": "sop_chunk_1"}},
+            {"text": "c", "metadata": {"chunk_id": "sop_chunk_1_1"}},
+        ],
+        sequenced=[0, 1],
+    )
+    _assign_job_chunk_ids(parsed, 7)
+    assert [c["metadata"]["chunk_id"] for c in parsed.chunks] == ["sop_chunk_8", "sop_chunk_9", "sop_chunk_1_1"]
+    assert parsed.chunks[1]["metadata"]["parent_chunk_id"] == "sop_chunk_8"
+
+
+def _pdf_ctx():
+    from backend.batch.embed_job import _ChunkingContext
+
+    return _ChunkingContext(
+        profile_name="p",
+        index_name="IDX",
+        profile_cfg={"chunker": {"type": "structured_pdf", "min_block_tokens": 0, "repeated_lines_window": 10}},
+        dedupe_enabled=False,
+    )
+
+
+def _fake_pdf_pages(pulled, n, fail=False):
+    def iter_load(path):
+        for page in range(1, n + 1):
+            pulled.append(page)
+            yield {
+                "text": f"Step {page}: torque the bolts on panel {page} before powering the rack on.",
+                "metadata": {"source": path, "content_type": "application/pdf", "page": page},
+            }
+        if fail:
+            raise RuntimeError("truncated xref table")
+
+    return iter_load
+
+
+def test_streamed_pdf_hands_on_pieces_with_the_whole_file_ids(monkeypatch):
+    from backend.batch import embed_job
+    from backend.ingest.loaders import pdf_loader
+
+    pulled = []
+    monkeypatch.setattr(pdf_loader, "iter_load", _fake_pdf_pages(pulled, 40))
+    monkeypatch.setattr(embed_job, "_STREAM_PIECE_CHUNKS", 8)
+    ctx = _pdf_ctx()
+    assert embed_job._streams_pages("/docs/rack.pdf", ctx) and not embed_job._streams_pages("/docs/rack.txt", ctx)
+
+    pieces = embed_job._iter_chunked_file(embed_job._prepare_file(embed_job._load_file("/docs/rack.pdf", True)), ctx)
+    first = next(pieces)
+    assert len(first.chunks) == 8 and len(pulled) < 40 and not first.continued
+    pieces = [first, *pieces]
+    assert all(p.continued for p in pieces[1:]) and not any(p.failed or p.errors for p in pieces)
+
+    offset, streamed = 5, []
+    for piece in pieces:
+        embed_job._assign_job_chunk_ids(piece, offset)
+        offset += len(piece.chunks)
+        streamed.extend(piece.chunks)
+    whole = embed_job._ParsedFile(filepath="/docs/rack.pdf", items=list(_fake_pdf_pages([], 40)("/docs/rack.pdf")))
+    whole = embed_job._chunk_file(embed_job._prepare_file(whole), ctx)
+    embed_job._assign_job_chunk_ids(whole, 5)
+    assert streamed == whole.chunks and len(streamed) == 40
+
+
+def test_streamed_pdf_failure_ends_the_file_with_a_failed_piece(monkeypatch):
+    from backend.batch import embed_job
+    from backend.ingest.loaders import pdf_loader
+
+    monkeypatch.setattr(pdf_loader, "iter_load", _fake_pdf_pages([], 30, fail=True))
+    monkeypatch.setattr(embed_job, "_STREAM_PIECE_CHUNKS", 8)
+    ctx = _pdf_ctx()
+
+    pieces = list(embed_job._iter_chunked_file(embed_job._prepare_file(embed_job._load_file("/docs/rack.pdf", True)), ctx))
+
+    assert [len(p.chunks) for p in pieces] == [8, 8, 8, 0]
+    assert pieces[-1].failed and pieces[-1].errors == 1 and pieces[-1].continued
@@ -0,0 +1,86 @@
+import pytest
+
+from backend.providers.oci.embedding_store import PersistentEmbeddingCache, embedding_key
+
+
+def test_round_trip_survives_reopen(tmp_path):
+    key = embedding_key("reset the router", "cohere.embed", "search_document")
+    cache = PersistentEmbeddingCache(str(tmp_path))
+    cache.put_many([(key, [0.5, -0.25, 1.0])])
+    cache.close()
+
+    reopened = PersistentEmbeddingCache(str(tmp_path))
+    assert reopened.get_many([key, "missing"]) == {key: [0.5, -0.25, 1.0]}
+    stats = reopened.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["bytes"] == 12
+
+
+def test_key_covers_model_input_type_and_dimensions():
+    base = embedding_key("t", "m1", "search_document")
+    assert base != embedding_key("t", "m2", "search_document")
+    assert base != embedding_key("t", "m1", "search_query")
+    assert base != embedding_key("t", "m1", "search_document", 256)
+    assert base == embedding_key("t", "m1", "search_document", 0)
+    assert base != embedding_key("t", "m1", "search_document", 0, "512/split/Tokenizer")
+
+
+def test_evicts_least_recently_used_past_max_bytes(tmp_path):
+    cache = PersistentEmbeddingCache(str(tmp_path), max_bytes=40)  # room for two 4-dim vectors
+    cache.put_many([("a", [1.0] * 4)])
+    cache.put_many([("b", [2.0] * 4)])
+    cache.get_many(["a"])  # "b" is now the oldest
+    cache.put_many([("c", [3.0] * 4)])
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_adapter_only_embeds_cache_misses(tmp_path):
+    pytest.importorskip("oci")
+    from backend.providers.oci.embeddings_adapter import OCIEmbeddingsAdapter
+
+    adapter = OCIEmbeddingsAdapter.__new__(OCIEmbeddingsAdapter)
+    adapter._model_id = "cohere.embed"
+    adapter._doc_input_type = "search_document"
+    adapter._cache_dimensions = 0
+    adapter._token_estimator = "heuristic"
+    adapter._persistent_cache = PersistentEmbeddingCache(str(tmp_path))
+    adapter._models = type("Models", (), {"OnDemandServingMode": staticmethod(lambda model_id: model_id)})
+    sent = []
+
+    def preflight(batch):
+        return list(batch), list(range(len(batch)))
+
+    def embed(serving_mode, inputs, input_type, exp_map):
+        sent.append(list(inputs))
+        return [[float(len(t)), 1.0] for t in inputs], list(exp_map)
+
+    adapter._preflight_expand_batch = preflight
+    adapter._embed_with_retry = embed
+    adapter._reassemble_by_map = lambda vecs, vec_map, n: vecs
+
+    first, _ = adapter.embed_documents(["aa", "bbb"])
+    second, index_map = adapter.embed_documents(["aa", "cccc", "bbb"])
+
+    assert sent == [["aa", "bbb"], ["cccc"]]
+    assert second == [[2.0, 1.0], [4.0, 1.0], [3.0, 1.0]]
+    assert index_map == [0, 1, 2]
+    stats = adapter.persistent_cache_stats()
+    assert stats["enabled"] and stats["hits"] == 2 and stats["misses"] == 3
+
+
+def test_adapter_keys_change_with_token_limit_settings(tmp_path):
+    pytest.importorskip("oci")
+    from backend.providers.oci.embeddings_adapter import OCIEmbeddingsAdapter
+
+    adapter = OCIEmbeddingsAdapter.__new__(OCIEmbeddingsAdapter)
+    adapter._max_input_tokens = 512
+    adapter._on_token_limit = "split"
+    adapter._token_estimator = "heuristic"
+    split = adapter._token_handling_key()
+    adapter._on_token_limit = "truncate"
+    truncate = adapter._token_handling_key()
+    adapter._max_input_tokens = 256
+    smaller = adapter._token_handling_key()
+    assert len({split, truncate, smaller}) == 3
+    assert split == "512/split/Tokenizer"
@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("oci")
+
+from backend.providers.oci.embeddings_adapter import OCIEmbeddingsAdapter
+from backend.providers.oci.query_cache import QueryEmbeddingCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_lru_eviction_and_ttl():
+    clock = FakeClock()
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=10, clock=clock)
+    k1 = cache.make_key("reset  the router ", "search_query", "m")
+    k2 = cache.make_key("b", "search_query", "m")
+    k3 = cache.make_key("c", "search_query", "m")
+    cache.put(k1, [1.0])
+    cache.put(k2, [2.0])
+    assert cache.get(cache.make_key("reset the router", "search_query", "m")) == [1.0]
+    cache.put(k3, [3.0])  # evicts k2 (least recently used)
+    assert cache.get(k2) is None
+    clock.now = 11.0
+    assert cache.get(k1) is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["evictions"] == 1 and stats["expirations"] == 1
+
+
+def test_cache_key_separates_input_type_and_model():
+    assert QueryEmbeddingCache.make_key("q", "search_query", "m1") != QueryEmbeddingCache.make_key(
+        "q", "search_document", "m1"
+    )
+    assert QueryEmbeddingCache.make_key("q", "search_query", "m1") != QueryEmbeddingCache.make_key(
+        "q", "search_query", "m2"
+    )
+
+
+def _adapter(cache):
+    adapter = OCIEmbeddingsAdapter.__new__(OCIEmbeddingsAdapter)
+    adapter._model_id = "cohere.embed"
+    adapter._query_input_type = "search_query"
+    adapter._query_cache = cache
+    adapter._models = type(
+        "Models", (), {"OnDemandServingMode": staticmethod(lambda model_id: model_id)}
+    )
+    adapter.calls = 0
+
+    def preflight(batch):
+        return list(batch), [0]
+
+    def embed(serving_mode, inputs, input_type, exp_map):
+        adapter.calls += 1
+        return [[0.1, 0.2]], [0]
+
+    adapter._preflight_expand_batch = preflight
+    adapter._embed_with_retry = embed
+    adapter._reassemble_by_map = lambda vecs, vec_map, n: vecs
+    return adapter
+
+
+def test_embed_query_skips_provider_on_hit():
+    adapter = _adapter(QueryEmbeddingCache(max_entries=8, ttl_seconds=60))
+    assert adapter.embed_query("How do I reset?") == [0.1, 0.2]
+    assert adapter.embed_query("How do I  reset? ") == [0.1, 0.2]
+    assert adapter.calls == 1
+    assert adapter.query_cache_stats()["hits"] == 1
+
+
+def test_embed_query_without_cache_always_calls_provider():
+    adapter = _adapter(None)
+    adapter.embed_query("q")
+    adapter.embed_query("q")
+    assert adapter.calls == 2
+    assert adapter.query_cache_stats() == {"enabled": False}
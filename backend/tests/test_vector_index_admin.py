@@ -0,0 +1,83 @@
+import pytest
+
+from backend.providers.oracle_vs import index_admin as ia
+
+
+class FakeCursor:
+    def __init__(self, existing):
+        self.existing = existing
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchone(self):
+        return (self.existing,) if self.existing else None
+
+
+class FakeConn:
+    def __init__(self, existing=None):
+        self.cur = FakeCursor(existing)
+
+    def cursor(self):
+        return self.cur
+
+
+EMBEDDINGS_CFG = {
+    "vector_index": {"type": "hnsw", "target_accuracy": 95},
+    "profiles": {"p": {"vector_index": {"neighbors": 16}}},
+    "domains": {"TS_SBC": {"index_name": "RAG_TS_SBC_CHUNKS", "vector_index": {"type": "ivf", "neighbor_partitions": 64}}},
+}
+
+
+def test_config_layers_profile_domain_and_overrides():
+    cfg = ia.resolve_vector_index_config(EMBEDDINGS_CFG, "p", "TS_SBC", {"target_accuracy": 90, "parallel": None})
+    assert cfg["type"] == "ivf" and cfg["neighbor_partitions"] == 64
+    assert cfg["neighbors"] == 16 and cfg["target_accuracy"] == 90
+    with pytest.raises(ValueError):
+        ia.resolve_vector_index_config({"vector_index": {"type": "flat"}})
+
+
+def test_ddl_for_hnsw_and_ivf():
+    hnsw = ia.build_vector_index_ddl("MY_DEMO_V1", "cosine", ia.resolve_vector_index_config({}))
+    assert "ORGANIZATION INMEMORY NEIGHBOR GRAPH DISTANCE COSINE" in hnsw
+    assert "WITH TARGET ACCURACY 95 PARAMETERS (TYPE HNSW, NEIGHBORS 32, EFCONSTRUCTION 200)" in hnsw
+    ivf_cfg = ia.resolve_vector_index_config(EMBEDDINGS_CFG, None, "TS_SBC", {"parallel": 4})
+    ivf = ia.build_vector_index_ddl("RAG_TS_SBC_CHUNKS", "dot_product", ivf_cfg)
+    assert ivf.startswith("CREATE VECTOR INDEX RAG_TS_SBC_CHUNKS_VIDX ON RAG_TS_SBC_CHUNKS (EMBEDDING)")
+    assert "NEIGHBOR PARTITIONS DISTANCE DOT" in ivf and ivf.endswith("(TYPE IVF, NEIGHBOR PARTITIONS 64) PARALLEL 4")
+
+
+def test_ensure_is_idempotent_and_rebuild_recreates():
+    cfg = ia.resolve_vector_index_config({})
+    conn = FakeConn(existing="MY_DEMO_V1_VIDX")
+    result = ia.ensure_vector_index(conn, "MY_DEMO_V1", "cosine", cfg)
+    assert result["changed"] is False and len(conn.cur.statements) == 1
+
+    conn = FakeConn(existing="MY_DEMO_V1_VIDX")
+    result = ia.ensure_vector_index(conn, "MY_DEMO_V1", "cosine", cfg, action="rebuild")
+    assert conn.cur.statements[1] == "DROP INDEX MY_DEMO_V1_VIDX"
+    assert conn.cur.statements[2].startswith("CREATE VECTOR INDEX MY_DEMO_V1_VIDX")
+    assert result["changed"] and result["index"] == "MY_DEMO_V1_VIDX"
+
+    conn = FakeConn()
+    result = ia.ensure_vector_index(conn, "MY_DEMO_V1", "cosine", cfg, action="drop")
+    assert result["changed"] is False and len(conn.cur.statements) == 1
+
+
+def test_unique_hash_index_created_once():
+    conn = FakeConn(existing=None)
+    conn.cur.fetchone = lambda: (0,)
+    assert ia.ensure_hash_unique_index(conn, "MY_DEMO_V1") is True
+    assert conn.cur.statements[-1] == "CREATE UNIQUE INDEX MY_DEMO_V1_HASH_UX ON MY_DEMO_V1 (HASH_NORM)"
+
+    conn = FakeConn(existing=None)
+    conn.cur.fetchone = lambda: (1,)
+    assert ia.ensure_hash_unique_index(conn, "MY_DEMO_V1") is False
+    assert len(conn.cur.statements) == 1
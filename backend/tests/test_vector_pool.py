@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+from backend.providers.oci import vectorstore as vs
+
+
+def test_resolve_pool_config_merges_defaults():
+    cfg = vs.resolve_pool_config({"max": "4", "stmtcachesize": 100, "ping_interval": None})
+    assert cfg["max"] == 4 and cfg["stmtcachesize"] == 100
+    assert cfg["ping_interval"] == vs.POOL_DEFAULTS["ping_interval"]
+    assert vs.resolve_pool_config(None) == vs.POOL_DEFAULTS
+
+
+def test_resolve_pool_config_keeps_max_at_least_min():
+    cfg = vs.resolve_pool_config({"min": 6, "max": 2})
+    assert cfg["max"] == 6
+
+
+def test_pool_stats_reports_wait_times():
+    pool = SimpleNamespace(opened=3, busy=1, min=1, max=8, acquires=4, wait_ms_total=10.0, wait_ms_max=7.5)
+    stats = vs.pool_stats(pool)
+    assert stats == {
+        "open": 3,
+        "busy": 1,
+        "min": 1,
+        "max": 8,
+        "acquires": 4,
+        "wait_ms_avg": 2.5,
+        "wait_ms_max": 7.5,
+    }
+    assert vs.pool_stats(SimpleNamespace())["wait_ms_avg"] == 0.0
+
+
+def test_async_acquire_records_waits_on_the_pool():
+    import asyncio
+
+    class FakeAsyncPool(vs._AcquireWaits):
+        def __init__(self):
+            self._init_waits()
+
+        def acquire(self):
+            class _Conn:
+                async def __aenter__(self):
+                    await asyncio.sleep(0.01)
+                    return "conn"
+
+                async def __aexit__(self, *exc):
+                    return False
+
+            return _Conn()
+
+    pool = FakeAsyncPool()
+
+    async def use():
+        async with vs.acquire_async(pool) as conn:
+            return conn
+
+    assert asyncio.run(use()) == "conn"
+    stats = vs.pool_stats(pool)
+    assert stats["acquires"] == 1 and stats["wait_ms_max"] >= 5.0